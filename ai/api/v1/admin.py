@@ -0,0 +1,154 @@
+from fastapi import APIRouter, Depends, Header, HTTPException, status
+from fastapi.responses import PlainTextResponse
+from starlette.concurrency import run_in_threadpool
+from typing import Optional
+import os
+
+from config.settings import settings
+from models.registry import model_registry
+from models.shadow import shadow_scorer
+from schemas.admin import ModelReloadRequest, ModelReloadResponse, ShadowCandidateRequest
+from utils.profiling import profile_store
+from utils.result_cache import result_cache
+
+
+def require_admin_key(x_admin_key: Optional[str] = Header(None)):
+    """X-Admin-Key 확인 (ADMIN_API_KEY가 없으면 관리 API 전체 비활성화)"""
+    if not settings.ADMIN_API_KEY:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="ADMIN_API_KEY가 설정되지 않아 관리 API를 사용할 수 없습니다.",
+        )
+    if x_admin_key != settings.ADMIN_API_KEY:
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="관리 API 키가 올바르지 않습니다.")
+
+
+def resolve_model_path(path: str) -> str:
+    """요청으로 받은 아티팩트 경로는 MODEL_DIR 안쪽만 허용 (심볼릭 링크 / .. 해석 후 비교)"""
+    model_dir = os.path.realpath(settings.MODEL_DIR)
+    resolved = os.path.realpath(os.path.join(model_dir, path))
+    if os.path.commonpath([model_dir, resolved]) != model_dir:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail=f"MODEL_DIR 밖의 경로는 사용할 수 없습니다: {path}",
+        )
+    return resolved
+
+
+def _require_model(name: str) -> None:
+    if model_registry.entry(name) is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"등록되지 않은 모델입니다: {name}")
+
+
+router = APIRouter(
+    prefix="/api/v1/admin",
+    tags=["admin"],
+    dependencies=[Depends(require_admin_key)],
+)
+
+
+@router.get("/models")
+async def list_models():
+    """
+    모델별 상태 / 버전 / 마지막 재로드 결과
+    """
+    return model_registry.status()
+
+
+@router.post("/models/{name}/reload", response_model=ModelReloadResponse)
+async def reload_model(name: str, request: Optional[ModelReloadRequest] = None):
+    """
+    무중단 모델 재로드 API
+
+    새 아티팩트를 로드 → 스키마 검증 → 워밍업 프로브 후 원자적 교체.
+    처리 중인 요청은 이전 모델로 끝나고, 실패하면 기존 모델 유지 (swapped=false)
+    """
+    _require_model(name)
+
+    path = resolve_model_path(request.path) if request is not None and request.path else None
+    # 로드/워밍업은 블로킹이므로 이벤트 루프 밖에서
+    result = await run_in_threadpool(model_registry.reload, name, path)
+    return ModelReloadResponse(**result)
+
+
+@router.get("/shadow")
+async def shadow_status():
+    """
+    섀도 평가 현황: 후보별 점수 차이 통계 (최근 SHADOW_WINDOW건), 처리/버림/오류 건수
+    """
+    return shadow_scorer.status()
+
+
+@router.put("/shadow/{name}")
+async def set_shadow_candidate(name: str, request: ShadowCandidateRequest):
+    """
+    후보 모델 등록 (주 모델 옆에서 실시간 입력을 받아 배치 평가, 응답에는 영향 없음)
+    """
+    _require_model(name)
+    path = resolve_model_path(request.path)
+    try:
+        candidate = await run_in_threadpool(shadow_scorer.set_candidate, name, path)
+    except FileNotFoundError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+    except Exception as e:
+        message = getattr(e, "message", None) or str(e)
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=message)
+    return candidate.to_dict()
+
+
+@router.delete("/shadow/{name}")
+async def remove_shadow_candidate(name: str):
+    candidate = shadow_scorer.remove_candidate(name)
+    if candidate is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"섀도 후보가 없습니다: {name}")
+    return candidate.to_dict()
+
+
+@router.post("/shadow/{name}/promote", response_model=ModelReloadResponse)
+async def promote_shadow_candidate(name: str):
+    """
+    후보를 주 모델로 승격 (무중단 재로드와 같은 경로, 성공하면 섀도 후보 해제)
+    """
+    candidate = shadow_scorer.candidate(name)
+    if candidate is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"섀도 후보가 없습니다: {name}")
+    result = await run_in_threadpool(model_registry.reload, name, candidate.artifact.path)
+    if result["swapped"]:
+        shadow_scorer.remove_candidate(name)
+    return ModelReloadResponse(**result)
+
+
+@router.get("/cache")
+async def result_cache_status():
+    """
+    공유 추론 결과 캐시: 적중률 / 교체 건수 / 점유 슬롯 (전체 워커 합산 + 이 워커)
+    """
+    return result_cache.stats()
+
+
+@router.delete("/cache")
+async def clear_result_cache():
+    """
+    공유 추론 결과 캐시 비우기 (모든 워커에 적용)
+    """
+    result_cache.clear()
+    return result_cache.stats()
+
+
+@router.get("/profiles")
+async def list_profiles():
+    """
+    저장된 요청 프로파일 목록 (최신순, 최대 PROFILE_MAX_FILES개)
+    """
+    return {"directory": profile_store.directory, "profiles": profile_store.list()}
+
+
+@router.get("/profiles/{profile_id}", response_class=PlainTextResponse)
+async def get_profile(profile_id: str):
+    """
+    collapsed stack 다운로드 (flamegraph.pl / speedscope 입력)
+    """
+    folded = profile_store.read(profile_id)
+    if folded is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"프로파일이 없습니다: {profile_id}")
+    return PlainTextResponse(folded)
@@ -0,0 +1,38 @@
+from fastapi import APIRouter, HTTPException
+from schemas.fit import FitRequest, FitResponse
+from schemas.health import ErrorResponse
+from services.fit_service import fit_service
+from utils.exceptions import BaseAPIException
+
+router = APIRouter(prefix="/api/v1/fit", tags=["fit"])
+
+
+@router.post(
+    "/rank",
+    response_model=FitResponse,
+    responses={
+        400: {"model": ErrorResponse, "description": "입력 검증 실패"},
+        500: {"model": ErrorResponse, "description": "서버 오류"}
+    }
+)
+async def rank_fit(request: FitRequest):
+    """
+    고령자 1명 × 후보 일자리 N개 종합 적합도 API
+
+    건강점수 / 산업재해 리스크 / 매칭 점수를 한 번에 계산하고
+    제약 조건(예: 이동 제한 > 0.5 → 고위험 일자리 제외)으로 거른 순위 반환
+    """
+    try:
+        return await fit_service.evaluate(request)
+    except BaseAPIException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.get("/")
+async def fit_check():
+    """
+    Fit service check
+    """
+    return {"status": "ok", "service": "fit"}
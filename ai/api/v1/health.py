@@ -2,6 +2,7 @@ from fastapi import APIRouter, HTTPException, status
 import logging
 
 from schemas.health import HealthScoreRequest, HealthScoreResponse, ErrorResponse
+from services.backend_push import backend_pusher
 from services.health_service import HealthScoreService
 from utils.exceptions import ValidationError, ServiceError
 
@@ -75,6 +76,7 @@ async def calculate_health_score(request: HealthScoreRequest) -> HealthScoreResp
         )
 
         logger.info(f"건강점수 계산 성공: senior_profile_id={request.senior_profile_id}, score={response.health_score}")
+        backend_pusher.publish("health_score", response.model_dump(mode="json"))
         return response
 
     except ValidationError as e:
@@ -1,12 +1,15 @@
 from fastapi import APIRouter, HTTPException
 from typing import List
-from schemas.job_risk import JobRiskRequest, JobRiskResponse
-from services.job_risk_service import JobRiskService
+from schemas.job_risk import (
+    JobRiskRequest,
+    JobRiskResponse,
+    JobRiskBatchRequest,
+    JobRiskBatchResponse,
+)
+from services.job_risk_service import job_risk_service
 
 router = APIRouter(prefix="/api/v1/job-risk", tags=["job-risk"])
 
-job_risk_service = JobRiskService()
-
 
 @router.post("/predict", response_model=JobRiskResponse)
 async def predict_job_risk(request: JobRiskRequest):
@@ -20,6 +23,18 @@ async def predict_job_risk(request: JobRiskRequest):
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@router.post("/predict/batch", response_model=JobRiskBatchResponse)
+async def predict_job_risk_batch(request: JobRiskBatchRequest):
+    """
+    산업재해 리스크 일괄 예측 API (predict 1회)
+    """
+    try:
+        results = await job_risk_service.predict_risk_batch(request.requests)
+        return JobRiskBatchResponse(results=results)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
 @router.get("/")
 async def job_risk_check():
     """
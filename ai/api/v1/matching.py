@@ -1,12 +1,21 @@
-from fastapi import APIRouter, HTTPException
-from typing import List
-from schemas.matching import MatchingRequest, MatchingResponse
-from services.matching_service import MatchingService
+from fastapi import APIRouter, Depends, HTTPException, Query
+from typing import List, Optional
+from schemas.matching import (
+    MatchingRequest,
+    MatchingResponse,
+    MatchingRankRequest,
+    MatchingRankResponse,
+    MatchingPriorityResponse,
+    PostingUpsertRequest,
+)
+from api.v1.admin import require_admin_key
+from services.matching_service import matching_service
+from services.posting_catalog import posting_catalog
+from services.priority_index import priority_index
+from utils.exceptions import ValidationError
 
 router = APIRouter(prefix="/api/v1/matching", tags=["matching"])
 
-matching_service = MatchingService()
-
 
 @router.post("/score", response_model=MatchingResponse)
 async def calculate_matching_score(request: MatchingRequest):
@@ -20,6 +29,59 @@ async def calculate_matching_score(request: MatchingRequest):
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@router.post("/rank", response_model=MatchingRankResponse)
+async def rank_job_postings(request: MatchingRankRequest):
+    """
+    구직자 1명에 대한 공고 Top-K 랭킹 API
+
+    응답의 seeker_priority는 파이프라인 우선순위 참고값 (구직자 단위라 공고 순서에는 영향 없음).
+    고령자 간 우선순위 순서는 GET /priority
+    """
+    try:
+        result = await matching_service.rank_postings(request)
+        return result
+    except ValidationError:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.put("/postings", dependencies=[Depends(require_admin_key)])
+async def upsert_postings(request: PostingUpsertRequest):
+    """
+    카탈로그 공고 추가/갱신 API (관리 API 키 필요)
+
+    posting_id는 요청 검증 단계에서 확인 → 잘못된 공고가 하나라도 있으면 아무것도 반영하지 않음
+    """
+    count = posting_catalog.add_postings([p.model_dump() for p in request.postings])
+    return {"upserted": count, "catalog_size": len(posting_catalog)}
+
+
+@router.delete("/postings/{posting_id}", dependencies=[Depends(require_admin_key)])
+async def close_posting(posting_id: int):
+    """
+    카탈로그 공고 마감 API (관리 API 키 필요)
+    """
+    if not posting_catalog.close_posting(posting_id):
+        raise HTTPException(status_code=404, detail=f"posting not found: {posting_id}")
+    return {"closed": posting_id, "catalog_size": len(posting_catalog)}
+
+
+@router.get("/priority", response_model=MatchingPriorityResponse)
+async def matching_priority(age_group: Optional[str] = None, limit: int = Query(100, ge=1, le=10000)):
+    """
+    파이프라인 매칭 우선순위 순서 API (연령대 지정 가능)
+    """
+    snapshot = priority_index.snapshot()
+    if snapshot is None:
+        raise HTTPException(status_code=503, detail="priority index not loaded")
+    return MatchingPriorityResponse(
+        age_group=age_group,
+        group_priority=snapshot.group_priority(age_group) if age_group else None,
+        results=snapshot.top(age_group, limit),
+    )
+
+
 @router.get("/")
 async def matching_check():
     """
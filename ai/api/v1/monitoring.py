@@ -1,7 +1,8 @@
 from fastapi import APIRouter, HTTPException, status
 import logging
 
-from schemas.monitoring import AnomalyDetectionRequest, AnomalyDetectionResponse
+from schemas.monitoring import AlertLevel, AnomalyDetectionRequest, AnomalyDetectionResponse
+from services.backend_push import backend_pusher
 from services.anomaly_service import AnomalyDetectionService
 
 logger = logging.getLogger(__name__)
@@ -22,6 +23,15 @@ async def detect_anomaly(request: AnomalyDetectionRequest) -> AnomalyDetectionRe
 
         response = AnomalyDetectionService.detect_anomalies(request)
 
+        # 이상이 있으면 백엔드로 경보 전송 (낙상 / 긴급 경보는 묶지 않고 즉시)
+        if response.anomalies_detected:
+            critical = response.alert_level == AlertLevel.CRITICAL or any(
+                a.type == "fall_detected" for a in response.detected_anomalies
+            )
+            backend_pusher.publish(
+                "anomaly_alert", response.model_dump(mode="json"), critical=critical
+            )
+
         return response
 
     except Exception as e:
@@ -0,0 +1,87 @@
+"""
+LSTM 아티팩트 로드 시간 벤치마크: torch.load(.pt) vs 텐서 아티팩트(.tensors)
+
+1) 같은 프로세스 (torch import 이후, 페이지 캐시 warm)
+    torch.load          : pickle state_dict 역직렬화 + 텐서 복사
+    tensors (numpy)     : 헤더 파싱 + 메모리맵 (복사 없음)
+    tensors → torch     : 메모리맵 버퍼를 torch.from_numpy로 감쌈 (복사 없음)
+2) 새 프로세스 콜드 로드 (import 포함): torch 필요 여부 차이
+
+사용법 (ai/ 에서 실행):
+    python benchmarks/bench_lstm_artifact.py
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import torch
+
+from features.feature_schema import MONITORING_SCHEMA_V1
+from models.lstm_model import AnomalyLSTM
+from models.tensor_artifact import LSTMArtifact, lstm_meta, write_tensor_artifact
+
+AI_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# (hidden_size, num_layers): 서비스 기본 모델 + 더 큰 모델
+CONFIGS = [(32, 1), (256, 2), (1024, 3)]
+
+COLD_TORCH = "import time; t=time.perf_counter(); import torch; torch.load({path!r}, map_location='cpu', weights_only=True); print(time.perf_counter()-t)"
+COLD_TENSORS = (
+    "import time, sys; sys.path.insert(0, {ai_dir!r}); t=time.perf_counter(); "
+    "from models.tensor_artifact import LSTMArtifact; LSTMArtifact({path!r}); print(time.perf_counter()-t)"
+)
+
+
+def timed(fn, repeat: int) -> float:
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - start)
+    return statistics.median(samples) * 1000
+
+
+def cold(code: str, repeat: int) -> float:
+    samples = [
+        float(subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True).stdout)
+        for _ in range(repeat)
+    ]
+    return statistics.median(samples) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--cold-repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    tmp_dir = tempfile.mkdtemp()
+    print(f"{'hidden x layers':<16} {'size':>9} {'torch.load':>11} {'tensors':>9} {'→torch':>9} "
+          f"{'cold torch':>11} {'cold tensors':>13}")
+    for hidden, layers in CONFIGS:
+        model = AnomalyLSTM(input_size=MONITORING_SCHEMA_V1.dim, hidden_size=hidden, num_layers=layers)
+        state = model.state_dict()
+        pt_path = os.path.join(tmp_dir, f"lstm_{hidden}_{layers}.pt")
+        tensors_path = os.path.join(tmp_dir, f"lstm_{hidden}_{layers}.tensors")
+        torch.save(state, pt_path)
+        write_tensor_artifact(tensors_path, state, lstm_meta(state, MONITORING_SCHEMA_V1))
+
+        t_torch = timed(lambda: torch.load(pt_path, map_location="cpu", weights_only=True), args.repeat)
+        t_tensors = timed(lambda: LSTMArtifact(tensors_path), args.repeat)
+        t_to_torch = timed(lambda: LSTMArtifact(tensors_path, mode="c").to_torch(), args.repeat)
+        c_torch = cold(COLD_TORCH.format(path=pt_path), args.cold_repeat)
+        c_tensors = cold(COLD_TENSORS.format(ai_dir=AI_DIR, path=tensors_path), args.cold_repeat)
+
+        size_kb = os.path.getsize(tensors_path) / 1024
+        print(f"{hidden:>6} x {layers:<7} {size_kb:>7.0f}KB {t_torch:>9.2f}ms {t_tensors:>7.2f}ms "
+              f"{t_to_torch:>7.2f}ms {c_torch:>9.0f}ms {c_tensors:>11.0f}ms")
+
+
+if __name__ == "__main__":
+    main()
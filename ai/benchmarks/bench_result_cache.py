@@ -0,0 +1,136 @@
+"""
+공유 추론 결과 캐시 벤치마크: 조회 비용 vs 재계산 비용, 워커 간 공유 적중률
+
+1) 단건 비용 (µs, 중앙값)
+    cache hit / miss / put : 키 해시(blake2b) + 세트 1개 스캔
+    recompute              : sklearn IsolationForest.decision_function / 메모리맵 포레스트 /
+                             건강점수 회귀 모델 predict (단일 행)
+2) 워커 N개가 Zipf 분포 요청을 나눠 처리할 때 적중률
+    shared  : 한 캐시 파일을 공유 (이 구현)
+    private : 워커마다 따로 (프로세스 내 캐시와 같음)
+3) 용량별 적중률 / 교체 건수 (근사 LRU)
+
+사용법 (ai/ 에서 실행):
+    python benchmarks/bench_result_cache.py
+"""
+import argparse
+import multiprocessing
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+from sklearn.ensemble import IsolationForest
+from sklearn.linear_model import LinearRegression
+
+from features.feature_schema import DEFAULT_MONITORING_SCHEMA, get_schema
+from models.shared_forest import SharedIsolationForest, export_isolation_forest
+from utils.result_cache import ResultCache
+
+VERSION = "bench0000001"
+
+
+def per_call_us(fn, args_list, repeat: int = 5) -> float:
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for args in args_list:
+            fn(*args)
+        samples.append((time.perf_counter() - start) / len(args_list))
+    return statistics.median(samples) * 1e6
+
+
+def zipf_keys(n_requests: int, n_distinct: int, seed: int) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    ranks = np.arange(1, n_distinct + 1, dtype=np.float64)
+    p = 1.0 / ranks ** 1.1
+    return rng.choice(n_distinct, size=n_requests, p=p / p.sum())
+
+
+def _worker(path, n_sets, ways, keys, dim, out):
+    cache = ResultCache(path, n_sets, ways)
+    for k in keys:
+        x = np.full(dim, float(k))
+        if cache.get(VERSION, x) is None:
+            cache.put(VERSION, x, (float(k),))
+    out.put((cache.local[0], cache.local[1]))
+
+
+def run_workers(tmp, shared: bool, n_workers, n_sets, ways, keys, dim) -> float:
+    ctx = multiprocessing.get_context("fork")
+    out = ctx.Queue()
+    processes = []
+    for w, part in enumerate(np.array_split(keys, n_workers)):
+        path = os.path.join(tmp, "shared.bin" if shared else f"private{w}.bin")
+        processes.append(ctx.Process(target=_worker, args=(path, n_sets, ways, part, dim, out)))
+    for p in processes:
+        p.start()
+    results = [out.get() for _ in processes]
+    for p in processes:
+        p.join()
+    hits = sum(h for h, _ in results)
+    return hits / sum(h + m for h, m in results)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="공유 추론 결과 캐시 벤치마크")
+    parser.add_argument("--keys", type=int, default=2000)
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--requests", type=int, default=40000)
+    parser.add_argument("--distinct", type=int, default=20000)
+    args = parser.parse_args()
+
+    schema = get_schema(DEFAULT_MONITORING_SCHEMA)
+    dim = schema.dim
+    rng = np.random.default_rng(0)
+    X = rng.normal(size=(args.keys, dim))
+
+    with tempfile.TemporaryDirectory() as tmp:
+        # 1) 단건 비용
+        iforest = IsolationForest(n_estimators=100, random_state=0).fit(rng.normal(size=(2000, dim)))
+        forest_path = os.path.join(tmp, "iforest.forest")
+        export_isolation_forest(iforest, forest_path, {"schema": schema.key})
+        shared_forest = SharedIsolationForest(forest_path)
+        health = LinearRegression().fit(rng.random((500, 4)), rng.random(500))
+        H = rng.random((args.keys, 4))
+
+        cache = ResultCache(os.path.join(tmp, "bench.bin"), 8192, 8)
+        rows = [(VERSION, X[i]) for i in range(args.keys)]
+        miss_us = per_call_us(cache.get, rows, repeat=1)
+        put_us = per_call_us(lambda v, x: cache.put(v, x, (0.1,)), rows, repeat=1)
+        hit_us = per_call_us(cache.get, rows)
+        singles = [(X[i:i + 1],) for i in range(min(args.keys, 300))]
+
+        print(f"단건 비용 (µs, {dim}차원 모니터링 벡터 / 4차원 건강 피처)")
+        print(f"  cache hit                          {hit_us:9.1f}")
+        print(f"  cache miss                         {miss_us:9.1f}")
+        print(f"  cache put                          {put_us:9.1f}")
+        print(f"  IsolationForest.decision_function  {per_call_us(iforest.decision_function, singles, 3):9.1f}")
+        print(f"  SharedIsolationForest (mmap)       {per_call_us(shared_forest.decision_function, singles, 3):9.1f}")
+        print(f"  health LinearRegression.predict    {per_call_us(health.predict, [(H[i:i + 1],) for i in range(300)], 3):9.1f}")
+
+        # 2) 워커 간 공유
+        keys = zipf_keys(args.requests, args.distinct, seed=1)
+        print(f"\n워커 {args.workers}개, 요청 {args.requests}건 (Zipf, 서로 다른 벡터 {args.distinct}개), 용량 8192")
+        for shared in (False, True):
+            ratio = run_workers(tmp, shared, args.workers, 1024, 8, keys, dim)
+            print(f"  {'shared ' if shared else 'private'} 적중률 {ratio:6.1%}")
+
+        # 3) 용량별
+        print("\n용량별 (단일 프로세스, 같은 요청열)")
+        for slots in (1024, 4096, 16384, 65536):
+            cache = ResultCache(os.path.join(tmp, f"cap{slots}.bin"), slots // 8, 8)
+            for k in keys:
+                x = np.full(dim, float(k))
+                if cache.get(VERSION, x) is None:
+                    cache.put(VERSION, x, (float(k),))
+            stats = cache.stats()
+            print(f"  {slots:6d}슬롯  적중률 {stats['hit_ratio']:6.1%}  교체 {stats['evictions']:6d}  점유 {stats['occupied']}")
+
+
+if __name__ == "__main__":
+    main()
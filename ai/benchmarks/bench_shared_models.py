@@ -0,0 +1,131 @@
+"""
+워커 수별 모델 메모리 벤치마크 (RSS / PSS / USS)
+
+200트리 Isolation Forest를 워커 N개(1, 4, 16)에서 서비스할 때 세 가지 배포 방식 비교
+    per_worker  : 워커마다 joblib.load (uvicorn --workers와 같은 방식)
+    preload     : 마스터가 로드 → gc.freeze() → fork (serve.py)
+    mmap        : 워커마다 메모리맵 아티팩트 열기 (MODEL_SHARED_MEMORY=true)
+
+모든 방식에서 라이브러리 import는 fork 전에 끝내므로 차이는 모델 메모리.
+PSS = 공유 페이지를 공유 프로세스 수로 나눈 값 → 합계가 실제 물리 메모리 사용량
+
+사용법 (ai/ 에서 실행, Linux 전용):
+    python benchmarks/bench_shared_models.py --workers 1 4 16
+"""
+import argparse
+import gc
+import os
+import sys
+import tempfile
+
+import joblib
+import numpy as np
+from sklearn.ensemble import IsolationForest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from features.feature_schema import MONITORING_SCHEMA_V1
+from models.shared_forest import SharedIsolationForest, export_isolation_forest
+
+MODES = ("per_worker", "preload", "mmap")
+
+
+def smaps_rollup(pid: int) -> dict:
+    """/proc/<pid>/smaps_rollup → kB 단위 Rss / Pss / USS"""
+    values = {}
+    with open(f"/proc/{pid}/smaps_rollup") as f:
+        for line in f:
+            parts = line.split()
+            if len(parts) >= 2 and parts[0].endswith(":") and parts[1].isdigit():
+                values[parts[0][:-1]] = int(parts[1])
+    return {
+        "rss": values.get("Rss", 0),
+        "pss": values.get("Pss", 0),
+        "uss": values.get("Private_Clean", 0) + values.get("Private_Dirty", 0),
+    }
+
+
+def serve(model_or_loader, X: np.ndarray, ready_w: int, release_r: int) -> None:
+    """워커: 모델 준비 → 추론으로 페이지 터치 → 측정될 때까지 대기"""
+    model = model_or_loader() if callable(model_or_loader) else model_or_loader
+    for row in X:
+        model.decision_function(row.reshape(1, -1))
+    os.write(ready_w, b"1")
+    os.read(release_r, 1)
+    os._exit(0)
+
+
+def run(mode: str, n_workers: int, pkl_path: str, forest_path: str, X: np.ndarray) -> dict:
+    if mode == "preload":
+        target = joblib.load(pkl_path)
+        gc.collect()
+        gc.freeze()
+    elif mode == "per_worker":
+        target = lambda: joblib.load(pkl_path)
+    else:
+        target = lambda: SharedIsolationForest(forest_path)
+
+    ready_r, ready_w = os.pipe()
+    release_r, release_w = os.pipe()
+    pids = []
+    for _ in range(n_workers):
+        pid = os.fork()
+        if pid == 0:
+            serve(target, X, ready_w, release_r)
+        pids.append(pid)
+
+    for _ in range(n_workers):
+        os.read(ready_r, 1)
+    stats = [smaps_rollup(pid) for pid in pids]
+    os.write(release_w, b"1" * n_workers)
+    for pid in pids:
+        os.waitpid(pid, 0)
+    for fd in (ready_r, ready_w, release_r, release_w):
+        os.close(fd)
+
+    if mode == "preload":
+        gc.unfreeze()
+        del target
+        gc.collect()
+
+    return {
+        key: sum(s[key] for s in stats) / n_workers
+        for key in ("rss", "pss", "uss")
+    } | {"pss_total": sum(s["pss"] for s in stats)}
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 4, 16])
+    parser.add_argument("--trees", type=int, default=200)
+    parser.add_argument("--requests", type=int, default=50)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(42)
+    dim = MONITORING_SCHEMA_V1.dim
+    model = IsolationForest(n_estimators=args.trees, contamination=0.05, random_state=42)
+    model.fit(rng.normal(size=(5000, dim)))
+    X = rng.normal(size=(args.requests, dim))
+
+    tmp_dir = tempfile.mkdtemp()
+    pkl_path = os.path.join(tmp_dir, "isolation_forest.pkl")
+    forest_path = os.path.join(tmp_dir, "isolation_forest.forest")
+    joblib.dump(model, pkl_path)
+    export_isolation_forest(model, forest_path)
+    del model
+    gc.collect()
+
+    print(f"pickle {os.path.getsize(pkl_path) / 1024:.0f}KB, "
+          f"mmap artifact {os.path.getsize(forest_path) / 1024:.0f}KB, trees={args.trees}")
+    print(f"{'mode':<11} {'workers':>7} {'RSS/worker':>11} {'PSS/worker':>11} {'USS/worker':>11} {'PSS total':>10}")
+    for n in args.workers:
+        for mode in MODES:
+            r = run(mode, n, pkl_path, forest_path, X)
+            print(
+                f"{mode:<11} {n:>7} {r['rss'] / 1024:>9.1f}MB {r['pss'] / 1024:>9.1f}MB "
+                f"{r['uss'] / 1024:>9.1f}MB {r['pss_total'] / 1024:>8.1f}MB"
+            )
+
+
+if __name__ == "__main__":
+    main()
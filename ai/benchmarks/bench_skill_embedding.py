@@ -0,0 +1,94 @@
+"""
+스킬 임베딩 인덱스 검색 지연 벤치마크
+
+합성 어휘(군집 구조, 128차원)를 .npy로 저장 후 메모리맵으로 로드해
+구직자 1명분 질의(스킬 5개, 이웃 16개)의 전수 탐색 / IVF 지연과 IVF recall 측정
+
+사용법 (ai/ 에서 실행):
+    python benchmarks/bench_skill_embedding.py --sizes 1000 10000 100000
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from features.skill_embedding import SkillEmbeddingIndex, normalize_rows
+
+
+def build_vectors(rng: np.random.Generator, n_skills: int, dim: int) -> np.ndarray:
+    """군집 중심 + 잡음 (실제 어휘처럼 유사 스킬 묶음이 있는 분포)"""
+    n_clusters = max(1, n_skills // 20)
+    centers = rng.standard_normal((n_clusters, dim)).astype(np.float32)
+    assign = rng.integers(0, n_clusters, size=n_skills)
+    return normalize_rows(centers[assign] + 0.5 * rng.standard_normal((n_skills, dim)))
+
+
+def percentile_ms(samples):
+    arr = np.array(samples) * 1000
+    return np.percentile(arr, 50), np.percentile(arr, 95)
+
+
+def run(size: int, args, rng: np.random.Generator, tmpdir: str):
+    path = os.path.join(tmpdir, f"skills_{size}.npy")
+    skills = [f"skill_{i}" for i in range(size)]
+    index = SkillEmbeddingIndex(skills, build_vectors(rng, size, args.dim))
+    n_lists = max(1, int(np.sqrt(size)))
+
+    start = time.perf_counter()
+    index.build_ivf(n_lists)
+    build_sec = time.perf_counter() - start
+    index.save(path)
+
+    loaded = SkillEmbeddingIndex.load(path)
+    queries = [
+        np.asarray(loaded.vectors[rng.choice(size, size=5, replace=False)])
+        for _ in range(args.queries)
+    ]
+
+    brute, ivf, recall = [], [], []
+    for q in queries:
+        start = time.perf_counter()
+        exact_ids, _ = loaded.search(q, k=args.k)
+        brute.append(time.perf_counter() - start)
+
+        start = time.perf_counter()
+        approx_ids, _ = loaded.search(q, k=args.k, n_probe=args.n_probe)
+        ivf.append(time.perf_counter() - start)
+
+        recall.append(np.mean([
+            len(set(e) & set(a)) / len(e) for e, a in zip(exact_ids.tolist(), approx_ids.tolist())
+        ]))
+
+    b50, b95 = percentile_ms(brute)
+    i50, i95 = percentile_ms(ivf)
+    print(
+        f"{size:>8} | lists {n_lists:>4} (build {build_sec:5.2f}s) | "
+        f"brute p50 {b50:7.3f} p95 {b95:7.3f} ms | "
+        f"ivf(probe {args.n_probe}) p50 {i50:7.3f} p95 {i95:7.3f} ms | "
+        f"recall@{args.k} {np.mean(recall):.3f}"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="스킬 임베딩 검색 벤치마크")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 100000])
+    parser.add_argument("--dim", type=int, default=128)
+    parser.add_argument("--k", type=int, default=16)
+    parser.add_argument("--n-probe", type=int, default=8)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.seed)
+    with tempfile.TemporaryDirectory() as tmpdir:
+        for size in args.sizes:
+            run(size, args, rng, tmpdir)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+"""
+스킬 역색인 후보 생성 벤치마크
+
+합성 카탈로그(1만~100만 공고)에서 구직자 1명 Top-K 랭킹의
+후보 축소율(pruning ratio)과 지연 시간을 전체 스캔과 비교
+
+사용법 (ai/ 에서 실행):
+    python benchmarks/bench_skill_index.py --sizes 10000 100000 1000000
+"""
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config.settings import settings
+from services.matching_service import MatchingService
+from services.posting_catalog import PostingCatalog
+
+EDUCATION = ["", "high_school", "bachelor", "master"]
+
+
+def build_catalog(rng: np.random.Generator, n_postings: int, n_skills: int) -> PostingCatalog:
+    """Zipf 분포 스킬 인기도를 가진 합성 공고 카탈로그"""
+    catalog = PostingCatalog()
+    popularity = 1.0 / np.arange(1, n_skills + 1)
+    popularity /= popularity.sum()
+
+    n_required = rng.integers(1, 6, size=n_postings)
+    n_required[rng.random(n_postings) < 0.01] = 0  # 요구 스킬 없는 공고 1%
+    skill_draws = rng.choice(n_skills, size=int(n_required.sum()), p=popularity)
+    experience = rng.integers(0, 10, size=n_postings)
+    education = rng.integers(0, len(EDUCATION), size=n_postings)
+
+    offset = 0
+    for i in range(n_postings):
+        k = n_required[i]
+        catalog.add_posting(i, {
+            "required_skills": [f"skill_{s}" for s in skill_draws[offset:offset + k]],
+            "required_experience": int(experience[i]),
+            "education_level": EDUCATION[education[i]],
+        })
+        offset += k
+
+    # 10% 마감 (지연 삭제 + compact 경로 포함)
+    for posting_id in rng.choice(n_postings, size=n_postings // 10, replace=False):
+        catalog.close_posting(int(posting_id))
+
+    catalog.arrays()
+    return catalog
+
+
+def make_seekers(rng: np.random.Generator, n_seekers: int, n_skills: int):
+    popularity = 1.0 / np.arange(1, n_skills + 1)
+    popularity /= popularity.sum()
+    return [
+        {
+            "skills": [f"skill_{s}" for s in rng.choice(n_skills, size=rng.integers(3, 11), p=popularity)],
+            "experience": int(rng.integers(0, 15)),
+            "education": EDUCATION[int(rng.integers(1, len(EDUCATION)))],
+        }
+        for _ in range(n_seekers)
+    ]
+
+
+def time_ranking(service, catalog, seekers, top_k, pruning):
+    settings.MATCHING_CANDIDATE_PRUNING = pruning
+    latencies, candidates = [], []
+    for seeker in seekers:
+        start = time.perf_counter()
+        response = service.rank_catalog(seeker, catalog, None, top_k)
+        latencies.append((time.perf_counter() - start) * 1000)
+        candidates.append(response.total_candidates)
+    return np.array(latencies), np.array(candidates)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="스킬 역색인 후보 생성 벤치마크")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000, 1_000_000])
+    parser.add_argument("--skills", type=int, default=5000, help="스킬 어휘 크기")
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--top-k", type=int, default=10)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    service = MatchingService()
+    service.model = None
+
+    print(f"{'postings':>10} {'active':>9} {'pruned%':>8} {'fallback%':>9} "
+          f"{'full p50':>9} {'full p95':>9} {'index p50':>10} {'index p95':>10}  (ms)")
+
+    for n_postings in args.sizes:
+        rng = np.random.default_rng(args.seed)
+        catalog = build_catalog(rng, n_postings, args.skills)
+        seekers = make_seekers(rng, args.queries, args.skills)
+        n_active = int(catalog.arrays().active.sum())
+
+        full_ms, _ = time_ranking(service, catalog, seekers, args.top_k, pruning=False)
+        index_ms, scored = time_ranking(service, catalog, seekers, args.top_k, pruning=True)
+
+        # 전체 스캔으로 돌아간 질의는 후보 수 == 활성 공고 수
+        fallback = scored == n_active
+        pruning_ratio = 1.0 - scored[~fallback].mean() / n_active if (~fallback).any() else 0.0
+
+        print(
+            f"{n_postings:>10} {n_active:>9} {pruning_ratio * 100:>7.1f}% {fallback.mean() * 100:>8.1f}% "
+            f"{np.percentile(full_ms, 50):>9.2f} {np.percentile(full_ms, 95):>9.2f} "
+            f"{np.percentile(index_ms, 50):>10.2f} {np.percentile(index_ms, 95):>10.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,149 @@
+"""
+콜드 스타트 벤치마크 + import 시간 리포트
+
+1) -X importtime 분석: 패키지별 self 시간 합계, 누적 시간 상위 모듈,
+   무거운 라이브러리(torch / sklearn / joblib / pandas / scipy)가 기동 시 import 되는지
+2) 기동 시간: 새 프로세스에서 import main → startup 이벤트 → GET /health 가
+   ready가 될 때까지 (모델 파일이 없으면 바로 ready), N회 중앙값을 예산과 비교
+3) 지연 초기화 비용: 각 서비스 엔드포인트 첫 요청 / 두 번째 요청 지연
+
+사용법 (ai/ 에서 실행):
+    python benchmarks/bench_startup.py --runs 5 --budget-ms 1500
+예산을 넘으면 종료 코드 1 (CI 게이트용)
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+from collections import defaultdict
+
+AI_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+HEAVY_MODULES = ("torch", "sklearn", "joblib", "pandas", "scipy")
+
+# 새 프로세스에서 실행: 기동 단계별 시간(ms)을 JSON 한 줄로 출력
+STARTUP_PROBE = r"""
+import json, sys, time
+t0 = time.perf_counter()
+import main
+t_import = time.perf_counter()
+from fastapi.testclient import TestClient
+with TestClient(main.app) as client:
+    t_startup = time.perf_counter()
+    while True:
+        response = client.get("/health")
+        if response.status_code == 200 or time.perf_counter() - t0 > 60:
+            break
+        time.sleep(0.005)
+    t_ready = time.perf_counter()
+
+    first_hit = {}
+    for name, path, body in ENDPOINTS:
+        timings = []
+        for _ in range(2):
+            start = time.perf_counter()
+            client.post(path, json=body)
+            timings.append((time.perf_counter() - start) * 1000)
+        first_hit[name] = timings
+
+print(json.dumps({
+    "import_ms": (t_import - t0) * 1000,
+    "startup_ms": (t_startup - t_import) * 1000,
+    "ready_ms": (t_ready - t0) * 1000,
+    "heavy_loaded": [m for m in HEAVY if m in sys.modules],
+    "first_hit": first_hit,
+}))
+"""
+
+ENDPOINTS = [
+    ("job_risk", "/api/v1/job-risk/predict", {
+        "job_type": "construction",
+        "work_environment": {"height_work": True},
+        "safety_equipment": ["helmet"],
+        "experience_years": 3,
+    }),
+    ("matching", "/api/v1/matching/score", {
+        "job_seeker_profile": {"skills": ["용접"], "experience": 3, "education": "high_school"},
+        "job_posting": {"required_skills": ["용접"], "required_experience": 2, "education_level": "high_school"},
+    }),
+]
+
+
+def importtime_report(top: int) -> None:
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import main"],
+        cwd=AI_DIR, capture_output=True, text=True,
+    )
+    rows = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        rows.append((int(self_us), int(cumulative_us), name.rstrip()))
+
+    by_package = defaultdict(int)
+    for self_us, _, name in rows:
+        by_package[name.strip().split(".")[0]] += self_us
+    total = sum(by_package.values())
+
+    print(f"== import main: 모듈 {len(rows)}개, self 합계 {total / 1000:.1f}ms ==")
+    print("-- 패키지별 self 시간 --")
+    for package, us in sorted(by_package.items(), key=lambda kv: -kv[1])[:top]:
+        print(f"  {package:<24} {us / 1000:>8.1f}ms  {us / total * 100:>5.1f}%")
+
+    print("-- 누적 시간 상위 모듈 (프로젝트 모듈) --")
+    project = {"main", "api", "openApi", "services", "features", "models", "schemas", "utils", "config"}
+    own = [r for r in rows if r[2].strip().split(".")[0] in project]
+    for self_us, cumulative_us, name in sorted(own, key=lambda r: -r[1])[:top]:
+        print(f"  {name.strip():<36} {cumulative_us / 1000:>8.1f}ms (self {self_us / 1000:.1f}ms)")
+
+    loaded = {r[2].strip() for r in rows}
+    heavy = [m for m in HEAVY_MODULES if m in loaded]
+    print(f"-- 기동 시 import된 무거운 라이브러리: {heavy or '없음'}")
+
+
+def startup_runs(runs: int) -> list:
+    code = (
+        f"ENDPOINTS = {ENDPOINTS!r}\nHEAVY = {HEAVY_MODULES!r}\n" + STARTUP_PROBE
+    )
+    results = []
+    for _ in range(runs):
+        out = subprocess.run(
+            [sys.executable, "-c", code], cwd=AI_DIR, capture_output=True, text=True, check=True,
+        )
+        results.append(json.loads(out.stdout.strip().splitlines()[-1]))
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--budget-ms", type=float, default=1500.0, help="ready까지 중앙값 예산")
+    parser.add_argument("--top", type=int, default=12)
+    args = parser.parse_args()
+
+    importtime_report(args.top)
+
+    results = startup_runs(args.runs)
+    print(f"\n== 기동 시간 ({args.runs}회 중앙값) ==")
+    for key in ("import_ms", "startup_ms", "ready_ms"):
+        values = [r[key] for r in results]
+        print(f"  {key:<11} {statistics.median(values):>8.1f}ms  (min {min(values):.1f}, max {max(values):.1f})")
+    print("-- 지연 초기화: 엔드포인트 첫 요청 / 두 번째 요청 (중앙값) --")
+    for name, _, _ in ENDPOINTS:
+        first = statistics.median(r["first_hit"][name][0] for r in results)
+        second = statistics.median(r["first_hit"][name][1] for r in results)
+        print(f"  {name:<11} {first:>8.1f}ms / {second:.1f}ms")
+
+    ready = statistics.median(r["ready_ms"] for r in results)
+    heavy = sorted({m for r in results for m in r["heavy_loaded"]})
+    ok = ready <= args.budget_ms
+    print(f"\n예산 {args.budget_ms:.0f}ms: {'통과' if ok else '초과'} (ready {ready:.1f}ms), "
+          f"ready 시점 무거운 라이브러리: {heavy or '없음'}")
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,418 @@
+"""
+합성 부하 생성기: 시니어별 센서 스트림 + 건강점수 / 매칭 요청
+
+- 시니어마다 안정 심박 / 활동 전이(마르코프) / 걸음수 누적으로 연속 센서 스트림 생성
+    심박 = 활동별 목표 심박으로 수렴하는 OU 과정 (+ 잡음)
+    급등(spike) / 낙상(fall)을 확률적으로 주입하고 시각을 기록 → 탐지 재현율
+- 건강점수 / 매칭 요청은 일부를 이전 요청 그대로 반복 (인기 시니어 / 공고 Zipf)
+- 목표 RPS(개방 루프, 포아송 도착) 또는 동시 요청 수(폐쇄 루프)로 구동
+- 결과: 엔드포인트별 처리량, 지연 p50/p90/p99, 오류율, 주입 이상 탐지 재현율
+
+사용법 (ai/ 에서 실행):
+    python benchmarks/load_generator.py --rps 50 --duration 30              # 앱을 프로세스 안에서 구동
+    python benchmarks/load_generator.py --url http://127.0.0.1:5000 --concurrency 32
+    python benchmarks/load_generator.py --mix sensor=1 --spike-rate 0.01 --fall-rate 0.005
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import sys
+import time
+from collections import defaultdict
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Optional, Set, Tuple
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import httpx
+import numpy as np
+
+SENSOR_PATH = "/api/ml/v1/monitoring/detect-anomaly"
+HEALTH_PATH = "/api/ml/v1/health/calculate"
+MATCHING_PATH = "/api/v1/matching/score"
+
+# 활동별 목표 심박 (안정 심박 대비), 걸음수 / 분
+ACTIVITY_HR_OFFSET = {"lying": -6, "sitting": 0, "standing": 5, "walking": 22, "moving": 14}
+ACTIVITY_STEPS = {"lying": 0, "sitting": 0, "standing": 2, "walking": 90, "moving": 40}
+DEFAULT_ACTIVITY_MIX = {"sitting": 0.35, "standing": 0.2, "walking": 0.25, "moving": 0.1, "lying": 0.1}
+
+# 이 유형이 주입 시각에 있으면 탐지로 인정
+SPIKE_TYPES = {"heart_rate_spike", "high_heart_rate_critical", "lstm_anomaly", "isolation_forest_anomaly"}
+FALL_TYPES = {"fall_detected"}
+
+CHRONIC_CONDITIONS = ("hypertension", "diabetes", "arthritis", "heart_disease")
+SKILLS = ("cleaning", "cooking", "driving", "security", "childcare", "gardening", "sales", "office", "caregiving")
+EDUCATION = ("high_school", "associate", "bachelor")
+
+
+def parse_mix(text: str, keys) -> Dict[str, float]:
+    mix = {k: 0.0 for k in keys}
+    for part in text.split(","):
+        name, _, weight = part.partition("=")
+        if name not in mix:
+            raise SystemExit(f"알 수 없는 항목: {name} (가능: {', '.join(keys)})")
+        mix[name] = float(weight)
+    total = sum(mix.values())
+    return {k: v / total for k, v in mix.items()}
+
+
+def zipf_index(rng: random.Random, n: int, s: float = 1.1) -> int:
+    """0..n-1, P(k) ∝ 대략 (k+1)^-(s+1) (파레토 분포 내림, 앞쪽일수록 자주)"""
+    while True:
+        k = int(rng.paretovariate(s)) - 1
+        if k < n:
+            return k
+
+
+# =========================================================
+# 센서 스트림
+# =========================================================
+class SeniorStream:
+    """시니어 1명의 연속 센서 스트림 (1분 간격)"""
+
+    def __init__(self, senior_id: int, rng: random.Random, args, start: datetime):
+        self.senior_id = senior_id
+        self.rng = rng
+        self.args = args
+        self.resting_hr = rng.uniform(58, 80)
+        self.hr = self.resting_hr
+        self.activity = "sitting"
+        self.steps = 0
+        self.now = start
+        self.activities = list(args.activity_mix)
+        self.weights = [args.activity_mix[a] for a in self.activities]
+        self.spike_left = 0
+
+    def next_window(self, size: int) -> Tuple[List[dict], Set[str], Set[str]]:
+        """센서 측정 size개 + 주입한 급등 / 낙상 시각"""
+        readings, spikes, falls = [], set(), set()
+        args, rng = self.args, self.rng
+        for _ in range(size):
+            self.now += timedelta(minutes=1)
+            # 활동 전이: 평균 체류 activity_dwell분
+            if rng.random() < 1.0 / args.activity_dwell:
+                self.activity = rng.choices(self.activities, self.weights)[0]
+
+            # OU 과정: 목표 심박으로 수렴 + 잡음
+            target = self.resting_hr + ACTIVITY_HR_OFFSET[self.activity]
+            self.hr += args.hr_reversion * (target - self.hr) + rng.gauss(0, args.hr_noise)
+            hr = self.hr
+
+            timestamp = self.now.isoformat()
+            if self.spike_left == 0 and rng.random() < args.spike_rate:
+                self.spike_left = rng.randint(1, 3)
+            if self.spike_left > 0:
+                hr = self.resting_hr + rng.uniform(70, 110)
+                self.spike_left -= 1
+                spikes.add(timestamp)
+
+            self.steps += int(ACTIVITY_STEPS[self.activity] * rng.uniform(0.7, 1.3))
+            activity = self.activity
+            posture = {"angle": 10.0 if activity == "lying" else rng.uniform(80, 100), "balance": "normal"}
+            if activity in ("walking", "standing") and rng.random() < args.fall_rate:
+                posture = {"angle": rng.uniform(5, 35), "balance": "unstable"}
+                falls.add(timestamp)
+
+            readings.append({
+                "timestamp": timestamp,
+                "heart_rate": int(min(200, max(30, round(hr)))),
+                "step_count": self.steps,
+                "posture": posture,
+                "activity": activity,
+            })
+        return readings, spikes, falls
+
+
+# =========================================================
+# 건강점수 / 매칭 요청 (일부 반복)
+# =========================================================
+def new_health_request(rng: random.Random, senior_id: int) -> dict:
+    return {
+        "senior_profile_id": senior_id,
+        "height_cm": int(rng.gauss(162, 8)),
+        "weight_kg": round(rng.gauss(62, 10), 1),
+        "chronic_conditions": {c: rng.random() < 0.3 for c in CHRONIC_CONDITIONS},
+        "risk_flags": {
+            "mobility_limited": round(rng.betavariate(2, 5), 2),
+            "cognitive_decline": round(rng.betavariate(1.5, 6), 2),
+        },
+    }
+
+
+def new_matching_request(rng: random.Random) -> dict:
+    return {
+        "job_seeker_profile": {
+            "skills": rng.sample(SKILLS, rng.randint(1, 4)),
+            "experience": rng.randint(0, 30),
+            "education": rng.choice(EDUCATION),
+        },
+        "job_posting": {
+            "required_skills": rng.sample(SKILLS, rng.randint(1, 3)),
+            "required_experience": rng.randint(0, 10),
+            "education_level": rng.choice(EDUCATION),
+        },
+    }
+
+
+class RepeatingPool:
+    """repeat 비율만큼 이전 요청을 Zipf 순위로 재사용 (인기 항목일수록 자주)"""
+
+    def __init__(self, rng: random.Random, repeat: float, make, max_size: int = 5000):
+        self.rng = rng
+        self.repeat = repeat
+        self.make = make
+        self.items: List[dict] = []
+        self.max_size = max_size
+
+    def next(self) -> dict:
+        if self.items and self.rng.random() < self.repeat:
+            return self.items[zipf_index(self.rng, len(self.items))]
+        item = self.make()
+        if len(self.items) < self.max_size:
+            self.items.append(item)
+        return item
+
+
+# =========================================================
+# 집계
+# =========================================================
+class Report:
+    def __init__(self):
+        self.latencies: Dict[str, List[float]] = defaultdict(list)
+        self.statuses: Dict[str, Dict[str, int]] = defaultdict(lambda: defaultdict(int))
+        self.injected = {"spike": 0, "fall": 0}
+        self.detected = {"spike": 0, "fall": 0}
+        self.readings = 0
+        self.false_positives = 0
+
+    def record(self, kind: str, seconds: float, status: str) -> None:
+        self.latencies[kind].append(seconds)
+        self.statuses[kind][status] += 1
+
+    def score_detection(self, response: dict, spikes: Set[str], falls: Set[str], n_readings: int) -> None:
+        found: Dict[str, Set[str]] = defaultdict(set)
+        for anomaly in response.get("detected_anomalies", []):
+            found[_normalize_ts(anomaly["timestamp"])].add(anomaly["type"])
+        self.readings += n_readings
+        self.injected["spike"] += len(spikes)
+        self.injected["fall"] += len(falls)
+        self.detected["spike"] += sum(1 for ts in spikes if found.get(_normalize_ts(ts), set()) & SPIKE_TYPES)
+        self.detected["fall"] += sum(1 for ts in falls if found.get(_normalize_ts(ts), set()) & FALL_TYPES)
+        injected = {_normalize_ts(ts) for ts in spikes | falls}
+        self.false_positives += sum(1 for ts in found if ts not in injected)
+
+    def summary(self, elapsed: float) -> dict:
+        endpoints = {}
+        for kind, samples in sorted(self.latencies.items()):
+            ms = np.asarray(samples) * 1000
+            statuses = dict(self.statuses[kind])
+            errors = sum(n for s, n in statuses.items() if not s.startswith("2"))
+            endpoints[kind] = {
+                "requests": len(samples),
+                "rps": round(len(samples) / elapsed, 1),
+                "p50_ms": round(float(np.percentile(ms, 50)), 2),
+                "p90_ms": round(float(np.percentile(ms, 90)), 2),
+                "p99_ms": round(float(np.percentile(ms, 99)), 2),
+                "max_ms": round(float(ms.max()), 2),
+                "error_rate": round(errors / len(samples), 4),
+                "statuses": statuses,
+            }
+        total = sum(len(s) for s in self.latencies.values())
+        return {
+            "elapsed_sec": round(elapsed, 2),
+            "requests": total,
+            "rps": round(total / elapsed, 1) if elapsed else 0.0,
+            "endpoints": endpoints,
+            "detection": {
+                "readings": self.readings,
+                "injected": self.injected,
+                "detected": self.detected,
+                "recall": {
+                    k: round(self.detected[k] / self.injected[k], 4) if self.injected[k] else None
+                    for k in self.injected
+                },
+                "false_positives_per_1k_readings": round(1000 * self.false_positives / self.readings, 2)
+                if self.readings else None,
+            },
+        }
+
+
+def _normalize_ts(value: str) -> str:
+    ts = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    if ts.tzinfo is None:
+        ts = ts.replace(tzinfo=timezone.utc)
+    return ts.astimezone(timezone.utc).isoformat()
+
+
+# =========================================================
+# 구동
+# =========================================================
+class LoadGenerator:
+    def __init__(self, client: httpx.AsyncClient, args):
+        self.client = client
+        self.args = args
+        self.rng = random.Random(args.seed)
+        start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+        self.streams = [
+            SeniorStream(i + 1, random.Random(args.seed * 1000 + i), args, start)
+            for i in range(args.seniors)
+        ]
+        self.health = RepeatingPool(
+            self.rng, args.health_repeat,
+            lambda: new_health_request(self.rng, self.rng.randint(1, args.seniors)),
+        )
+        self.matching = RepeatingPool(self.rng, args.matching_repeat, lambda: new_matching_request(self.rng))
+        self.kinds = list(args.mix)
+        self.kind_weights = [args.mix[k] for k in self.kinds]
+        self.report = Report()
+
+    async def one_request(self) -> None:
+        kind = self.rng.choices(self.kinds, self.kind_weights)[0]
+        spikes = falls = None
+        if kind == "sensor":
+            stream = self.rng.choice(self.streams)
+            readings, spikes, falls = stream.next_window(self.args.window)
+            path, body = SENSOR_PATH, {
+                "senior_profile_id": stream.senior_id,
+                "matching_id": stream.senior_id,
+                "sensor_readings": readings,
+            }
+        elif kind == "health":
+            path, body = HEALTH_PATH, self.health.next()
+        else:
+            path, body = MATCHING_PATH, self.matching.next()
+
+        start = time.perf_counter()
+        try:
+            response = await self.client.post(path, json=body)
+            status = str(response.status_code)
+        except httpx.HTTPError as e:
+            response, status = None, type(e).__name__
+        self.report.record(kind, time.perf_counter() - start, status)
+
+        if kind == "sensor" and response is not None and response.status_code == 200:
+            self.report.score_detection(response.json(), spikes, falls, self.args.window)
+
+    async def run_open_loop(self, rps: float, duration: float, max_in_flight: int) -> float:
+        """포아송 도착 (응답을 기다리지 않음, 동시 요청은 max_in_flight까지)"""
+        limiter = asyncio.Semaphore(max_in_flight)
+        tasks = set()
+
+        async def guarded():
+            try:
+                await self.one_request()
+            finally:
+                limiter.release()
+
+        start = time.perf_counter()
+        next_at = start
+        while next_at - start < duration:
+            delay = next_at - time.perf_counter()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            # 포화 시 도착이 밀림 (서버가 따라오지 못하면 실제 RPS가 목표보다 낮게 보고됨)
+            await limiter.acquire()
+            task = asyncio.create_task(guarded())
+            tasks.add(task)
+            task.add_done_callback(tasks.discard)
+            next_at += self.rng.expovariate(rps)
+        await asyncio.gather(*tasks)
+        return time.perf_counter() - start
+
+    async def run_closed_loop(self, concurrency: int, duration: float) -> float:
+        """동시 요청 concurrency개 유지 (응답이 오면 바로 다음 요청)"""
+        start = time.perf_counter()
+
+        async def worker():
+            while time.perf_counter() - start < duration:
+                await self.one_request()
+
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        return time.perf_counter() - start
+
+
+def _client(args) -> httpx.AsyncClient:
+    timeout = httpx.Timeout(args.timeout)
+    limits = httpx.Limits(max_connections=max(args.concurrency, args.max_in_flight))
+    if args.url:
+        return httpx.AsyncClient(base_url=args.url, timeout=timeout, limits=limits)
+
+    # 앱을 같은 프로세스에서 구동 (네트워크 없이 앱 자체 지연만)
+    from main import app
+    from models.loader import load_models
+
+    load_models()
+    return httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app), base_url="http://loadgen", timeout=timeout
+    )
+
+
+async def main_async(args) -> dict:
+    async with _client(args) as client:
+        generator = LoadGenerator(client, args)
+        if args.rps:
+            elapsed = await generator.run_open_loop(args.rps, args.duration, args.max_in_flight)
+        else:
+            elapsed = await generator.run_closed_loop(args.concurrency, args.duration)
+        return generator.report.summary(elapsed)
+
+
+def print_summary(summary: dict) -> None:
+    print(f"총 {summary['requests']}건 / {summary['elapsed_sec']}초 = {summary['rps']} req/s")
+    print(f"{'endpoint':<10}{'requests':>9}{'rps':>8}{'p50':>9}{'p90':>9}{'p99':>9}{'max':>9}{'errors':>8}")
+    for kind, e in summary["endpoints"].items():
+        print(
+            f"{kind:<10}{e['requests']:>9}{e['rps']:>8}{e['p50_ms']:>9}{e['p90_ms']:>9}"
+            f"{e['p99_ms']:>9}{e['max_ms']:>9}{e['error_rate']:>8.2%}"
+        )
+    d = summary["detection"]
+    if d["readings"]:
+        print(
+            f"탐지 재현율: spike {d['recall']['spike']} ({d['detected']['spike']}/{d['injected']['spike']}), "
+            f"fall {d['recall']['fall']} ({d['detected']['fall']}/{d['injected']['fall']}), "
+            f"오탐 {d['false_positives_per_1k_readings']}건 / 측정 1천건"
+        )
+
+
+def parse_args(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description="합성 부하 생성기")
+    parser.add_argument("--url", default=None, help="대상 서버 (없으면 앱을 프로세스 안에서 구동)")
+    parser.add_argument("--rps", type=float, default=0.0, help="목표 RPS (0이면 --concurrency 폐쇄 루프)")
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--max-in-flight", type=int, default=256, help="개방 루프 최대 동시 요청")
+    parser.add_argument("--duration", type=float, default=10.0)
+    parser.add_argument("--timeout", type=float, default=10.0)
+    parser.add_argument("--mix", default="sensor=0.5,health=0.3,matching=0.2")
+    parser.add_argument("--seed", type=int, default=0)
+    # 센서 스트림
+    parser.add_argument("--seniors", type=int, default=200)
+    parser.add_argument("--window", type=int, default=60, help="요청당 측정 수 (1분 간격)")
+    parser.add_argument("--activity-mix", default=",".join(f"{k}={v}" for k, v in DEFAULT_ACTIVITY_MIX.items()))
+    parser.add_argument("--activity-dwell", type=float, default=15.0, help="평균 활동 유지 시간 (분)")
+    parser.add_argument("--hr-reversion", type=float, default=0.3, help="목표 심박 수렴 속도 (0-1)")
+    parser.add_argument("--hr-noise", type=float, default=2.0, help="심박 잡음 표준편차 (bpm)")
+    parser.add_argument("--spike-rate", type=float, default=0.005, help="측정당 급등 시작 확률")
+    parser.add_argument("--fall-rate", type=float, default=0.002, help="보행/서있음 측정당 낙상 확률")
+    # 반복 요청 비율
+    parser.add_argument("--health-repeat", type=float, default=0.6)
+    parser.add_argument("--matching-repeat", type=float, default=0.4)
+    parser.add_argument("--json", action="store_true", help="결과를 JSON으로 출력")
+    args = parser.parse_args(argv)
+    args.mix = parse_mix(args.mix, ("sensor", "health", "matching"))
+    args.activity_mix = parse_mix(args.activity_mix, tuple(ACTIVITY_HR_OFFSET))
+    return args
+
+
+def main():
+    args = parse_args()
+    summary = asyncio.run(main_async(args))
+    if args.json:
+        print(json.dumps(summary, ensure_ascii=False, indent=2))
+    else:
+        print_summary(summary)
+
+
+if __name__ == "__main__":
+    main()
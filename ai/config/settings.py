@@ -9,11 +9,91 @@ class Settings(BaseSettings):
     # 모델 경로
     HEALTH_MODEL_PATH: str = "models/health_model.pkl"
     HEALTH_VECTORIZER_PATH: str = "models/health_vectorizer.pkl"
+    JOB_RISK_MODEL_PATH: str = "models/job_risk_model.pkl"
+    MATCHING_MODEL_PATH: str = "models/matching_model.pkl"
+    # 관리 API로 지정할 수 있는 아티팩트 폴더 (재로드 / 섀도 후보 경로는 이 안에서만)
+    MODEL_DIR: str = "models"
+    # 공유 메모리 배포 모드: 메모리맵 아티팩트 (models/export_shared_models.py) + serve.py 사전 로드 후 fork
+    MODEL_SHARED_MEMORY: bool = False
+    # 모델 파일 변경 감시 주기 (초, 0이면 관리 API로만 재로드)
+    MODEL_RELOAD_CHECK_SEC: float = 10.0
+
+    # 섀도 평가 (후보 모델에 실시간 입력 복제, 큐가 차면 버림)
+    SHADOW_QUEUE_SIZE: int = 1024
+    SHADOW_BATCH_SIZE: int = 64
+    SHADOW_BATCH_WAIT_SEC: float = 0.05
+    SHADOW_WINDOW: int = 10000
+
+    # 프로세스 간 공유 추론 결과 캐시 (메모리맵 파일, 경로가 없으면 /dev/shm 또는 임시 폴더)
+    RESULT_CACHE_ENABLED: bool = True
+    RESULT_CACHE_PATH: Optional[str] = None
+    RESULT_CACHE_SLOTS: int = 65536
+    RESULT_CACHE_WAYS: int = 8
+
+    # 단계별 지연 시간 / 요청 지표 (GET /metrics, 끄면 계측 없이 통과)
+    METRICS_ENABLED: bool = True
+
+    # 수용 제어 / 부하 차단 (워커당 전체 동시 처리 상한, 분류별 상한은 utils/admission.py)
+    ADMISSION_ENABLED: bool = True
+    ADMISSION_MAX_IN_FLIGHT: int = 64
+
+    # 동일 요청 합치기 (대상 경로는 utils/coalescing.py, 본문이 이보다 크면 합치지 않음)
+    COALESCE_ENABLED: bool = True
+    COALESCE_MAX_BODY_BYTES: int = 1 << 20
+
+    # 요청 프로파일링 (X-Profile: 1 + 관리 API 키 헤더 또는 샘플링 비율, 0이면 헤더로만)
+    PROFILE_SAMPLE_RATE: float = 0.0
+    PROFILE_INTERVAL_SEC: float = 0.005
+    PROFILE_DIR: Optional[str] = None
+    PROFILE_MAX_FILES: int = 50
+
+    # 관리 API 키 (X-Admin-Key 헤더, 설정하지 않으면 관리 API 비활성화)
+    ADMIN_API_KEY: Optional[str] = None
 
     # Backend API
     BACKEND_URL: str = "http://localhost:8080"
     BACKEND_API_KEY: Optional[str] = None
 
+    # 백엔드로 결과 전송 (이상 경보 / 점수 갱신, 긴급 경보는 묶지 않고 즉시)
+    # 전송 실패분은 JSONL 파일에 보관 후 재전송 (경로가 없으면 임시 폴더)
+    BACKEND_PUSH_ENABLED: bool = False
+    BACKEND_PUSH_PATH: str = "/api/internal/ml-events"
+    BACKEND_PUSH_QUEUE_SIZE: int = 10000
+    BACKEND_PUSH_BATCH_SIZE: int = 100
+    BACKEND_PUSH_BATCH_WAIT_SEC: float = 0.5
+    BACKEND_PUSH_MAX_RETRIES: int = 4
+    BACKEND_PUSH_BACKOFF_SEC: float = 0.5
+    BACKEND_PUSH_TIMEOUT_SEC: float = 5.0
+    BACKEND_PUSH_SPILL_PATH: Optional[str] = None
+    BACKEND_PUSH_SPILL_MAX_BYTES: int = 64 << 20
+
+    # 매칭 공고 카탈로그 (JSON 배열, posting_id 포함)
+    POSTING_CATALOG_PATH: str = "models/posting_catalog.json"
+    # 카탈로그 랭킹 시 스킬 역색인으로 후보 축소 (정확하지 않으면 자동으로 전체 스캔)
+    MATCHING_CANDIDATE_PRUNING: bool = True
+
+    # 베이스라인 파이프라인 우선순위 (data/03_baseline_model, 변경 시 자동 재적재)
+    MATCHING_SCORE_PATH: str = "../data/03_baseline_model/matching_score.csv"
+    SENIOR_SCORE_PATH: str = "../data/03_baseline_model/senior_score.csv"
+    PRIORITY_INDEX_CHECK_SEC: float = 5.0
+
+    # 스킬 임베딩 유사 매칭 (models/create_skill_embeddings.py로 생성, 파일 없으면 정확 일치만)
+    MATCHING_SOFT_SKILLS: bool = False
+    SKILL_EMBEDDING_PATH: str = "models/skill_embeddings.npy"
+    SKILL_SOFT_MATCH_THRESHOLD: float = 0.75
+    SKILL_SOFT_MATCH_NEIGHBORS: int = 16
+    SKILL_EMBEDDING_IVF_PROBES: int = 8
+
+    # 산업재해 기본 리스크(모델 없음) 전체 조합을 시작 시 사전 계산
+    JOB_RISK_BASELINE_LUT: bool = True
+    # 사고 통계 기반 업종 리스크 사전 분포 (models/create_risk_prior.py로 생성, 없으면 고정 상수)
+    JOB_RISK_PRIOR_PATH: str = "models/risk_prior.bin"
+
+    # 모니터링 롤업 보존 버킷 수 (1분 / 1시간 / 1일)
+    MONITORING_ROLLUP_MINUTES: int = 1440
+    MONITORING_ROLLUP_HOURS: int = 24 * 35
+    MONITORING_ROLLUP_DAYS: int = 400
+
     # 로깅
     LOG_LEVEL: str = "INFO"
     LOG_FORMAT: str = "json"
@@ -0,0 +1,256 @@
+import hashlib
+import json
+import os
+import logging
+from collections import Counter
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from utils.exceptions import ModelLoadError
+
+logger = logging.getLogger(__name__)
+
+
+class FeatureSchema:
+    """
+    모델 입력 피처 계약 (버전별)
+
+    - feature_names 순서가 곧 모델 입력 인덱스
+    - fingerprint: 피처 목록 해시 (모델 아티팩트와 비교)
+    - extract(): dict를 거치지 않고 고정 인덱스에 바로 기록하는 컴파일된 추출기
+    """
+
+    def __init__(
+        self,
+        name: str,
+        version: int,
+        feature_names: Sequence[str],
+        extractors: Dict[str, Callable[["_ReadingContext"], float]],
+    ):
+        missing = [n for n in feature_names if n not in extractors]
+        if missing:
+            raise ValueError(f"피처 추출기가 없습니다: {missing}")
+
+        self.name = name
+        self.version = version
+        self.feature_names: Tuple[str, ...] = tuple(feature_names)
+        self.index: Dict[str, int] = {n: i for i, n in enumerate(self.feature_names)}
+        self.fingerprint = hashlib.sha256(
+            "\n".join(self.feature_names).encode("utf-8")
+        ).hexdigest()[:16]
+
+        # 컴파일: (인덱스, 추출 함수) 튜플을 미리 고정
+        self._compiled: Tuple[Tuple[int, Callable], ...] = tuple(
+            (i, extractors[n]) for i, n in enumerate(self.feature_names)
+        )
+
+    @property
+    def key(self) -> str:
+        return f"{self.name}.v{self.version}"
+
+    @property
+    def dim(self) -> int:
+        return len(self.feature_names)
+
+    def extract(self, sensor_readings: List[Dict]) -> np.ndarray:
+        """센서 시계열 → 고정 길이 입력 벡터"""
+        out = np.zeros(self.dim, dtype=np.float64)
+        if not sensor_readings:
+            return out
+
+        ctx = _ReadingContext(sensor_readings)
+        for idx, fn in self._compiled:
+            out[idx] = fn(ctx)
+        return out
+
+    def vectorize(self, features: Dict[str, float]) -> List[float]:
+        """피처 dict → 입력 벡터 (기존 dict 경로 호환용)"""
+        return [features.get(n, 0.0) for n in self.feature_names]
+
+    def to_artifact_meta(self) -> Dict:
+        return {
+            "schema": self.key,
+            "fingerprint": self.fingerprint,
+            "n_features": self.dim,
+            "feature_names": list(self.feature_names),
+        }
+
+
+# =========================================================
+# 센서 시계열 컨텍스트 (요청당 1회 계산)
+# =========================================================
+class _ReadingContext:
+    __slots__ = ("hr", "steps", "activity_counts", "activity_total")
+
+    def __init__(self, sensor_readings: List[Dict]):
+        self.hr = np.array(
+            [r["heart_rate"] for r in sensor_readings if r.get("heart_rate") is not None],
+            dtype=np.float64,
+        )
+        self.steps = np.array(
+            [r["step_count"] for r in sensor_readings if r.get("step_count") is not None],
+            dtype=np.float64,
+        )
+        activities = [r.get("activity") for r in sensor_readings if r.get("activity")]
+        self.activity_counts = Counter(activities)
+        self.activity_total = len(activities)
+
+
+def _hr(fn: Callable[[np.ndarray], float]) -> Callable[[_ReadingContext], float]:
+    return lambda ctx: float(fn(ctx.hr)) if ctx.hr.size else 0.0
+
+
+def _activity_ratio(activity: str) -> Callable[[_ReadingContext], float]:
+    def fn(ctx: _ReadingContext) -> float:
+        if ctx.activity_total == 0:
+            return 0.0
+        return ctx.activity_counts.get(activity, 0) / ctx.activity_total
+    return fn
+
+
+def _step_rate(ctx: _ReadingContext) -> float:
+    if not ctx.steps.size:
+        return 0.0
+    return float(ctx.steps.sum() / ctx.steps.size)
+
+
+def _step_std(ctx: _ReadingContext) -> float:
+    return float(np.std(ctx.steps)) if ctx.steps.size else 0.0
+
+
+# 모니터링 피처 추출기 (유일한 정의, 스키마는 feature_names로 이 중 일부를 고정 순서로 사용)
+MONITORING_EXTRACTORS: Dict[str, Callable[[_ReadingContext], float]] = {
+    "hr_mean": _hr(np.mean),
+    "hr_std": _hr(np.std),
+    "hr_max": _hr(np.max),
+    "hr_min": _hr(np.min),
+    "hr_trend": _hr(lambda hr: hr[-1] - hr[0]),
+    "step_mean": _step_rate,
+    "step_std": _step_std,
+    "step_rate": _step_rate,
+    "activity_walking": _activity_ratio("walking"),
+    "activity_sitting": _activity_ratio("sitting"),
+    "activity_lying": _activity_ratio("lying"),
+    "activity_standing": _activity_ratio("standing"),
+}
+
+
+def extract_monitoring_features(sensor_readings: List[Dict]) -> Dict[str, float]:
+    """센서 시계열 → 모니터링 피처 dict (스키마 벡터와 같은 추출기, 데이터가 없으면 0.0)"""
+    if not sensor_readings:
+        return {}
+    ctx = _ReadingContext(sensor_readings)
+    return {name: fn(ctx) for name, fn in MONITORING_EXTRACTORS.items()}
+
+
+# =========================================================
+# 스키마 레지스트리
+# =========================================================
+_SCHEMAS: Dict[str, FeatureSchema] = {}
+
+
+def register_schema(schema: FeatureSchema) -> FeatureSchema:
+    if schema.key in _SCHEMAS:
+        raise ValueError(f"이미 등록된 피처 스키마입니다: {schema.key}")
+    _SCHEMAS[schema.key] = schema
+    return schema
+
+
+def get_schema(key: str) -> FeatureSchema:
+    try:
+        return _SCHEMAS[key]
+    except KeyError:
+        raise ModelLoadError(
+            message=f"알 수 없는 피처 스키마입니다: {key}",
+            details={"schema": key, "available": sorted(_SCHEMAS)},
+        )
+
+
+def list_schemas() -> List[str]:
+    return sorted(_SCHEMAS)
+
+
+# Isolation Forest / LSTM 공통 입력 (⚠️ v1 순서 변경 금지 — 바꾸려면 v2 등록)
+MONITORING_SCHEMA_V1 = register_schema(
+    FeatureSchema(
+        name="monitoring",
+        version=1,
+        feature_names=[
+            "hr_mean",
+            "hr_std",
+            "hr_max",
+            "hr_min",
+            "hr_trend",
+            "step_rate",
+            "activity_walking",
+            "activity_sitting",
+            "activity_lying",
+            "activity_standing",
+        ],
+        extractors=MONITORING_EXTRACTORS,
+    )
+)
+
+DEFAULT_MONITORING_SCHEMA = MONITORING_SCHEMA_V1.key
+
+
+# =========================================================
+# 모델 아티팩트 ↔ 스키마 검증
+# =========================================================
+def schema_sidecar_path(artifact_path: str) -> str:
+    return os.path.splitext(artifact_path)[0] + ".schema.json"
+
+
+def write_schema_sidecar(artifact_path: str, schema: FeatureSchema) -> str:
+    """모델 아티팩트 옆에 피처 스키마 메타데이터 저장"""
+    path = schema_sidecar_path(artifact_path)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(schema.to_artifact_meta(), f, ensure_ascii=False, indent=2)
+    return path
+
+
+def resolve_artifact_schema(
+    artifact_path: str,
+    n_features: Optional[int],
+    default_key: str = DEFAULT_MONITORING_SCHEMA,
+) -> FeatureSchema:
+    """
+    아티팩트가 기대하는 피처 스키마 확인 (불일치 시 ModelLoadError)
+
+    - 사이드카(.schema.json)가 있으면 스키마 키 + fingerprint 비교
+    - 없으면 default 스키마로 간주하고 입력 차원만 비교
+    """
+    sidecar = schema_sidecar_path(artifact_path)
+
+    if os.path.exists(sidecar):
+        with open(sidecar, "r", encoding="utf-8") as f:
+            meta = json.load(f)
+        schema = get_schema(meta.get("schema", default_key))
+
+        if meta.get("fingerprint") != schema.fingerprint:
+            raise ModelLoadError(
+                message=f"피처 스키마 해시 불일치: {artifact_path}",
+                details={
+                    "schema": schema.key,
+                    "expected": schema.fingerprint,
+                    "artifact": meta.get("fingerprint"),
+                },
+            )
+    else:
+        schema = get_schema(default_key)
+        logger.warning(
+            f"스키마 메타데이터가 없습니다 ({sidecar}). {schema.key}로 간주합니다."
+        )
+
+    if n_features is not None and n_features != schema.dim:
+        raise ModelLoadError(
+            message=f"모델 입력 차원 불일치: {artifact_path}",
+            details={
+                "schema": schema.key,
+                "expected": schema.dim,
+                "model": n_features,
+            },
+        )
+
+    return schema
@@ -1,6 +1,20 @@
 from schemas.job_risk import JobRiskRequest
+from typing import List
 import numpy as np
 
+# 피처 순서 (= 모델 계약, 18개)
+JOB_TYPES = ("construction", "mining", "manufacturing", "office", "service", "other")
+ENVIRONMENT_FLAGS = ("height", "machinery", "chemicals", "noise")
+SAFETY_ITEMS = ("helmet", "safety_harness", "gloves", "safety_shoes", "goggles")
+
+JOB_TYPE_INDEX = {job: i for i, job in enumerate(JOB_TYPES)}
+ENV_OFFSET = len(JOB_TYPES)                               # 6-9
+SAFETY_COUNT_COL = ENV_OFFSET + len(ENVIRONMENT_FLAGS)    # 10
+SAFETY_INDEX = {item: SAFETY_COUNT_COL + 1 + i for i, item in enumerate(SAFETY_ITEMS)}  # 11-15
+EXPERIENCE_COL = SAFETY_COUNT_COL + 1 + len(SAFETY_ITEMS)  # 16
+EXPERIENCE_GROUP_COL = EXPERIENCE_COL + 1                  # 17
+FEATURE_DIM = EXPERIENCE_GROUP_COL + 1                     # 18
+
 
 class JobRiskFeatureEngineer:
     """산업재해 리스크 피처 엔지니어링"""
@@ -18,8 +32,7 @@ class JobRiskFeatureEngineer:
         features = []
         
         # 직종 인코딩
-        job_types = ["construction", "mining", "manufacturing", "office", "service", "other"]
-        job_type_encoded = [1.0 if job == request.job_type else 0.0 for job in job_types]
+        job_type_encoded = [1.0 if job == request.job_type else 0.0 for job in JOB_TYPES]
         features.extend(job_type_encoded)
         
         # 작업 환경
@@ -33,8 +46,7 @@ class JobRiskFeatureEngineer:
         features.append(len(request.safety_equipment))
         
         # 안전 장비 원-핫 인코딩
-        safety_items = ["helmet", "safety_harness", "gloves", "safety_shoes", "goggles"]
-        for item in safety_items:
+        for item in SAFETY_ITEMS:
             features.append(1.0 if item in request.safety_equipment else 0.0)
         
         # 경력
@@ -50,3 +62,44 @@ class JobRiskFeatureEngineer:
         features.append(exp_group)
         
         return features
+
+    @staticmethod
+    def encode_batch(requests: List[JobRiskRequest]) -> np.ndarray:
+        """
+        N건 → (N, 18) float32 피처 행렬 (extract_features와 같은 순서/값)
+
+        미리 할당한 행렬에 인덱스 맵으로 0이 아닌 칸만 채움
+        """
+        X = np.zeros((len(requests), FEATURE_DIM), dtype=np.float32)
+        experience = np.empty(len(requests), dtype=np.float32)
+
+        for i, request in enumerate(requests):
+            row = X[i]
+
+            col = JOB_TYPE_INDEX.get(request.job_type)
+            if col is not None:
+                row[col] = 1.0
+
+            env = request.work_environment
+            if env:
+                if env.get("height") == "high":
+                    row[ENV_OFFSET] = 1.0
+                if env.get("machinery", False):
+                    row[ENV_OFFSET + 1] = 1.0
+                if env.get("chemicals", False):
+                    row[ENV_OFFSET + 2] = 1.0
+                if env.get("noise", False):
+                    row[ENV_OFFSET + 3] = 1.0
+
+            equipment = request.safety_equipment or ()
+            row[SAFETY_COUNT_COL] = len(equipment)
+            for item in equipment:
+                col = SAFETY_INDEX.get(item)
+                if col is not None:
+                    row[col] = 1.0
+
+            experience[i] = request.experience_years
+
+        X[:, EXPERIENCE_COL] = experience
+        X[:, EXPERIENCE_GROUP_COL] = (experience >= 1).astype(np.float32) + (experience >= 5)
+        return X
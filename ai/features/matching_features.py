@@ -1,10 +1,225 @@
 from schemas.matching import MatchingRequest
+from dataclasses import dataclass
+from typing import Dict, Optional, Tuple
 import numpy as np
 
+# 학력 서열 (모르는 값은 0)
+EDU_SCORES = {"high_school": 1, "bachelor": 2, "master": 3, "phd": 4}
+
+DEFAULT_WEIGHTS = {"skills": 0.4, "experience": 0.3, "education": 0.3}
+
+
+def resolve_weights(weights: Optional[dict]) -> Dict[str, float]:
+    """요청 가중치 → (skills, experience, education) 가중치"""
+    weights = weights or DEFAULT_WEIGHTS
+    return {k: weights.get(k, v) for k, v in DEFAULT_WEIGHTS.items()}
+
+
+def compute_subscores(
+    seeker_skill_mask: np.ndarray,
+    seeker_exp: float,
+    seeker_edu: int,
+    skill_indices: np.ndarray,
+    skill_entry_rows: np.ndarray,
+    n_required: np.ndarray,
+    required_exp: np.ndarray,
+    required_edu: np.ndarray,
+):
+    """
+    구직자 1명 × 공고 N개 세부 점수 (0-100) 벡터 계산
+
+    Args:
+        seeker_skill_mask: 스킬 ID → 보유 여부 (bool, 어휘 크기)
+        skill_indices: 공고별 요구 스킬 ID를 이어 붙인 배열 (CSR indices)
+        skill_entry_rows: skill_indices 각 원소의 공고 행 번호
+        n_required: 공고별 (중복 제거) 요구 스킬 수
+
+    Returns:
+        (skills_match, experience_match, education_match) 각 shape (N,)
+    """
+    matched = np.bincount(
+        skill_entry_rows, weights=seeker_skill_mask[skill_indices], minlength=len(n_required)
+    )
+    return subscores_from_counts(
+        matched, n_required, seeker_exp, seeker_edu, required_exp, required_edu
+    )
+
+
+def count_matched_skills(
+    seeker_skill_mask: np.ndarray,
+    skill_indices: np.ndarray,
+    skill_entry_rows: np.ndarray,
+    n_postings: int,
+) -> np.ndarray:
+    """
+    공고별 일치 요구 스킬 개수 (부분 일치도 1개, score_pair의 n_matched와 같은 기준)
+
+    seeker_skill_mask가 유사도 가중치여도 0보다 크면 일치로 셈
+    """
+    return np.bincount(
+        skill_entry_rows, weights=seeker_skill_mask[skill_indices] > 0, minlength=n_postings
+    )
+
+
+def subscores_from_counts(
+    matched: np.ndarray,
+    n_required: np.ndarray,
+    seeker_exp: float,
+    seeker_edu: int,
+    required_exp: np.ndarray,
+    required_edu: np.ndarray,
+):
+    """일치 스킬 수가 이미 있을 때 세부 점수 (0-100) 벡터 계산"""
+    with np.errstate(divide="ignore", invalid="ignore"):
+        skills = np.where(n_required == 0, 100.0, matched / n_required * 100.0)
+        experience = np.where(
+            (required_exp == 0) | (seeker_exp >= required_exp),
+            100.0,
+            seeker_exp / required_exp * 100.0,
+        )
+        education = np.where(
+            seeker_edu >= required_edu,
+            100.0,
+            seeker_edu / required_edu * 100.0,
+        )
+
+    return skills, experience, education
+
+
+@dataclass(frozen=True, slots=True)
+class MatchingScoreRecord:
+    """
+    구직자-공고 1쌍의 중간 계산 결과 (한 번만 계산)
+
+    모델 입력 피처, 기본 점수, 세부 내역, 권장사항은 모두 이 레코드에서 파생
+    """
+    n_seeker_skills: int
+    n_required_skills: int
+    n_matched_skills: int
+    missing_skills: Tuple[str, ...]  # 공고 요구 순서 유지
+    skills_ratio: float
+    seeker_exp: float
+    required_exp: float
+    exp_ratio: float
+    seeker_edu_score: int
+    required_edu_score: int
+    required_edu: str
+    edu_ratio: float
+    weights: Dict[str, float]
+
+    def to_features(self) -> list:
+        """extract_features() 15개 피처 (순서 = 모델 계약)"""
+        return [
+            self.skills_ratio,
+            self.n_seeker_skills,
+            self.n_required_skills,
+            self.n_matched_skills,
+            self.n_required_skills - self.n_matched_skills,  # 부족한 스킬 수
+            self.exp_ratio,
+            self.seeker_exp,
+            self.required_exp,
+            max(0, self.required_exp - self.seeker_exp),  # 부족한 경력
+            self.edu_ratio,
+            self.seeker_edu_score,
+            self.required_edu_score,
+            self.weights["skills"],
+            self.weights["experience"],
+            self.weights["education"],
+        ]
+
+    def baseline_score(self) -> float:
+        """가중 평균 기본 점수 (모델이 없을 경우)"""
+        return min(
+            100.0,
+            self.skills_ratio * 100.0 * self.weights["skills"]
+            + self.exp_ratio * 100.0 * self.weights["experience"]
+            + self.edu_ratio * 100.0 * self.weights["education"],
+        )
+
+    def breakdown(self) -> dict:
+        return {
+            "skills_match": round(self.skills_ratio * 100.0, 2),
+            "experience_match": round(self.exp_ratio * 100.0, 2),
+            "education_match": round(self.edu_ratio * 100.0, 2),
+        }
+
 
 class MatchingFeatureEngineer:
     """매칭 점수 피처 엔지니어링"""
-    
+
+    @staticmethod
+    def score_pair(
+        seeker: dict,
+        posting: dict,
+        weights: Optional[dict] = None,
+        skill_embeddings=None,
+        soft_threshold: float = 1.0,
+    ) -> MatchingScoreRecord:
+        """
+        구직자-공고 1쌍 중간값 단일 계산
+
+        Args:
+            seeker: 구직자 프로필 (skills, experience, education)
+            posting: 채용 공고 (required_skills, required_experience, education_level)
+            weights: 가중치 (없으면 기본값)
+            skill_embeddings: SkillEmbeddingIndex (있으면 정확히 일치하지 않는 요구 스킬을
+                유사도 soft_threshold 이상일 때 유사도만큼 부분 일치로 계산)
+
+        Returns:
+            MatchingScoreRecord
+        """
+        # 스킬 매칭
+        seeker_skills = set(seeker.get("skills", []))
+        required_list = list(dict.fromkeys(posting.get("required_skills", [])))
+        missing = tuple(s for s in required_list if s not in seeker_skills)
+        n_required = len(required_list)
+        n_matched = n_required - len(missing)
+        matched_weight = float(n_matched)
+
+        if skill_embeddings is not None and missing and seeker_skills:
+            sims = skill_embeddings.max_similarity(missing, seeker_skills)
+            soft = sims >= soft_threshold
+            matched_weight += float(sims[soft].sum())
+            n_matched += int(soft.sum())
+            missing = tuple(s for s, hit in zip(missing, soft.tolist()) if not hit)
+
+        skills_ratio = 1.0 if n_required == 0 else matched_weight / n_required
+
+        # 경력 매칭
+        seeker_exp = seeker.get("experience", 0)
+        required_exp = posting.get("required_experience", 0)
+
+        if required_exp == 0 or seeker_exp >= required_exp:
+            exp_ratio = 1.0
+        else:
+            exp_ratio = seeker_exp / required_exp
+
+        # 학력 매칭 (요구 학력 없음 = 0 → 나눗셈 없이 1.0)
+        required_edu = posting.get("education_level", "")
+        seeker_edu_score = EDU_SCORES.get(seeker.get("education", ""), 0)
+        required_edu_score = EDU_SCORES.get(required_edu, 0)
+
+        if required_edu_score == 0 or seeker_edu_score >= required_edu_score:
+            edu_ratio = 1.0
+        else:
+            edu_ratio = seeker_edu_score / required_edu_score
+
+        return MatchingScoreRecord(
+            n_seeker_skills=len(seeker_skills),
+            n_required_skills=n_required,
+            n_matched_skills=n_matched,
+            missing_skills=missing,
+            skills_ratio=skills_ratio,
+            seeker_exp=seeker_exp,
+            required_exp=required_exp,
+            exp_ratio=exp_ratio,
+            seeker_edu_score=seeker_edu_score,
+            required_edu_score=required_edu_score,
+            required_edu=required_edu,
+            edu_ratio=edu_ratio,
+            weights=resolve_weights(weights),
+        )
+
     def extract_features(self, request: MatchingRequest) -> list:
         """
         매칭 점수 계산을 위한 피처 추출
@@ -15,62 +230,49 @@ class MatchingFeatureEngineer:
         Returns:
             list: 피처 벡터
         """
-        features = []
-        
-        # 스킬 매칭
-        seeker_skills = set(request.job_seeker_profile.get("skills", []))
-        required_skills = set(request.job_posting.get("required_skills", []))
-        
-        if len(required_skills) == 0:
-            skills_match_ratio = 1.0
-        else:
-            skills_match_ratio = len(seeker_skills & required_skills) / len(required_skills)
-        
-        features.append(skills_match_ratio)
-        features.append(len(seeker_skills))
-        features.append(len(required_skills))
-        features.append(len(seeker_skills & required_skills))
-        features.append(len(required_skills - seeker_skills))  # 부족한 스킬 수
-        
-        # 경력 매칭
-        seeker_exp = request.job_seeker_profile.get("experience", 0)
-        required_exp = request.job_posting.get("required_experience", 0)
-        
-        if required_exp == 0:
-            exp_match_ratio = 1.0
-        elif seeker_exp >= required_exp:
-            exp_match_ratio = 1.0
-        else:
-            exp_match_ratio = seeker_exp / required_exp
-        
-        features.append(exp_match_ratio)
-        features.append(seeker_exp)
-        features.append(required_exp)
-        features.append(max(0, required_exp - seeker_exp))  # 부족한 경력
-        
-        # 학력 매칭
-        seeker_edu = request.job_seeker_profile.get("education", "")
-        required_edu = request.job_posting.get("education_level", "")
-        
-        edu_scores = {"high_school": 1, "bachelor": 2, "master": 3, "phd": 4}
-        seeker_edu_score = edu_scores.get(seeker_edu, 0)
-        required_edu_score = edu_scores.get(required_edu, 0)
-        
-        if required_edu_score == 0:
-            edu_match_ratio = 1.0
-        elif seeker_edu_score >= required_edu_score:
-            edu_match_ratio = 1.0
-        else:
-            edu_match_ratio = seeker_edu_score / required_edu_score
-        
-        features.append(edu_match_ratio)
-        features.append(seeker_edu_score)
-        features.append(required_edu_score)
-        
-        # 가중치
-        weights = request.weights or {}
-        features.append(weights.get("skills", 0.4))
-        features.append(weights.get("experience", 0.3))
-        features.append(weights.get("education", 0.3))
-        
-        return features
+        return self.score_pair(
+            request.job_seeker_profile, request.job_posting, request.weights
+        ).to_features()
+
+    @staticmethod
+    def build_feature_matrix(
+        rows: np.ndarray,
+        arrays,
+        n_seeker_skills: int,
+        seeker_exp: float,
+        seeker_edu: int,
+        skills: np.ndarray,
+        experience: np.ndarray,
+        education: np.ndarray,
+        weights: Dict[str, float],
+        matched_counts: np.ndarray,
+    ) -> np.ndarray:
+        """
+        extract_features()와 같은 15개 피처를 공고 N개에 대해 한 번에 생성
+
+        matched_counts: 공고별 일치 스킬 개수 (count_matched_skills, 부분 일치 가중 비율에서 역산하지 않음)
+        """
+        n_required = arrays.n_required[rows].astype(np.float64)
+        required_exp = arrays.required_exp[rows]
+        required_edu = arrays.required_edu[rows].astype(np.float64)
+        skills_ratio = skills[rows] / 100.0
+        n_matched = matched_counts[rows].astype(np.float64)
+
+        X = np.empty((len(rows), 15), dtype=np.float64)
+        X[:, 0] = skills_ratio
+        X[:, 1] = n_seeker_skills
+        X[:, 2] = n_required
+        X[:, 3] = n_matched
+        X[:, 4] = n_required - n_matched
+        X[:, 5] = experience[rows] / 100.0
+        X[:, 6] = seeker_exp
+        X[:, 7] = required_exp
+        X[:, 8] = np.maximum(0, required_exp - seeker_exp)
+        X[:, 9] = np.where(required_edu == 0, 1.0, education[rows] / 100.0)
+        X[:, 10] = seeker_edu
+        X[:, 11] = required_edu
+        X[:, 12] = weights["skills"]
+        X[:, 13] = weights["experience"]
+        X[:, 14] = weights["education"]
+        return X
+
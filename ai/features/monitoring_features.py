@@ -1,6 +1,12 @@
 import numpy as np
 from typing import List, Dict
 
+from features.feature_schema import (
+    DEFAULT_MONITORING_SCHEMA,
+    extract_monitoring_features,
+    get_schema,
+)
+
 
 class MonitoringFeatureExtractor:
     """
@@ -33,47 +39,11 @@ class MonitoringFeatureExtractor:
     ) -> Dict[str, float]:
         """
         시계열 센서 데이터 → 통계 피처 추출
+
+        계산은 features/feature_schema.py 추출기에 위임 (모델 입력 벡터와 같은 정의)
         """
 
-        if not sensor_readings:
-            return {}
-
-        heart_rates = [
-            r["heart_rate"]
-            for r in sensor_readings
-            if r.get("heart_rate") is not None
-        ]
-        step_counts = [
-            r["step_count"]
-            for r in sensor_readings
-            if r.get("step_count") is not None
-        ]
-
-        features: Dict[str, float] = {}
-
-        # 심박수 관련 피처
-        if heart_rates:
-            features["hr_mean"] = float(np.mean(heart_rates))
-            features["hr_std"] = float(np.std(heart_rates))
-            features["hr_max"] = float(np.max(heart_rates))
-            features["hr_min"] = float(np.min(heart_rates))
-            features["hr_trend"] = float(heart_rates[-1] - heart_rates[0])
-
-        # 걸음수 관련 피처
-        if step_counts:
-            features["step_mean"] = float(np.mean(step_counts))
-            features["step_std"] = float(np.std(step_counts))
-            features["step_rate"] = float(sum(step_counts) / len(step_counts))
-
-        # 활동 유형 분포
-        activities = [r.get("activity") for r in sensor_readings if r.get("activity")]
-        total = len(activities)
-
-        if total > 0:
-            for activity in ["walking", "sitting", "lying", "standing"]:
-                features[f"activity_{activity}"] = activities.count(activity) / total
-
-        return features
+        return extract_monitoring_features(sensor_readings)
 
     # =========================================================
     # 2️⃣ 통계적 이상치 탐지 (Z-score)
@@ -124,21 +94,13 @@ class MonitoringFeatureExtractor:
     # 4️⃣ ⭐ ML 모델 입력 벡터 생성 (핵심)
     # =========================================================
     @staticmethod
-    def to_model_input(features: Dict[str, float]) -> List[float]:
+    def to_model_input(
+        features: Dict[str, float],
+        schema_key: str = DEFAULT_MONITORING_SCHEMA,
+    ) -> List[float]:
         """
         Isolation Forest / LSTM 공통 입력 벡터
-        ⚠️ 순서 절대 변경 금지 (모델 계약)
+        ⚠️ 순서는 features/feature_schema.py 스키마가 결정 (모델 계약)
         """
 
-        return [
-            features.get("hr_mean", 0.0),
-            features.get("hr_std", 0.0),
-            features.get("hr_max", 0.0),
-            features.get("hr_min", 0.0),
-            features.get("hr_trend", 0.0),
-            features.get("step_rate", 0.0),
-            features.get("activity_walking", 0.0),
-            features.get("activity_sitting", 0.0),
-            features.get("activity_lying", 0.0),
-            features.get("activity_standing", 0.0),
-        ]
+        return get_schema(schema_key).vectorize(features)
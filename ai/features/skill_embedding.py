@@ -0,0 +1,258 @@
+import json
+import logging
+import os
+from typing import Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from config.settings import settings
+from utils.exceptions import ModelLoadError
+
+logger = logging.getLogger(__name__)
+
+
+def embedding_sidecar_paths(path: str) -> Tuple[str, str]:
+    """임베딩 행렬(.npy) 경로 → (어휘 JSON, IVF npz) 경로"""
+    base, _ = os.path.splitext(path)
+    return base + ".vocab.json", base + ".ivf.npz"
+
+
+def normalize_rows(vectors: np.ndarray) -> np.ndarray:
+    """행 단위 L2 정규화 (float32, 0 벡터는 그대로)"""
+    vectors = np.asarray(vectors, dtype=np.float32)
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    return vectors / np.maximum(norms, 1e-12)
+
+
+class SkillEmbeddingIndex:
+    """
+    스킬 어휘 임베딩 인덱스 (네트워크 없이 로컬에서 동작)
+
+    - 임베딩 행렬은 오프라인에서 미리 계산해 .npy로 저장, 서빙 시 메모리맵으로 로드
+    - 행은 L2 정규화되어 있으므로 내적 = 코사인 유사도
+    - 어휘가 크면 IVF(역파일) 분할: 중심점 n_probe개 목록만 탐색, 없으면 전수 탐색
+    """
+
+    def __init__(
+        self,
+        skills: Sequence[str],
+        vectors: np.ndarray,
+        centroids: Optional[np.ndarray] = None,
+        list_order: Optional[np.ndarray] = None,
+        list_offsets: Optional[np.ndarray] = None,
+    ):
+        if len(skills) != len(vectors):
+            raise ValueError(f"스킬 수({len(skills)})와 임베딩 행 수({len(vectors)})가 다릅니다")
+
+        self.skills = list(skills)
+        self.vectors = vectors
+        self._ids = {s: i for i, s in enumerate(self.skills)}
+
+        # IVF: 목록 l의 스킬 ID = list_order[list_offsets[l]:list_offsets[l + 1]]
+        self.centroids = centroids
+        self.list_order = list_order
+        self.list_offsets = list_offsets
+
+    def __len__(self) -> int:
+        return len(self.skills)
+
+    @property
+    def dim(self) -> int:
+        return int(self.vectors.shape[1])
+
+    @property
+    def n_lists(self) -> int:
+        return 0 if self.centroids is None else len(self.centroids)
+
+    def ids_for(self, skills: Iterable[str]) -> np.ndarray:
+        """스킬 이름 → 임베딩 ID (없는 스킬은 -1)"""
+        return np.fromiter((self._ids.get(s, -1) for s in skills), dtype=np.int64)
+
+    # =========================================================
+    # IVF 구성
+    # =========================================================
+    def build_ivf(self, n_lists: int, n_iter: int = 10, seed: int = 0) -> None:
+        """
+        구면 k-means로 IVF 목록 구성 (오프라인 빌드 시 1회)
+        """
+        n_lists = max(1, min(n_lists, len(self)))
+        vectors = np.asarray(self.vectors, dtype=np.float32)
+        rng = np.random.default_rng(seed)
+        centroids = vectors[rng.choice(len(vectors), size=n_lists, replace=False)].copy()
+
+        for _ in range(n_iter):
+            assign = np.argmax(vectors @ centroids.T, axis=1)
+            sums = np.zeros_like(centroids)
+            np.add.at(sums, assign, vectors)
+            empty = np.bincount(assign, minlength=n_lists) == 0
+            sums[empty] = centroids[empty]  # 빈 목록은 이전 중심점 유지
+            centroids = normalize_rows(sums)
+
+        assign = np.argmax(vectors @ centroids.T, axis=1)
+        self.list_order = np.argsort(assign, kind="stable").astype(np.int64)
+        self.list_offsets = np.zeros(n_lists + 1, dtype=np.int64)
+        np.cumsum(np.bincount(assign, minlength=n_lists), out=self.list_offsets[1:])
+        self.centroids = centroids
+
+    # =========================================================
+    # 검색
+    # =========================================================
+    def search(
+        self,
+        queries: np.ndarray,
+        k: int = 10,
+        n_probe: Optional[int] = None,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        코사인 Top-k 이웃 (queries는 정규화된 (q, dim))
+
+        Returns:
+            (이웃 ID (q, k), 유사도 (q, k)) — 이웃이 k개보다 적으면 ID -1, 유사도 -inf
+        """
+        queries = np.atleast_2d(np.asarray(queries, dtype=np.float32))
+        k = min(k, len(self))
+        ids = np.full((len(queries), k), -1, dtype=np.int64)
+        sims = np.full((len(queries), k), -np.inf, dtype=np.float32)
+        if k == 0:
+            return ids, sims
+
+        if self.centroids is None or n_probe is None or n_probe >= self.n_lists:
+            # 전수 탐색 (메모리맵 행렬을 그대로 1회 행렬곱)
+            all_sims = queries @ np.asarray(self.vectors).T
+            for q in range(len(queries)):
+                ids[q], sims[q] = self._top_k(np.arange(len(self)), all_sims[q], k)
+            return ids, sims
+
+        probes = np.argsort(-(queries @ self.centroids.T), axis=1)[:, :n_probe]
+        for q in range(len(queries)):
+            # 정렬된 ID로 모아 읽으면 메모리맵 접근이 순차적
+            candidates = np.sort(np.concatenate([
+                self.list_order[self.list_offsets[l]:self.list_offsets[l + 1]]
+                for l in probes[q]
+            ]))
+            if len(candidates) == 0:
+                continue
+            cand_sims = np.asarray(self.vectors[candidates]) @ queries[q]
+            found_ids, found_sims = self._top_k(candidates, cand_sims, k)
+            ids[q, :len(found_ids)] = found_ids
+            sims[q, :len(found_sims)] = found_sims
+        return ids, sims
+
+    @staticmethod
+    def _top_k(candidates: np.ndarray, sims: np.ndarray, k: int) -> Tuple[np.ndarray, np.ndarray]:
+        k = min(k, len(candidates))
+        top = np.argpartition(-sims, k - 1)[:k]
+        top = top[np.lexsort((candidates[top], -sims[top]))]
+        return candidates[top], sims[top]
+
+    def neighbors(
+        self,
+        skills: Iterable[str],
+        threshold: float,
+        k: int = 16,
+        n_probe: Optional[int] = None,
+    ) -> List[Tuple[str, float]]:
+        """
+        주어진 스킬들의 유사 스킬 (유사도 threshold 이상, 스킬별 최대값)
+
+        어휘에 없는 스킬은 무시
+        """
+        ids = self.ids_for(skills)
+        ids = ids[ids >= 0]
+        if len(ids) == 0:
+            return []
+
+        found_ids, found_sims = self.search(
+            np.asarray(self.vectors[np.sort(ids)]), k=k, n_probe=n_probe
+        )
+        best = {}
+        for skill_id, sim in zip(found_ids.ravel().tolist(), found_sims.ravel().tolist()):
+            if skill_id >= 0 and sim >= threshold and sim > best.get(skill_id, -1.0):
+                best[skill_id] = sim
+        return [(self.skills[i], min(1.0, s)) for i, s in best.items()]
+
+    def max_similarity(self, targets: Sequence[str], sources: Iterable[str]) -> np.ndarray:
+        """
+        targets 각각에 대한 sources 중 최대 코사인 유사도 (어휘에 없으면 0)
+        """
+        result = np.zeros(len(targets), dtype=np.float32)
+        target_ids = self.ids_for(targets)
+        source_ids = self.ids_for(sources)
+        source_ids = source_ids[source_ids >= 0]
+        known = np.flatnonzero(target_ids >= 0)
+        if len(known) == 0 or len(source_ids) == 0:
+            return result
+
+        sims = np.asarray(self.vectors[target_ids[known]]) @ np.asarray(self.vectors[source_ids]).T
+        result[known] = np.clip(sims.max(axis=1), 0.0, 1.0)
+        return result
+
+    # =========================================================
+    # 저장 / 로드
+    # =========================================================
+    def save(self, path: str) -> None:
+        """임베딩 행렬(.npy) + 어휘(.vocab.json) + IVF(.ivf.npz, 있을 때) 저장"""
+        vocab_path, ivf_path = embedding_sidecar_paths(path)
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+
+        np.save(path, np.asarray(self.vectors, dtype=np.float32))
+        with open(vocab_path, "w", encoding="utf-8") as f:
+            json.dump({"skills": self.skills, "dim": self.dim}, f, ensure_ascii=False)
+
+        if self.centroids is not None:
+            np.savez(
+                ivf_path,
+                centroids=self.centroids,
+                list_order=self.list_order,
+                list_offsets=self.list_offsets,
+            )
+        elif os.path.exists(ivf_path):
+            os.remove(ivf_path)
+
+    @classmethod
+    def load(cls, path: str) -> "SkillEmbeddingIndex":
+        """임베딩 행렬은 메모리맵(읽기 전용)으로 로드"""
+        vocab_path, ivf_path = embedding_sidecar_paths(path)
+        if not os.path.exists(vocab_path):
+            raise ModelLoadError(
+                message=f"스킬 임베딩 어휘 파일이 없습니다: {vocab_path}",
+                details={"path": path}
+            )
+
+        vectors = np.load(path, mmap_mode="r")
+        with open(vocab_path, "r", encoding="utf-8") as f:
+            meta = json.load(f)
+
+        if vectors.ndim != 2 or vectors.shape[1] != meta.get("dim", vectors.shape[1]):
+            raise ModelLoadError(
+                message=f"스킬 임베딩 차원 불일치: {vectors.shape} (어휘 dim={meta.get('dim')})",
+                details={"path": path}
+            )
+
+        ivf = {}
+        if os.path.exists(ivf_path):
+            with np.load(ivf_path) as data:
+                ivf = {key: data[key] for key in ("centroids", "list_order", "list_offsets")}
+
+        try:
+            return cls(meta["skills"], vectors, **ivf)
+        except ValueError as e:
+            raise ModelLoadError(message=str(e), details={"path": path})
+
+
+def load_skill_embeddings(path: Optional[str] = None) -> Optional[SkillEmbeddingIndex]:
+    """
+    서비스 시작 시 스킬 임베딩 로드 (파일이 없으면 None → 정확 일치만 사용)
+    """
+    path = path or settings.SKILL_EMBEDDING_PATH
+
+    if not path or not os.path.exists(path):
+        logger.warning(f"스킬 임베딩 파일이 없습니다: {path}")
+        return None
+
+    index = SkillEmbeddingIndex.load(path)
+    logger.info(
+        f"스킬 임베딩 로드 완료: {len(index)}개 × {index.dim}차원 "
+        f"(IVF 목록 {index.n_lists}개, {path})"
+    )
+    return index
@@ -0,0 +1,48 @@
+import threading
+from typing import Dict, Iterable, List, Optional
+
+import numpy as np
+
+
+class SkillVocabulary:
+    """
+    스킬 문자열 → 정수 ID 인터닝
+
+    매칭 엔진은 스킬을 문자열 대신 ID 배열로 다룸 (문자열 비교는 그대로 정확 일치)
+    """
+
+    def __init__(self):
+        self._ids: Dict[str, int] = {}
+        self._names: List[str] = []
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def intern(self, skill: str) -> int:
+        skill_id = self._ids.get(skill)
+        if skill_id is None:
+            with self._lock:
+                skill_id = self._ids.get(skill)
+                if skill_id is None:
+                    skill_id = len(self._names)
+                    self._ids[skill] = skill_id
+                    self._names.append(skill)
+        return skill_id
+
+    def intern_many(self, skills: Iterable[str]) -> np.ndarray:
+        """중복 제거된 스킬 ID 배열 (없으면 새로 등록)"""
+        return np.unique(
+            np.fromiter((self.intern(s) for s in skills), dtype=np.int32)
+        )
+
+    def lookup(self, skill: str) -> Optional[int]:
+        return self._ids.get(skill)
+
+    def lookup_many(self, skills: Iterable[str]) -> np.ndarray:
+        """등록된 스킬만 ID로 변환 (모르는 스킬은 어떤 공고와도 일치하지 않으므로 제외)"""
+        ids = [self._ids[s] for s in skills if s in self._ids]
+        return np.unique(np.array(ids, dtype=np.int32))
+
+    def name(self, skill_id: int) -> str:
+        return self._names[skill_id]
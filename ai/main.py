@@ -1,18 +1,31 @@
 from fastapi import FastAPI, Request, status
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.openapi.utils import get_openapi
-from fastapi.responses import JSONResponse
-import uvicorn
+from fastapi.responses import JSONResponse, PlainTextResponse
 import logging
 import traceback
 
 # ✅ 라우터는 모듈에서 직접 import (순환 import 방지)
 from api.v1.health import router as health_router
 from api.v1.monitoring import router as monitoring_router
+from openApi.v1.monitoring import router as monitoring_rollup_router
+from api.v1.matching import router as matching_router
+from api.v1.fit import router as fit_router
+from api.v1.job_risk import router as job_risk_router
+from api.v1.admin import router as admin_router
 
 from config.settings import Settings
 from models.loader import load_models
+from models.registry import model_registry
+from services.backend_push import backend_pusher
+from services.posting_catalog import load_posting_catalog
+from services.priority_index import priority_index
+from utils.admission import AdmissionMiddleware, admission_controller
+from utils.coalescing import CoalescingMiddleware
 from utils.logger import setup_logger
+from utils.metrics import ERRORS, MetricsMiddleware, metrics
+from utils.profiling import ProfilingMiddleware
+from utils.result_cache import result_cache
 from utils.exceptions import (
     BaseAPIException,
     ValidationError,
@@ -37,6 +50,15 @@ app = FastAPI(
     redoc_url="/redoc",
 )
 
+# 수용 제어: 경로 분류별 동시 처리 상한 + 유한 대기열, 넘치면 503 + Retry-After
+# (가장 안쪽 미들웨어 → 거절 응답도 CORS / 요청 지표 / 프로파일링 대상)
+if settings.ADMISSION_ENABLED:
+    app.add_middleware(AdmissionMiddleware)
+
+# 같은 본문의 요청이 동시에 들어오면 계산 1회를 공유 (수용 제어 바깥: 합쳐진 요청은 자리를 쓰지 않음)
+if settings.COALESCE_ENABLED:
+    app.add_middleware(CoalescingMiddleware)
+
 # CORS 설정 (Backend 연동)
 app.add_middleware(
     CORSMiddleware,
@@ -46,6 +68,19 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# 요청 수 / 처리 시간 (GET /metrics)
+if settings.METRICS_ENABLED:
+    app.add_middleware(MetricsMiddleware)
+
+# 온디맨드 프로파일링 (X-Profile 헤더 / PROFILE_SAMPLE_RATE, 목록은 GET /api/v1/admin/profiles)
+app.add_middleware(ProfilingMiddleware)
+
+# 스크레이프 시점에 읽는 지표
+metrics.add_collector(model_registry.metric_families)
+metrics.add_collector(result_cache.metric_families)
+metrics.add_collector(admission_controller.metric_families)
+metrics.add_collector(backend_pusher.metric_families)
+
 # 전역 예외 핸들러
 @app.exception_handler(BaseAPIException)
 async def api_exception_handler(request: Request, exc: BaseAPIException):
@@ -58,6 +93,7 @@ async def api_exception_handler(request: Request, exc: BaseAPIException):
     elif isinstance(exc, (ModelPredictionError, ServiceError)):
         status_code = status.HTTP_500_INTERNAL_SERVER_ERROR
 
+    ERRORS.inc((exc.error_code,))
     logger.error(
         f"API 예외 발생: {exc.error_code} - {exc.message}",
         exc_info=True,
@@ -75,6 +111,7 @@ async def api_exception_handler(request: Request, exc: BaseAPIException):
 
 @app.exception_handler(ValueError)
 async def value_error_handler(request: Request, exc: ValueError):
+    ERRORS.inc(("VALIDATION_ERROR",))
     logger.error(f"입력 검증 오류: {str(exc)}", exc_info=True)
 
     return JSONResponse(
@@ -89,6 +126,7 @@ async def value_error_handler(request: Request, exc: ValueError):
 
 @app.exception_handler(Exception)
 async def general_exception_handler(request: Request, exc: Exception):
+    ERRORS.inc(("INTERNAL_SERVER_ERROR",))
     error_traceback = traceback.format_exc()
     logger.error(
         f"예상치 못한 오류 발생: {str(exc)}\n{error_traceback}",
@@ -108,23 +146,63 @@ async def general_exception_handler(request: Request, exc: Exception):
 # 모델 로드 (앱 시작 시)
 @app.on_event("startup")
 async def startup_event():
-    logger.info("ML 모델 로딩 시작...")
+    # 모델은 백그라운드 병렬 로드 (기동을 막지 않음, 준비 여부는 GET /health)
+    # 스키마 불일치 등 계약 위반 모델은 failed로 기록되고 /health가 준비되지 않음으로 응답
+    load_models()
+
     try:
-        load_models()
-        logger.info("ML 모델 로드 완료")
+        load_posting_catalog()
     except Exception as e:
-        logger.error(f"모델 로드 실패: {str(e)}", exc_info=True)
-        logger.warning("모델이 없어도 규칙 기반 로직으로 동작합니다.")
+        logger.error(f"공고 카탈로그 적재 실패: {str(e)}", exc_info=True)
 
+    # 매칭 우선순위 인덱스 (백그라운드 적재 + 파일 감시, 실패해도 기동, 요청 경로는 스냅샷만 읽음)
+    priority_index.start_watcher()
 
-# 헬스 체크
+    # 백엔드로 결과 전송 (이상 경보 / 점수 갱신)
+    if settings.BACKEND_PUSH_ENABLED:
+        await backend_pusher.start()
+
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    model_registry.stop_watcher()
+    priority_index.stop_watcher()
+    await backend_pusher.stop()
+
+
+# 헬스 체크 (모든 모델 로드 시도가 끝나고 실패가 없을 때만 200)
 @app.get("/health")
 async def health_check():
-    return {
-        "status": "ok",
+    ready = model_registry.is_ready()
+    body = {
+        "status": "ok" if ready else "loading",
+        "ready": ready,
         "service": "ml-service",
         "version": "1.0.0",
     }
+    if not ready:
+        failed = [
+            name for name, info in model_registry.status()["models"].items()
+            if info["status"] == "failed"
+        ]
+        if failed:
+            body["status"] = "degraded"
+            body["failed_models"] = failed
+        return JSONResponse(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, content=body)
+    return body
+
+
+# 모델별 상태 (버전, 로드 시간, 메모리)
+@app.get("/health/models")
+async def model_status():
+    return model_registry.status()
+
+
+# Prometheus 텍스트 형식 지표 (단계별 지연 시간, 요청 / 오류 수, 모델 상태, 결과 캐시)
+# 워커 프로세스별 값 (serve.py 다중 워커에서는 스크레이프한 워커 기준, 결과 캐시만 전체 합산)
+@app.get("/metrics", include_in_schema=False)
+async def prometheus_metrics():
+    return PlainTextResponse(metrics.render(), media_type="text/plain; version=0.0.4")
 
 
 # ✅ 라우터 등록
@@ -140,6 +218,24 @@ app.include_router(
     tags=["Monitoring"],
 )
 
+app.include_router(
+    monitoring_rollup_router,
+    prefix="/api/ml/v1",
+    tags=["Monitoring Rollup"],
+)
+
+# 매칭 라우터는 자체 prefix(/api/v1/matching) 사용
+app.include_router(matching_router)
+
+# 산업재해 리스크 라우터는 자체 prefix(/api/v1/job-risk) 사용
+app.include_router(job_risk_router)
+
+# 종합 적합도 라우터는 자체 prefix(/api/v1/fit) 사용
+app.include_router(fit_router)
+
+# 관리 라우터 (모델 재로드 등, 자체 prefix /api/v1/admin)
+app.include_router(admin_router)
+
 
 # OpenAPI 커스터마이징
 def custom_openapi():
@@ -159,6 +255,8 @@ app.openapi = custom_openapi
 
 
 if __name__ == "__main__":
+    import uvicorn
+
     uvicorn.run(
         "main:app",
         host="0.0.0.0",
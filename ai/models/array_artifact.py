@@ -0,0 +1,98 @@
+import json
+import os
+import struct
+from typing import Dict, Tuple
+
+import numpy as np
+
+from utils.exceptions import ModelLoadError
+
+# 파일 구조: MAGIC(4) | 헤더 길이(uint32 LE) | 헤더 JSON(UTF-8) | 0 패딩(64바이트 정렬) | 배열들
+# 배열 위치/shape/dtype은 헤더 "arrays"에 기록 (메모리맵으로 바로 접근)
+# 메모리맵 배열은 페이지 캐시를 그대로 쓰므로 여러 워커 프로세스가 물리 메모리 1벌을 공유
+ALIGN = 64
+
+
+def _align(offset: int) -> int:
+    return (offset + ALIGN - 1) // ALIGN * ALIGN
+
+
+def write_array_artifact(
+    path: str,
+    magic: bytes,
+    format_version: int,
+    header: dict,
+    arrays: Dict[str, np.ndarray],
+) -> None:
+    """
+    배열 아티팩트 저장 (임시 파일에 쓴 뒤 교체)
+
+    Args:
+        header: 메타데이터 (arrays 위치 정보와 format_version은 여기서 추가)
+        arrays: 이름 → 배열 (dtype 유지, 리틀 엔디언으로 저장)
+    """
+    header = dict(header, format_version=format_version, arrays={})
+    encoded = {}
+
+    # 헤더 길이가 배열 오프셋에 영향을 주므로 오프셋을 헤더 끝 기준 상대값으로 기록
+    offset = 0
+    for name, array in arrays.items():
+        array = np.ascontiguousarray(array)
+        array = array.astype(array.dtype.newbyteorder("<"), copy=False)
+        encoded[name] = array
+        offset = _align(offset)
+        header["arrays"][name] = {"offset": offset, "shape": list(array.shape), "dtype": array.dtype.str}
+        offset += array.nbytes
+
+    header_bytes = json.dumps(header, ensure_ascii=False).encode("utf-8")
+    data_start = _align(len(magic) + 4 + len(header_bytes))
+
+    tmp_path = path + ".tmp"
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    with open(tmp_path, "wb") as f:
+        f.write(magic)
+        f.write(struct.pack("<I", len(header_bytes)))
+        f.write(header_bytes)
+        for name, array in encoded.items():
+            f.write(b"\0" * (data_start + header["arrays"][name]["offset"] - f.tell()))
+            f.write(array.tobytes())
+    os.replace(tmp_path, path)
+
+
+def read_array_artifact(
+    path: str,
+    magic: bytes,
+    format_version: int,
+    kind: str = "배열 아티팩트",
+    mode: str = "r",
+) -> Tuple[dict, Dict[str, np.ndarray]]:
+    """
+    배열 아티팩트 열기 → (헤더, 이름 → 메모리맵 배열)
+
+    mode="r"은 읽기 전용, "c"는 copy-on-write (쓰기 가능한 배열이 필요한 torch.from_numpy 등,
+    실제로 쓰기 전까지는 복사 없음)
+    """
+    with open(path, "rb") as f:
+        if f.read(len(magic)) != magic:
+            raise ModelLoadError(
+                message=f"{kind} 파일 형식이 아닙니다: {path}",
+                details={"path": path}
+            )
+        (header_len,) = struct.unpack("<I", f.read(4))
+        header = json.loads(f.read(header_len).decode("utf-8"))
+
+    if header.get("format_version") != format_version:
+        raise ModelLoadError(
+            message=f"지원하지 않는 {kind} 버전: {header.get('format_version')}",
+            details={"path": path}
+        )
+
+    data_start = _align(len(magic) + 4 + header_len)
+    arrays = {
+        name: np.memmap(
+            path, mode=mode, dtype=np.dtype(meta["dtype"]),
+            offset=data_start + meta["offset"], shape=tuple(meta["shape"]),
+        )
+        for name, meta in header["arrays"].items()
+    }
+    return header, arrays
@@ -1,16 +1,21 @@
 import os
+import sys
 import pickle
 import numpy as np
 from sklearn.ensemble import IsolationForest
 
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from features.feature_schema import MONITORING_SCHEMA_V1, write_schema_sidecar
+
 # ======================================================
 # 설정
 # ======================================================
 MODEL_DIR = "ai/models"
 MODEL_PATH = os.path.join(MODEL_DIR, "isolation_forest.pkl")
 
-# monitoring_features.py의 to_model_input() 기준
-FEATURE_DIM = 10  # ⚠️ 반드시 일치해야 함
+# features/feature_schema.py의 모니터링 스키마 기준
+SCHEMA = MONITORING_SCHEMA_V1
+FEATURE_DIM = SCHEMA.dim
 
 # ======================================================
 # 더미 학습 데이터 생성
@@ -52,5 +57,9 @@ os.makedirs(MODEL_DIR, exist_ok=True)
 with open(MODEL_PATH, "wb") as f:
     pickle.dump(model, f)
 
+# 피처 스키마 메타데이터 (서빙 시 로드 단계에서 검증)
+sidecar_path = write_schema_sidecar(MODEL_PATH, SCHEMA)
+
 print("✅ Isolation Forest 재학습 완료")
 print(f"📦 저장 위치: {MODEL_PATH}")
+print(f"🧾 피처 스키마: {SCHEMA.key} ({SCHEMA.fingerprint}) → {sidecar_path}")
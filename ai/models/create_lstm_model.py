@@ -1,7 +1,21 @@
+import os
+import sys
+
 import torch
 from lstm_model import AnomalyLSTM
 
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from features.feature_schema import MONITORING_SCHEMA_V1, write_schema_sidecar
+from export_lstm_tensors import TENSORS_PATH, export_lstm
+
+MODEL_PATH = "ai/models/lstm_model.pt"
+
 if __name__ == "__main__":
-    model = AnomalyLSTM()
-    torch.save(model.state_dict(), "ai/models/lstm_model.pt")
+    model = AnomalyLSTM(input_size=MONITORING_SCHEMA_V1.dim)
+    torch.save(model.state_dict(), MODEL_PATH)
+    write_schema_sidecar(MODEL_PATH, MONITORING_SCHEMA_V1)
     print("✅ LSTM state_dict 저장 완료")
+
+    # 서빙용 pickle 없는 텐서 아티팩트 (메모리맵, torch 없이 로드)
+    export_lstm(model.state_dict(), TENSORS_PATH, MONITORING_SCHEMA_V1)
+    print(f"✅ LSTM 텐서 아티팩트 저장 완료: {TENSORS_PATH}")
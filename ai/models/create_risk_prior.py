@@ -0,0 +1,126 @@
+"""
+산업재해 통계 → 업종 리스크 사전 분포 아티팩트 (models/risk_prior.bin)
+
+입력: data/00_raw/01_산업재해현황.csv (연도 × 나이대 × 사고유형 × 산업분류)
+
+사용법 (저장소 루트에서 실행):
+    python ai/models/create_risk_prior.py
+"""
+import argparse
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from features.job_risk_features import JOB_TYPES
+from services.risk_prior import UNKNOWN_JOB_CODE, write_risk_prior
+
+# ======================================================
+# 설정
+# ======================================================
+SOURCE_PATH = "data/00_raw/01_산업재해현황.csv"
+MODEL_PATH = "ai/models/risk_prior.bin"
+
+# 가중 피해 = 발생건수 + DEATH_WEIGHT × 사망자 + 휴업일수 / LOST_DAYS_PER_CASE
+DEATH_WEIGHT = 10.0
+LOST_DAYS_PER_CASE = 30.0
+# 최근 연도일수록 가중 (1년 전 × YEAR_DECAY)
+YEAR_DECAY = 0.8
+# 가장 위험한 (연령대, 업종) = 기존 고위험 직종 가산점과 같은 30점
+MAX_POINTS = 30.0
+
+# API 직종 → 통계 산업분류 (통계에 없는 직종은 가장 가까운 분류)
+JOB_TYPE_INDUSTRY = {
+    "construction": "건설",
+    "manufacturing": "제조",
+    "mining": "기타",
+    "service": "서비스",
+    "office": "서비스",
+    "other": "기타",
+}
+UNKNOWN_INDUSTRY = "기타"
+
+COLUMNS = {
+    "연도": "year",
+    "나이대": "age_group",
+    "사고유형": "accident_type",
+    "산업분류": "industry",
+    "발생건수": "accident_count",
+    "사망자": "deaths",
+    "휴업일수": "lost_days",
+}
+
+
+def build_prior(df: pd.DataFrame):
+    df = df.rename(columns=COLUMNS)[list(COLUMNS.values())].dropna()
+
+    age_groups = sorted(df["age_group"].astype(str).unique())
+    industries = sorted(df["industry"].astype(str).unique())
+    accident_types = sorted(df["accident_type"].astype(str).unique())
+
+    latest = int(df["year"].max())
+    year_weight = YEAR_DECAY ** (latest - df["year"].astype(int))
+    harm = (
+        df["accident_count"]
+        + DEATH_WEIGHT * df["deaths"]
+        + df["lost_days"] / LOST_DAYS_PER_CASE
+    ) * year_weight
+
+    # harm[연령대 코드, 업종, 사고유형 코드] (코드 0 = 전체)
+    tensor = np.zeros((len(age_groups) + 1, len(industries), len(accident_types) + 1), dtype=np.float64)
+    a = df["age_group"].astype(str).map({g: i + 1 for i, g in enumerate(age_groups)}).to_numpy()
+    i = df["industry"].astype(str).map({g: k for k, g in enumerate(industries)}).to_numpy()
+    t = df["accident_type"].astype(str).map({g: k + 1 for k, g in enumerate(accident_types)}).to_numpy()
+    np.add.at(tensor, (a, i, t), harm.to_numpy())
+    tensor[:, :, 0] = tensor[:, :, 1:].sum(axis=2)
+    # 전체 연령 = 연령대 평균 (연령대 셀과 같은 척도)
+    tensor[0] = tensor[1:].mean(axis=0)
+
+    # 연령대 × 업종 → 0 ~ MAX_POINTS (연령대 셀 전체 기준 min-max)
+    totals = tensor[:, :, 0]
+    lo, hi = totals[1:].min(), totals[1:].max()
+    scaled = np.zeros_like(totals) if hi == lo else np.clip((totals - lo) / (hi - lo), 0.0, 1.0)
+    industry_points = MAX_POINTS * scaled  # (연령대 코드, 업종)
+
+    points = np.zeros((UNKNOWN_JOB_CODE + 1, len(age_groups) + 1), dtype=np.float64)
+    job_names = list(JOB_TYPES) + [None]
+    for code, job_type in enumerate(job_names):
+        industry = JOB_TYPE_INDUSTRY.get(job_type, UNKNOWN_INDUSTRY)
+        points[code] = industry_points[:, industries.index(industry)]
+
+    header = {
+        "source": SOURCE_PATH,
+        "years": sorted(int(y) for y in df["year"].unique()),
+        "age_groups": age_groups,
+        "industries": industries,
+        "accident_types": accident_types,
+        "job_types": list(JOB_TYPES),
+        "job_type_industry": JOB_TYPE_INDUSTRY,
+        "max_points": MAX_POINTS,
+        "death_weight": DEATH_WEIGHT,
+        "year_decay": YEAR_DECAY,
+    }
+    return header, {"points": points, "harm": tensor}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="업종 리스크 사전 분포 생성")
+    parser.add_argument("--source", default=SOURCE_PATH)
+    parser.add_argument("--out", default=MODEL_PATH)
+    args = parser.parse_args()
+
+    df = pd.read_csv(args.source, encoding="utf-8-sig")
+    header, arrays = build_prior(df)
+    write_risk_prior(args.out, header, arrays)
+
+    print("✅ 리스크 사전 분포 생성 완료")
+    print(f"📦 저장 위치: {args.out} ({os.path.getsize(args.out)} bytes)")
+    for code, job_type in enumerate(list(JOB_TYPES) + ["(unknown)"]):
+        row = ", ".join(f"{g}={p:.1f}" for g, p in zip(["all"] + header["age_groups"], arrays["points"][code]))
+        print(f"   {job_type:<14} {row}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""
+스킬 임베딩 인덱스 생성 (오프라인, 서빙은 네트워크 없이 이 파일만 사용)
+
+- --vectors: 외부 임베딩 결과 JSON ({"스킬": [float, ...]})을 그대로 정규화해 저장
+- 없으면 로컬 대체 임베딩: 음절 n-gram 해싱 + 동의어 그룹 공통 방향
+
+사용법 (저장소 루트에서 실행):
+    python ai/models/create_skill_embeddings.py --catalog ai/models/posting_catalog.json
+    python ai/models/create_skill_embeddings.py --vectors skill_vectors.json --ivf-lists 64
+"""
+import argparse
+import hashlib
+import json
+import os
+import sys
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from features.skill_embedding import SkillEmbeddingIndex, normalize_rows
+
+# ======================================================
+# 설정
+# ======================================================
+MODEL_DIR = "ai/models"
+MODEL_PATH = os.path.join(MODEL_DIR, "skill_embeddings.npy")
+DIM = 128
+
+# 로컬 대체 임베딩용 동의어 그룹 (같은 그룹 = 같은 공통 방향)
+SYNONYM_GROUPS = [
+    ["요양보호", "돌봄", "간병", "요양", "방문요양", "노인돌봄"],
+    ["운전", "배송", "배달", "택배", "운송"],
+    ["조리", "조리보조", "주방", "급식"],
+    ["청소", "미화", "환경미화", "시설관리"],
+    ["경비", "보안", "주차관리"],
+    ["상담", "안내", "고객응대"],
+    ["사무", "문서작성", "컴퓨터", "엑셀"],
+    ["원예", "농사", "조경"],
+]
+GROUP_WEIGHT = 2.0
+
+
+def _hash_vector(token: str, dim: int) -> np.ndarray:
+    """토큰 → 고정 난수 방향 (해시 시드, 실행마다 동일)"""
+    seed = int.from_bytes(hashlib.sha256(token.encode("utf-8")).digest()[:8], "little")
+    return np.random.default_rng(seed).standard_normal(dim).astype(np.float32)
+
+
+def local_embedding(skill: str, dim: int = DIM) -> np.ndarray:
+    """음절 1~3-gram 해싱 + 동의어 그룹 방향"""
+    text = skill.replace(" ", "")
+    vector = np.zeros(dim, dtype=np.float32)
+    for n in (1, 2, 3):
+        for i in range(len(text) - n + 1):
+            vector += _hash_vector(f"{n}:{text[i:i + n]}", dim)
+    vector /= max(np.linalg.norm(vector), 1e-12)
+
+    for g, group in enumerate(SYNONYM_GROUPS):
+        if skill in group:
+            vector += GROUP_WEIGHT * _hash_vector(f"group:{g}", dim) / np.sqrt(dim)
+    return vector
+
+
+def collect_skills(catalog_path):
+    skills = [s for group in SYNONYM_GROUPS for s in group]
+    if catalog_path and os.path.exists(catalog_path):
+        with open(catalog_path, "r", encoding="utf-8") as f:
+            for posting in json.load(f):
+                skills.extend(posting.get("required_skills", []))
+    return list(dict.fromkeys(skills))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="스킬 임베딩 인덱스 생성")
+    parser.add_argument("--vectors", help="외부 임베딩 JSON ({스킬: 벡터})")
+    parser.add_argument("--catalog", help="공고 카탈로그 JSON (로컬 임베딩 어휘 수집용)")
+    parser.add_argument("--ivf-lists", type=int, default=0, help="IVF 목록 수 (0이면 전수 탐색)")
+    parser.add_argument("--out", default=MODEL_PATH)
+    args = parser.parse_args()
+
+    if args.vectors:
+        with open(args.vectors, "r", encoding="utf-8") as f:
+            table = json.load(f)
+        skills = list(table)
+        vectors = np.array([table[s] for s in skills], dtype=np.float32)
+    else:
+        skills = collect_skills(args.catalog)
+        vectors = np.stack([local_embedding(s) for s in skills])
+
+    index = SkillEmbeddingIndex(skills, normalize_rows(vectors))
+    if args.ivf_lists:
+        index.build_ivf(args.ivf_lists)
+    index.save(args.out)
+
+    print("✅ 스킬 임베딩 인덱스 생성 완료")
+    print(f"📦 저장 위치: {args.out} ({len(index)}개 × {index.dim}차원, IVF 목록 {index.n_lists}개)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+"""
+AnomalyLSTM state_dict(.pt) → pickle 없는 텐서 아티팩트(.tensors)
+
+헤더 JSON(하이퍼파라미터, 텐서 shape/dtype, 피처 스키마) + 64바이트 정렬 텐서 버퍼.
+서빙은 메모리맵으로 바로 읽고 numpy로 추론 (torch 불필요)
+
+사용법 (저장소 루트에서 실행):
+    python ai/models/create_lstm_model.py      # .pt + .tensors 함께 생성
+    python ai/models/export_lstm_tensors.py    # 기존 .pt만 변환
+"""
+import argparse
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from features.feature_schema import resolve_artifact_schema
+from models.tensor_artifact import LSTMArtifact, lstm_meta, write_tensor_artifact
+
+# ======================================================
+# 설정
+# ======================================================
+MODEL_DIR = "ai/models"
+PT_PATH = os.path.join(MODEL_DIR, "lstm_model.pt")
+TENSORS_PATH = os.path.join(MODEL_DIR, "lstm_model.tensors")
+
+
+def export_lstm(state_dict, path: str, schema) -> LSTMArtifact:
+    """state_dict → 텐서 아티팩트 저장 후 다시 열어 반환"""
+    write_tensor_artifact(path, state_dict, lstm_meta(state_dict, schema))
+    return LSTMArtifact(path)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="LSTM 텐서 아티팩트 변환")
+    parser.add_argument("--pt", default=PT_PATH)
+    parser.add_argument("--out", default=TENSORS_PATH)
+    args = parser.parse_args()
+
+    import torch
+
+    state_dict = torch.load(args.pt, map_location="cpu", weights_only=True)
+    schema = resolve_artifact_schema(args.pt, int(state_dict["lstm.weight_ih_l0"].shape[1]))
+    artifact = export_lstm(state_dict, args.out, schema)
+
+    print("✅ LSTM 텐서 아티팩트 생성 완료")
+    print(f"📦 저장 위치: {args.out} ({os.path.getsize(args.out)} bytes)")
+    print(f"🧾 hidden={artifact.hidden_size}, layers={artifact.num_layers}, 스키마 {artifact.schema_key}")
+
+
+if __name__ == "__main__":
+    main()
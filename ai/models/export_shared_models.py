@@ -0,0 +1,53 @@
+"""
+공유 메모리 배포용 모델 아티팩트 변환
+
+isolation_forest.pkl → isolation_forest.forest (평탄화 노드 배열, 메모리맵)
+피처 스키마 사이드카(isolation_forest.schema.json)는 같은 이름이라 그대로 사용
+
+사용법 (저장소 루트에서 실행):
+    python ai/models/export_shared_models.py
+    MODEL_SHARED_MEMORY=true python ai/serve.py --workers 4
+"""
+import argparse
+import os
+import sys
+
+import joblib
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from features.feature_schema import resolve_artifact_schema
+from models.shared_forest import SharedIsolationForest, export_isolation_forest
+
+# ======================================================
+# 설정
+# ======================================================
+MODEL_DIR = "ai/models"
+IFOREST_PATH = os.path.join(MODEL_DIR, "isolation_forest.pkl")
+SHARED_IFOREST_PATH = os.path.join(MODEL_DIR, "isolation_forest.forest")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="공유 메모리 모델 아티팩트 변환")
+    parser.add_argument("--iforest", default=IFOREST_PATH)
+    parser.add_argument("--out", default=SHARED_IFOREST_PATH)
+    args = parser.parse_args()
+
+    model = joblib.load(args.iforest)
+    schema = resolve_artifact_schema(args.iforest, getattr(model, "n_features_in_", None))
+    export_isolation_forest(model, args.out, {"schema": schema.key, "source": args.iforest})
+
+    # 변환 검증: 같은 입력에 sklearn과 같은 점수
+    shared = SharedIsolationForest(args.out)
+    X = np.random.default_rng(0).normal(size=(256, model.n_features_in_)) * 20 + 50
+    diff = float(np.abs(shared.decision_function(X) - model.decision_function(X)).max())
+    if diff > 1e-9:
+        raise SystemExit(f"❌ 점수 불일치 (최대 차이 {diff})")
+
+    print("✅ Isolation Forest 공유 메모리 아티팩트 생성 완료")
+    print(f"📦 저장 위치: {args.out} ({os.path.getsize(args.out)} bytes)")
+    print(f"🧾 트리 {shared.n_estimators}개, 최대 깊이 {shared.max_depth}, 점수 최대 차이 {diff:.2e}")
+
+
+if __name__ == "__main__":
+    main()
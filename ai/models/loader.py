@@ -1,82 +1,221 @@
 import pickle
 import os
 import logging
+from datetime import datetime, timedelta
 from typing import Optional
 
-import joblib
-import torch
+import numpy as np
 
 from config.settings import settings
+from features.feature_schema import DEFAULT_MONITORING_SCHEMA, get_schema, resolve_artifact_schema
+from models.registry import LoadedArtifact, ModelEntry, ModelStatus, model_registry
+from models.shared_forest import SharedIsolationForest
+from models.tensor_artifact import LSTMArtifact
+from utils.exceptions import ModelLoadError
 
 logger = logging.getLogger(__name__)
 
+# 모델 파일 기본 위치 (models 폴더)
+MODEL_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
 # =========================
-# 전역 모델 캐시
+# 아티팩트별 로더 / 검증
 # =========================
 
-_health_model: Optional[object] = None
-_lstm_model: Optional[object] = None
-_iforest_model: Optional[object] = None
+def _load_pickle(path: str):
+    with open(path, "rb") as f:
+        return pickle.load(f)
 
 
-# =========================
-# Health Model
-# =========================
+def _load_joblib(path: str):
+    import joblib
 
-def get_health_model():
-    """
-    건강점수 모델 가져오기
-    """
-    global _health_model
+    # 공유 메모리 모드: joblib으로 저장된 numpy 배열은 메모리맵 (워커 간 페이지 공유)
+    return joblib.load(path, mmap_mode="r" if settings.MODEL_SHARED_MEMORY else None)
 
-    if _health_model is None:
-        logger.warning("건강점수 모델이 로드되지 않았습니다. 기본값을 사용합니다.")
-        return None
 
-    return _health_model
+def _load_shared_forest(path: str):
+    return SharedIsolationForest(path)
 
 
-def load_health_model(model_path: Optional[str] = None) -> bool:
-    """
-    건강점수 모델 로드
-    """
-    global _health_model
+def _load_torch_state(path: str):
+    # torch는 레거시 .pt 아티팩트가 있을 때만 import (기동 시간 / 메모리)
+    import torch
+
+    return torch.load(path, map_location="cpu")
+
+
+def _load_lstm(path: str):
+    """텐서 아티팩트(.tensors, 메모리맵 + numpy 추론) 또는 레거시 torch state_dict(.pt)"""
+    if path.endswith(".pt"):
+        return _load_torch_state(path)
+    return LSTMArtifact(path)
+
 
-    if model_path is None:
-        model_path = settings.HEALTH_MODEL_PATH
+def _lstm_path() -> str:
+    """텐서 아티팩트 우선, 레거시 .pt만 있으면 .pt"""
+    tensors_path = os.path.join(MODEL_DIR, "lstm_model.tensors")
+    legacy_path = os.path.join(MODEL_DIR, "lstm_model.pt")
+    if not os.path.exists(tensors_path) and os.path.exists(legacy_path):
+        return legacy_path
+    return tensors_path
 
-    if not model_path or not os.path.exists(model_path):
-        logger.warning(f"건강점수 모델 파일을 찾을 수 없습니다: {model_path}")
-        _health_model = None
-        return False
 
-    try:
-        with open(model_path, "rb") as f:
-            _health_model = pickle.load(f)
-        logger.info(f"건강점수 모델 로드 완료: {model_path}")
-        return True
-    except Exception as e:
-        logger.error(f"건강점수 모델 로드 실패: {str(e)}")
-        _health_model = None
-        return False
+def _lstm_input_dim(state) -> Optional[int]:
+    """state_dict에서 LSTM 입력 차원 추출"""
+    weight = state.get("lstm.weight_ih_l0") if hasattr(state, "get") else None
+    return int(weight.shape[1]) if weight is not None else None
+
+
+def _validate_lstm(path: str, state) -> str:
+    """피처 스키마가 맞지 않으면 ModelLoadError"""
+    schema = resolve_artifact_schema(path, _lstm_input_dim(state))
+
+    # 텐서 아티팩트는 헤더에도 스키마 해시가 있음
+    if isinstance(state, LSTMArtifact) and state.meta.get("fingerprint"):
+        if state.meta["fingerprint"] != get_schema(state.schema_key).fingerprint:
+            raise ModelLoadError(
+                message=f"피처 스키마 해시 불일치: {path}",
+                details={"schema": state.schema_key, "artifact": state.meta["fingerprint"]}
+            )
+        return state.schema_key
+    return schema.key
+
+
+def _validate_isolation_forest(path: str, model) -> str:
+    schema = resolve_artifact_schema(path, getattr(model, "n_features_in_", None))
+    logger.info(f"Isolation Forest 피처 스키마: {schema.key} ({schema.fingerprint})")
+    return schema.key
 
 
 # =========================
-# Monitoring Models
+# 워밍업 프로브 (교체 전 새 모델로 실제 추론, 출력이 유한해야 통과)
 # =========================
 
+# 건강점수 피처 (bmi, chronic, mobility, cognitive)
+HEALTH_PROBE_FEATURES = np.array([
+    [0.5, 0.8, 0.9, 0.9],
+    [1.0, 1.0, 1.0, 1.0],
+    [0.2, 0.4, 0.5, 0.6],
+])
+
+
+def _probe_readings():
+    """정상 / 빈맥 / 저활동 센서 시계열"""
+    start = datetime(2024, 1, 1, 9, 0)
+    patterns = (
+        (72, 30, "walking"),
+        (125, 5, "standing"),
+        (58, 0, "lying"),
+    )
+    return [
+        [
+            {
+                "timestamp": start + timedelta(minutes=i),
+                "heart_rate": hr + (i % 3),
+                "step_count": steps * i,
+                "activity": activity,
+            }
+            for i in range(20)
+        ]
+        for hr, steps, activity in patterns
+    ]
+
+
+def _require_finite(name: str, output) -> None:
+    values = np.asarray(output, dtype=np.float64)
+    if values.size == 0 or not np.all(np.isfinite(values)):
+        raise ValueError(f"[{name}] 워밍업 프로브 출력이 유효하지 않습니다: {values!r}")
+
+
+def _probe_health(model, schema_key: Optional[str]) -> None:
+    _require_finite("health", model.predict(HEALTH_PROBE_FEATURES))
+
+
+def _probe_isolation_forest(model, schema_key: Optional[str]) -> None:
+    schema = get_schema(schema_key or DEFAULT_MONITORING_SCHEMA)
+    X = np.stack([schema.extract(readings) for readings in _probe_readings()])
+    _require_finite("isolation_forest", model.decision_function(X))
+
+
+def register_default_models() -> None:
+    """서비스가 쓰는 모든 모델 아티팩트 등록"""
+    model_registry.register("health", settings.HEALTH_MODEL_PATH, _load_pickle, probe=_probe_health)
+    # 공유 메모리 모드는 models/export_shared_models.py로 만든 메모리맵 아티팩트 사용
+    if settings.MODEL_SHARED_MEMORY:
+        iforest_path, iforest_loader = os.path.join(MODEL_DIR, "isolation_forest.forest"), _load_shared_forest
+    else:
+        iforest_path, iforest_loader = os.path.join(MODEL_DIR, "isolation_forest.pkl"), _load_joblib
+    model_registry.register(
+        "isolation_forest",
+        iforest_path,
+        iforest_loader,
+        _validate_isolation_forest,
+        _probe_isolation_forest,
+    )
+    # 기동 후 .tensors를 내보내면 파일 감시가 .pt → .tensors로 전환
+    model_registry.register("lstm", _lstm_path(), _load_lstm, _validate_lstm, resolve_path=_lstm_path)
+    model_registry.register("job_risk", settings.JOB_RISK_MODEL_PATH, _load_pickle)
+    model_registry.register("matching", settings.MATCHING_MODEL_PATH, _load_pickle)
+
+
+register_default_models()
+
+
+# =========================
+# 조회
+# =========================
+
+def get_health_model():
+    """
+    건강점수 모델 가져오기
+    """
+    model = model_registry.get("health")
+    if model is None:
+        logger.debug("건강점수 모델이 로드되지 않았습니다. 기본값을 사용합니다.")
+    return model
+
+
 def get_lstm_model():
     """
     LSTM 이상 탐지 모델 가져오기
     """
-    return _lstm_model
+    return model_registry.get("lstm")
 
 
 def get_isolation_forest():
     """
     Isolation Forest 모델 가져오기
     """
-    return _iforest_model
+    return model_registry.get("isolation_forest")
+
+
+def get_model_artifact(model_name: str) -> Optional[LoadedArtifact]:
+    """
+    모델 + 버전 + 스키마 (재로드로 교체돼도 한 요청 안에서는 같은 버전)
+    """
+    return model_registry.artifact(model_name)
+
+
+def get_model_schema(model_name: str) -> Optional[str]:
+    """
+    로드된 모델이 기대하는 피처 스키마 키
+    """
+    entry = model_registry.entry(model_name)
+    return entry.schema_key if entry is not None else None
+
+
+# =========================
+# 동기 로드 (스크립트 / 테스트용)
+# =========================
+
+def load_health_model(model_path: Optional[str] = None) -> bool:
+    """
+    건강점수 모델 로드
+    """
+    entry = model_registry.load("health", model_path)
+    return entry.status == ModelStatus.READY
 
 
 def load_monitoring_models(
@@ -85,41 +224,20 @@ def load_monitoring_models(
 ) -> None:
     """
     Monitoring용 ML 모델 로드 (LSTM + Isolation Forest)
+
+    피처 스키마가 맞지 않으면 ModelLoadError
     """
-    global _lstm_model, _iforest_model
+    for name, path in (("lstm", lstm_path), ("isolation_forest", iforest_path)):
+        entry = model_registry.load(name, path)
+        _raise_if_failed(entry)
 
-    # 기본 경로 (설정값 없으면 models 폴더 기준)
-    base_dir = os.path.dirname(os.path.abspath(__file__))
 
-    if lstm_path is None:
-        lstm_path = os.path.join(base_dir, "lstm_model.pt")
-
-    if iforest_path is None:
-        iforest_path = os.path.join(base_dir, "isolation_forest.pkl")
-
-    # LSTM 로드
-    if os.path.exists(lstm_path):
-        try:
-            _lstm_model = torch.load(lstm_path, map_location="cpu")
-            logger.info(f"LSTM 모델 로드 완료: {lstm_path}")
-        except Exception as e:
-            logger.error(f"LSTM 모델 로드 실패: {str(e)}")
-            _lstm_model = None
-    else:
-        logger.warning(f"LSTM 모델 파일이 없습니다: {lstm_path}")
-        _lstm_model = None
-
-    # Isolation Forest 로드
-    if os.path.exists(iforest_path):
-        try:
-            _iforest_model = joblib.load(iforest_path)
-            logger.info(f"Isolation Forest 모델 로드 완료: {iforest_path}")
-        except Exception as e:
-            logger.error(f"Isolation Forest 모델 로드 실패: {str(e)}")
-            _iforest_model = None
-    else:
-        logger.warning(f"Isolation Forest 모델 파일이 없습니다: {iforest_path}")
-        _iforest_model = None
+def _raise_if_failed(entry: ModelEntry) -> None:
+    if entry.status == ModelStatus.FAILED:
+        raise ModelLoadError(
+            message=f"[{entry.name}] 모델 로드 실패: {entry.error}",
+            details={"path": entry.path}
+        )
 
 
 # =========================
@@ -128,28 +246,18 @@ def load_monitoring_models(
 
 def load_models():
     """
-    모든 ML 모델 로드
-    앱 시작 시 호출됨
+    모든 ML 모델을 백그라운드 스레드에서 병렬 로드 시작
+    앱 시작 시 호출됨 (완료 여부는 model_registry.is_ready() / GET /health)
     """
-    logger.info("모델 로딩 시작...")
-
-    # 1️⃣ Health 모델
-    load_health_model()
-
-    # 2️⃣ Monitoring 모델 (실패해도 서버 유지)
-    load_monitoring_models()
-
-    logger.info("모델 로딩 완료")
+    logger.info("모델 로딩 시작 (백그라운드)...")
+    model_registry.start()
+    # 아티팩트 파일이 바뀌면 무중단 재로드 (0이면 관리 API로만)
+    model_registry.start_watcher(settings.MODEL_RELOAD_CHECK_SEC)
 
 
 def clear_models():
     """
     모델 캐시 클리어 (테스트용)
     """
-    global _health_model, _lstm_model, _iforest_model
-
-    _health_model = None
-    _lstm_model = None
-    _iforest_model = None
-
+    model_registry.clear()
     logger.info("모델 캐시 클리어 완료")
@@ -0,0 +1,532 @@
+import hashlib
+import logging
+import os
+import pickle
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from enum import Enum
+from typing import Any, Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class ModelStatus(str, Enum):
+    PENDING = "pending"    # 등록만 됨
+    LOADING = "loading"
+    READY = "ready"
+    MISSING = "missing"    # 파일 없음 (서비스는 규칙 기반으로 동작)
+    FAILED = "failed"      # 로드/검증 실패
+
+
+def file_version(path: str) -> str:
+    """아티팩트 내용 해시 (sha256 앞 12자리)"""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()[:12]
+
+
+def estimate_memory(model: Any) -> int:
+    """
+    모델 메모리 추정 (bytes)
+
+    텐서/배열 dict는 원소 크기 합, 그 외는 pickle 직렬화 크기
+    """
+    if isinstance(model, dict):
+        total = 0
+        for value in model.values():
+            if hasattr(value, "nbytes"):
+                total += int(value.nbytes)
+            elif hasattr(value, "element_size") and hasattr(value, "nelement"):
+                total += int(value.element_size() * value.nelement())
+            else:
+                return _pickled_size(model)
+        return total
+    if hasattr(model, "nbytes"):
+        return int(model.nbytes)
+    return _pickled_size(model)
+
+
+def _pickled_size(model: Any) -> int:
+    try:
+        return len(pickle.dumps(model, protocol=pickle.HIGHEST_PROTOCOL))
+    except Exception:
+        return 0
+
+
+class LoadedArtifact:
+    """
+    로드 + 검증 + 워밍업까지 끝난 모델 1개 (불변)
+
+    교체는 엔트리의 참조 1개를 바꾸는 것으로 끝나므로 원자적.
+    이미 이전 아티팩트를 잡은 요청은 그대로 이전 버전으로 끝남
+    """
+
+    __slots__ = ("model", "path", "version", "schema_key", "mtime",
+                 "loaded_at", "load_seconds", "probe_seconds", "memory_bytes")
+
+    def __init__(self, model, path, version, schema_key, mtime,
+                 load_seconds, probe_seconds, memory_bytes):
+        self.model = model
+        self.path = path
+        self.version = version
+        self.schema_key = schema_key
+        self.mtime = mtime
+        self.loaded_at = time.time()
+        self.load_seconds = load_seconds
+        self.probe_seconds = probe_seconds
+        self.memory_bytes = memory_bytes
+
+
+class ModelEntry:
+    """레지스트리에 등록된 아티팩트 1개의 상태"""
+
+    def __init__(
+        self,
+        name: str,
+        path: str,
+        loader: Callable[[str], Any],
+        validator: Optional[Callable[[str, Any], Optional[str]]] = None,
+        probe: Optional[Callable[[Any, Optional[str]], None]] = None,
+        resolve_path: Optional[Callable[[], str]] = None,
+    ):
+        self.name = name
+        self.path = path
+        self.loader = loader
+        # 형식이 여러 개인 아티팩트: 로드 / 파일 감시 때마다 경로를 다시 고름 (예: .tensors 우선, 없으면 .pt)
+        self.resolve_path = resolve_path
+        # (경로, 모델) → 피처 스키마 키 (검증 실패 시 예외)
+        self.validator = validator
+        # (모델, 스키마 키) → 워밍업 추론 (출력이 이상하면 예외)
+        self.probe = probe
+
+        self.status = ModelStatus.PENDING
+        self.artifact: Optional[LoadedArtifact] = None
+        self.error: Optional[str] = None
+        # 마지막 재로드 결과 (시간, 교체 여부, 오류)
+        self.last_reload: Optional[dict] = None
+        # 같은 모델의 재로드는 한 번에 하나 (관리 API + 파일 감시)
+        self.reload_lock = threading.Lock()
+
+    def current_path(self) -> str:
+        return self.resolve_path() if self.resolve_path is not None else self.path
+
+    @property
+    def model(self) -> Any:
+        artifact = self.artifact
+        return artifact.model if artifact is not None else None
+
+    @property
+    def version(self) -> Optional[str]:
+        artifact = self.artifact
+        return artifact.version if artifact is not None else None
+
+    @property
+    def schema_key(self) -> Optional[str]:
+        artifact = self.artifact
+        return artifact.schema_key if artifact is not None else None
+
+    @property
+    def load_seconds(self) -> Optional[float]:
+        artifact = self.artifact
+        return artifact.load_seconds if artifact is not None else None
+
+    @property
+    def memory_bytes(self) -> Optional[int]:
+        artifact = self.artifact
+        return artifact.memory_bytes if artifact is not None else None
+
+    def to_dict(self) -> dict:
+        artifact = self.artifact
+        return {
+            "name": self.name,
+            "status": self.status.value,
+            "path": artifact.path if artifact is not None else self.path,
+            "version": artifact.version if artifact is not None else None,
+            "schema": artifact.schema_key if artifact is not None else None,
+            "loaded_at": artifact.loaded_at if artifact is not None else None,
+            "load_seconds": _round(artifact.load_seconds) if artifact is not None else None,
+            "probe_seconds": _round(artifact.probe_seconds) if artifact is not None else None,
+            "memory_bytes": artifact.memory_bytes if artifact is not None else None,
+            "error": self.error,
+            "last_reload": self.last_reload,
+        }
+
+
+def _round(seconds: Optional[float]) -> Optional[float]:
+    return None if seconds is None else round(seconds, 4)
+
+
+class ModelRegistry:
+    """
+    모든 모델 아티팩트의 단일 레지스트리
+
+    - start(): 등록된 모델을 백그라운드 스레드에서 병렬 로드 (앱 시작을 막지 않음)
+    - get(name): 준비된 모델 (없거나 로딩 중이면 None → 서비스는 규칙 기반)
+    - is_ready(): 모든 모델 로드 시도가 끝났고 실패가 없을 때 True
+      (파일 없음은 규칙 기반으로 동작 가능하므로 준비 완료로 봄)
+    - reload(name): 새 아티팩트를 옆에서 로드/검증/워밍업한 뒤 원자적 교체
+      (실패하면 기존 모델 유지), 교체 시 버전 리스너 호출 (결과 캐시 무효화)
+    - check_for_updates(): 파일 mtime이 바뀐 모델만 reload
+    """
+
+    def __init__(self):
+        self._entries: Dict[str, ModelEntry] = {}
+        self._lock = threading.Lock()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._futures: Dict[str, Future] = {}
+        self._listeners: List[Callable[[str, Optional[str], Optional[str]], None]] = []
+        self._watcher: Optional[threading.Thread] = None
+        self._watcher_stop = threading.Event()
+
+    def register(
+        self,
+        name: str,
+        path: str,
+        loader: Callable[[str], Any],
+        validator: Optional[Callable[[str, Any], Optional[str]]] = None,
+        probe: Optional[Callable[[Any, Optional[str]], None]] = None,
+        resolve_path: Optional[Callable[[], str]] = None,
+    ) -> ModelEntry:
+        with self._lock:
+            entry = ModelEntry(name, path, loader, validator, probe, resolve_path)
+            self._entries[name] = entry
+            return entry
+
+    def unregister(self, name: str) -> None:
+        with self._lock:
+            self._entries.pop(name, None)
+            self._futures.pop(name, None)
+
+    def names(self) -> List[str]:
+        return list(self._entries)
+
+    def entry(self, name: str) -> Optional[ModelEntry]:
+        return self._entries.get(name)
+
+    def get(self, name: str) -> Any:
+        entry = self._entries.get(name)
+        return entry.model if entry is not None else None
+
+    def artifact(self, name: str) -> Optional[LoadedArtifact]:
+        """모델 + 버전 + 스키마를 한 번에 (요청 중 교체돼도 서로 어긋나지 않음)"""
+        entry = self._entries.get(name)
+        return entry.artifact if entry is not None else None
+
+    def add_listener(self, callback: Callable[[str, Optional[str], Optional[str]], None]) -> None:
+        """모델 교체 시 (이름, 이전 버전, 새 버전) 콜백 등록"""
+        self._listeners.append(callback)
+
+    def remove_listener(self, callback) -> None:
+        if callback in self._listeners:
+            self._listeners.remove(callback)
+
+    # =========================================================
+    # 로드
+    # =========================================================
+    def start(self, max_workers: Optional[int] = None) -> Dict[str, Future]:
+        """등록된 모든 모델을 백그라운드에서 병렬 로드"""
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=max_workers or max(1, len(self._entries)),
+                    thread_name_prefix="model-loader",
+                )
+            for name, entry in self._entries.items():
+                if entry.status == ModelStatus.PENDING:
+                    entry.status = ModelStatus.LOADING
+                    self._futures[name] = self._executor.submit(self.load, name)
+            return dict(self._futures)
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """백그라운드 로드 완료 대기 (테스트/사전 fork용)"""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        for future in list(self._futures.values()):
+            remaining = None if deadline is None else max(0.0, deadline - time.monotonic())
+            try:
+                future.result(timeout=remaining)
+            except Exception:
+                return False
+        return self.is_ready()
+
+    def shutdown(self) -> None:
+        """로더 스레드 풀 정리 (fork 전에 호출, 자식이 죽은 스레드를 물려받지 않도록)"""
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=True)
+                self._executor = None
+            self._futures.clear()
+
+    def load(self, name: str, path: Optional[str] = None) -> ModelEntry:
+        """
+        모델 1개 동기 로드 (성공하면 참조 교체, 실패 시 상태만 기록)
+
+        재로드와 같은 reload_lock 사용. 이미 서비스 중인 모델이 있으면
+        파일이 없거나 로드에 실패해도 기존 모델을 유지 (첫 로드일 때만 MISSING / FAILED)
+        """
+        entry = self._entries[name]
+        with entry.reload_lock:
+            path = path or entry.current_path()
+            serving = entry.artifact is not None
+            if not serving:
+                entry.status = ModelStatus.LOADING
+
+            if not path or not os.path.exists(path):
+                if serving:
+                    logger.error(f"[{name}] 모델 파일이 없습니다 (기존 모델 유지): {path}")
+                    entry.error = f"모델 파일이 없습니다: {path}"
+                    return entry
+                logger.warning(f"[{name}] 모델 파일이 없습니다: {path}")
+                entry.error = None
+                entry.status = ModelStatus.MISSING
+                return entry
+
+            try:
+                artifact = self._build(entry, path)
+            except Exception as e:
+                message = _error_message(e)
+                entry.error = message
+                if serving:
+                    logger.error(f"[{name}] 모델 로드 실패 (기존 모델 유지): {message}")
+                    return entry
+                logger.error(f"[{name}] 모델 로드 실패: {message}")
+                entry.status = ModelStatus.FAILED
+                return entry
+
+            self._swap(entry, artifact)
+            entry.path = path
+            entry.error = None
+            entry.status = ModelStatus.READY
+
+        logger.info(
+            f"[{name}] 모델 로드 완료: {path} (version={artifact.version}, "
+            f"{artifact.load_seconds * 1000:.1f}ms, {artifact.memory_bytes / 1024:.1f}KB)"
+        )
+        return entry
+
+    def reload(self, name: str, path: Optional[str] = None) -> dict:
+        """
+        무중단 재로드
+
+        새 아티팩트를 별도로 로드 → 검증 → 워밍업 프로브까지 통과해야 교체.
+        실패하면 기존 모델을 그대로 서비스하고 결과만 기록
+        """
+        entry = self._entries[name]
+        with entry.reload_lock:
+            path = path or entry.current_path()
+            previous = entry.version
+            started = time.perf_counter()
+            result = {
+                "name": name,
+                "path": path,
+                "swapped": False,
+                "previous_version": previous,
+                "version": previous,
+                "load_seconds": None,
+                "probe_seconds": None,
+                "total_seconds": None,
+                "error": None,
+                "at": time.time(),
+            }
+
+            if not path or not os.path.exists(path):
+                result["error"] = f"모델 파일이 없습니다: {path}"
+            else:
+                try:
+                    artifact = self._build(entry, path)
+                except Exception as e:
+                    result["error"] = _error_message(e)
+                else:
+                    self._swap(entry, artifact)
+                    entry.path = path
+                    entry.error = None
+                    entry.status = ModelStatus.READY
+                    result.update(
+                        swapped=True,
+                        version=artifact.version,
+                        load_seconds=_round(artifact.load_seconds),
+                        probe_seconds=_round(artifact.probe_seconds),
+                    )
+
+            result["total_seconds"] = _round(time.perf_counter() - started)
+            entry.last_reload = result
+
+        if result["swapped"]:
+            logger.info(
+                f"[{name}] 모델 교체 완료: {previous} → {result['version']} "
+                f"({result['total_seconds'] * 1000:.1f}ms)"
+            )
+        else:
+            logger.error(f"[{name}] 모델 재로드 실패 (기존 모델 유지): {result['error']}")
+        return result
+
+    def check_for_updates(self) -> List[dict]:
+        """파일 mtime이 바뀐 (또는 새로 생긴, 경로가 바뀐) 모델만 재로드"""
+        results = []
+        for name, entry in list(self._entries.items()):
+            if entry.status in (ModelStatus.PENDING, ModelStatus.LOADING):
+                continue
+            path = entry.current_path()
+            try:
+                mtime = os.path.getmtime(path)
+            except OSError:
+                continue
+            artifact = entry.artifact
+            if artifact is not None and artifact.path == path and artifact.mtime == mtime:
+                continue
+            last = entry.last_reload
+            # 같은 파일로 이미 실패했으면 파일이 다시 바뀔 때까지 재시도하지 않음
+            if (
+                last is not None and not last["swapped"]
+                and last.get("path") == path and last.get("mtime") == mtime
+            ):
+                continue
+            result = self.reload(name, path)
+            result["mtime"] = mtime
+            results.append(result)
+        return results
+
+    def start_watcher(self, interval_sec: float) -> None:
+        """백그라운드 파일 감시 (interval_sec <= 0이면 사용 안 함)"""
+        if interval_sec <= 0 or self._watcher is not None:
+            return
+        self._watcher_stop.clear()
+
+        def run():
+            while not self._watcher_stop.wait(interval_sec):
+                try:
+                    self.check_for_updates()
+                except Exception as e:
+                    logger.error(f"모델 파일 감시 실패: {str(e)}", exc_info=True)
+
+        self._watcher = threading.Thread(target=run, name="model-watcher", daemon=True)
+        self._watcher.start()
+
+    def stop_watcher(self) -> None:
+        self._watcher_stop.set()
+        if self._watcher is not None:
+            self._watcher.join(timeout=5)
+            self._watcher = None
+
+    def build_candidate(self, name: str, path: str) -> LoadedArtifact:
+        """
+        등록된 모델과 같은 로더/검증/워밍업으로 후보 아티팩트만 만듦 (교체하지 않음, 섀도 평가용)
+        """
+        if not os.path.exists(path):
+            raise FileNotFoundError(f"모델 파일이 없습니다: {path}")
+        return self._build(self._entries[name], path)
+
+    def _build(self, entry: ModelEntry, path: str) -> LoadedArtifact:
+        """로드 → 스키마 검증 → 워밍업 프로브 (서비스 중인 모델은 건드리지 않음)"""
+        mtime = os.path.getmtime(path)
+        start = time.perf_counter()
+        model = entry.loader(path)
+        schema_key = entry.validator(path, model) if entry.validator else None
+        load_seconds = time.perf_counter() - start
+
+        probe_seconds = None
+        if entry.probe is not None:
+            probe_start = time.perf_counter()
+            entry.probe(model, schema_key)
+            probe_seconds = time.perf_counter() - probe_start
+
+        return LoadedArtifact(
+            model=model,
+            path=path,
+            version=file_version(path),
+            schema_key=schema_key,
+            mtime=mtime,
+            load_seconds=load_seconds,
+            probe_seconds=probe_seconds,
+            memory_bytes=estimate_memory(model),
+        )
+
+    def _swap(self, entry: ModelEntry, artifact: Optional[LoadedArtifact]) -> None:
+        previous = entry.version
+        entry.artifact = artifact
+        current = entry.version
+        if previous == current:
+            return
+        for callback in list(self._listeners):
+            try:
+                callback(entry.name, previous, current)
+            except Exception as e:
+                logger.error(f"모델 교체 리스너 실패: {str(e)}", exc_info=True)
+
+    def clear(self) -> None:
+        """로드된 모델 해제 (테스트용, 등록 정보는 유지)"""
+        with self._lock:
+            for entry in self._entries.values():
+                entry.artifact = None
+                entry.error = None
+                entry.last_reload = None
+                entry.status = ModelStatus.PENDING
+            self._futures.clear()
+
+    # =========================================================
+    # 상태
+    # =========================================================
+    def is_ready(self) -> bool:
+        return all(
+            entry.status in (ModelStatus.READY, ModelStatus.MISSING)
+            for entry in self._entries.values()
+        )
+
+    def status(self) -> dict:
+        return {
+            "ready": self.is_ready(),
+            "models": {name: entry.to_dict() for name, entry in self._entries.items()},
+        }
+
+    def metric_families(self):
+        """GET /metrics 수집기: 모델별 로드 상태 / 로드 시간 / 메모리"""
+        entries = list(self._entries.values())
+        yield (
+            "if_model_status", "gauge", "모델 로드 상태 (현재 상태 레이블만 1)",
+            [
+                ({"model": e.name, "status": s.value}, 1 if e.status == s else 0)
+                for e in entries for s in ModelStatus
+            ],
+        )
+        yield (
+            "if_model_load_seconds", "gauge", "현재 모델 로드 + 검증 소요 시간",
+            [({"model": e.name}, e.load_seconds) for e in entries if e.load_seconds is not None],
+        )
+        yield (
+            "if_model_memory_bytes", "gauge", "현재 모델 메모리 추정",
+            [({"model": e.name}, e.memory_bytes) for e in entries if e.memory_bytes is not None],
+        )
+
+
+def _error_message(e: Exception) -> str:
+    return getattr(e, "message", None) or str(e)
+
+
+model_registry = ModelRegistry()
+
+
+class RegistryModel:
+    """
+    서비스 속성 → 레지스트리의 현재 모델
+
+    요청마다 레지스트리를 조회하므로 재로드된 모델이 바로 반영됨.
+    인스턴스에 직접 대입하면 그 인스턴스에서만 해당 값으로 고정 (테스트에서 model = None 등)
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+
+    def __set_name__(self, owner, attr: str):
+        self.attr = f"_{attr}_pinned"
+
+    def __get__(self, obj, objtype=None):
+        if obj is None:
+            return self
+        if self.attr in obj.__dict__:
+            return obj.__dict__[self.attr]
+        return model_registry.get(self.name)
+
+    def __set__(self, obj, value):
+        obj.__dict__[self.attr] = value
@@ -0,0 +1,235 @@
+import logging
+import queue
+import threading
+import time
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from config.settings import settings
+from models.registry import LoadedArtifact, model_registry
+
+logger = logging.getLogger(__name__)
+
+# 모델별 점수 함수 (주 모델이 요청 경로에서 쓰는 것과 같은 메서드)
+SCORE_METHODS = {
+    "health": "predict",
+    "isolation_forest": "decision_function",
+}
+
+# 결정 일치율: 점수 < 기준이면 이상 (Isolation Forest decision_function 부호)
+DECISION_THRESHOLDS = {
+    "isolation_forest": 0.0,
+}
+
+
+class ShadowStats:
+    """주 모델 vs 후보 점수의 최근 window건 링버퍼 + 누적 카운터"""
+
+    def __init__(self, window: int):
+        self.window = window
+        self.primary = np.zeros(window, dtype=np.float64)
+        self.candidate = np.zeros(window, dtype=np.float64)
+        self.filled = 0
+        self.cursor = 0
+        self.scored = 0
+        self.batches = 0
+        self.errors = 0
+        self.dropped = 0
+        self.last_error: Optional[str] = None
+        self.last_batch_ms: Optional[float] = None
+
+    def add(self, primary: np.ndarray, candidate: np.ndarray) -> None:
+        n = len(primary)
+        if n >= self.window:
+            primary, candidate = primary[-self.window:], candidate[-self.window:]
+            n = self.window
+        idx = (self.cursor + np.arange(n)) % self.window
+        self.primary[idx] = primary
+        self.candidate[idx] = candidate
+        self.cursor = int((self.cursor + n) % self.window)
+        self.filled = min(self.window, self.filled + n)
+
+    def summary(self, threshold: Optional[float] = None) -> dict:
+        n = self.filled
+        result = {
+            "scored": self.scored,
+            "dropped": self.dropped,
+            "errors": self.errors,
+            "batches": self.batches,
+            "last_batch_ms": None if self.last_batch_ms is None else round(self.last_batch_ms, 3),
+            "last_error": self.last_error,
+            "window": n,
+        }
+        if n == 0:
+            return result
+
+        primary, candidate = self.primary[:n], self.candidate[:n]
+        delta = candidate - primary
+        abs_delta = np.abs(delta)
+        result.update(
+            delta_mean=float(delta.mean()),
+            delta_std=float(delta.std()),
+            abs_delta_mean=float(abs_delta.mean()),
+            abs_delta_p50=float(np.percentile(abs_delta, 50)),
+            abs_delta_p95=float(np.percentile(abs_delta, 95)),
+            abs_delta_max=float(abs_delta.max()),
+            primary_mean=float(primary.mean()),
+            candidate_mean=float(candidate.mean()),
+        )
+        if n > 1 and primary.std() > 0 and candidate.std() > 0:
+            result["correlation"] = float(np.corrcoef(primary, candidate)[0, 1])
+        if threshold is not None:
+            result["decision_agreement"] = float(np.mean((primary < threshold) == (candidate < threshold)))
+        return result
+
+
+class ShadowCandidate:
+    def __init__(self, name: str, artifact: LoadedArtifact, window: int):
+        self.name = name
+        self.artifact = artifact
+        self.method = SCORE_METHODS.get(name, "predict")
+        self.stats = ShadowStats(window)
+        self.registered_at = time.time()
+
+    def to_dict(self) -> dict:
+        primary = model_registry.entry(self.name)
+        return {
+            "name": self.name,
+            "candidate_path": self.artifact.path,
+            "candidate_version": self.artifact.version,
+            "primary_version": primary.version if primary is not None else None,
+            "registered_at": self.registered_at,
+            "stats": self.stats.summary(DECISION_THRESHOLDS.get(self.name)),
+        }
+
+
+class ShadowScorer:
+    """
+    후보 모델 섀도 평가 (요청 지연 없음)
+
+    - submit(): 요청 경로에서 (입력 벡터, 주 모델 점수)를 큐에 넣기만 함
+      후보가 없으면 즉시 반환, 큐가 가득 차면 버리고 dropped 증가 (대기 없음)
+    - 백그라운드 스레드가 모아서 후보 모델로 배치 점수 계산 → 점수 차이 통계
+    """
+
+    def __init__(
+        self,
+        queue_size: Optional[int] = None,
+        batch_size: Optional[int] = None,
+        batch_wait_sec: Optional[float] = None,
+        window: Optional[int] = None,
+    ):
+        self.queue: "queue.Queue" = queue.Queue(maxsize=queue_size or settings.SHADOW_QUEUE_SIZE)
+        self.batch_size = batch_size or settings.SHADOW_BATCH_SIZE
+        self.batch_wait_sec = settings.SHADOW_BATCH_WAIT_SEC if batch_wait_sec is None else batch_wait_sec
+        self.window = window or settings.SHADOW_WINDOW
+        self._candidates: Dict[str, ShadowCandidate] = {}
+        self._lock = threading.Lock()
+        self._worker: Optional[threading.Thread] = None
+
+    # =========================================================
+    # 후보 관리
+    # =========================================================
+    def set_candidate(self, name: str, path: str) -> ShadowCandidate:
+        """주 모델과 같은 검증/워밍업을 통과한 후보 등록 (기존 후보는 교체, 통계 초기화)"""
+        if model_registry.entry(name) is None:
+            raise KeyError(name)
+        artifact = model_registry.build_candidate(name, path)
+        candidate = ShadowCandidate(name, artifact, self.window)
+        with self._lock:
+            self._candidates[name] = candidate
+            self._ensure_worker()
+        logger.info(f"[{name}] 섀도 후보 등록: {path} (version={artifact.version})")
+        return candidate
+
+    def remove_candidate(self, name: str) -> Optional[ShadowCandidate]:
+        with self._lock:
+            return self._candidates.pop(name, None)
+
+    def candidate(self, name: str) -> Optional[ShadowCandidate]:
+        return self._candidates.get(name)
+
+    def status(self) -> dict:
+        return {
+            "queue_size": self.queue.qsize(),
+            "queue_capacity": self.queue.maxsize,
+            "candidates": {name: c.to_dict() for name, c in list(self._candidates.items())},
+        }
+
+    # =========================================================
+    # 요청 경로
+    # =========================================================
+    def submit(self, name: str, features, primary_score) -> bool:
+        candidate = self._candidates.get(name)
+        if candidate is None:
+            return False
+        try:
+            self.queue.put_nowait((candidate, features, primary_score))
+            return True
+        except queue.Full:
+            candidate.stats.dropped += 1
+            return False
+
+    # =========================================================
+    # 백그라운드 배치 평가
+    # =========================================================
+    def _ensure_worker(self) -> None:
+        if self._worker is None or not self._worker.is_alive():
+            self._worker = threading.Thread(target=self._run, name="shadow-scorer", daemon=True)
+            self._worker.start()
+
+    def _next_batch(self) -> List[tuple]:
+        batch = [self.queue.get()]
+        deadline = time.monotonic() + self.batch_wait_sec
+        while len(batch) < self.batch_size:
+            remaining = deadline - time.monotonic()
+            try:
+                batch.append(self.queue.get(timeout=remaining) if remaining > 0 else self.queue.get_nowait())
+            except queue.Empty:
+                break
+        return batch
+
+    def _run(self) -> None:
+        while True:
+            batch = self._next_batch()
+            by_candidate: Dict[int, List[tuple]] = {}
+            for item in batch:
+                by_candidate.setdefault(id(item[0]), []).append(item)
+            for items in by_candidate.values():
+                self.score_batch(items)
+            for _ in batch:
+                self.queue.task_done()
+
+    def score_batch(self, items: List[tuple]) -> None:
+        candidate = items[0][0]
+        # 이미 교체/삭제된 후보의 잔여 항목은 버림
+        if self._candidates.get(candidate.name) is not candidate:
+            return
+        stats = candidate.stats
+        start = time.perf_counter()
+        try:
+            X = np.vstack([np.asarray(features, dtype=np.float64).reshape(1, -1) for _, features, _ in items])
+            primary = np.asarray([float(score) for _, _, score in items], dtype=np.float64)
+            scores = np.asarray(
+                getattr(candidate.artifact.model, candidate.method)(X), dtype=np.float64
+            ).reshape(-1)
+        except Exception as e:
+            stats.errors += len(items)
+            stats.last_error = str(e)
+            logger.warning(f"[{candidate.name}] 섀도 점수 계산 실패: {str(e)}")
+            return
+        stats.add(primary, scores)
+        stats.scored += len(items)
+        stats.batches += 1
+        stats.last_batch_ms = (time.perf_counter() - start) * 1000
+
+    def flush(self, timeout: float = 5.0) -> bool:
+        """큐가 빌 때까지 대기 (테스트용)"""
+        deadline = time.monotonic() + timeout
+        while self.queue.unfinished_tasks and time.monotonic() < deadline:
+            time.sleep(0.005)
+        return self.queue.unfinished_tasks == 0
+
+
+shadow_scorer = ShadowScorer()
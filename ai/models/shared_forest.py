@@ -0,0 +1,139 @@
+from typing import Optional
+
+import numpy as np
+
+from models.array_artifact import read_array_artifact, write_array_artifact
+
+# 파일 구조는 models/array_artifact.py (메모리맵 → 워커 간 물리 메모리 공유)
+MAGIC = b"IFSF"
+FORMAT_VERSION = 1
+
+EULER_GAMMA = 0.5772156649015329
+
+
+def average_path_length(n: np.ndarray) -> np.ndarray:
+    """n개 샘플 iTree의 평균 경로 길이 c(n) (sklearn _average_path_length와 동일)"""
+    n = np.asarray(n, dtype=np.float64)
+    out = np.zeros_like(n)
+    two = n == 2
+    many = n > 2
+    out[two] = 1.0
+    out[many] = 2.0 * (np.log(n[many] - 1.0) + EULER_GAMMA) - 2.0 * (n[many] - 1.0) / n[many]
+    return out
+
+
+def export_isolation_forest(model, path: str, header: Optional[dict] = None) -> None:
+    """
+    학습된 sklearn IsolationForest → 평탄화 배열 아티팩트
+
+    트리 전체 노드를 한 배열에 이어 붙이고 리프는 자기 자신을 가리키게 해서
+    고정 깊이만큼 벡터 순회하면 모든 트리의 리프에 도달
+    """
+    lefts, rights, features, thresholds, leaf_values, roots = [], [], [], [], [], []
+    offset = 0
+    max_depth = 0
+
+    for estimator, tree_features in zip(model.estimators_, model.estimators_features_):
+        tree = estimator.tree_
+        n = tree.node_count
+        left = tree.children_left.astype(np.int64)
+        right = tree.children_right.astype(np.int64)
+        is_leaf = left == -1
+
+        # 노드 깊이 (부모가 항상 자식보다 앞 번호)
+        depth = np.zeros(n, dtype=np.int64)
+        for node in range(n):
+            if not is_leaf[node]:
+                depth[left[node]] = depth[node] + 1
+                depth[right[node]] = depth[node] + 1
+        max_depth = max(max_depth, int(depth.max()))
+
+        node_ids = np.arange(n, dtype=np.int64)
+        left = np.where(is_leaf, node_ids, left) + offset
+        right = np.where(is_leaf, node_ids, right) + offset
+        # 트리별 피처 부분집합 → 원본 피처 인덱스
+        feature = np.where(is_leaf, 0, np.asarray(tree_features)[np.maximum(tree.feature, 0)])
+
+        lefts.append(left)
+        rights.append(right)
+        features.append(feature)
+        thresholds.append(np.where(is_leaf, 0.0, tree.threshold))
+        # 리프 경로 길이 = 깊이 + c(리프 샘플 수)
+        leaf_values.append(
+            np.where(is_leaf, depth + average_path_length(tree.n_node_samples), 0.0)
+        )
+        roots.append(offset)
+        offset += n
+
+    meta = dict(
+        header or {},
+        model="IsolationForest",
+        n_estimators=len(model.estimators_),
+        n_features_in=int(model.n_features_in_),
+        max_samples=int(model.max_samples_),
+        max_depth=max_depth,
+        offset=float(model.offset_),
+    )
+    write_array_artifact(path, MAGIC, FORMAT_VERSION, meta, {
+        "roots": np.asarray(roots, dtype=np.int64),
+        "left": np.concatenate(lefts).astype(np.int32),
+        "right": np.concatenate(rights).astype(np.int32),
+        "feature": np.concatenate(features).astype(np.int32),
+        "threshold": np.concatenate(thresholds).astype(np.float64),
+        "leaf_value": np.concatenate(leaf_values).astype(np.float64),
+    })
+
+
+class SharedIsolationForest:
+    """
+    메모리맵 Isolation Forest (export_isolation_forest 아티팩트)
+
+    sklearn 모델과 같은 점수 (decision_function / score_samples / predict).
+    노드 배열이 파일 페이지 캐시를 그대로 쓰므로 워커가 몇 개든 물리 메모리 1벌
+    """
+
+    def __init__(self, path: str):
+        self.header, arrays = read_array_artifact(
+            path, MAGIC, FORMAT_VERSION, kind="Isolation Forest"
+        )
+        self.roots = arrays["roots"]
+        self.left = arrays["left"]
+        self.right = arrays["right"]
+        self.feature = arrays["feature"]
+        self.threshold = arrays["threshold"]
+        self.leaf_value = arrays["leaf_value"]
+
+        self.n_estimators = int(self.header["n_estimators"])
+        self.n_features_in_ = int(self.header["n_features_in"])
+        self.max_depth = int(self.header["max_depth"])
+        self.offset_ = float(self.header["offset"])
+        self._denominator = self.n_estimators * float(
+            average_path_length(np.array([self.header["max_samples"]]))[0]
+        )
+
+    @property
+    def nbytes(self) -> int:
+        return sum(int(a.nbytes) for a in (
+            self.roots, self.left, self.right, self.feature, self.threshold, self.leaf_value
+        ))
+
+    def score_samples(self, X) -> np.ndarray:
+        # sklearn 트리와 같은 비교 (입력은 float32로 변환 후 float64 임계값과 비교)
+        X = np.asarray(X, dtype=np.float32)
+        rows = np.arange(X.shape[0])[None, :]
+        nodes = np.broadcast_to(np.asarray(self.roots)[:, None], (self.n_estimators, X.shape[0]))
+
+        for _ in range(self.max_depth):
+            go_left = X[rows, self.feature[nodes]] <= self.threshold[nodes]
+            nodes = np.where(go_left, self.left[nodes], self.right[nodes])
+
+        depths = self.leaf_value[nodes].sum(axis=0)
+        if self._denominator == 0:
+            return -np.ones(X.shape[0])
+        return -(2.0 ** (-depths / self._denominator))
+
+    def decision_function(self, X) -> np.ndarray:
+        return self.score_samples(X) - self.offset_
+
+    def predict(self, X) -> np.ndarray:
+        return np.where(self.decision_function(X) < 0, -1, 1)
@@ -0,0 +1,147 @@
+from typing import Dict, Iterator, Optional
+
+import numpy as np
+
+from models.array_artifact import read_array_artifact, write_array_artifact
+from utils.exceptions import ModelLoadError
+
+# 파일 구조는 models/array_artifact.py (JSON 헤더 + 64바이트 정렬 텐서 버퍼, 메모리맵)
+# pickle을 쓰지 않으므로 로드 시 임의 코드 실행이 없고 torch 없이도 읽을 수 있음
+MAGIC = b"IFTA"
+FORMAT_VERSION = 1
+
+LSTM_MODEL = "AnomalyLSTM"
+
+
+def write_tensor_artifact(path: str, tensors: Dict[str, object], meta: dict) -> None:
+    """
+    state_dict (torch 텐서 또는 numpy 배열) → 텐서 아티팩트
+
+    Args:
+        meta: 모델 이름 / 하이퍼파라미터 / 피처 스키마 등 (헤더 JSON에 그대로 기록)
+    """
+    arrays = {}
+    for name, tensor in tensors.items():
+        if hasattr(tensor, "detach"):
+            tensor = tensor.detach().cpu().contiguous().numpy()
+        arrays[name] = np.ascontiguousarray(tensor)
+    write_array_artifact(path, MAGIC, FORMAT_VERSION, meta, arrays)
+
+
+def lstm_meta(state: Dict[str, object], schema=None) -> dict:
+    """AnomalyLSTM state_dict에서 하이퍼파라미터 추출 (+ 피처 스키마)"""
+    weight_ih = state["lstm.weight_ih_l0"]
+    num_layers = sum(1 for name in state if name.startswith("lstm.weight_ih_l"))
+    meta = {
+        "model": LSTM_MODEL,
+        "input_size": int(weight_ih.shape[1]),
+        "hidden_size": int(weight_ih.shape[0] // 4),
+        "num_layers": num_layers,
+    }
+    if schema is not None:
+        meta["schema"] = schema.key
+        meta["fingerprint"] = schema.fingerprint
+    return meta
+
+
+def _sigmoid(x: np.ndarray) -> np.ndarray:
+    return 0.5 * (np.tanh(0.5 * x) + 1.0)
+
+
+class TensorArtifact:
+    """
+    메모리맵 텐서 아티팩트 (복사 없이 numpy 배열로 바로 접근)
+
+    state_dict처럼 이름으로 조회 가능 (state["lstm.weight_ih_l0"]),
+    to_torch()는 같은 버퍼를 torch 텐서로 감쌈 (copy-on-write 메모리맵, 복사 없음)
+    """
+
+    def __init__(self, path: str, mode: str = "r"):
+        self.path = path
+        self.meta, self.tensors = read_array_artifact(
+            path, MAGIC, FORMAT_VERSION, kind="텐서 아티팩트", mode=mode
+        )
+
+    def __getitem__(self, name: str) -> np.ndarray:
+        return self.tensors[name]
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.tensors
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.tensors)
+
+    def keys(self):
+        return self.tensors.keys()
+
+    def get(self, name: str, default=None):
+        return self.tensors.get(name, default)
+
+    @property
+    def nbytes(self) -> int:
+        return sum(int(t.nbytes) for t in self.tensors.values())
+
+    def to_torch(self) -> Dict[str, object]:
+        """torch state_dict (load_state_dict 용, 메모리맵 버퍼 공유)"""
+        import torch
+
+        tensors = self.tensors
+        if any(not t.flags.writeable for t in tensors.values()):
+            tensors = read_array_artifact(self.path, MAGIC, FORMAT_VERSION, mode="c")[1]
+        return {name: torch.from_numpy(t) for name, t in tensors.items()}
+
+
+class LSTMArtifact(TensorArtifact):
+    """
+    AnomalyLSTM 텐서 아티팩트 + numpy 추론 (torch 없이 서빙)
+
+    forward(x): x (batch, seq_len, input_size) → fc(마지막 층 h_n) (batch, 1)
+    게이트 순서는 torch.nn.LSTM과 같음 (input, forget, cell, output)
+    """
+
+    def __init__(self, path: str, mode: str = "r"):
+        super().__init__(path, mode)
+        if self.meta.get("model") != LSTM_MODEL:
+            raise ModelLoadError(
+                message=f"AnomalyLSTM 아티팩트가 아닙니다: {path}",
+                details={"path": path, "model": self.meta.get("model")}
+            )
+        self.input_size = int(self.meta["input_size"])
+        self.hidden_size = int(self.meta["hidden_size"])
+        self.num_layers = int(self.meta["num_layers"])
+
+    @property
+    def schema_key(self) -> Optional[str]:
+        return self.meta.get("schema")
+
+    def forward(self, x) -> np.ndarray:
+        x = np.asarray(x, dtype=np.float32)
+        if x.ndim == 2:
+            x = x[None, :, :]
+        batch, seq_len, _ = x.shape
+        H = self.hidden_size
+
+        layer_input = x
+        h = np.zeros((batch, H), dtype=np.float32)
+        for layer in range(self.num_layers):
+            w_ih = self[f"lstm.weight_ih_l{layer}"]
+            w_hh = self[f"lstm.weight_hh_l{layer}"]
+            bias = self[f"lstm.bias_ih_l{layer}"] + self[f"lstm.bias_hh_l{layer}"]
+
+            # 입력 투영은 전체 시퀀스를 한 번에
+            projected = layer_input @ w_ih.T + bias
+            h = np.zeros((batch, H), dtype=np.float32)
+            c = np.zeros((batch, H), dtype=np.float32)
+            outputs = np.empty((batch, seq_len, H), dtype=np.float32)
+            for t in range(seq_len):
+                gates = projected[:, t] + h @ w_hh.T
+                i = _sigmoid(gates[:, :H])
+                f = _sigmoid(gates[:, H:2 * H])
+                g = np.tanh(gates[:, 2 * H:3 * H])
+                o = _sigmoid(gates[:, 3 * H:])
+                c = f * c + i * g
+                h = o * np.tanh(c)
+                outputs[:, t] = h
+            layer_input = outputs
+
+        return h @ self["fc.weight"].T + self["fc.bias"]
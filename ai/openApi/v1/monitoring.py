@@ -1,10 +1,23 @@
+from datetime import datetime
+from typing import Optional
+
 from fastapi import APIRouter
-from schemas.monitoring import MonitoringRequest, MonitoringResponse
-from services.monitoring_service import analyze_monitoring
+from schemas.monitoring import MonitoringRequest, MonitoringResponse, RollupResolution
+from services.monitoring_service import analyze_monitoring, query_monitoring
 
 router = APIRouter()
 
 @router.post("/monitoring", response_model=MonitoringResponse)
 def monitoring_api(req: MonitoringRequest):
-    result = analyze_monitoring(req.data)
+    result = analyze_monitoring(req.senior_profile_id, req.data, req.resolution)
     return result
+
+
+@router.get("/monitoring/{senior_profile_id}/rollups", response_model=MonitoringResponse)
+def monitoring_rollups_api(
+    senior_profile_id: int,
+    resolution: RollupResolution = RollupResolution.HOUR,
+    start: Optional[datetime] = None,
+    end: Optional[datetime] = None,
+):
+    return query_monitoring(senior_profile_id, resolution, start, end)
@@ -0,0 +1,57 @@
+"""
+야간 매칭 배치: 전체 구직자 × 오픈 공고 적합도 행렬 생성
+
+사용법 (ai/ 에서 실행):
+    python -m pipelines.matching_pipeline seekers.json postings.json out/matching_matrix.npy
+"""
+import argparse
+import json
+import os
+import time
+
+import numpy as np
+
+from services.matching_matrix import MatchingMatrixEngine
+
+
+def main():
+    parser = argparse.ArgumentParser(description="구직자 × 공고 매칭 점수 행렬 생성")
+    parser.add_argument("seekers_path", help="구직자 JSON 배열 (seeker_id, skills, experience, education)")
+    parser.add_argument("postings_path", help="공고 JSON 배열 (posting_id, required_skills, ...)")
+    parser.add_argument("out_path", help="출력 .npy 경로 (float32, S×P)")
+    parser.add_argument("--tile-seekers", type=int, default=256)
+    parser.add_argument("--tile-postings", type=int, default=4096)
+    args = parser.parse_args()
+
+    with open(args.seekers_path, "r", encoding="utf-8") as f:
+        seekers = json.load(f)
+    with open(args.postings_path, "r", encoding="utf-8") as f:
+        postings = [p for p in json.load(f) if p.get("status", "open") == "open"]
+
+    engine = MatchingMatrixEngine()
+    start = time.perf_counter()
+
+    # 공고를 먼저 인코딩해야 어휘가 채워짐
+    posting_block = engine.encode_postings(postings)
+    seeker_block = engine.encode_seekers(seekers)
+
+    os.makedirs(os.path.dirname(os.path.abspath(args.out_path)), exist_ok=True)
+    engine.write_score_matrix(
+        args.out_path,
+        seeker_block,
+        posting_block,
+        tile_seekers=args.tile_seekers,
+        tile_postings=args.tile_postings,
+    )
+
+    # 행/열 ID 저장 (행렬 인덱스 → seeker_id / posting_id)
+    ids_path = os.path.splitext(args.out_path)[0] + "_ids.npz"
+    np.savez(ids_path, seeker_ids=seeker_block.ids, posting_ids=posting_block.ids)
+
+    elapsed = time.perf_counter() - start
+    print(f"✅ 매칭 행렬 생성 완료: {len(seeker_block)} × {len(posting_block)} ({elapsed:.1f}s)")
+    print(f"📦 저장 위치: {args.out_path}, {ids_path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,25 @@
+from pydantic import BaseModel, Field
+from typing import Optional
+
+
+class ModelReloadRequest(BaseModel):
+    """모델 재로드 요청"""
+    path: Optional[str] = Field(None, description="새 아티팩트 경로 (MODEL_DIR 기준, 그 밖은 거부 / 없으면 등록된 경로)")
+
+
+class ModelReloadResponse(BaseModel):
+    """모델 재로드 결과 (실패 시 기존 모델 유지)"""
+    name: str
+    path: Optional[str] = None
+    swapped: bool = Field(..., description="새 모델로 교체됐는지")
+    previous_version: Optional[str] = None
+    version: Optional[str] = Field(None, description="현재 서비스 중인 버전")
+    load_seconds: Optional[float] = Field(None, description="로드 + 스키마 검증 시간")
+    probe_seconds: Optional[float] = Field(None, description="워밍업 프로브 시간")
+    total_seconds: Optional[float] = None
+    error: Optional[str] = None
+
+
+class ShadowCandidateRequest(BaseModel):
+    """섀도 후보 모델 등록 요청"""
+    path: str = Field(..., description="후보 아티팩트 경로 (MODEL_DIR 기준, 주 모델과 같은 로더/검증/워밍업)")
@@ -0,0 +1,96 @@
+from pydantic import BaseModel, Field
+from typing import Optional, List, Dict
+
+from schemas.health import HealthScoreRequest, RiskLevel
+
+
+class FitJob(BaseModel):
+    """적합도 평가 후보 일자리 (매칭 공고 + 작업 환경)"""
+    job_id: int = Field(..., description="일자리 ID")
+    job_posting: dict = Field(..., description="채용 공고 (required_skills, required_experience, education_level)")
+    job_type: str = Field(..., description="직종")
+    work_environment: Optional[dict] = Field(default={}, description="작업 환경")
+    safety_equipment: Optional[List[str]] = Field(default=[], description="안전 장비")
+
+
+class FitConstraints(BaseModel):
+    """후보 제외 조건"""
+    mobility_limited_threshold: float = Field(
+        default=0.5, ge=0, le=1,
+        description="risk_flags.mobility_limited가 이 값을 넘으면 고위험 일자리 제외"
+    )
+    exclude_high_risk_for_critical_health: bool = Field(
+        default=True, description="건강 위험 수준 critical이면 고위험 일자리 제외"
+    )
+    min_matching_score: float = Field(default=0.0, ge=0, le=100, description="최소 매칭 점수")
+
+
+class FitRequest(BaseModel):
+    """고령자 1명 × 후보 일자리 N개 종합 적합도 요청"""
+    health: HealthScoreRequest = Field(..., description="건강점수 입력")
+    job_seeker_profile: dict = Field(..., description="구직자 프로필 (skills, experience, education)")
+    jobs: List[FitJob] = Field(..., min_length=1, max_length=1000, description="후보 일자리")
+    weights: Optional[dict] = Field(default={}, description="매칭 가중치")
+    fit_weights: Optional[Dict[str, float]] = Field(
+        default=None, description="종합 점수 가중치 (matching, safety)"
+    )
+    constraints: FitConstraints = Field(default_factory=FitConstraints)
+    top_k: Optional[int] = Field(default=None, ge=1, le=1000, description="반환할 일자리 수")
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "health": {
+                    "senior_profile_id": 1,
+                    "height_cm": 165,
+                    "weight_kg": 62.0,
+                    "chronic_conditions": {"arthritis": True},
+                    "risk_flags": {"mobility_limited": 0.6}
+                },
+                "job_seeker_profile": {
+                    "skills": ["요양보호", "운전"],
+                    "experience": 3,
+                    "education": "high_school"
+                },
+                "jobs": [
+                    {
+                        "job_id": 101,
+                        "job_posting": {"required_skills": ["요양보호"], "required_experience": 2},
+                        "job_type": "service",
+                        "safety_equipment": ["gloves"]
+                    },
+                    {
+                        "job_id": 102,
+                        "job_posting": {"required_skills": ["운전"], "required_experience": 1},
+                        "job_type": "construction",
+                        "work_environment": {"height": "high", "machinery": True}
+                    }
+                ]
+            }
+        }
+
+
+class FitJobResult(BaseModel):
+    """일자리별 종합 적합도"""
+    job_id: int
+    fit_score: float = Field(..., ge=0, le=100, description="종합 적합도")
+    matching_score: float = Field(..., ge=0, le=100)
+    job_risk_score: float = Field(..., ge=0, le=100)
+    job_risk_level: str
+    score_breakdown: Dict[str, float]
+
+
+class FitExcludedJob(BaseModel):
+    """제외된 일자리"""
+    job_id: int
+    reason: str
+    job_risk_level: str
+
+
+class FitResponse(BaseModel):
+    """종합 적합도 응답 (fit_score 내림차순)"""
+    senior_profile_id: int
+    health_score: float
+    health_risk_level: RiskLevel
+    results: List[FitJobResult]
+    excluded: List[FitExcludedJob]
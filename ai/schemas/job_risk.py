@@ -8,6 +8,9 @@ class JobRiskRequest(BaseModel):
     work_environment: Optional[dict] = Field(default={}, description="작업 환경")
     safety_equipment: Optional[List[str]] = Field(default=[], description="안전 장비")
     experience_years: Optional[int] = Field(default=0, description="경력 연수", ge=0)
+    age_group: Optional[str] = Field(
+        default=None, description="연령대 (50-59, 60-69, 70+) — 업종 리스크 사전 분포 조회용"
+    )
     
     class Config:
         json_schema_extra = {
@@ -18,7 +21,8 @@ class JobRiskRequest(BaseModel):
                     "machinery": True
                 },
                 "safety_equipment": ["helmet", "safety_harness"],
-                "experience_years": 5
+                "experience_years": 5,
+                "age_group": "60-69"
             }
         }
 
@@ -45,3 +49,13 @@ class JobRiskResponse(BaseModel):
                 ]
             }
         }
+
+
+class JobRiskBatchRequest(BaseModel):
+    """산업재해 리스크 일괄 예측 요청"""
+    requests: List[JobRiskRequest] = Field(..., min_length=1, max_length=10000, description="예측 요청 목록")
+
+
+class JobRiskBatchResponse(BaseModel):
+    """산업재해 리스크 일괄 예측 응답 (요청 순서 유지)"""
+    results: List[JobRiskResponse]
@@ -51,3 +51,90 @@ class MatchingResponse(BaseModel):
                 ]
             }
         }
+
+
+class MatchingRankRequest(BaseModel):
+    """구직자 1명 × 공고 N개 Top-K 랭킹 요청"""
+    job_seeker_profile: dict = Field(..., description="구직자 프로필")
+    job_postings: Optional[List[dict]] = Field(
+        default=None, description="채용 공고 목록 (posting_id 포함 권장)"
+    )
+    posting_ids: Optional[List[int]] = Field(
+        default=None, description="카탈로그 공고 ID 목록 (job_postings가 없을 때)"
+    )
+    top_k: int = Field(default=10, ge=1, le=1000, description="반환할 공고 수")
+    weights: Optional[dict] = Field(default={}, description="가중치 설정")
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "job_seeker_profile": {
+                    "skills": ["요양보호", "운전"],
+                    "experience": 3,
+                    "education": "high_school"
+                },
+                "job_postings": [
+                    {
+                        "posting_id": 101,
+                        "required_skills": ["요양보호"],
+                        "required_experience": 2,
+                        "education_level": "high_school"
+                    },
+                    {
+                        "posting_id": 102,
+                        "required_skills": ["운전", "배송"],
+                        "required_experience": 5,
+                        "education_level": "high_school"
+                    }
+                ],
+                "top_k": 5
+            }
+        }
+
+
+class RankedPosting(BaseModel):
+    """랭킹된 공고"""
+    posting_id: int
+    matching_score: float = Field(..., ge=0, le=100)
+    score_breakdown: Dict[str, float]
+
+
+class MatchingRankResponse(BaseModel):
+    """Top-K 랭킹 응답"""
+    total_candidates: int = Field(..., description="점수를 계산한 공고 수")
+    results: List[RankedPosting]
+    seeker_priority: Optional[float] = Field(
+        default=None,
+        description=(
+            "파이프라인 매칭 우선순위 (구직자 senior_id / age_group 기준, 없으면 null). "
+            "참고값: 구직자 단위 값이라 공고 순서 / 점수에는 반영되지 않음"
+        )
+    )
+
+
+class PriorityEntry(BaseModel):
+    """고령자 매칭 우선순위"""
+    senior_key: int
+    age_group: str
+    senior_score: float
+    priority: float
+
+
+class MatchingPriorityResponse(BaseModel):
+    """매칭 우선순위 순서 응답"""
+    age_group: Optional[str] = None
+    group_priority: Optional[float] = Field(default=None, description="연령대 평균 우선순위")
+    results: List[PriorityEntry]
+
+
+class CatalogPosting(BaseModel):
+    """카탈로그 공고 (posting_id 필수, 나머지 필드는 그대로 보관)"""
+    posting_id: int = Field(..., description="공고 ID")
+
+    class Config:
+        extra = "allow"
+
+
+class PostingUpsertRequest(BaseModel):
+    """카탈로그 공고 추가/갱신 요청 (전체 검증 후 한 번에 반영)"""
+    postings: List[CatalogPosting] = Field(..., min_length=1, description="posting_id를 포함한 공고 목록")
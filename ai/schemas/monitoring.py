@@ -94,3 +94,51 @@ class AnomalyDetectionResponse(BaseModel):
             }
         }
 
+
+# =========================================================
+# 모니터링 롤업 (대시보드용 집계)
+# =========================================================
+class RollupResolution(str, Enum):
+    MINUTE = "1m"
+    HOUR = "1h"
+    DAY = "1d"
+
+class MonitoringRequest(BaseModel):
+    """센서 데이터 적재 + 롤업 조회 요청"""
+    senior_profile_id: int
+    data: List[SensorReading] = Field(..., min_length=1, max_length=10000)
+    resolution: RollupResolution = RollupResolution.HOUR
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "senior_profile_id": 1,
+                "resolution": "1h",
+                "data": [
+                    {
+                        "timestamp": "2025-01-01T10:00:00Z",
+                        "heart_rate": 72,
+                        "step_count": 100,
+                        "posture": {"angle": 90, "balance": "normal"},
+                        "activity": "walking"
+                    }
+                ]
+            }
+        }
+
+class RollupBucket(BaseModel):
+    bucket_start: datetime
+    readings: int
+    heart_rate_min: Optional[float] = None
+    heart_rate_mean: Optional[float] = None
+    heart_rate_max: Optional[float] = None
+    steps: int
+    activity_seconds: Dict[str, float] = Field(..., description="활동 유형별 체류 시간 (초)")
+    fall_count: int
+
+class MonitoringResponse(BaseModel):
+    """롤업 조회 응답"""
+    senior_profile_id: int
+    resolution: RollupResolution
+    ingested: int = Field(0, description="이번 요청에서 적재된 측정값 수")
+    buckets: List[RollupBucket]
@@ -0,0 +1,121 @@
+"""
+사전 로드 후 fork 하는 멀티 워커 서버 (공유 메모리 배포 모드)
+
+uvicorn --workers는 워커마다 새 인터프리터를 띄우고 각자 모델을 로드하므로
+모델 메모리가 워커 수만큼 늘어남. 여기서는 마스터가 모델을 한 번 로드하고
+gc.freeze() 후 fork → 워커는 모델 페이지를 copy-on-write로 공유.
+MODEL_SHARED_MEMORY=true면 Isolation Forest는 메모리맵 아티팩트라 재로드 후에도 공유.
+
+사용법 (ai/ 에서 실행):
+    MODEL_SHARED_MEMORY=true python serve.py --workers 4 --port 5000
+"""
+import argparse
+import gc
+import logging
+import os
+import signal
+import socket
+import sys
+
+import uvicorn
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+logger = logging.getLogger("serve")
+
+
+def bind_socket(host: str, port: int) -> socket.socket:
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    sock.bind((host, port))
+    sock.listen(2048)
+    sock.set_inheritable(True)
+    return sock
+
+
+def preload(timeout: float) -> None:
+    """마스터에서 모델 로드 완료까지 대기 (워커는 로드된 모델을 물려받음)"""
+    from models.registry import model_registry
+
+    model_registry.start()
+    if not model_registry.wait(timeout=timeout):
+        logger.warning(f"일부 모델이 준비되지 않았습니다: {model_registry.status()}")
+    model_registry.shutdown()
+
+    # 매칭 우선순위 인덱스도 마스터에서 (워커 시작 시에는 mtime이 같아 재적재 안 함)
+    from services.priority_index import priority_index
+
+    priority_index.reload_if_changed()
+
+    # fork 이후 GC가 공유 객체 헤더를 건드려 페이지가 복사되지 않도록
+    gc.collect()
+    gc.freeze()
+
+
+def run_worker(app, sock: socket.socket, log_level: str) -> None:
+    signal.signal(signal.SIGTERM, signal.SIG_DFL)
+    signal.signal(signal.SIGINT, signal.SIG_DFL)
+    server = uvicorn.Server(uvicorn.Config(app, log_level=log_level))
+    server.run(sockets=[sock])
+
+
+def spawn(app, sock: socket.socket, log_level: str) -> int:
+    pid = os.fork()
+    if pid == 0:
+        try:
+            run_worker(app, sock, log_level)
+        finally:
+            os._exit(0)
+    return pid
+
+
+def main():
+    parser = argparse.ArgumentParser(description="사전 로드 후 fork 멀티 워커 서버")
+    parser.add_argument("--host", default="0.0.0.0")
+    parser.add_argument("--port", type=int, default=5000)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--log-level", default="info")
+    parser.add_argument("--preload-timeout", type=float, default=120.0)
+    args = parser.parse_args()
+
+    sock = bind_socket(args.host, args.port)
+
+    from main import app
+
+    preload(args.preload_timeout)
+
+    workers = {spawn(app, sock, args.log_level) for _ in range(args.workers)}
+    logger.info(f"워커 {len(workers)}개 시작: {sorted(workers)}")
+
+    stopping = False
+
+    def stop(signum, frame):
+        nonlocal stopping
+        stopping = True
+        for pid in workers:
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+
+    signal.signal(signal.SIGTERM, stop)
+    signal.signal(signal.SIGINT, stop)
+
+    while workers:
+        try:
+            pid, status = os.wait()
+        except ChildProcessError:
+            break
+        except InterruptedError:
+            continue
+        workers.discard(pid)
+        if not stopping:
+            # 비정상 종료한 워커는 다시 fork (모델은 마스터 메모리에서 그대로 공유)
+            logger.warning(f"워커 종료 (pid={pid}, status={status}), 재시작")
+            workers.add(spawn(app, sock, args.log_level))
+
+    sock.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,6 @@
 import logging
 import numpy as np
-from typing import List, Dict
+from typing import List, Dict, Optional
 
 from schemas.monitoring import (
     AnomalyDetectionRequest,
@@ -10,10 +10,18 @@ from schemas.monitoring import (
     AnomalySeverity,
 )
 from features.monitoring_features import MonitoringFeatureExtractor
-from models.loader import get_isolation_forest, get_lstm_model
+from features.feature_schema import DEFAULT_MONITORING_SCHEMA, get_schema
+from models.loader import get_model_artifact
+from models.shadow import shadow_scorer
+from models.tensor_artifact import LSTMArtifact
+from utils.metrics import metrics
+from utils.result_cache import result_cache
 
 logger = logging.getLogger(__name__)
 
+# LSTM 입력 시퀀스 길이 (측정값 개수)
+LSTM_WINDOW = 10
+
 
 class AnomalyDetectionService:
     """센서 데이터 이상 탐지 서비스"""
@@ -32,6 +40,9 @@ class AnomalyDetectionService:
 
         detected_anomalies: List[DetectedAnomaly] = []
 
+        # 스키마 키 → 입력 벡터 (같은 스키마를 쓰는 모델끼리 요청당 1회만 계산)
+        feature_vectors: Dict[str, np.ndarray] = {}
+
         # --------------------------------------------------
         # 1️⃣ 통계 기반 이상 탐지
         # --------------------------------------------------
@@ -43,7 +54,9 @@ class AnomalyDetectionService:
         # 2️⃣ Isolation Forest (⭐ 핵심 ML)
         # --------------------------------------------------
         detected_anomalies.extend(
-            AnomalyDetectionService._detect_isolation_forest_anomalies(readings)
+            AnomalyDetectionService._detect_isolation_forest_anomalies(
+                readings, feature_vectors
+            )
         )
 
         # --------------------------------------------------
@@ -63,6 +76,7 @@ class AnomalyDetectionService:
         # --------------------------------------------------
         # 후처리
         # --------------------------------------------------
+        clock = metrics.clock("anomaly")
         detected_anomalies = AnomalyDetectionService._merge_anomalies(
             detected_anomalies
         )
@@ -78,6 +92,7 @@ class AnomalyDetectionService:
         recommendations = AnomalyDetectionService._generate_recommendations(
             detected_anomalies
         )
+        clock.lap("postprocess")
 
         logger.info(
             f"이상 탐지 완료: score={anomaly_score:.2f}, level={alert_level}"
@@ -97,6 +112,7 @@ class AnomalyDetectionService:
     # 통계 기반 이상 탐지
     # =====================================================
     @staticmethod
+    @metrics.timed("anomaly.statistical")
     def _detect_statistical_anomalies(
         readings: List[Dict],
     ) -> List[DetectedAnomaly]:
@@ -129,36 +145,55 @@ class AnomalyDetectionService:
         return anomalies
 
     # =====================================================
-    # ⭐ Isolation Forest (10개 피처 고정)
+    # 모델 입력 벡터 (피처 스키마 기준)
+    # =====================================================
+    @staticmethod
+    def _feature_vector(
+        readings: List[Dict],
+        schema_key: Optional[str],
+        cache: Dict[str, np.ndarray],
+    ) -> np.ndarray:
+
+        schema_key = schema_key or DEFAULT_MONITORING_SCHEMA
+
+        if schema_key not in cache:
+            cache[schema_key] = get_schema(schema_key).extract(readings)
+
+        return cache[schema_key]
+
+    # =====================================================
+    # ⭐ Isolation Forest (피처 스키마 고정)
     # =====================================================
     @staticmethod
+    @metrics.timed("anomaly.isolation_forest")
     def _detect_isolation_forest_anomalies(
         readings: List[Dict],
+        feature_vectors: Optional[Dict[str, np.ndarray]] = None,
     ) -> List[DetectedAnomaly]:
 
         try:
-            model = get_isolation_forest()
-            if model is None:
+            # 모델과 스키마를 같은 아티팩트에서 (요청 중 재로드돼도 어긋나지 않음)
+            artifact = get_model_artifact("isolation_forest")
+            if artifact is None:
                 return []
+            model = artifact.model
 
-            # 1️⃣ 시계열 → 피처 dict
-            features = MonitoringFeatureExtractor.extract_time_series_features(
-                readings
+            # 1️⃣ 시계열 → ⭐ 고정 인덱스 입력 벡터 (스키마 컴파일 추출기)
+            vector = AnomalyDetectionService._feature_vector(
+                readings,
+                artifact.schema_key,
+                feature_vectors if feature_vectors is not None else {},
             )
 
-            # 2️⃣ ⭐ 고정된 입력 벡터 (10개)
-            vector = MonitoringFeatureExtractor.to_model_input(features)
+            # 2️⃣ sklearn 입력 형태
+            X = vector.reshape(1, -1)
 
-            # 🔍 디버그 확인용 (문제 해결 후 제거 가능)
-            logger.warning(
-                f"[DEBUG] Isolation Forest input dim = {len(vector)}"
-            )
-
-            # 3️⃣ sklearn 입력 형태
-            X = np.array(vector).reshape(1, -1)
-
-            # 4️⃣ anomaly score
-            score = float(model.decision_function(X)[0])
+            # 3️⃣ anomaly score (같은 모델 버전 + 같은 벡터면 워커 간 공유 캐시)
+            with metrics.stage("model.isolation_forest"):
+                score = result_cache.get_or_compute(
+                    artifact.version, vector, lambda: float(model.decision_function(X)[0])
+                )
+            shadow_scorer.submit("isolation_forest", vector, score)
 
             # 경험적 기준
             if score < -0.5:
@@ -182,36 +217,42 @@ class AnomalyDetectionService:
     # LSTM (선택적)
     # =====================================================
     @staticmethod
+    @metrics.timed("anomaly.lstm")
     def _detect_lstm_anomalies(
         readings: List[Dict],
     ) -> List[DetectedAnomaly]:
 
         try:
-            model = get_lstm_model()
-            if model is None:
+            artifact = get_model_artifact("lstm")
+            if artifact is None:
+                return []
+            model = artifact.model
+            # 레거시 torch state_dict(.pt)는 추론 경로 없음 (export_lstm_tensors.py로 변환 필요)
+            if not isinstance(model, LSTMArtifact):
+                logger.debug("LSTM 텐서 아티팩트가 아니어서 건너뜁니다.")
                 return []
 
-            heart_rates = np.array(
-                [
-                    r["heart_rate"]
-                    for r in readings
-                    if r.get("heart_rate") is not None
-                ]
-            )
-
-            if len(heart_rates) < 10:
+            hr_readings = [r for r in readings if r.get("heart_rate") is not None]
+            if len(hr_readings) <= LSTM_WINDOW:
                 return []
 
-            reconstructed = model.predict(heart_rates.reshape(-1, 1))
-            errors = np.abs(heart_rates - reconstructed.flatten())
+            schema = get_schema(artifact.schema_key or DEFAULT_MONITORING_SCHEMA)
+            sequences = AnomalyDetectionService._lstm_sequences(hr_readings, schema)
+            heart_rates = np.array([r["heart_rate"] for r in hr_readings], dtype=np.float64)
+
+            # 직전 LSTM_WINDOW 시점 → 다음 심박 예측, 예측 오차가 큰 시점이 이상
+            with metrics.stage("model.lstm"):
+                predicted = model.forward(sequences)[:, 0]
+            targets = heart_rates[LSTM_WINDOW:]
+            errors = np.abs(targets - predicted)
 
             threshold = np.mean(errors) + 2 * np.std(errors)
-            indices = np.where(errors > threshold)[0]
+            indices = np.where(errors > threshold)[0] + LSTM_WINDOW
 
             anomalies: List[DetectedAnomaly] = []
 
             for idx in indices:
-                r = readings[idx]
+                r = hr_readings[idx]
                 anomalies.append(
                     DetectedAnomaly(
                         timestamp=r["timestamp"],
@@ -228,10 +269,27 @@ class AnomalyDetectionService:
             logger.warning(f"LSTM 탐지 실패: {str(e)}")
             return []
 
+    @staticmethod
+    def _lstm_sequences(readings: List[Dict], schema) -> np.ndarray:
+        """
+        (예측 시점 수, LSTM_WINDOW, schema.dim) 입력
+
+        각 시점의 입력은 그 시점까지 LSTM_WINDOW개 측정값의 스키마 벡터 (Isolation Forest와 같은 추출기),
+        예측 시점 t의 시퀀스는 t 직전 LSTM_WINDOW개 시점
+        """
+        steps = np.stack([
+            schema.extract(readings[max(0, t - LSTM_WINDOW + 1):t + 1])
+            for t in range(len(readings) - 1)
+        ])
+        windows = np.lib.stride_tricks.sliding_window_view(steps, LSTM_WINDOW, axis=0)
+        # sliding_window_view는 창 축을 마지막에 둠 → (시점, 창, 피처)
+        return np.ascontiguousarray(windows.transpose(0, 2, 1), dtype=np.float32)
+
     # =====================================================
     # 규칙 기반
     # =====================================================
     @staticmethod
+    @metrics.timed("anomaly.rule_based")
     def _detect_rule_based_anomalies(
         readings: List[Dict],
     ) -> List[DetectedAnomaly]:
@@ -0,0 +1,380 @@
+import asyncio
+import fcntl
+import json
+import logging
+import os
+import random
+import tempfile
+import time
+import uuid
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from typing import List, Optional
+
+from config.settings import settings
+from utils.metrics import metrics
+
+logger = logging.getLogger(__name__)
+
+EVENTS = metrics.counter(
+    "if_backend_push_events_total",
+    "백엔드 전송 이벤트 (sent / spilled=디스크 보관 / replayed / rejected=4xx / dropped / quarantined=깨진 보관 줄)",
+    ("result",),
+)
+BATCHES = metrics.counter(
+    "if_backend_push_requests_total", "백엔드 전송 HTTP 요청 (batch / critical)", ("kind", "status")
+)
+SEND_SECONDS = metrics.histogram(
+    "if_backend_push_send_seconds", "백엔드 전송 소요 시간 (재시도 포함)", ("kind",)
+)
+
+
+# 큐가 한동안 비어 있을 때 보관분 재전송을 시도하는 주기
+_REPLAY_INTERVAL_SEC = 30.0
+
+# stop()이 큐 끝에 넣는 종료 표시
+_STOP = object()
+
+
+class DeliveryRejected(Exception):
+    """백엔드가 4xx로 거절 (재시도해도 같은 결과)"""
+
+
+def make_event(event_type: str, payload: dict) -> dict:
+    """
+    전송 이벤트 (event_id로 백엔드가 재시도 중복을 거를 수 있음)
+    """
+    return {
+        "event_id": uuid.uuid4().hex,
+        "type": event_type,
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "payload": payload,
+    }
+
+
+class BackendPusher:
+    """
+    이상 탐지 경보 / 점수 갱신을 백엔드로 밀어넣는 비동기 전송기
+
+    - 유한 큐 → 크기(batch_size) 또는 시간(batch_wait)으로 묶어 POST 1회
+    - keep-alive 연결 풀 (httpx.AsyncClient), 5xx / 429 / 연결 오류는 지수 백오프 재시도
+    - 재시도를 다 써도 실패하거나 큐가 가득 차면 디스크(JSONL)에 보관 → 전송이 성공하면 다시 보냄
+    - 낙상 등 긴급 경보는 큐 / 묶음 없이 바로 전송
+    """
+
+    def __init__(
+        self,
+        url: Optional[str] = None,
+        api_key: Optional[str] = None,
+        queue_size: Optional[int] = None,
+        batch_size: Optional[int] = None,
+        batch_wait: Optional[float] = None,
+        max_retries: Optional[int] = None,
+        backoff_base: Optional[float] = None,
+        spill_path: Optional[str] = None,
+        spill_max_bytes: Optional[int] = None,
+        timeout: Optional[float] = None,
+    ):
+        self.url = url or settings.BACKEND_URL.rstrip("/") + settings.BACKEND_PUSH_PATH
+        self.api_key = api_key if api_key is not None else settings.BACKEND_API_KEY
+        self.queue_size = queue_size or settings.BACKEND_PUSH_QUEUE_SIZE
+        self.batch_size = batch_size or settings.BACKEND_PUSH_BATCH_SIZE
+        self.batch_wait = batch_wait if batch_wait is not None else settings.BACKEND_PUSH_BATCH_WAIT_SEC
+        self.max_retries = max_retries if max_retries is not None else settings.BACKEND_PUSH_MAX_RETRIES
+        self.backoff_base = backoff_base if backoff_base is not None else settings.BACKEND_PUSH_BACKOFF_SEC
+        self.spill_path = spill_path or settings.BACKEND_PUSH_SPILL_PATH or os.path.join(
+            tempfile.gettempdir(), "if_backend_push.jsonl"
+        )
+        self.spill_max_bytes = spill_max_bytes or settings.BACKEND_PUSH_SPILL_MAX_BYTES
+        self.timeout = timeout or settings.BACKEND_PUSH_TIMEOUT_SEC
+
+        self._queue: Optional[asyncio.Queue] = None
+        self._client = None
+        self._worker: Optional[asyncio.Task] = None
+        self._critical: set = set()
+        self._replay_lock: Optional[asyncio.Lock] = None
+
+    @property
+    def running(self) -> bool:
+        return self._worker is not None and not self._worker.done()
+
+    # =========================================================
+    # 시작 / 종료 (앱 startup / shutdown, 같은 이벤트 루프)
+    # =========================================================
+    async def start(self) -> None:
+        if self.running:
+            return
+        import httpx
+
+        self._queue = asyncio.Queue(maxsize=self.queue_size)
+        self._replay_lock = asyncio.Lock()
+        headers = {"X-API-Key": self.api_key} if self.api_key else {}
+        self._client = httpx.AsyncClient(
+            headers=headers,
+            timeout=self.timeout,
+            limits=httpx.Limits(max_connections=8, max_keepalive_connections=4),
+        )
+        self._worker = asyncio.create_task(self._run(), name="backend-push")
+        logger.info(f"백엔드 전송 시작: {self.url}")
+
+    async def stop(self) -> None:
+        """남은 큐 전송 (실패분은 디스크 보관) 후 연결 종료"""
+        if self._worker is None:
+            return
+        if self._critical:
+            await asyncio.gather(*self._critical, return_exceptions=True)
+        if self._queue.full():
+            # 큐가 가득 차 있으면 남은 분량은 디스크로 (다음 시작 후 재전송)
+            self._spill(self._drain(self._queue.qsize()))
+        # 종료 표시: 워커가 앞의 이벤트를 모두 보낸 뒤 끝남
+        self._queue.put_nowait(_STOP)
+        await self._worker
+        await self._client.aclose()
+        self._worker = None
+
+    # =========================================================
+    # 적재 (이벤트 루프 안, 대기 없음)
+    # =========================================================
+    def publish(self, event_type: str, payload: dict, critical: bool = False) -> None:
+        if not self.running:
+            if self._worker is not None:
+                # 시작됐는데 워커가 끝난 경우 (정상 종료 중이 아니면 버그)
+                EVENTS.inc(("dropped",))
+                logger.error(f"백엔드 전송 워커가 종료되어 이벤트를 버립니다: {event_type}")
+            return
+        event = make_event(event_type, payload)
+        if critical:
+            # 긴급 경보: 묶지 않고 바로 (응답을 기다리지 않음)
+            task = asyncio.get_running_loop().create_task(self._deliver([event], "critical"))
+            self._critical.add(task)
+            task.add_done_callback(self._critical.discard)
+            return
+        try:
+            self._queue.put_nowait(event)
+        except asyncio.QueueFull:
+            # 큐가 가득 차면 요청을 막지 않고 디스크 보관
+            self._spill([event])
+
+    # =========================================================
+    # 묶음 전송 루프
+    # =========================================================
+    async def _run(self) -> None:
+        while True:
+            try:
+                if not await self._run_once():
+                    return
+            except Exception as e:
+                # 워커가 끝나면 이후 이벤트가 모두 버려지므로 어떤 오류에도 계속
+                logger.error(f"백엔드 전송 루프 오류: {str(e)}", exc_info=True)
+                await asyncio.sleep(1.0)
+
+    async def _run_once(self) -> bool:
+        """묶음 1개 전송 (또는 유휴 시 보관분 재전송), 종료 표시를 받으면 False"""
+        try:
+            first = await asyncio.wait_for(self._queue.get(), _REPLAY_INTERVAL_SEC)
+        except asyncio.TimeoutError:
+            # 한동안 이벤트가 없으면 보관분 재전송 시도 (백엔드 복구 확인)
+            await self._try_replay()
+            return True
+        if first is _STOP:
+            return False
+        batch = [first]
+        deadline = time.monotonic() + self.batch_wait
+        stopping = False
+        while len(batch) < self.batch_size:
+            timeout = deadline - time.monotonic()
+            if timeout <= 0:
+                break
+            try:
+                event = await asyncio.wait_for(self._queue.get(), timeout)
+            except asyncio.TimeoutError:
+                break
+            if event is _STOP:
+                stopping = True
+                break
+            batch.append(event)
+        await self._deliver(batch, "batch")
+        return not stopping
+
+    async def _try_replay(self) -> None:
+        if self._replay_lock.locked():
+            return
+        if not (os.path.exists(self.spill_path) or os.path.exists(self.spill_path + ".replay")):
+            return
+        try:
+            await self._replay_spill()
+        except Exception as e:
+            logger.error(f"보관 이벤트 재전송 오류: {str(e)}", exc_info=True)
+
+    def _drain(self, limit: int) -> List[dict]:
+        events = []
+        while len(events) < limit:
+            try:
+                events.append(self._queue.get_nowait())
+            except asyncio.QueueEmpty:
+                break
+        return events
+
+    async def _deliver(self, events: List[dict], kind: str) -> bool:
+        """전송 (재시도 포함), 실패하면 디스크 보관. 성공 후 보관분이 있으면 재전송"""
+        start = time.perf_counter()
+        try:
+            await self._post_with_retry(events, kind)
+        except DeliveryRejected as e:
+            EVENTS.inc(("rejected",), len(events))
+            logger.error(f"백엔드가 이벤트 {len(events)}건을 거절했습니다: {str(e)}")
+            return False
+        except Exception as e:
+            logger.warning(f"백엔드 전송 실패, 디스크 보관: {len(events)}건 ({str(e)})")
+            self._spill(events)
+            return False
+        finally:
+            SEND_SECONDS.observe((kind,), time.perf_counter() - start)
+
+        EVENTS.inc(("sent",), len(events))
+        await self._try_replay()
+        return True
+
+    async def _post_with_retry(self, events: List[dict], kind: str) -> None:
+        import httpx
+
+        body = {"events": events}
+        for attempt in range(self.max_retries + 1):
+            try:
+                response = await self._client.post(self.url, json=body)
+                BATCHES.inc((kind, str(response.status_code)))
+                if response.status_code < 300:
+                    return
+                if response.status_code != 429 and response.status_code < 500:
+                    raise DeliveryRejected(f"HTTP {response.status_code}: {response.text[:200]}")
+                error: Exception = RuntimeError(f"HTTP {response.status_code}")
+            except httpx.HTTPError as e:
+                BATCHES.inc((kind, type(e).__name__))
+                error = e
+            if attempt < self.max_retries:
+                # 지수 백오프 + 지터 (최대 30초)
+                delay = min(30.0, self.backoff_base * (2 ** attempt))
+                await asyncio.sleep(delay * random.uniform(0.5, 1.0))
+        raise error
+
+    # =========================================================
+    # 디스크 보관 (JSONL, 같은 경로를 여러 워커 프로세스가 공유)
+    # =========================================================
+    @contextmanager
+    def _file_lock(self, suffix: str, mode: int):
+        """프로세스 간 flock (LOCK_NB면 이미 잡혀 있을 때 BlockingIOError)"""
+        fd = os.open(self.spill_path + suffix, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            fcntl.flock(fd, mode)
+            try:
+                yield
+            finally:
+                fcntl.flock(fd, fcntl.LOCK_UN)
+        finally:
+            os.close(fd)
+
+    def _spill(self, events: List[dict]) -> None:
+        try:
+            size = os.path.getsize(self.spill_path) if os.path.exists(self.spill_path) else 0
+            data = "".join(json.dumps(e, ensure_ascii=False) + "\n" for e in events).encode("utf-8")
+            if size + len(data) > self.spill_max_bytes:
+                EVENTS.inc(("dropped",), len(events))
+                logger.error(f"보관 파일 한도 초과, 이벤트 {len(events)}건 버림: {self.spill_path}")
+                return
+            os.makedirs(os.path.dirname(self.spill_path) or ".", exist_ok=True)
+            # 공유 잠금: 다른 워커의 추가와는 동시에, 재전송 쪽 파일 떼어내기와는 배타적으로
+            with self._file_lock(".lock", fcntl.LOCK_SH):
+                _append(self.spill_path, data)
+            EVENTS.inc(("spilled",), len(events))
+        except OSError as e:
+            EVENTS.inc(("dropped",), len(events))
+            logger.error(f"보관 파일 기록 실패, 이벤트 {len(events)}건 버림: {str(e)}")
+
+    async def _replay_spill(self) -> None:
+        """
+        보관분 재전송 (한 번에 한 프로세스만, 다른 워커가 재전송 중이면 건너뜀)
+
+        보관 파일을 .replay로 떼어낸 뒤 batch_size씩 전송. .replay는 모든 묶음이 확인된 뒤에만 지움
+        (중간에 실패하면 남은 분량만 다시 기록, 프로세스가 죽으면 다음 재전송이 이어서 처리 → 중복은 event_id로)
+        """
+        async with self._replay_lock:
+            replaying = self.spill_path + ".replay"
+            try:
+                with self._file_lock(".replay.lock", fcntl.LOCK_EX | fcntl.LOCK_NB):
+                    while True:
+                        if not os.path.exists(replaying):
+                            with self._file_lock(".lock", fcntl.LOCK_EX):
+                                if not os.path.exists(self.spill_path):
+                                    return
+                                os.replace(self.spill_path, replaying)
+                        if not await self._replay_file(replaying):
+                            return
+            except BlockingIOError:
+                return
+
+    async def _replay_file(self, replaying: str) -> bool:
+        """.replay 파일 1개 재전송 (모두 확인되면 True, 실패하면 남은 분량을 남기고 False)"""
+        events = self._read_spill(replaying)
+        for i in range(0, len(events), self.batch_size):
+            chunk = events[i:i + self.batch_size]
+            try:
+                await self._post_with_retry(chunk, "batch")
+            except DeliveryRejected:
+                EVENTS.inc(("rejected",), len(chunk))
+                continue
+            except Exception as e:
+                logger.warning(f"보관 이벤트 재전송 실패, {len(events) - i}건 남김: {str(e)}")
+                _rewrite(replaying, events[i:])
+                return False
+            EVENTS.inc(("replayed",), len(chunk))
+        os.remove(replaying)
+        logger.info(f"보관 이벤트 재전송 완료: {len(events)}건")
+        return True
+
+    def _read_spill(self, path: str) -> List[dict]:
+        """JSONL 읽기: 깨진 줄은 .bad 파일로 옮기고 건너뜀"""
+        events, bad = [], []
+        with open(path, "rb") as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                try:
+                    event = json.loads(line)
+                except ValueError:
+                    bad.append(line if line.endswith(b"\n") else line + b"\n")
+                    continue
+                if isinstance(event, dict):
+                    events.append(event)
+                else:
+                    bad.append(line if line.endswith(b"\n") else line + b"\n")
+        if bad:
+            EVENTS.inc(("quarantined",), len(bad))
+            logger.error(f"보관 파일의 깨진 줄 {len(bad)}건을 격리했습니다: {self.spill_path}.bad")
+            _append(self.spill_path + ".bad", b"".join(bad))
+        return events
+
+    def metric_families(self):
+        """GET /metrics 수집기: 큐 길이"""
+        depth = self._queue.qsize() if self._queue is not None else 0
+        yield ("if_backend_push_queue_depth", "gauge", "백엔드 전송 대기 이벤트 수", [({}, depth)])
+
+
+def _append(path: str, data: bytes) -> None:
+    """O_APPEND 단일 write (여러 프로세스가 추가해도 줄이 섞이지 않음)"""
+    fd = os.open(path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+    try:
+        os.write(fd, data)
+    finally:
+        os.close(fd)
+
+
+def _rewrite(path: str, events: List[dict]) -> None:
+    """임시 파일에 쓴 뒤 교체 (쓰는 도중 죽어도 기존 파일 유지)"""
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        f.writelines(json.dumps(e, ensure_ascii=False) + "\n" for e in events)
+    os.replace(tmp, path)
+
+
+# 앱 공용 인스턴스 (BACKEND_PUSH_ENABLED일 때 startup에서 시작)
+backend_pusher = BackendPusher()
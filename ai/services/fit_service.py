@@ -0,0 +1,147 @@
+import logging
+from typing import Dict, Optional
+
+import numpy as np
+
+from schemas.fit import FitRequest, FitResponse, FitJobResult, FitExcludedJob
+from schemas.health import RiskLevel
+from schemas.job_risk import JobRiskRequest
+from services.health_service import HealthScoreService
+from services.job_risk_service import JobRiskService, job_risk_service
+from services.matching_service import MatchingService, matching_service
+from services.posting_catalog import PostingCatalog
+from utils.lazy import LazyInstance
+from utils.metrics import metrics
+
+logger = logging.getLogger(__name__)
+
+
+class FitService:
+    """
+    고령자 1명 × 후보 일자리 N개 종합 적합도 (건강 + 산업재해 리스크 + 매칭)
+
+    - 건강점수는 1회 계산
+    - 리스크는 N건 일괄 (JobRiskService.score_batch)
+    - 매칭은 요청 일자리로 임시 카탈로그를 만들어 벡터 계산 (MatchingService.rank_catalog)
+    - 제약 조건으로 거른 뒤 종합 점수 내림차순
+    """
+
+    # 종합 점수 = matching × 매칭 점수 + safety × (100 - 리스크 점수)
+    DEFAULT_FIT_WEIGHTS = {"matching": 0.6, "safety": 0.4}
+
+    def __init__(
+        self,
+        matching_service: Optional[MatchingService] = None,
+        job_risk_service: Optional[JobRiskService] = None,
+    ):
+        self.matching_service = matching_service or MatchingService()
+        self.job_risk_service = job_risk_service or JobRiskService()
+
+    @metrics.timed("fit.evaluate")
+    async def evaluate(self, request: FitRequest) -> FitResponse:
+        # 1️⃣ 건강점수 (1회)
+        health = request.health
+        health_result = HealthScoreService.calculate_health_score(
+            senior_profile_id=health.senior_profile_id,
+            height_cm=health.height_cm,
+            weight_kg=health.weight_kg,
+            chronic_conditions=health.chronic_conditions,
+            risk_flags=health.risk_flags,
+        )
+
+        # 2️⃣ 산업재해 리스크 (일괄)
+        experience = int(request.job_seeker_profile.get("experience", 0) or 0)
+        age_group = request.job_seeker_profile.get("age_group")
+        risk_scores = self.job_risk_service.score_batch([
+            JobRiskRequest(
+                job_type=job.job_type,
+                work_environment=job.work_environment,
+                safety_equipment=job.safety_equipment,
+                experience_years=max(0, experience),
+                age_group=age_group,
+            )
+            for job in request.jobs
+        ])
+        risk_scores = np.clip(risk_scores, 0.0, 100.0)
+        risk_levels = self.job_risk_service.determine_risk_levels(risk_scores)
+
+        # 3️⃣ 매칭 (벡터, 행 번호 = 요청 일자리 순번)
+        catalog = PostingCatalog.from_postings(
+            [{**job.job_posting, "posting_id": i} for i, job in enumerate(request.jobs)]
+        )
+        ranked = self.matching_service.rank_catalog(
+            request.job_seeker_profile, catalog, None, len(request.jobs), request.weights
+        )
+        matching = {r.posting_id: r for r in ranked.results}
+
+        # 4️⃣ 제약 조건 + 종합 점수
+        fit_weights = self._resolve_fit_weights(request.fit_weights)
+        exclude_high_risk_reason = self._high_risk_exclusion_reason(
+            request, health_result.risk_level
+        )
+
+        results, excluded = [], []
+        for i, job in enumerate(request.jobs):
+            level = risk_levels[i]
+            match = matching[i]
+
+            if exclude_high_risk_reason and level == "high":
+                excluded.append(FitExcludedJob(
+                    job_id=job.job_id, reason=exclude_high_risk_reason, job_risk_level=level
+                ))
+                continue
+            if match.matching_score < request.constraints.min_matching_score:
+                excluded.append(FitExcludedJob(
+                    job_id=job.job_id, reason="min_matching_score", job_risk_level=level
+                ))
+                continue
+
+            fit_score = (
+                fit_weights["matching"] * match.matching_score
+                + fit_weights["safety"] * (100.0 - float(risk_scores[i]))
+            )
+            results.append(FitJobResult(
+                job_id=job.job_id,
+                fit_score=round(max(0.0, min(100.0, fit_score)), 2),
+                matching_score=match.matching_score,
+                job_risk_score=float(risk_scores[i]),
+                job_risk_level=level,
+                score_breakdown=match.score_breakdown,
+            ))
+
+        results.sort(key=lambda r: -r.fit_score)
+        if request.top_k is not None:
+            results = results[:request.top_k]
+
+        logger.info(
+            f"종합 적합도 계산 완료: senior_profile_id={health.senior_profile_id}, "
+            f"후보 {len(request.jobs)}건, 결과 {len(results)}건, 제외 {len(excluded)}건"
+        )
+
+        return FitResponse(
+            senior_profile_id=health.senior_profile_id,
+            health_score=health_result.health_score,
+            health_risk_level=health_result.risk_level,
+            results=results,
+            excluded=excluded,
+        )
+
+    def _resolve_fit_weights(self, weights: Optional[Dict[str, float]]) -> Dict[str, float]:
+        weights = weights or self.DEFAULT_FIT_WEIGHTS
+        return {k: weights.get(k, v) for k, v in self.DEFAULT_FIT_WEIGHTS.items()}
+
+    @staticmethod
+    def _high_risk_exclusion_reason(request: FitRequest, health_risk: RiskLevel) -> Optional[str]:
+        """고위험 일자리를 제외해야 하면 그 사유, 아니면 None"""
+        constraints = request.constraints
+        mobility = request.health.risk_flags.get("mobility_limited", 0.0)
+
+        if mobility > constraints.mobility_limited_threshold:
+            return "mobility_limited"
+        if constraints.exclude_high_risk_for_critical_health and health_risk == RiskLevel.CRITICAL:
+            return "critical_health"
+        return None
+
+
+# 라우터 공용 인스턴스 (매칭 / 리스크 라우터와 같은 서비스 공유)
+fit_service = LazyInstance(lambda: FitService(matching_service, job_risk_service))
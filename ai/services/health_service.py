@@ -5,7 +5,10 @@ import logging
 
 from schemas.health import HealthScoreResponse, RiskLevel
 from features.health_features import HealthFeatureExtractor
-from models.loader import get_health_model
+from models.loader import get_model_artifact
+from models.shadow import shadow_scorer
+from utils.metrics import metrics
+from utils.result_cache import result_cache
 from utils.validators import validate_health_input
 from utils.exceptions import ValidationError, ModelPredictionError, ServiceError
 
@@ -42,6 +45,8 @@ class HealthScoreService:
         """
 
         logger.info(f"건강점수 계산 시작: senior_profile_id={senior_profile_id}")
+        # 단계별 소요 시간 (GET /metrics, stage="health.<단계>")
+        clock = metrics.clock("health")
 
         try:
             # 1️⃣ 입력 검증
@@ -57,6 +62,7 @@ class HealthScoreService:
                         "risk_flags": risk_flags
                     }
                 )
+            clock.lap("validate")
 
             # 2️⃣ 피처 추출
             try:
@@ -69,6 +75,7 @@ class HealthScoreService:
                     message="피처 추출 중 오류가 발생했습니다.",
                     details={"error": str(e)}
                 )
+            clock.lap("features")
 
             # 3️⃣ 규칙 기반 점수 계산 (0-1)
             try:
@@ -81,9 +88,11 @@ class HealthScoreService:
                     message="점수 계산 중 오류가 발생했습니다.",
                     details={"error": str(e)}
                 )
+            clock.lap("rules")
 
             # 4️⃣ ML 모델 예측 (선택사항)
             ml_score = HealthScoreService._predict_with_ml_model(features)
+            clock.lap("ml")
 
             # 5️⃣ 앙상블 (규칙 70% + ML 30%)
             try:
@@ -101,6 +110,7 @@ class HealthScoreService:
                     message="점수 정규화 중 오류가 발생했습니다.",
                     details={"error": str(e)}
                 )
+            clock.lap("ensemble")
 
             # 7️⃣ 위험 수준 판정
             try:
@@ -109,6 +119,7 @@ class HealthScoreService:
                 logger.error(f"위험 수준 판정 실패: {str(e)}", exc_info=True)
                 # 위험 수준 판정 실패는 기본값 사용
                 risk_level = RiskLevel.MEDIUM
+            clock.lap("risk_level")
 
             # 8️⃣ 권장사항 생성
             try:
@@ -119,6 +130,7 @@ class HealthScoreService:
                 logger.warning(f"권장사항 생성 실패: {str(e)}")
                 # 권장사항 생성 실패는 기본값 사용
                 recommendations = ["건강 상태를 확인해주세요."]
+            clock.lap("recommendations")
 
             logger.info(f"건강점수 계산 완료: score={final_score:.1f}, risk={risk_level}")
 
@@ -169,11 +181,12 @@ class HealthScoreService:
         """
 
         try:
-            model = get_health_model()
-            
-            if model is None:
+            artifact = get_model_artifact("health")
+
+            if artifact is None:
                 logger.debug("ML 모델이 없습니다. 기본값을 사용합니다.")
                 return 0.5  # 기본값으로 폴백
+            model = artifact.model
 
             # 피처를 배열로 변환
             try:
@@ -189,8 +202,16 @@ class HealthScoreService:
 
             # 모델 예측
             try:
-                prediction = model.predict(feature_vector)[0]
-                return float(prediction)
+                # 같은 모델 버전 + 같은 피처면 워커 간 공유 캐시에서
+                with metrics.stage("model.health"):
+                    prediction = result_cache.get_or_compute(
+                        artifact.version,
+                        feature_vector,
+                        lambda: float(model.predict(feature_vector)[0]),
+                    )
+                # 후보 모델이 있으면 섀도 평가 큐로 복제 (대기 없음)
+                shadow_scorer.submit("health", feature_vector, prediction)
+                return prediction
             except AttributeError as e:
                 logger.warning(f"모델에 predict 메서드가 없습니다: {str(e)}")
                 return 0.5  # 기본값으로 폴백
@@ -0,0 +1,137 @@
+import itertools
+import logging
+import time
+from typing import List, Tuple
+
+import numpy as np
+
+from features.job_risk_features import JOB_TYPE_INDEX, JOB_TYPES
+from schemas.job_risk import JobRiskRequest
+
+logger = logging.getLogger(__name__)
+
+# 비트 패킹 키 구성
+#   bit 0-2  : 직종 코드 (JOB_TYPES 순번, 그 외 = 6)
+#   bit 3    : height == "high"
+#   bit 4    : machinery
+#   bit 5-9  : 안전 장비 개수 (0-16, 16 이상은 리스크가 항상 0으로 잘리므로 16)
+#   bit 10-13: 경력 연수 (0-10, 10 이상은 감소량 동일하므로 10)
+#   bit 14-  : 연령대 코드 (리스크 사전 분포가 있을 때만, 0 = 미지정/전체)
+# chemicals / noise 는 기본 리스크·요인·권장사항에 쓰이지 않아 키에서 제외
+UNKNOWN_JOB_CODE = len(JOB_TYPES)
+MAX_EQUIPMENT = 16
+MAX_EXPERIENCE = 10
+
+_HEIGHT_SHIFT = 3
+_MACHINERY_SHIFT = 4
+_EQUIPMENT_SHIFT = 5
+_EXPERIENCE_SHIFT = 10
+_AGE_SHIFT = 14
+BASE_TABLE_SIZE = 1 << _AGE_SHIFT
+
+RISK_LEVELS = ("low", "medium", "high")
+
+
+def pack_key(
+    job_code: int,
+    height_high: bool,
+    machinery: bool,
+    n_equipment: int,
+    experience_years: int,
+    age_code: int = 0,
+) -> int:
+    return (
+        (age_code << _AGE_SHIFT)
+        | job_code
+        | (int(height_high) << _HEIGHT_SHIFT)
+        | (int(machinery) << _MACHINERY_SHIFT)
+        | (min(n_equipment, MAX_EQUIPMENT) << _EQUIPMENT_SHIFT)
+        | (min(experience_years, MAX_EXPERIENCE) << _EXPERIENCE_SHIFT)
+    )
+
+
+def request_key(request: JobRiskRequest, risk_prior=None) -> int:
+    """요청 → 테이블 키 (정수 연산만)"""
+    env = request.work_environment or {}
+    return pack_key(
+        JOB_TYPE_INDEX.get(request.job_type, UNKNOWN_JOB_CODE),
+        env.get("height") == "high",
+        bool(env.get("machinery", False)),
+        len(request.safety_equipment or ()),
+        request.experience_years,
+        risk_prior.age_code(request.age_group) if risk_prior is not None else 0,
+    )
+
+
+class JobRiskLookupTable:
+    """
+    기본 리스크(모델 없음) 전체 조합 사전 계산 테이블
+
+    키 공간의 모든 조합에 대해 JobRiskService의 실제 로직을 한 번씩 실행해 채우므로
+    결과는 실시간 계산과 같음. 서빙 시 키 계산 1회 + 배열 조회 1회
+
+    - entries: 키 → (점수, 레벨, 위험 요인 항목, 권장사항) 튜플 (단건 조회용,
+      numpy 스칼라 변환 비용이 없음)
+    - risk_score / level_code: 같은 값의 numpy 열 (키 배열로 일괄 조회용)
+    """
+
+    def __init__(self, service):
+        start = time.perf_counter()
+
+        # 사전 분포가 있으면 연령대별로 리스크가 달라지므로 연령대 축 추가
+        self.risk_prior = getattr(service, "risk_prior", None)
+        age_groups = [None] + (list(self.risk_prior.age_groups) if self.risk_prior else [])
+        table_size = BASE_TABLE_SIZE * len(age_groups)
+
+        self.risk_score = np.zeros(table_size, dtype=np.float64)
+        self.level_code = np.zeros(table_size, dtype=np.uint8)
+        self.filled = np.zeros(table_size, dtype=bool)
+        self.entries: List[tuple] = [None] * table_size
+
+        # 같은 권장사항 조합은 튜플 1개를 공유
+        recommendation_patterns = {}
+        job_names = list(JOB_TYPES) + ["__unknown__"]
+
+        combinations = itertools.product(
+            enumerate(age_groups),
+            enumerate(job_names),
+            (False, True),
+            (False, True),
+            range(MAX_EQUIPMENT + 1),
+            range(MAX_EXPERIENCE + 1),
+        )
+        for (age_code, age_group), (job_code, job_type), height, machinery, n_equipment, experience in combinations:
+            request = JobRiskRequest.model_construct(
+                job_type=job_type,
+                work_environment={"height": "high" if height else "low", "machinery": machinery},
+                safety_equipment=["_"] * n_equipment,
+                experience_years=experience,
+                age_group=age_group,
+            )
+            key = pack_key(job_code, height, machinery, n_equipment, experience, age_code)
+
+            score = service._calculate_baseline_risk(request)
+            level = service._determine_risk_level(score)
+            factors = tuple(service._analyze_risk_factors(request).items())
+            recs = tuple(service._generate_safety_recommendations(request, score))
+            recs = recommendation_patterns.setdefault(recs, recs)
+
+            self.risk_score[key] = score
+            self.level_code[key] = RISK_LEVELS.index(level)
+            self.filled[key] = True
+            self.entries[key] = (float(score), level, factors, recs)
+
+        logger.info(
+            f"기본 리스크 조회 테이블 생성: {int(self.filled.sum())}개 조합, "
+            f"권장사항 패턴 {len(recommendation_patterns)}개 "
+            f"({(time.perf_counter() - start) * 1000:.1f}ms)"
+        )
+
+    def lookup(self, request: JobRiskRequest) -> Tuple[float, str, dict, list]:
+        """(리스크 점수, 레벨, 위험 요인, 권장사항)"""
+        score, level, factors, recs = self.entries[request_key(request, self.risk_prior)]
+        return score, level, dict(factors), list(recs)
+
+    def lookup_scores(self, keys: np.ndarray) -> np.ndarray:
+        """키 배열 → 리스크 점수 배열"""
+        return self.risk_score[keys]
@@ -1,27 +1,35 @@
 from schemas.job_risk import JobRiskRequest, JobRiskResponse
-from features.job_risk_features import JobRiskFeatureEngineer
-from utils.loader import ModelLoader
-import os
+from features.job_risk_features import (
+    JobRiskFeatureEngineer,
+    ENV_OFFSET,
+    EXPERIENCE_COL,
+    JOB_TYPE_INDEX,
+    SAFETY_COUNT_COL,
+)
+from services.job_risk_lut import JobRiskLookupTable
+from services.risk_prior import UNKNOWN_JOB_CODE, load_risk_prior
+from models.registry import RegistryModel
+from utils.lazy import LazyInstance
+from utils.metrics import metrics
+from config.settings import settings
+from typing import List
+import numpy as np
 
 
 class JobRiskService:
     """산업재해 리스크 예측 서비스"""
+
+    # 모델은 레지스트리에서 요청마다 조회 (없으면 None → 기본 리스크)
+    model = RegistryModel("job_risk")
     
     def __init__(self):
         self.feature_engineer = JobRiskFeatureEngineer()
-        self.model_loader = ModelLoader()
-        self.model = None
-        self._load_model()
-    
-    def _load_model(self):
-        """모델 로드"""
-        model_path = os.path.join("models", "job_risk_model.pkl")
-        try:
-            self.model = self.model_loader.load_model(model_path)
-        except FileNotFoundError:
-            # 모델이 없을 경우 None으로 설정
-            self.model = None
+        self.risk_prior = load_risk_prior()
+        self.baseline_table = (
+            JobRiskLookupTable(self) if settings.JOB_RISK_BASELINE_LUT else None
+        )
     
+    @metrics.timed("job_risk.predict")
     async def predict_risk(self, request: JobRiskRequest) -> JobRiskResponse:
         """
         산업재해 리스크 예측
@@ -32,12 +40,25 @@ class JobRiskService:
         Returns:
             JobRiskResponse: 리스크 예측 결과
         """
+        # 모델이 없으면 사전 계산 테이블 조회 (실시간 로직과 같은 결과)
+        if not self.model and self.baseline_table is not None:
+            risk_score, risk_level, risk_factors, safety_recommendations = (
+                self.baseline_table.lookup(request)
+            )
+            return JobRiskResponse(
+                risk_score=risk_score,
+                risk_level=risk_level,
+                risk_factors=risk_factors,
+                safety_recommendations=safety_recommendations
+            )
+
         # 피처 엔지니어링
         features = self.feature_engineer.extract_features(request)
         
         # 모델 예측 (모델이 있으면)
         if self.model:
-            risk_score = self.model.predict([features])[0]
+            with metrics.stage("model.job_risk"):
+                risk_score = self.model.predict([features])[0]
         else:
             # 임시 로직 (모델이 없을 경우)
             risk_score = self._calculate_baseline_risk(request)
@@ -58,14 +79,76 @@ class JobRiskService:
             safety_recommendations=safety_recommendations
         )
     
+    async def predict_risk_batch(self, requests: List[JobRiskRequest]) -> List[JobRiskResponse]:
+        """
+        산업재해 리스크 N건 일괄 예측
+
+        (N, 18) 피처 행렬 1회 인코딩 → predict 1회 (모델이 없으면 벡터 기본 리스크)
+        """
+        risk_scores = self.score_batch(requests)
+        risk_levels = self.determine_risk_levels(risk_scores)
+
+        return [
+            JobRiskResponse(
+                risk_score=float(risk_score),
+                risk_level=risk_level,
+                risk_factors=self._analyze_risk_factors(request),
+                safety_recommendations=self._generate_safety_recommendations(request, risk_score),
+            )
+            for request, risk_score, risk_level in zip(requests, risk_scores.tolist(), risk_levels)
+        ]
+
+    @metrics.timed("job_risk.score_batch")
+    def score_batch(self, requests: List[JobRiskRequest]) -> np.ndarray:
+        """
+        리스크 점수만 N건 일괄 계산 (모델이 있으면 predict 1회)
+        """
+        if not requests:
+            return np.zeros(0, dtype=np.float64)
+
+        X = self.feature_engineer.encode_batch(requests)
+        if self.model:
+            with metrics.stage("model.job_risk"):
+                return np.asarray(self.model.predict(X), dtype=np.float64)
+
+        return self._calculate_baseline_risk_batch(X, requests)
+
+    def _calculate_baseline_risk_batch(
+        self, X: np.ndarray, requests: List[JobRiskRequest]
+    ) -> np.ndarray:
+        """_calculate_baseline_risk의 벡터 버전 (encode_batch 피처 행렬 입력)"""
+        X = X.astype(np.float64)
+
+        if self.risk_prior is not None:
+            job_codes = [JOB_TYPE_INDEX.get(r.job_type, UNKNOWN_JOB_CODE) for r in requests]
+            age_codes = [self.risk_prior.age_code(r.age_group) for r in requests]
+            job_type_risk = np.asarray(self.risk_prior.points_table, dtype=np.float64)[
+                job_codes, age_codes
+            ]
+        else:
+            high_risk_cols = [JOB_TYPE_INDEX[j] for j in ("construction", "mining", "manufacturing")]
+            job_type_risk = 30.0 * X[:, high_risk_cols].sum(axis=1)
+
+        base_risk = (
+            30.0
+            + job_type_risk
+            + 20.0 * X[:, ENV_OFFSET]                       # height == "high"
+            - 5.0 * X[:, SAFETY_COUNT_COL]
+            - np.minimum(10.0, X[:, EXPERIENCE_COL])
+        )
+        return np.clip(base_risk, 0.0, 100.0)
+
     def _calculate_baseline_risk(self, request: JobRiskRequest) -> float:
         """기본 리스크 계산 (모델이 없을 경우)"""
         base_risk = 30.0
         
-        # 직종별 기본 리스크
-        high_risk_jobs = ["construction", "mining", "manufacturing"]
-        if request.job_type in high_risk_jobs:
-            base_risk += 30.0
+        # 직종별 기본 리스크 (사전 분포가 있으면 연령대 × 업종 사고 통계 기준)
+        if self.risk_prior is not None:
+            base_risk += self.risk_prior.points(request.job_type, request.age_group)
+        else:
+            high_risk_jobs = ["construction", "mining", "manufacturing"]
+            if request.job_type in high_risk_jobs:
+                base_risk += 30.0
         
         # 작업 환경 영향
         if request.work_environment.get("height") == "high":
@@ -81,6 +164,11 @@ class JobRiskService:
         
         return max(0, min(100, base_risk))
     
+    def determine_risk_levels(self, risk_scores) -> List[str]:
+        """리스크 점수 N개 → 위험도 레벨 N개 (_determine_risk_level과 같은 경계)"""
+        levels = np.array(["low", "medium", "high"])
+        return levels[np.searchsorted([40.0, 70.0], risk_scores, side="right")].tolist()
+
     def _determine_risk_level(self, risk_score: float) -> str:
         """위험도 레벨 결정"""
         if risk_score >= 70:
@@ -94,12 +182,17 @@ class JobRiskService:
         """위험 요인 분석"""
         factors = {}
         
-        # 직종 리스크
-        high_risk_jobs = ["construction", "mining", "manufacturing"]
-        if request.job_type in high_risk_jobs:
-            factors["job_type_risk"] = 40.0
+        # 직종 리스크 (사전 분포가 있으면 점수 계산과 같은 연령대 × 업종 사고 통계 기준)
+        if self.risk_prior is not None:
+            factors["job_type_risk"] = round(
+                self.risk_prior.points(request.job_type, request.age_group), 2
+            )
         else:
-            factors["job_type_risk"] = 20.0
+            high_risk_jobs = ["construction", "mining", "manufacturing"]
+            if request.job_type in high_risk_jobs:
+                factors["job_type_risk"] = 40.0
+            else:
+                factors["job_type_risk"] = 20.0
         
         # 환경 리스크
         env_risk = 0.0
@@ -128,3 +221,7 @@ class JobRiskService:
             recommendations.append("신입 작업자 안전 교육 필수")
         
         return recommendations
+
+
+# 라우터 공용 인스턴스 (첫 요청 때 생성: 리스크 사전 분포 + 기본 리스크 테이블)
+job_risk_service = LazyInstance(JobRiskService)
@@ -0,0 +1,195 @@
+import logging
+from typing import Iterator, List, Optional, Tuple
+
+import numpy as np
+
+from features.matching_features import EDU_SCORES, resolve_weights
+from features.skill_vocabulary import SkillVocabulary
+
+logger = logging.getLogger(__name__)
+
+
+def pack_skill_bitsets(skill_ids: List[np.ndarray], n_words: int) -> np.ndarray:
+    """
+    스킬 ID 목록들 → 비트셋 (n, n_words) uint64
+
+    스킬 ID k는 word k // 64의 비트 k % 64
+    """
+    bits = np.zeros((len(skill_ids), n_words), dtype=np.uint64)
+    if not skill_ids:
+        return bits
+
+    lengths = np.fromiter((len(s) for s in skill_ids), dtype=np.int64, count=len(skill_ids))
+    if lengths.sum() == 0:
+        return bits
+
+    rows = np.repeat(np.arange(len(skill_ids)), lengths)
+    ids = np.concatenate(skill_ids).astype(np.int64)
+    np.bitwise_or.at(
+        bits,
+        (rows, ids >> 6),
+        np.left_shift(np.uint64(1), (ids & 63).astype(np.uint64)),
+    )
+    return bits
+
+
+class SkillBitsetBlock:
+    """비트셋으로 인코딩된 구직자 또는 공고 묶음"""
+
+    __slots__ = ("ids", "bits", "n_skills", "experience", "education")
+
+    def __init__(self, ids, bits, n_skills, experience, education):
+        self.ids = ids
+        self.bits = bits
+        self.n_skills = n_skills
+        self.experience = experience
+        self.education = education
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+
+class MatchingMatrixEngine:
+    """
+    구직자 S명 × 공고 P개 전체 적합도 행렬 (야간 배치용)
+
+    - 스킬을 어휘로 인터닝 후 uint64 비트셋으로 패킹
+    - 교집합 수 = 타일 단위 AND + popcount (word 단위 누적 → 메모리는 타일 크기만큼)
+    - S×P 점수는 타일로 스트리밍 (전체 행렬을 메모리에 올리지 않음)
+    """
+
+    def __init__(self, vocab: Optional[SkillVocabulary] = None):
+        self.vocab = vocab or SkillVocabulary()
+
+    # =========================================================
+    # 인코딩
+    # =========================================================
+    def encode_postings(self, postings: List[dict]) -> SkillBitsetBlock:
+        """공고 인코딩 (요구 스킬은 어휘에 등록)"""
+        skill_ids = [self.vocab.intern_many(p.get("required_skills", [])) for p in postings]
+        return self._block(
+            [int(p.get("posting_id", i)) for i, p in enumerate(postings)],
+            skill_ids,
+            [p.get("required_experience", 0) for p in postings],
+            [EDU_SCORES.get(p.get("education_level", ""), 0) for p in postings],
+        )
+
+    def encode_seekers(self, seekers: List[dict]) -> SkillBitsetBlock:
+        """
+        구직자 인코딩
+
+        ⚠️ encode_postings 이후 호출 (어휘에 없는 스킬은 어떤 공고와도 교집합이 없으므로 제외)
+        """
+        skill_ids = [self.vocab.lookup_many(s.get("skills", [])) for s in seekers]
+        return self._block(
+            [int(s.get("seeker_id", i)) for i, s in enumerate(seekers)],
+            skill_ids,
+            [s.get("experience", 0) for s in seekers],
+            [EDU_SCORES.get(s.get("education", ""), 0) for s in seekers],
+        )
+
+    def _block(self, ids, skill_ids, experience, education) -> SkillBitsetBlock:
+        n_words = max(1, (len(self.vocab) + 63) // 64)
+        return SkillBitsetBlock(
+            ids=np.array(ids, dtype=np.int64),
+            bits=pack_skill_bitsets(skill_ids, n_words),
+            n_skills=np.array([len(s) for s in skill_ids], dtype=np.float32),
+            experience=np.array(experience, dtype=np.float32),
+            education=np.array(education, dtype=np.float32),
+        )
+
+    # =========================================================
+    # 점수 계산
+    # =========================================================
+    @staticmethod
+    def intersection_counts(seeker_bits: np.ndarray, posting_bits: np.ndarray) -> np.ndarray:
+        """(s, W) × (p, W) → 교집합 크기 (s, p)"""
+        counts = np.zeros((len(seeker_bits), len(posting_bits)), dtype=np.uint16)
+
+        # 어느 쪽이든 전부 0인 word는 건너뜀
+        active_words = np.flatnonzero(
+            seeker_bits.any(axis=0) & posting_bits.any(axis=0)
+        )
+        for w in active_words:
+            counts += np.bitwise_count(
+                seeker_bits[:, w, None] & posting_bits[None, :, w]
+            )
+        return counts
+
+    @staticmethod
+    def score_tile(
+        seekers: SkillBitsetBlock,
+        postings: SkillBitsetBlock,
+        s_slice: slice,
+        p_slice: slice,
+        weights: dict,
+    ) -> np.ndarray:
+        """타일 하나의 종합 매칭 점수 (float32, 0-100)"""
+
+        inter = MatchingMatrixEngine.intersection_counts(
+            seekers.bits[s_slice], postings.bits[p_slice]
+        ).astype(np.float32)
+
+        n_req = postings.n_skills[p_slice][None, :]
+        req_exp = postings.experience[p_slice][None, :]
+        req_edu = postings.education[p_slice][None, :]
+        s_exp = seekers.experience[s_slice][:, None]
+        s_edu = seekers.education[s_slice][:, None]
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            skills = np.where(n_req == 0, 100.0, inter / n_req * 100.0)
+            experience = np.where(
+                (req_exp == 0) | (s_exp >= req_exp), 100.0, s_exp / req_exp * 100.0
+            )
+            education = np.where(s_edu >= req_edu, 100.0, s_edu / req_edu * 100.0)
+
+        tile = (
+            skills * weights["skills"]
+            + experience * weights["experience"]
+            + education * weights["education"]
+        )
+        return np.minimum(100.0, tile).astype(np.float32)
+
+    def iter_score_tiles(
+        self,
+        seekers: SkillBitsetBlock,
+        postings: SkillBitsetBlock,
+        weights: Optional[dict] = None,
+        tile_seekers: int = 256,
+        tile_postings: int = 4096,
+    ) -> Iterator[Tuple[int, int, np.ndarray]]:
+        """
+        (seeker 시작 행, posting 시작 열, 점수 타일) 스트리밍
+        """
+        w = resolve_weights(weights)
+
+        for s0 in range(0, len(seekers), tile_seekers):
+            s_slice = slice(s0, min(s0 + tile_seekers, len(seekers)))
+            for p0 in range(0, len(postings), tile_postings):
+                p_slice = slice(p0, min(p0 + tile_postings, len(postings)))
+                yield s0, p0, self.score_tile(seekers, postings, s_slice, p_slice, w)
+
+    def write_score_matrix(
+        self,
+        out_path: str,
+        seekers: SkillBitsetBlock,
+        postings: SkillBitsetBlock,
+        weights: Optional[dict] = None,
+        tile_seekers: int = 256,
+        tile_postings: int = 4096,
+    ) -> np.ndarray:
+        """
+        S×P 점수 행렬을 .npy 메모리맵 파일로 타일 단위 기록
+        """
+        matrix = np.lib.format.open_memmap(
+            out_path, mode="w+", dtype=np.float32, shape=(len(seekers), len(postings))
+        )
+
+        for s0, p0, tile in self.iter_score_tiles(
+            seekers, postings, weights, tile_seekers, tile_postings
+        ):
+            matrix[s0:s0 + tile.shape[0], p0:p0 + tile.shape[1]] = tile
+
+        matrix.flush()
+        logger.info(f"매칭 점수 행렬 저장: {out_path} shape={matrix.shape}")
+        return matrix
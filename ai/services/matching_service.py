@@ -1,27 +1,44 @@
-from schemas.matching import MatchingRequest, MatchingResponse
-from features.matching_features import MatchingFeatureEngineer
-from utils.loader import ModelLoader
-import os
+from schemas.matching import (
+    MatchingRequest,
+    MatchingResponse,
+    MatchingRankRequest,
+    MatchingRankResponse,
+    RankedPosting,
+)
+from features.matching_features import (
+    EDU_SCORES,
+    MatchingFeatureEngineer,
+    MatchingScoreRecord,
+    compute_subscores,
+    count_matched_skills,
+    resolve_weights,
+    subscores_from_counts,
+)
+from features.skill_embedding import load_skill_embeddings
+from services.posting_catalog import PostingCatalog, posting_catalog
+from services.priority_index import priority_index
+from models.registry import RegistryModel
+from utils.lazy import LazyInstance
+from utils.metrics import metrics
+from config.settings import settings
+from utils.exceptions import ValidationError
+from typing import Optional
+import numpy as np
 
 
 class MatchingService:
     """매칭 점수 계산 서비스"""
+
+    # 모델은 레지스트리에서 요청마다 조회 (없으면 None → 기본 점수)
+    model = RegistryModel("matching")
     
     def __init__(self):
         self.feature_engineer = MatchingFeatureEngineer()
-        self.model_loader = ModelLoader()
-        self.model = None
-        self._load_model()
-    
-    def _load_model(self):
-        """모델 로드"""
-        model_path = os.path.join("models", "matching_model.pkl")
-        try:
-            self.model = self.model_loader.load_model(model_path)
-        except FileNotFoundError:
-            # 모델이 없을 경우 None으로 설정
-            self.model = None
+        self.skill_embeddings = (
+            load_skill_embeddings() if settings.MATCHING_SOFT_SKILLS else None
+        )
     
+    @metrics.timed("matching.score")
     async def calculate_score(self, request: MatchingRequest) -> MatchingResponse:
         """
         매칭 점수 계산
@@ -32,147 +49,264 @@ class MatchingService:
         Returns:
             MatchingResponse: 매칭 점수 계산 결과
         """
-        # 피처 엔지니어링
-        features = self.feature_engineer.extract_features(request)
+        # 중간값 1회 계산 (피처 / 세부 내역 / 권장사항 모두 이 레코드에서 파생)
+        record = self.feature_engineer.score_pair(
+            request.job_seeker_profile, request.job_posting, request.weights,
+            self.skill_embeddings, settings.SKILL_SOFT_MATCH_THRESHOLD,
+        )
         
         # 모델 예측 (모델이 있으면)
         if self.model:
-            matching_score = self.model.predict([features])[0]
+            with metrics.stage("model.matching"):
+                matching_score = self.model.predict([record.to_features()])[0]
         else:
             # 임시 로직 (모델이 없을 경우)
-            matching_score = self._calculate_baseline_score(request)
-        
-        # 점수 세부 내역 계산
-        score_breakdown = self._calculate_score_breakdown(request)
+            matching_score = record.baseline_score()
         
         # 개선 권장사항 생성
-        recommendations = self._generate_recommendations(request, matching_score)
+        recommendations = self._generate_recommendations(record, matching_score)
         
         return MatchingResponse(
             matching_score=float(matching_score),
-            score_breakdown=score_breakdown,
+            score_breakdown=record.breakdown(),
             recommendations=recommendations
         )
     
-    def _calculate_baseline_score(self, request: MatchingRequest) -> float:
-        """기본 점수 계산 (모델이 없을 경우)"""
-        # 스킬 매칭
-        seeker_skills = set(request.job_seeker_profile.get("skills", []))
-        required_skills = set(request.job_posting.get("required_skills", []))
-        
-        if len(required_skills) == 0:
-            skills_score = 100.0
-        else:
-            skills_match = len(seeker_skills & required_skills) / len(required_skills)
-            skills_score = skills_match * 100.0
-        
-        # 경력 매칭
-        seeker_exp = request.job_seeker_profile.get("experience", 0)
-        required_exp = request.job_posting.get("required_experience", 0)
-        
-        if required_exp == 0:
-            exp_score = 100.0
-        elif seeker_exp >= required_exp:
-            exp_score = 100.0
-        else:
-            exp_score = (seeker_exp / required_exp) * 100.0
-        
-        # 학력 매칭
-        seeker_edu = request.job_seeker_profile.get("education", "")
-        required_edu = request.job_posting.get("education_level", "")
-        
-        edu_scores = {"high_school": 1, "bachelor": 2, "master": 3, "phd": 4}
-        seeker_edu_score = edu_scores.get(seeker_edu, 0)
-        required_edu_score = edu_scores.get(required_edu, 0)
-        
-        if seeker_edu_score >= required_edu_score:
-            edu_score = 100.0
+    async def rank_postings(self, request: MatchingRankRequest) -> MatchingRankResponse:
+        """
+        구직자 1명 × 공고 N개 Top-K 랭킹
+
+        - job_postings가 있으면 요청 공고로 임시 카탈로그 구성
+        - 없으면 적재된 카탈로그 (posting_ids 지정 시 해당 공고만)
+        - seeker_priority는 참고값: 파이프라인 우선순위는 구직자(고령자) 단위라
+          한 요청의 모든 공고에 같은 값 → 공고 순서 / 점수에는 반영하지 않음
+        """
+        if request.job_postings is not None:
+            catalog = PostingCatalog.from_postings(request.job_postings)
+            rows = None
         else:
-            edu_score = (seeker_edu_score / required_edu_score) * 100.0
-        
-        # 가중치 적용
-        weights = request.weights or {"skills": 0.4, "experience": 0.3, "education": 0.3}
-        
-        total_score = (
-            skills_score * weights.get("skills", 0.4) +
-            exp_score * weights.get("experience", 0.3) +
-            edu_score * weights.get("education", 0.3)
+            catalog = posting_catalog
+            rows = None
+            if request.posting_ids is not None:
+                try:
+                    rows = catalog.rows_for(request.posting_ids)
+                except KeyError as e:
+                    raise ValidationError(
+                        message=f"카탈로그에 없는 공고입니다: {e.args[0]}",
+                        details={"field": "posting_ids", "value": e.args[0]}
+                    )
+
+        response = self.rank_catalog(
+            request.job_seeker_profile, catalog, rows, request.top_k, request.weights
         )
-        
-        return min(100.0, total_score)
-    
-    def _calculate_score_breakdown(self, request: MatchingRequest) -> dict:
-        """점수 세부 내역 계산"""
-        # 스킬 매칭
-        seeker_skills = set(request.job_seeker_profile.get("skills", []))
-        required_skills = set(request.job_posting.get("required_skills", []))
-        
-        if len(required_skills) == 0:
-            skills_match = 100.0
-        else:
-            skills_match = len(seeker_skills & required_skills) / len(required_skills) * 100.0
-        
-        # 경력 매칭
-        seeker_exp = request.job_seeker_profile.get("experience", 0)
-        required_exp = request.job_posting.get("required_experience", 0)
-        
-        if required_exp == 0:
-            experience_match = 100.0
-        elif seeker_exp >= required_exp:
-            experience_match = 100.0
+        # 참고값만 (랭킹에는 쓰지 않음, 위 docstring)
+        response.seeker_priority = priority_index.seeker_priority(request.job_seeker_profile)
+        return response
+
+    @metrics.timed("matching.rank_catalog")
+    def rank_catalog(
+        self,
+        seeker: dict,
+        catalog: PostingCatalog,
+        rows: Optional[np.ndarray],
+        top_k: int,
+        weights: Optional[dict] = None,
+    ) -> MatchingRankResponse:
+        """카탈로그 전체(또는 rows)를 벡터로 점수화한 뒤 argpartition으로 Top-K 선택"""
+        arrays = catalog.arrays()
+        w = resolve_weights(weights)
+
+        seeker_skills = set(seeker.get("skills", []))
+        seeker_exp = seeker.get("experience", 0)
+        seeker_edu = EDU_SCORES.get(seeker.get("education", ""), 0)
+        seeker_skill_ids = catalog.vocab.lookup_many(seeker_skills)
+
+        # 스킬 역색인으로 후보 축소 (정확성 보장 안 되면 None → 전체 스캔)
+        # 유사 스킬 매칭 시에는 역색인 밖 공고도 스킬 점수가 있으므로 사용 안 함
+        if (
+            rows is None and self.model is None and self.skill_embeddings is None
+            and settings.MATCHING_CANDIDATE_PRUNING
+        ):
+            pruned = self._rank_pruned(
+                catalog, arrays, seeker_skill_ids, seeker_exp, seeker_edu, top_k, w
+            )
+            if pruned is not None:
+                return pruned
+
+        mask = self._seeker_skill_mask(catalog, seeker_skills, seeker_skill_ids)
+
+        skills, experience, education = compute_subscores(
+            mask, seeker_exp, seeker_edu,
+            arrays.indices, arrays.entry_rows, arrays.n_required,
+            arrays.required_exp, arrays.required_edu,
+        )
+
+        if rows is None:
+            candidates = np.flatnonzero(arrays.active)
         else:
-            experience_match = (seeker_exp / required_exp) * 100.0
-        
-        # 학력 매칭
-        seeker_edu = request.job_seeker_profile.get("education", "")
-        required_edu = request.job_posting.get("education_level", "")
-        
-        edu_scores = {"high_school": 1, "bachelor": 2, "master": 3, "phd": 4}
-        seeker_edu_score = edu_scores.get(seeker_edu, 0)
-        required_edu_score = edu_scores.get(required_edu, 0)
-        
-        if seeker_edu_score >= required_edu_score:
-            education_match = 100.0
+            candidates = rows[arrays.active[rows]]
+
+        if self.model:
+            matched_counts = count_matched_skills(
+                mask, arrays.indices, arrays.entry_rows, len(arrays.n_required)
+            )
+            X = MatchingFeatureEngineer.build_feature_matrix(
+                candidates, arrays, len(seeker_skills),
+                seeker_exp, seeker_edu, skills, experience, education, w, matched_counts,
+            )
+            with metrics.stage("model.matching"):
+                scores = np.asarray(self.model.predict(X), dtype=np.float64)
         else:
-            education_match = (seeker_edu_score / required_edu_score) * 100.0
-        
-        return {
-            "skills_match": round(skills_match, 2),
-            "experience_match": round(experience_match, 2),
-            "education_match": round(education_match, 2)
-        }
-    
-    def _generate_recommendations(self, request: MatchingRequest, matching_score: float) -> list:
+            scores = np.minimum(
+                100.0,
+                skills[candidates] * w["skills"]
+                + experience[candidates] * w["experience"]
+                + education[candidates] * w["education"],
+            )
+
+        top = self._top_k(candidates, scores, top_k)
+        return self._ranked_response(
+            arrays.posting_ids, candidates, scores, top,
+            skills[candidates], experience[candidates], education[candidates],
+        )
+
+    def _seeker_skill_mask(
+        self,
+        catalog: PostingCatalog,
+        seeker_skills: set,
+        seeker_skill_ids: np.ndarray,
+    ) -> np.ndarray:
+        """
+        카탈로그 어휘 크기의 스킬 일치 가중치 (정확 일치 1.0)
+
+        임베딩이 있으면 구직자 스킬의 이웃 스킬에 유사도만큼 부분 가중치
+        (score_pair의 부분 일치와 같은 기준)
+        """
+        if self.skill_embeddings is None:
+            mask = np.zeros(len(catalog.vocab), dtype=bool)
+            mask[seeker_skill_ids] = True
+            return mask
+
+        mask = np.zeros(len(catalog.vocab), dtype=np.float64)
+        for skill, sim in self.skill_embeddings.neighbors(
+            seeker_skills,
+            threshold=settings.SKILL_SOFT_MATCH_THRESHOLD,
+            k=settings.SKILL_SOFT_MATCH_NEIGHBORS,
+            n_probe=settings.SKILL_EMBEDDING_IVF_PROBES,
+        ):
+            skill_id = catalog.vocab.lookup(skill)
+            if skill_id is not None:
+                mask[skill_id] = max(mask[skill_id], sim)
+        mask[seeker_skill_ids] = 1.0
+        return mask
+
+    def _rank_pruned(
+        self,
+        catalog: PostingCatalog,
+        arrays,
+        seeker_skill_ids: np.ndarray,
+        seeker_exp: float,
+        seeker_edu: int,
+        top_k: int,
+        w: dict,
+    ) -> Optional[MatchingRankResponse]:
+        """
+        스킬이 하나라도 겹치는(또는 요구 스킬이 없는) 공고만 점수화
+
+        후보 밖 공고는 스킬 점수가 0이므로 최대 100 × (경력 + 학력 가중치).
+        K번째 후보 점수가 그 상한보다 클 때만 결과가 전체 스캔과 같으므로 반환,
+        아니면 None (호출자가 전체 스캔)
+        """
+        if min(w.values()) < 0:
+            return None
+
+        candidates, matched = catalog.skill_index.candidate_counts(
+            seeker_skill_ids, arrays.active
+        )
+        k = min(top_k, len(candidates))
+        if k < top_k and k < int(arrays.active.sum()):
+            return None
+
+        skills, experience, education = subscores_from_counts(
+            matched, arrays.n_required[candidates], seeker_exp, seeker_edu,
+            arrays.required_exp[candidates], arrays.required_edu[candidates],
+        )
+        scores = np.minimum(
+            100.0,
+            skills * w["skills"] + experience * w["experience"] + education * w["education"],
+        )
+
+        top = self._top_k(candidates, scores, top_k)
+        pruned_bound = min(100.0, 100.0 * (w["experience"] + w["education"]))
+        if len(top) and scores[top[-1]] <= pruned_bound:
+            return None
+
+        return self._ranked_response(
+            arrays.posting_ids, candidates, scores, top, skills, experience, education
+        )
+
+    @staticmethod
+    def _top_k(candidates: np.ndarray, scores: np.ndarray, top_k: int) -> np.ndarray:
+        """점수 내림차순 Top-K 인덱스 (동점은 행 번호 오름차순)"""
+        k = min(top_k, len(candidates))
+        if k == 0:
+            return np.zeros(0, dtype=np.int64)
+
+        # argpartition은 동점 중 임의로 고르므로 K번째 점수와 같은 공고는 앞 순번부터 채움
+        kth = scores[np.argpartition(-scores, k - 1)[k - 1]]
+        better = np.flatnonzero(scores > kth)
+        ties = np.flatnonzero(scores == kth)[: k - len(better)]
+        top = np.concatenate((better, ties))
+        return top[np.lexsort((candidates[top], -scores[top]))]
+
+    @staticmethod
+    def _ranked_response(
+        posting_ids: np.ndarray,
+        candidates: np.ndarray,
+        scores: np.ndarray,
+        top: np.ndarray,
+        skills: np.ndarray,
+        experience: np.ndarray,
+        education: np.ndarray,
+    ) -> MatchingRankResponse:
+        """candidates와 같은 길이의 점수 배열들 → 응답"""
+        results = [
+            RankedPosting(
+                posting_id=int(posting_ids[candidates[i]]),
+                matching_score=float(scores[i]),
+                score_breakdown={
+                    "skills_match": round(float(skills[i]), 2),
+                    "experience_match": round(float(experience[i]), 2),
+                    "education_match": round(float(education[i]), 2),
+                },
+            )
+            for i in top.tolist()
+        ]
+        return MatchingRankResponse(total_candidates=len(candidates), results=results)
+
+    def _generate_recommendations(
+        self, record: MatchingScoreRecord, matching_score: float
+    ) -> list:
         """개선 권장사항 생성"""
         recommendations = []
         
         # 스킬 부족 체크
-        seeker_skills = set(request.job_seeker_profile.get("skills", []))
-        required_skills = set(request.job_posting.get("required_skills", []))
-        missing_skills = required_skills - seeker_skills
-        
-        if missing_skills:
-            recommendations.append(f"{', '.join(list(missing_skills)[:3])} 기술 학습 권장")
+        if record.missing_skills:
+            recommendations.append(f"{', '.join(record.missing_skills[:3])} 기술 학습 권장")
         
         # 경력 부족 체크
-        seeker_exp = request.job_seeker_profile.get("experience", 0)
-        required_exp = request.job_posting.get("required_experience", 0)
-        
-        if seeker_exp < required_exp:
-            recommendations.append(f"경력 {required_exp - seeker_exp}년 추가 필요")
+        if record.seeker_exp < record.required_exp:
+            recommendations.append(f"경력 {record.required_exp - record.seeker_exp}년 추가 필요")
         
         # 학력 부족 체크
-        seeker_edu = request.job_seeker_profile.get("education", "")
-        required_edu = request.job_posting.get("education_level", "")
-        
-        edu_scores = {"high_school": 1, "bachelor": 2, "master": 3, "phd": 4}
-        seeker_edu_score = edu_scores.get(seeker_edu, 0)
-        required_edu_score = edu_scores.get(required_edu, 0)
-        
-        if seeker_edu_score < required_edu_score:
-            recommendations.append(f"학력 요건 충족 필요 ({required_edu})")
+        if record.seeker_edu_score < record.required_edu_score:
+            recommendations.append(f"학력 요건 충족 필요 ({record.required_edu})")
         
         if matching_score >= 80:
             recommendations.append("높은 매칭 점수 - 지원 권장")
         
         return recommendations
+
+
+# 라우터 공용 인스턴스 (첫 요청 때 생성: 스킬 임베딩 등)
+matching_service = LazyInstance(MatchingService)
@@ -0,0 +1,355 @@
+import logging
+import threading
+from datetime import datetime, timezone, timedelta
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from config.settings import settings
+from schemas.monitoring import (
+    ActivityType,
+    MonitoringResponse,
+    RollupBucket,
+    RollupResolution,
+    SensorReading,
+)
+from features.monitoring_features import MonitoringFeatureExtractor
+from utils.metrics import metrics
+
+logger = logging.getLogger(__name__)
+
+ACTIVITIES: Tuple[str, ...] = tuple(a.value for a in ActivityType)
+_ACTIVITY_INDEX = {a: i for i, a in enumerate(ACTIVITIES)}
+
+RESOLUTION_SECONDS = {
+    RollupResolution.MINUTE: 60,
+    RollupResolution.HOUR: 3600,
+    RollupResolution.DAY: 86400,
+}
+
+# 측정 간격이 이보다 길면 기기 미착용으로 보고 활동 시간에 포함하지 않음
+MAX_ACTIVITY_GAP_SEC = 300
+
+
+def _to_epoch(ts: datetime) -> float:
+    if ts.tzinfo is None:
+        ts = ts.replace(tzinfo=timezone.utc)
+    return ts.timestamp()
+
+
+class RollupSeries:
+    """
+    단일 해상도 롤업 링버퍼 (버킷 ID % capacity 슬롯)
+
+    슬롯에 다른 버킷 ID가 들어 있으면 보존 기간이 지난 것이므로 덮어씀
+    """
+
+    def __init__(self, width_sec: int, capacity: int):
+        self.width = width_sec
+        self.capacity = capacity
+
+        self.bucket_ids = np.full(capacity, -1, dtype=np.int64)
+        self.hr_min = np.zeros(capacity, dtype=np.float32)
+        self.hr_max = np.zeros(capacity, dtype=np.float32)
+        self.hr_sum = np.zeros(capacity, dtype=np.float64)
+        self.hr_count = np.zeros(capacity, dtype=np.int32)
+        self.readings = np.zeros(capacity, dtype=np.int32)
+        self.steps = np.zeros(capacity, dtype=np.int64)
+        self.activity_sec = np.zeros((capacity, len(ACTIVITIES)), dtype=np.float32)
+        self.falls = np.zeros(capacity, dtype=np.int32)
+
+    def _slot(self, bucket_id: int) -> int:
+        slot = bucket_id % self.capacity
+        if self.bucket_ids[slot] != bucket_id:
+            self.bucket_ids[slot] = bucket_id
+            self.hr_min[slot] = np.inf
+            self.hr_max[slot] = -np.inf
+            self.hr_sum[slot] = 0.0
+            self.hr_count[slot] = 0
+            self.readings[slot] = 0
+            self.steps[slot] = 0
+            self.activity_sec[slot] = 0.0
+            self.falls[slot] = 0
+        return slot
+
+    def add_batch(
+        self,
+        ts: np.ndarray,
+        hr: np.ndarray,
+        steps: np.ndarray,
+        falls: np.ndarray,
+        activity_ts: np.ndarray,
+        activity_idx: np.ndarray,
+        activity_dt: np.ndarray,
+    ) -> None:
+        """정렬된 배치를 버킷별로 미리 집계한 뒤 슬롯에 병합"""
+
+        bids = (ts // self.width).astype(np.int64)
+        uniq, inv = np.unique(bids, return_inverse=True)
+        n = len(uniq)
+
+        has_hr = ~np.isnan(hr)
+        hr_cnt = np.bincount(inv, weights=has_hr, minlength=n)
+        hr_sum = np.bincount(inv[has_hr], weights=hr[has_hr], minlength=n)
+        hr_min = np.full(n, np.inf)
+        hr_max = np.full(n, -np.inf)
+        np.minimum.at(hr_min, inv[has_hr], hr[has_hr])
+        np.maximum.at(hr_max, inv[has_hr], hr[has_hr])
+        cnt = np.bincount(inv, minlength=n)
+        step_sum = np.bincount(inv, weights=steps, minlength=n)
+        fall_sum = np.bincount(inv, weights=falls, minlength=n)
+
+        # 보존 기간 하한 (이보다 오래된 버킷은 버림)
+        oldest = max(int(self.bucket_ids.max()), int(uniq[-1])) - self.capacity
+
+        for g, bucket_id in enumerate(uniq.tolist()):
+            if bucket_id <= oldest:
+                continue
+
+            slot = self._slot(bucket_id)
+            self.readings[slot] += cnt[g]
+            self.steps[slot] += int(step_sum[g])
+            self.falls[slot] += int(fall_sum[g])
+            if hr_cnt[g]:
+                self.hr_count[slot] += int(hr_cnt[g])
+                self.hr_sum[slot] += hr_sum[g]
+                self.hr_min[slot] = min(self.hr_min[slot], hr_min[g])
+                self.hr_max[slot] = max(self.hr_max[slot], hr_max[g])
+
+        if len(activity_ts):
+            act_bids = (activity_ts // self.width).astype(np.int64)
+            for bucket_id in np.unique(act_bids).tolist():
+                if bucket_id <= oldest:
+                    continue
+                mask = act_bids == bucket_id
+                slot = self._slot(bucket_id)
+                self.activity_sec[slot] += np.bincount(
+                    activity_idx[mask],
+                    weights=activity_dt[mask],
+                    minlength=len(ACTIVITIES),
+                ).astype(np.float32)
+
+    def query(self, start_ts: float, end_ts: float) -> np.ndarray:
+        """[start, end) 구간에 걸친 슬롯 인덱스 (버킷 시간순)"""
+        lo = int(start_ts // self.width)
+        hi = int(np.ceil(end_ts / self.width))
+        slots = np.nonzero((self.bucket_ids >= lo) & (self.bucket_ids < hi))[0]
+        return slots[np.argsort(self.bucket_ids[slots], kind="stable")]
+
+
+class _SeniorRollup:
+    def __init__(self, retention: Dict[RollupResolution, int]):
+        self.lock = threading.Lock()
+        self.series = {
+            res: RollupSeries(RESOLUTION_SECONDS[res], retention[res])
+            for res in RollupResolution
+        }
+        self.last_ts: Optional[float] = None
+        self.last_activity: Optional[int] = None
+
+
+class MonitoringRollupEngine:
+    """
+    시니어별 센서 데이터 증분 롤업 (1분 / 1시간 / 1일)
+
+    - 심박수 min / mean / max, 총 걸음수, 활동별 체류 시간, 낙상 횟수
+    - 대시보드는 원본 대신 작은 집계 버킷만 조회
+    """
+
+    def __init__(self, retention: Optional[Dict[RollupResolution, int]] = None):
+        self.retention = retention or {
+            RollupResolution.MINUTE: settings.MONITORING_ROLLUP_MINUTES,
+            RollupResolution.HOUR: settings.MONITORING_ROLLUP_HOURS,
+            RollupResolution.DAY: settings.MONITORING_ROLLUP_DAYS,
+        }
+        self._seniors: Dict[int, _SeniorRollup] = {}
+        self._lock = threading.Lock()
+
+    def _get(self, senior_profile_id: int) -> _SeniorRollup:
+        rollup = self._seniors.get(senior_profile_id)
+        if rollup is None:
+            with self._lock:
+                rollup = self._seniors.setdefault(
+                    senior_profile_id, _SeniorRollup(self.retention)
+                )
+        return rollup
+
+    @metrics.timed("rollup.ingest")
+    def ingest(self, senior_profile_id: int, readings: List[SensorReading]) -> int:
+        """측정값 배치 적재 (시간순 정렬 후 모든 해상도에 병합)"""
+
+        if not readings:
+            return 0
+
+        ordered = sorted(readings, key=lambda r: _to_epoch(r.timestamp))
+        n = len(ordered)
+
+        ts = np.fromiter((_to_epoch(r.timestamp) for r in ordered), dtype=np.float64, count=n)
+        hr = np.fromiter(
+            (np.nan if r.heart_rate is None else r.heart_rate for r in ordered),
+            dtype=np.float64,
+            count=n,
+        )
+        steps = np.fromiter((r.step_count or 0 for r in ordered), dtype=np.float64, count=n)
+        falls = np.fromiter(
+            (
+                MonitoringFeatureExtractor.detect_fall(
+                    r.posture.dict() if r.posture else None, r.activity
+                )
+                for r in ordered
+            ),
+            dtype=np.float64,
+            count=n,
+        )
+        activity = np.fromiter(
+            (_ACTIVITY_INDEX[ActivityType(r.activity).value] for r in ordered),
+            dtype=np.int64,
+            count=n,
+        )
+
+        rollup = self._get(senior_profile_id)
+
+        with rollup.lock:
+            # 직전 배치의 마지막 측정값을 이어 붙여 측정 간격 → 이전 활동 시간으로 귀속
+            if rollup.last_ts is not None and rollup.last_ts <= ts[0]:
+                prev_ts = np.concatenate(([rollup.last_ts], ts[:-1]))
+                prev_act = np.concatenate(([rollup.last_activity], activity[:-1]))
+            else:
+                prev_ts, prev_act = ts[:-1], activity[:-1]
+
+            cur_ts = ts if len(prev_ts) == n else ts[1:]
+            dt = cur_ts - prev_ts
+            valid = (dt > 0) & (dt <= MAX_ACTIVITY_GAP_SEC)
+
+            for series in rollup.series.values():
+                series.add_batch(
+                    ts, hr, steps, falls,
+                    prev_ts[valid], prev_act[valid], dt[valid],
+                )
+
+            if rollup.last_ts is None or ts[-1] >= rollup.last_ts:
+                rollup.last_ts = float(ts[-1])
+                rollup.last_activity = int(activity[-1])
+
+        return n
+
+    @metrics.timed("rollup.query")
+    def query(
+        self,
+        senior_profile_id: int,
+        resolution: RollupResolution,
+        start: datetime,
+        end: datetime,
+    ) -> Dict[str, np.ndarray]:
+        """
+        구간 롤업 조회 (컬럼별 배열)
+
+        링버퍼 크기에 비례하는 numpy 마스크 1회 → 한 달치도 서브 ms
+        """
+
+        rollup = self._seniors.get(senior_profile_id)
+        if rollup is None:
+            return {}
+
+        series = rollup.series[resolution]
+        with rollup.lock:
+            slots = series.query(_to_epoch(start), _to_epoch(end))
+            hr_count = series.hr_count[slots]
+            with np.errstate(invalid="ignore", divide="ignore"):
+                hr_mean = series.hr_sum[slots] / hr_count
+
+            return {
+                "bucket_start": series.bucket_ids[slots] * series.width,
+                "readings": series.readings[slots].copy(),
+                "hr_count": hr_count,
+                "hr_min": series.hr_min[slots].copy(),
+                "hr_mean": hr_mean,
+                "hr_max": series.hr_max[slots].copy(),
+                "steps": series.steps[slots].copy(),
+                "activity_sec": series.activity_sec[slots].copy(),
+                "falls": series.falls[slots].copy(),
+            }
+
+    def clear(self) -> None:
+        with self._lock:
+            self._seniors.clear()
+
+
+rollup_engine = MonitoringRollupEngine()
+
+
+def _to_buckets(columns: Dict[str, np.ndarray]) -> List[RollupBucket]:
+    if not columns:
+        return []
+
+    buckets: List[RollupBucket] = []
+    for i in range(len(columns["bucket_start"])):
+        has_hr = columns["hr_count"][i] > 0
+        buckets.append(
+            RollupBucket(
+                bucket_start=datetime.fromtimestamp(
+                    int(columns["bucket_start"][i]), tz=timezone.utc
+                ),
+                readings=int(columns["readings"][i]),
+                heart_rate_min=float(columns["hr_min"][i]) if has_hr else None,
+                heart_rate_mean=round(float(columns["hr_mean"][i]), 2) if has_hr else None,
+                heart_rate_max=float(columns["hr_max"][i]) if has_hr else None,
+                steps=int(columns["steps"][i]),
+                activity_seconds={
+                    a: round(float(columns["activity_sec"][i][j]), 1)
+                    for j, a in enumerate(ACTIVITIES)
+                },
+                fall_count=int(columns["falls"][i]),
+            )
+        )
+    return buckets
+
+
+def analyze_monitoring(
+    senior_profile_id: int,
+    data: List[SensorReading],
+    resolution: RollupResolution = RollupResolution.HOUR,
+) -> MonitoringResponse:
+    """
+    센서 데이터 적재 후, 적재 구간의 롤업 버킷 반환
+    """
+
+    ingested = rollup_engine.ingest(senior_profile_id, data)
+    logger.info(f"모니터링 롤업 적재: senior_id={senior_profile_id}, readings={ingested}")
+
+    epochs = [_to_epoch(r.timestamp) for r in data]
+    start = datetime.fromtimestamp(min(epochs), tz=timezone.utc)
+    end = datetime.fromtimestamp(max(epochs) + 1, tz=timezone.utc)
+
+    return MonitoringResponse(
+        senior_profile_id=senior_profile_id,
+        resolution=resolution,
+        ingested=ingested,
+        buckets=_to_buckets(
+            rollup_engine.query(senior_profile_id, resolution, start, end)
+        ),
+    )
+
+
+def query_monitoring(
+    senior_profile_id: int,
+    resolution: RollupResolution,
+    start: Optional[datetime] = None,
+    end: Optional[datetime] = None,
+) -> MonitoringResponse:
+    """
+    롤업 구간 조회 (기본: 해당 해상도의 보존 기간 전체)
+    """
+
+    end = end or datetime.now(timezone.utc)
+    if start is None:
+        window = RESOLUTION_SECONDS[resolution] * rollup_engine.retention[resolution]
+        start = end - timedelta(seconds=window)
+
+    return MonitoringResponse(
+        senior_profile_id=senior_profile_id,
+        resolution=resolution,
+        buckets=_to_buckets(
+            rollup_engine.query(senior_profile_id, resolution, start, end)
+        ),
+    )
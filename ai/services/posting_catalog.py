@@ -0,0 +1,220 @@
+import json
+import logging
+import os
+import threading
+from typing import Dict, Iterable, List, Optional
+
+import numpy as np
+
+from config.settings import settings
+from features.matching_features import EDU_SCORES
+from features.skill_vocabulary import SkillVocabulary
+from services.skill_index import SkillInvertedIndex
+
+logger = logging.getLogger(__name__)
+
+
+class CatalogArrays:
+    """
+    공고 카탈로그의 열 지향 스냅샷 (랭킹 시 읽기 전용)
+
+    요구 스킬은 CSR 형태: 공고 i의 스킬 = indices[indptr[i]:indptr[i + 1]]
+    """
+
+    __slots__ = (
+        "posting_ids", "required_exp", "required_edu", "indptr",
+        "indices", "entry_rows", "n_required", "active",
+    )
+
+    def __init__(self, posting_ids, required_exp, required_edu, indptr, indices, active):
+        self.posting_ids = posting_ids
+        self.required_exp = required_exp
+        self.required_edu = required_edu
+        self.indptr = indptr
+        self.indices = indices
+        self.n_required = np.diff(indptr).astype(np.int32)
+        self.entry_rows = np.repeat(
+            np.arange(len(posting_ids), dtype=np.int32), self.n_required
+        )
+        self.active = active
+
+    def __len__(self) -> int:
+        return len(self.posting_ids)
+
+
+class PostingCatalog:
+    """
+    채용 공고 카탈로그 (posting_id → 행)
+
+    - 추가/마감은 증분 반영, 랭킹용 배열 스냅샷은 변경 시 지연 재구성
+    - 같은 posting_id를 다시 추가하면 기존 행을 마감하고 새 행으로 교체
+    - 스킬 역색인(skill_index)도 함께 증분 갱신 (후보 생성용)
+    """
+
+    # 역색인의 죽은 항목 비율이 이 값을 넘으면 compact
+    COMPACT_DEAD_RATIO = 0.5
+
+    def __init__(self, vocab: Optional[SkillVocabulary] = None):
+        self.vocab = vocab or SkillVocabulary()
+        self.skill_index = SkillInvertedIndex()
+        self._lock = threading.RLock()
+
+        self._posting_ids: List[int] = []
+        self._rows: Dict[int, int] = {}
+        self._postings: List[dict] = []
+        self._skills: List[np.ndarray] = []
+        self._required_exp: List[float] = []
+        self._required_edu: List[int] = []
+        self._active: List[bool] = []
+
+        self._snapshot: Optional[CatalogArrays] = None
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    # =========================================================
+    # 증분 변경
+    # =========================================================
+    def add_posting(self, posting_id: int, posting: dict) -> int:
+        prepared = self._prepare(posting)
+        with self._lock:
+            return self._apply(posting_id, posting, prepared)
+
+    def add_postings(self, postings: Iterable[dict]) -> int:
+        """
+        공고 여러 건 추가/갱신 (전부 검증 / 변환한 뒤 락 한 번으로 반영)
+
+        posting_id가 없거나 값이 잘못된 공고가 있으면 KeyError / ValueError, 카탈로그는 그대로
+        """
+        batch = [
+            (int(posting["posting_id"]), posting, self._prepare(posting))
+            for posting in postings
+        ]
+
+        with self._lock:
+            for posting_id, posting, prepared in batch:
+                self._apply(posting_id, posting, prepared)
+        return len(batch)
+
+    def _prepare(self, posting: dict):
+        """락 밖에서 하는 변환 (실패해도 카탈로그는 변경 없음)"""
+        return (
+            self.vocab.intern_many(posting.get("required_skills", [])),
+            float(posting.get("required_experience", 0)),
+            EDU_SCORES.get(posting.get("education_level", ""), 0),
+        )
+
+    def _apply(self, posting_id: int, posting: dict, prepared) -> int:
+        """self._lock 안에서 호출"""
+        skill_ids, required_exp, required_edu = prepared
+
+        old_row = self._rows.get(posting_id)
+        if old_row is not None:
+            self._active[old_row] = False
+            self.skill_index.mark_removed(len(self._skills[old_row]))
+
+        row = len(self._posting_ids)
+        self._posting_ids.append(posting_id)
+        self._postings.append(posting)
+        self._skills.append(skill_ids)
+        self._required_exp.append(required_exp)
+        self._required_edu.append(required_edu)
+        self._active.append(True)
+        self._rows[posting_id] = row
+        self.skill_index.add(row, skill_ids)
+        self._snapshot = None
+        return row
+
+    def close_posting(self, posting_id: int) -> bool:
+        with self._lock:
+            row = self._rows.pop(posting_id, None)
+            if row is None:
+                return False
+
+            self._active[row] = False
+            if self._snapshot is not None:
+                self._snapshot.active[row] = False
+
+            self.skill_index.mark_removed(len(self._skills[row]))
+            if self.skill_index.dead_ratio > self.COMPACT_DEAD_RATIO:
+                self.skill_index.compact(np.array(self._active, dtype=bool))
+
+        return True
+
+    # =========================================================
+    # 조회
+    # =========================================================
+    def arrays(self) -> CatalogArrays:
+        """랭킹용 배열 스냅샷 (변경이 있었으면 재구성)"""
+        snapshot = self._snapshot
+        if snapshot is not None:
+            return snapshot
+
+        with self._lock:
+            if self._snapshot is None:
+                lengths = np.fromiter(
+                    (len(s) for s in self._skills), dtype=np.int64, count=len(self._skills)
+                )
+                indptr = np.zeros(len(lengths) + 1, dtype=np.int64)
+                np.cumsum(lengths, out=indptr[1:])
+
+                self._snapshot = CatalogArrays(
+                    posting_ids=np.array(self._posting_ids, dtype=np.int64),
+                    required_exp=np.array(self._required_exp, dtype=np.float64),
+                    required_edu=np.array(self._required_edu, dtype=np.int64),
+                    indptr=indptr,
+                    indices=(
+                        np.concatenate(self._skills).astype(np.int32)
+                        if self._skills else np.zeros(0, dtype=np.int32)
+                    ),
+                    active=np.array(self._active, dtype=bool),
+                )
+            return self._snapshot
+
+    def rows_for(self, posting_ids: Iterable[int]) -> np.ndarray:
+        """posting_id 목록 → 행 번호 (카탈로그에 없는 ID는 KeyError)"""
+        rows = self._rows
+        return np.fromiter((rows[pid] for pid in posting_ids), dtype=np.int64)
+
+    def posting(self, row: int) -> dict:
+        return self._postings[row]
+
+    # =========================================================
+    # 생성
+    # =========================================================
+    @classmethod
+    def from_postings(
+        cls,
+        postings: List[dict],
+        vocab: Optional[SkillVocabulary] = None,
+    ) -> "PostingCatalog":
+        """
+        공고 목록 → 카탈로그 (posting_id가 없으면 목록 순번 사용)
+        """
+        catalog = cls(vocab)
+        for i, posting in enumerate(postings):
+            catalog.add_posting(int(posting.get("posting_id", i)), posting)
+        return catalog
+
+    def load_json(self, path: str) -> int:
+        """JSON 배열 파일에서 공고 적재"""
+        with open(path, "r", encoding="utf-8") as f:
+            return self.add_postings(json.load(f))
+
+
+posting_catalog = PostingCatalog()
+
+
+def load_posting_catalog(path: Optional[str] = None) -> int:
+    """
+    앱 시작 시 공고 카탈로그 적재 (파일이 없으면 빈 카탈로그)
+    """
+    path = path or settings.POSTING_CATALOG_PATH
+
+    if not path or not os.path.exists(path):
+        logger.warning(f"공고 카탈로그 파일이 없습니다: {path}")
+        return 0
+
+    count = posting_catalog.load_json(path)
+    logger.info(f"공고 카탈로그 적재 완료: {count}건 ({path})")
+    return count
@@ -0,0 +1,246 @@
+import logging
+import os
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+
+class PriorityIndexSnapshot:
+    """
+    베이스라인 파이프라인 결과(matching_score.csv / senior_score.csv)의 배열 스냅샷
+
+    - 고령자 키: senior_id 열이 있으면 그 값, 없으면 파일 행 번호 (train_data.csv 순서)
+    - 우선순위 정렬: 연령대별로 matching_score 내림차순 (동점은 키 오름차순)
+      연령대 g의 정렬 행 = order[group_offsets[g]:group_offsets[g + 1]]
+    - 생성 후 변경하지 않음 (재적재 시 새 스냅샷으로 교체)
+    """
+
+    __slots__ = (
+        "age_groups", "senior_keys", "group_codes", "senior_score", "priority",
+        "order", "group_offsets", "group_mean", "source_mtimes", "_rows", "_groups",
+    )
+
+    def __init__(
+        self,
+        age_groups: np.ndarray,
+        senior_keys: np.ndarray,
+        senior_score: np.ndarray,
+        priority: np.ndarray,
+        source_mtimes: Tuple[float, ...] = (),
+    ):
+        groups, codes = np.unique(age_groups.astype(str), return_inverse=True)
+        self.age_groups = tuple(groups.tolist())
+        self.group_codes = codes.astype(np.int32)
+        self.senior_keys = senior_keys.astype(np.int64)
+        self.senior_score = senior_score.astype(np.float64)
+        self.priority = priority.astype(np.float64)
+        self.source_mtimes = source_mtimes
+
+        self.order = np.lexsort((self.senior_keys, -self.priority, self.group_codes))
+        counts = np.bincount(self.group_codes, minlength=len(self.age_groups))
+        self.group_offsets = np.zeros(len(self.age_groups) + 1, dtype=np.int64)
+        np.cumsum(counts, out=self.group_offsets[1:])
+        self.group_mean = (
+            np.bincount(self.group_codes, weights=self.priority, minlength=len(self.age_groups))
+            / np.maximum(counts, 1)
+        )
+
+        self._rows: Dict[int, int] = {k: i for i, k in enumerate(self.senior_keys.tolist())}
+        self._groups: Dict[str, int] = {g: i for i, g in enumerate(self.age_groups)}
+
+    def __len__(self) -> int:
+        return len(self.senior_keys)
+
+    def lookup(self, senior_key: int) -> Optional[dict]:
+        """고령자 1명의 우선순위 (O(1), 없으면 None)"""
+        row = self._rows.get(senior_key)
+        if row is None:
+            return None
+        return self._entry(row)
+
+    def group_priority(self, age_group: str) -> Optional[float]:
+        """연령대 평균 우선순위 (O(1), 없는 연령대는 None)"""
+        code = self._groups.get(age_group)
+        return None if code is None else float(self.group_mean[code])
+
+    def top(self, age_group: Optional[str] = None, limit: int = 100) -> List[dict]:
+        """우선순위 순서 (연령대 지정 시 해당 연령대만, 아니면 전체 내림차순)"""
+        if age_group is None:
+            rows = np.lexsort((self.senior_keys, -self.priority))[:limit]
+        else:
+            code = self._groups.get(age_group)
+            if code is None:
+                return []
+            start = self.group_offsets[code]
+            rows = self.order[start:min(start + limit, self.group_offsets[code + 1])]
+        return [self._entry(row) for row in rows.tolist()]
+
+    def _entry(self, row: int) -> dict:
+        return {
+            "senior_key": int(self.senior_keys[row]),
+            "age_group": self.age_groups[self.group_codes[row]],
+            "senior_score": float(self.senior_score[row]),
+            "priority": float(self.priority[row]),
+        }
+
+
+def compile_priority_index(
+    matching_path: Optional[str],
+    senior_path: Optional[str],
+) -> PriorityIndexSnapshot:
+    """
+    파이프라인 CSV → 스냅샷
+
+    matching_score.csv가 없으면 senior_score.csv에서 make_matching_score.py와 같은
+    규칙(최대 senior_score - senior_score)으로 계산
+    """
+    # pandas는 우선순위 파일을 실제로 읽을 때만 import (기동 시간)
+    import pandas as pd
+
+    mtimes = tuple(
+        os.path.getmtime(p) if p and os.path.exists(p) else 0.0
+        for p in (matching_path, senior_path)
+    )
+
+    if matching_path and os.path.exists(matching_path):
+        df = pd.read_csv(matching_path, encoding="utf-8-sig")
+        if senior_path and os.path.exists(senior_path):
+            senior = pd.read_csv(senior_path, encoding="utf-8-sig")
+            if len(senior) != len(df) or not (
+                senior["age_group"].astype(str).values == df["age_group"].astype(str).values
+            ).all():
+                raise ValueError(
+                    f"senior_score.csv와 matching_score.csv의 행이 일치하지 않습니다 "
+                    f"({len(senior)} vs {len(df)})"
+                )
+    elif senior_path and os.path.exists(senior_path):
+        df = pd.read_csv(senior_path, encoding="utf-8-sig")
+        df["matching_score"] = df["senior_score"].max() - df["senior_score"]
+    else:
+        raise FileNotFoundError(f"우선순위 파일이 없습니다: {matching_path}, {senior_path}")
+
+    missing = {"age_group", "senior_score", "matching_score"} - set(df.columns)
+    if missing:
+        raise ValueError(f"우선순위 파일에 필요한 열이 없습니다: {sorted(missing)}")
+
+    if "senior_id" in df.columns:
+        keys = df["senior_id"].to_numpy()
+    else:
+        keys = np.arange(len(df))
+
+    return PriorityIndexSnapshot(
+        age_groups=df["age_group"].to_numpy(),
+        senior_keys=keys,
+        senior_score=df["senior_score"].to_numpy(dtype=np.float64),
+        priority=df["matching_score"].to_numpy(dtype=np.float64),
+        source_mtimes=mtimes,
+    )
+
+
+class MatchingPriorityIndex:
+    """
+    매칭 우선순위 인덱스 (요청 시 CSV를 읽지 않음)
+
+    - 조회는 현재 스냅샷 참조 1회 (stat / 락 / 파일 읽기 없음) → 재적재 중에도 일관된 스냅샷
+    - 파일 확인과 재적재는 백그라운드 스레드가 PRIORITY_INDEX_CHECK_SEC 간격으로
+      (새 스냅샷은 재적재 락 안에서 만든 뒤 참조만 교체, 요청 경로는 이 락을 잡지 않음)
+    - 첫 적재 전에는 스냅샷 없음 (None)
+    """
+
+    def __init__(
+        self,
+        matching_path: Optional[str] = None,
+        senior_path: Optional[str] = None,
+        check_interval: Optional[float] = None,
+    ):
+        self.matching_path = matching_path or settings.MATCHING_SCORE_PATH
+        self.senior_path = senior_path or settings.SENIOR_SCORE_PATH
+        self.check_interval = (
+            settings.PRIORITY_INDEX_CHECK_SEC if check_interval is None else check_interval
+        )
+        self._snapshot: Optional[PriorityIndexSnapshot] = None
+        self._reload_lock = threading.Lock()
+        self._watcher: Optional[threading.Thread] = None
+        self._watcher_stop = threading.Event()
+
+    def snapshot(self) -> Optional[PriorityIndexSnapshot]:
+        """현재 스냅샷 (요청 경로: 참조만 읽음)"""
+        return self._snapshot
+
+    def _source_mtimes(self) -> Tuple[float, ...]:
+        return tuple(
+            os.path.getmtime(p) if p and os.path.exists(p) else 0.0
+            for p in (self.matching_path, self.senior_path)
+        )
+
+    def reload_if_changed(self) -> bool:
+        """파일 mtime이 스냅샷과 다르면 재적재 (블로킹, 실패 시 기존 스냅샷 유지)"""
+        with self._reload_lock:
+            current = self._snapshot
+            mtimes = self._source_mtimes()
+            if current is not None and current.source_mtimes == mtimes:
+                return False
+            if not any(mtimes):
+                return False
+            try:
+                start = time.perf_counter()
+                snapshot = compile_priority_index(self.matching_path, self.senior_path)
+            except Exception as e:
+                logger.error(f"매칭 우선순위 인덱스 적재 실패 (기존 유지): {str(e)}")
+                return False
+            self._snapshot = snapshot
+            logger.info(
+                f"매칭 우선순위 인덱스 적재: {len(snapshot)}명, 연령대 {len(snapshot.age_groups)}개 "
+                f"({(time.perf_counter() - start) * 1000:.1f}ms)"
+            )
+            return True
+
+    def start_watcher(self) -> None:
+        """백그라운드 적재 + 파일 감시 (시작 즉시 1회, 이후 check_interval마다, 0 이하면 1회만)"""
+        if self._watcher is not None:
+            return
+        self._watcher_stop.clear()
+
+        def run():
+            while True:
+                try:
+                    self.reload_if_changed()
+                except Exception as e:
+                    logger.error(f"매칭 우선순위 파일 감시 실패: {str(e)}", exc_info=True)
+                if self.check_interval <= 0 or self._watcher_stop.wait(self.check_interval):
+                    return
+
+        self._watcher = threading.Thread(target=run, name="priority-index", daemon=True)
+        self._watcher.start()
+
+    def stop_watcher(self) -> None:
+        self._watcher_stop.set()
+        if self._watcher is not None:
+            self._watcher.join(timeout=5)
+            self._watcher = None
+
+    def seeker_priority(self, seeker: dict) -> Optional[float]:
+        """
+        구직자 프로필의 senior_id(우선) 또는 age_group으로 우선순위 조회
+        """
+        snapshot = self.snapshot()
+        if snapshot is None:
+            return None
+
+        senior_id = seeker.get("senior_id")
+        if senior_id is not None:
+            entry = snapshot.lookup(int(senior_id))
+            if entry is not None:
+                return entry["priority"]
+
+        age_group = seeker.get("age_group")
+        return None if age_group is None else snapshot.group_priority(str(age_group))
+
+
+priority_index = MatchingPriorityIndex()
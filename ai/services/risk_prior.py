@@ -0,0 +1,101 @@
+import logging
+import os
+from typing import Dict, Optional
+
+import numpy as np
+
+from config.settings import settings
+from features.job_risk_features import JOB_TYPE_INDEX, JOB_TYPES
+from models.array_artifact import read_array_artifact, write_array_artifact
+from utils.exceptions import ModelLoadError
+
+logger = logging.getLogger(__name__)
+
+# 파일 구조는 models/array_artifact.py (MAGIC + 헤더 JSON + 64바이트 정렬 배열, 메모리맵)
+MAGIC = b"IFRP"
+FORMAT_VERSION = 1
+
+UNKNOWN_JOB_CODE = len(JOB_TYPES)
+
+
+def write_risk_prior(path: str, header: dict, arrays: Dict[str, np.ndarray]) -> None:
+    """
+    사전 분포 아티팩트 저장 (임시 파일에 쓴 뒤 교체)
+
+    Args:
+        header: 축 이름 등 메타데이터 (arrays 위치 정보는 여기서 추가)
+        arrays: 이름 → float32 배열
+    """
+    arrays = {name: np.asarray(a, dtype="<f4") for name, a in arrays.items()}
+    write_array_artifact(path, MAGIC, FORMAT_VERSION, header, arrays)
+
+
+class RiskPriorTable:
+    """
+    사고 통계 기반 업종 리스크 사전 분포 (models/create_risk_prior.py로 생성)
+
+    - points[직종 코드, 연령대 코드]: 기본 리스크에 더할 점수 (연령대 코드 0 = 전체)
+    - harm[연령대 코드, 업종, 사고유형 코드]: 가중 피해 지표 (사고유형 코드 0 = 전체)
+    조회는 배열 인덱싱 1회 (O(1)), 배열은 메모리맵
+    """
+
+    def __init__(self, path: str):
+        self.header, self.arrays = read_array_artifact(
+            path, MAGIC, FORMAT_VERSION, kind="리스크 사전 분포"
+        )
+
+        self.age_groups = list(self.header["age_groups"])
+        self.industries = list(self.header["industries"])
+        self.accident_types = list(self.header["accident_types"])
+        self.age_index = {g: i + 1 for i, g in enumerate(self.age_groups)}
+
+        expected = (UNKNOWN_JOB_CODE + 1, len(self.age_groups) + 1)
+        if self.points_table.shape != expected:
+            raise ModelLoadError(
+                message=f"리스크 사전 분포 shape 불일치: {self.points_table.shape} != {expected}",
+                details={"path": path}
+            )
+
+        # 단건 조회는 파이썬 리스트 (numpy 스칼라 변환 비용 회피)
+        self._points_rows = self.points_table.tolist()
+
+    @property
+    def points_table(self) -> np.ndarray:
+        return self.arrays["points"]
+
+    @property
+    def n_age_codes(self) -> int:
+        return len(self.age_groups) + 1
+
+    def age_code(self, age_group: Optional[str]) -> int:
+        """연령대 → 코드 (없거나 모르는 연령대 = 0, 전체 연령)"""
+        return self.age_index.get(age_group, 0) if age_group else 0
+
+    def points(self, job_type: str, age_group: Optional[str] = None) -> float:
+        return self._points_rows[JOB_TYPE_INDEX.get(job_type, UNKNOWN_JOB_CODE)][
+            self.age_code(age_group)
+        ]
+
+    def harm(self, age_group: Optional[str], industry: str, accident_type: Optional[str] = None) -> float:
+        """가중 피해 지표 조회 (분석/설명용)"""
+        i = self.industries.index(industry)
+        t = self.accident_types.index(accident_type) + 1 if accident_type else 0
+        return float(self.arrays["harm"][self.age_code(age_group), i, t])
+
+
+def load_risk_prior(path: Optional[str] = None) -> Optional[RiskPriorTable]:
+    """
+    서비스 시작 시 리스크 사전 분포 로드 (파일이 없으면 None → 고정 상수 사용)
+    """
+    path = path or settings.JOB_RISK_PRIOR_PATH
+
+    if not path or not os.path.exists(path):
+        logger.warning(f"리스크 사전 분포 파일이 없습니다: {path}")
+        return None
+
+    table = RiskPriorTable(path)
+    logger.info(
+        f"리스크 사전 분포 로드 완료: 업종 {len(table.industries)}개, "
+        f"연령대 {len(table.age_groups)}개, 사고유형 {len(table.accident_types)}개 ({path})"
+    )
+    return table
@@ -0,0 +1,108 @@
+import threading
+from array import array
+from typing import Dict, Tuple
+
+import numpy as np
+
+
+class SkillInvertedIndex:
+    """
+    스킬 ID → 공고 행 번호 역색인 (후보 생성용)
+
+    - 추가는 posting list에 append (증분)
+    - 마감은 지연 삭제: 조회 시 active 마스크로 거르고, 죽은 항목이 많아지면 compact()
+    - 요구 스킬이 없는 공고는 스킬 점수 100이므로 항상 후보
+    """
+
+    def __init__(self):
+        self._lists: Dict[int, array] = {}
+        self._no_skill_rows = array("q")
+        self._lock = threading.Lock()
+        self._entries = 0
+        self._dead_entries = 0
+
+    @property
+    def dead_ratio(self) -> float:
+        return self._dead_entries / self._entries if self._entries else 0.0
+
+    def add(self, row: int, skill_ids: np.ndarray) -> None:
+        with self._lock:
+            if len(skill_ids) == 0:
+                self._no_skill_rows.append(row)
+                self._entries += 1
+                return
+            for skill_id in skill_ids.tolist():
+                posting_list = self._lists.get(skill_id)
+                if posting_list is None:
+                    posting_list = self._lists[skill_id] = array("q")
+                posting_list.append(row)
+            self._entries += len(skill_ids)
+
+    def mark_removed(self, n_skills: int) -> None:
+        """마감된 공고의 항목 수만큼 죽은 항목 카운트 (실제 제거는 compact)"""
+        with self._lock:
+            self._dead_entries += max(1, n_skills)
+
+    def compact(self, active: np.ndarray) -> None:
+        """마감된 행을 posting list에서 실제로 제거"""
+        with self._lock:
+            entries = 0
+            for skill_id, posting_list in list(self._lists.items()):
+                rows = np.frombuffer(posting_list, dtype=np.int64)
+                kept = rows[active[rows]] if len(rows) else rows
+                if len(kept):
+                    self._lists[skill_id] = array("q", kept.tobytes())
+                    entries += len(kept)
+                else:
+                    del self._lists[skill_id]
+
+            rows = np.frombuffer(self._no_skill_rows, dtype=np.int64)
+            kept = rows[active[rows]] if len(rows) else rows
+            self._no_skill_rows = array("q", kept.tobytes())
+
+            self._entries = entries + len(kept)
+            self._dead_entries = 0
+
+    def candidate_counts(
+        self,
+        skill_ids: np.ndarray,
+        active: np.ndarray,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        구직자 스킬들의 posting list 합집합
+
+        Returns:
+            (후보 행 번호 오름차순, 행별 일치 스킬 수)
+        """
+        n_rows = len(active)
+
+        with self._lock:
+            parts = [
+                np.frombuffer(self._lists[s], dtype=np.int64)
+                for s in skill_ids.tolist()
+                if s in self._lists
+            ]
+            no_skill = np.frombuffer(self._no_skill_rows, dtype=np.int64).copy()
+            hits = np.concatenate(parts) if parts else np.zeros(0, dtype=np.int64)
+            # 버퍼 뷰를 락 안에서 해제 (뷰가 남아 있으면 array.append가 BufferError)
+            del parts
+
+        # 스냅샷 이후에 추가된 행은 제외
+        hits = hits[hits < n_rows]
+        no_skill = no_skill[no_skill < n_rows]
+
+        # 같은 공고가 여러 스킬 list에 있으면 그 횟수 = 일치 스킬 수
+        if len(hits) * 8 < n_rows:
+            rows, counts = np.unique(hits, return_counts=True)
+        else:
+            counts_all = np.bincount(hits, minlength=n_rows)
+            rows = np.flatnonzero(counts_all)
+            counts = counts_all[rows]
+
+        rows = np.concatenate((rows, no_skill))
+        counts = np.concatenate((counts, np.zeros(len(no_skill), dtype=counts.dtype)))
+
+        keep = active[rows]
+        rows, counts = rows[keep], counts[keep]
+        order = np.argsort(rows, kind="stable")
+        return rows[order], counts[order]
@@ -0,0 +1,110 @@
+import asyncio
+
+import httpx
+import pytest
+
+from utils.admission import AdmissionController, AdmissionMiddleware, Overloaded
+
+CLASSES = {
+    "critical": dict(limit=1, queue=4, deadline=1.0, priority=0),
+    "dashboard": dict(limit=1, queue=1, deadline=0.05, priority=3),
+}
+RULES = [
+    ("POST", "/alert", "critical"),
+    ("GET", "/dashboard", "dashboard"),
+]
+
+
+def _controller(max_in_flight=8):
+    return AdmissionController(max_in_flight, CLASSES, RULES)
+
+
+def test_classify():
+    controller = _controller()
+    assert controller.classify("POST", "/alert/1").name == "critical"
+    assert controller.classify("GET", "/dashboard").name == "dashboard"
+    assert controller.classify("GET", "/health") is None
+
+
+def test_queue_full_and_deadline_shed():
+    async def scenario():
+        controller = _controller()
+        rc = controller.classes["dashboard"]
+        await controller.acquire(rc)
+
+        waiting = asyncio.ensure_future(controller.acquire(rc))
+        await asyncio.sleep(0)
+        with pytest.raises(Overloaded) as full:
+            await controller.acquire(rc)
+        assert full.value.reason == "queue_full"
+
+        with pytest.raises(Overloaded) as late:
+            await waiting
+        assert late.value.reason == "deadline"
+        assert late.value.retry_after >= 1
+        assert rc.in_flight == 1 and not rc.waiters
+
+    asyncio.run(scenario())
+
+
+def test_released_slot_goes_to_higher_priority_waiter():
+    async def scenario():
+        controller = _controller(max_in_flight=1)
+        critical, dashboard = controller.classes["critical"], controller.classes["dashboard"]
+        dashboard.deadline = 1.0
+        await controller.acquire(critical)
+
+        order = []
+
+        async def wait(rc):
+            await controller.acquire(rc)
+            order.append(rc.name)
+
+        # 대시보드가 먼저 기다려도 경보가 먼저
+        first = asyncio.ensure_future(wait(dashboard))
+        await asyncio.sleep(0)
+        second = asyncio.ensure_future(wait(critical))
+        await asyncio.sleep(0)
+
+        controller.release(critical, 0.01)
+        await asyncio.sleep(0.01)
+        assert order == ["critical"]
+        controller.release(critical, 0.01)
+        await asyncio.gather(first, second)
+        assert order == ["critical", "dashboard"]
+
+    asyncio.run(scenario())
+
+
+def test_middleware_sheds_with_retry_after():
+    async def scenario():
+        gate = asyncio.Event()
+
+        async def app(scope, receive, send):
+            await gate.wait()
+            await send({"type": "http.response.start", "status": 200, "headers": []})
+            await send({"type": "http.response.body", "body": b"ok"})
+
+        transport = httpx.ASGITransport(app=AdmissionMiddleware(app, _controller()))
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            running = asyncio.ensure_future(client.get("/dashboard"))
+            queued = asyncio.ensure_future(client.get("/dashboard"))
+            await asyncio.sleep(0.01)
+            shed = await client.get("/dashboard")
+            await asyncio.sleep(0.1)
+            gate.set()
+            ok = await running
+            late = await queued
+            passthrough = await client.get("/health")
+
+        assert ok.status_code == 200 and passthrough.status_code == 200
+        assert shed.status_code == 503
+        assert int(shed.headers["retry-after"]) >= 1
+        body = shed.json()
+        assert body["error_code"] == "SERVICE_OVERLOADED"
+        assert body["details"]["route_class"] == "dashboard"
+        assert body["details"]["reason"] == "queue_full"
+        # 대기 deadline(0.05초)을 넘긴 요청도 503
+        assert late.status_code == 503 and late.json()["details"]["reason"] == "deadline"
+
+    asyncio.run(scenario())
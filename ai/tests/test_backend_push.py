@@ -0,0 +1,228 @@
+import asyncio
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from services.backend_push import EVENTS, BackendPusher, make_event
+
+
+class StubBackend:
+    """POST 본문을 기록하는 로컬 백엔드 (처음 fail_first건은 503)"""
+
+    def __init__(self, fail_first: int = 0):
+        self.batches = []
+        self.headers = []
+        self.fail_first = fail_first
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_POST(self):
+                body = self.rfile.read(int(self.headers["Content-Length"]))
+                if stub.fail_first > 0:
+                    stub.fail_first -= 1
+                    status = 503
+                else:
+                    stub.batches.append(json.loads(body)["events"])
+                    stub.headers.append(dict(self.headers))
+                    status = 202
+                self.send_response(status)
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+
+            def log_message(self, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}/api/internal/ml-events"
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+    def close(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+def _pusher(url, tmp_path, **kwargs):
+    params = dict(batch_size=10, batch_wait=0.05, max_retries=2, backoff_base=0.01, timeout=1.0)
+    params.update(kwargs)
+    return BackendPusher(url=url, api_key="secret", spill_path=str(tmp_path / "spill.jsonl"), **params)
+
+
+def test_events_are_batched_by_size_and_time(tmp_path):
+    stub = StubBackend()
+
+    async def scenario():
+        pusher = _pusher(stub.url, tmp_path)
+        await pusher.start()
+        for i in range(25):
+            pusher.publish("health_score", {"senior_profile_id": i})
+        await asyncio.sleep(0.3)
+        await pusher.stop()
+
+    try:
+        asyncio.run(scenario())
+    finally:
+        stub.close()
+
+    assert [len(b) for b in stub.batches] == [10, 10, 5]
+    ids = [e["payload"]["senior_profile_id"] for b in stub.batches for e in b]
+    assert ids == list(range(25))
+    assert len({e["event_id"] for b in stub.batches for e in b}) == 25
+    assert stub.headers[0]["X-API-Key"] == "secret"
+
+
+def test_critical_event_bypasses_batching(tmp_path):
+    stub = StubBackend()
+
+    async def scenario():
+        # 묶음 대기 시간이 길어도 긴급 경보는 바로 전송
+        pusher = _pusher(stub.url, tmp_path, batch_wait=5.0)
+        await pusher.start()
+        pusher.publish("health_score", {"senior_profile_id": 1})
+        pusher.publish("anomaly_alert", {"senior_profile_id": 2}, critical=True)
+        await asyncio.sleep(0.3)
+        delivered = [list(b) for b in stub.batches]
+        await pusher.stop()
+        return delivered
+
+    try:
+        delivered = asyncio.run(scenario())
+    finally:
+        stub.close()
+
+    assert len(delivered) == 1
+    assert delivered[0][0]["type"] == "anomaly_alert"
+    # 종료 시 남은 묶음도 전송
+    assert stub.batches[-1][0]["type"] == "health_score"
+
+
+def test_retries_after_server_error(tmp_path):
+    stub = StubBackend(fail_first=2)
+
+    async def scenario():
+        pusher = _pusher(stub.url, tmp_path)
+        await pusher.start()
+        pusher.publish("health_score", {"senior_profile_id": 1})
+        await pusher.stop()
+
+    try:
+        asyncio.run(scenario())
+    finally:
+        stub.close()
+
+    assert len(stub.batches) == 1
+    assert not (tmp_path / "spill.jsonl").exists()
+
+
+def test_spills_when_backend_down_and_replays_after_recovery(tmp_path):
+    stub = StubBackend()
+    url = stub.url
+    stub.close()
+    spill = tmp_path / "spill.jsonl"
+    before = EVENTS.value(("replayed",))
+
+    async def down():
+        pusher = _pusher(url, tmp_path, max_retries=1)
+        await pusher.start()
+        for i in range(3):
+            pusher.publish("health_score", {"senior_profile_id": i})
+        await pusher.stop()
+
+    asyncio.run(down())
+    assert len(spill.read_text().splitlines()) == 3
+
+    stub = StubBackend()
+
+    async def up():
+        pusher = _pusher(stub.url, tmp_path)
+        await pusher.start()
+        pusher.publish("health_score", {"senior_profile_id": 3})
+        await pusher.stop()
+
+    try:
+        asyncio.run(up())
+    finally:
+        stub.close()
+
+    ids = sorted(e["payload"]["senior_profile_id"] for b in stub.batches for e in b)
+    assert ids == [0, 1, 2, 3]
+    assert not spill.exists()
+    assert EVENTS.value(("replayed",)) - before == 3
+
+
+def test_full_queue_spills_instead_of_blocking(tmp_path):
+    async def scenario():
+        # 연결되지 않는 주소: 워커가 첫 묶음 재시도 중이면 큐가 가득 참
+        pusher = _pusher("http://127.0.0.1:9/none", tmp_path, queue_size=2, batch_size=1,
+                         max_retries=0)
+        await pusher.start()
+        for i in range(10):
+            pusher.publish("health_score", {"senior_profile_id": i})
+        await pusher.stop()
+
+    asyncio.run(scenario())
+    lines = (tmp_path / "spill.jsonl").read_text().splitlines()
+    assert sorted(json.loads(l)["payload"]["senior_profile_id"] for l in lines) == list(range(10))
+
+
+def test_corrupt_spill_lines_are_quarantined_and_worker_survives(tmp_path):
+    stub = StubBackend()
+    spill = tmp_path / "spill.jsonl"
+    good = [make_event("health_score", {"senior_profile_id": i}) for i in range(2)]
+    spill.write_text(
+        json.dumps(good[0]) + "\n{corrupt\n[1, 2]\n" + json.dumps(good[1]) + "\n", encoding="utf-8"
+    )
+    before = EVENTS.value(("quarantined",))
+
+    async def scenario():
+        pusher = _pusher(stub.url, tmp_path)
+        await pusher.start()
+        pusher.publish("health_score", {"senior_profile_id": 9})
+        await asyncio.sleep(0.3)
+        assert pusher.running
+        pusher.publish("health_score", {"senior_profile_id": 10})
+        await pusher.stop()
+
+    try:
+        asyncio.run(scenario())
+    finally:
+        stub.close()
+
+    ids = sorted(e["payload"]["senior_profile_id"] for b in stub.batches for e in b)
+    assert ids == [0, 1, 9, 10]
+    assert EVENTS.value(("quarantined",)) - before == 2
+    assert (tmp_path / "spill.jsonl.bad").read_text().splitlines() == ["{corrupt", "[1, 2]"]
+    assert not spill.exists() and not (tmp_path / "spill.jsonl.replay").exists()
+
+
+def test_replay_file_is_kept_until_acknowledged(tmp_path):
+    replaying = tmp_path / "spill.jsonl.replay"
+    events = [make_event("health_score", {"senior_profile_id": i}) for i in range(3)]
+    # 이전 프로세스가 재전송 도중 죽으면서 남긴 파일
+    replaying.write_text("".join(json.dumps(e) + "\n" for e in events), encoding="utf-8")
+
+    async def down():
+        pusher = _pusher("http://127.0.0.1:9/none", tmp_path, max_retries=0)
+        await pusher.start()
+        await pusher._try_replay()
+        await pusher.stop()
+
+    asyncio.run(down())
+    assert len(replaying.read_text().splitlines()) == 3
+
+    stub = StubBackend()
+
+    async def up():
+        pusher = _pusher(stub.url, tmp_path)
+        await pusher.start()
+        await pusher._try_replay()
+        await pusher.stop()
+
+    try:
+        asyncio.run(up())
+    finally:
+        stub.close()
+
+    assert [e["event_id"] for b in stub.batches for e in b] == [e["event_id"] for e in events]
+    assert not replaying.exists()
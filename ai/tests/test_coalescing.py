@@ -0,0 +1,85 @@
+import asyncio
+import json
+
+import httpx
+
+from utils.coalescing import COALESCED, CoalescingMiddleware, canonical_key
+
+ROUTES = {("POST", "/score")}
+
+
+def _app(calls, gate, status=200):
+    async def app(scope, receive, send):
+        body = b""
+        while True:
+            message = await receive()
+            body += message.get("body", b"")
+            if not message.get("more_body"):
+                break
+        calls.append(json.loads(body) if body else None)
+        await gate.wait()
+        payload = json.dumps({"n": len(calls)}).encode()
+        await send({"type": "http.response.start", "status": status,
+                    "headers": [(b"content-type", b"application/json")]})
+        await send({"type": "http.response.body", "body": payload})
+    return app
+
+
+def test_canonical_key_ignores_key_order_and_whitespace():
+    a = canonical_key("POST", "/score", b"", b'{"a": 1, "b": [1, 2]}')
+    b = canonical_key("POST", "/score", b"", b'{"b":[1,2],"a":1}')
+    c = canonical_key("POST", "/score", b"", b'{"a": 2, "b": [1, 2]}')
+    assert a == b != c
+    assert canonical_key("POST", "/other", b"", b'{"a": 1, "b": [1, 2]}') != a
+
+
+def test_identical_concurrent_requests_share_one_computation():
+    async def scenario():
+        calls, gate = [], asyncio.Event()
+        transport = httpx.ASGITransport(app=CoalescingMiddleware(_app(calls, gate), ROUTES))
+        before = COALESCED.value(("/score", "follower"))
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            same = [
+                asyncio.ensure_future(client.post("/score", content=body))
+                for body in (b'{"x": 1, "y": 2}', b'{"y": 2, "x": 1}', b'{"x":1,"y":2}')
+            ]
+            other = asyncio.ensure_future(client.post("/score", json={"x": 9}))
+            await asyncio.sleep(0.05)
+            gate.set()
+            responses = await asyncio.gather(*same)
+            await other
+            # 끝난 뒤의 같은 요청은 새로 계산 (진행 중인 것만 합침)
+            again = await client.post("/score", json={"x": 1, "y": 2})
+
+        assert [r.json() for r in responses] == [responses[0].json()] * 3
+        assert len(calls) == 3
+        assert again.json() == {"n": 3}
+        assert COALESCED.value(("/score", "follower")) == before + 2
+
+    asyncio.run(scenario())
+
+
+def test_followers_recompute_when_leader_fails():
+    async def scenario():
+        calls, gate = [], asyncio.Event()
+        transport = httpx.ASGITransport(app=CoalescingMiddleware(_app(calls, gate, status=500), ROUTES))
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            pending = [asyncio.ensure_future(client.post("/score", json={"x": 1})) for _ in range(2)]
+            await asyncio.sleep(0.05)
+            gate.set()
+            await asyncio.gather(*pending)
+        assert len(calls) == 2
+
+    asyncio.run(scenario())
+
+
+def test_other_routes_pass_through():
+    async def scenario():
+        calls, gate = [], asyncio.Event()
+        gate.set()
+        transport = httpx.ASGITransport(app=CoalescingMiddleware(_app(calls, gate), ROUTES))
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            await asyncio.gather(*(client.post("/rank", json={"x": 1}) for _ in range(3)))
+        assert len(calls) == 3
+
+    asyncio.run(scenario())
@@ -0,0 +1,41 @@
+import json
+import os
+import subprocess
+import sys
+
+from utils.lazy import LazyInstance
+
+AI_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def test_import_main_skips_heavy_libraries_and_services():
+    code = (
+        "import json, sys, main\n"
+        "from services.job_risk_service import job_risk_service\n"
+        "from services.matching_service import matching_service\n"
+        "print(json.dumps({\n"
+        "    'heavy': [m for m in ('torch', 'sklearn', 'joblib', 'pandas', 'uvicorn') if m in sys.modules],\n"
+        "    'created': [job_risk_service.created, matching_service.created],\n"
+        "}))\n"
+    )
+    out = subprocess.run([sys.executable, "-c", code], cwd=AI_DIR, capture_output=True, text=True, check=True)
+    result = json.loads(out.stdout.strip().splitlines()[-1])
+
+    assert result["heavy"] == []
+    assert result["created"] == [False, False]
+
+
+def test_lazy_instance_creates_once_on_first_use():
+    calls = []
+
+    class Service:
+        def __init__(self):
+            calls.append(1)
+            self.value = 1
+
+    lazy = LazyInstance(Service)
+    assert not lazy.created and calls == []
+
+    assert lazy.value == 1
+    lazy.value = 2
+    assert lazy.get().value == 2 and calls == [1]
@@ -0,0 +1,54 @@
+import json
+
+import pytest
+
+from features.feature_schema import (
+    MONITORING_SCHEMA_V1,
+    resolve_artifact_schema,
+    write_schema_sidecar,
+)
+from features.monitoring_features import MonitoringFeatureExtractor
+from utils.exceptions import ModelLoadError
+
+
+READINGS = [
+    {"heart_rate": 72, "step_count": 100, "activity": "walking"},
+    {"heart_rate": 90, "step_count": None, "activity": "sitting"},
+    {"heart_rate": None, "step_count": 40, "activity": "walking"},
+    {"heart_rate": 65, "step_count": 0, "activity": "lying"},
+]
+
+
+def test_compiled_extractor_matches_dict_path():
+    """컴파일 추출기 == 기존 dict 경로"""
+    features = MonitoringFeatureExtractor.extract_time_series_features(READINGS)
+    expected = MonitoringFeatureExtractor.to_model_input(features)
+
+    vector = MONITORING_SCHEMA_V1.extract(READINGS)
+
+    assert vector.tolist() == pytest.approx(expected)
+    assert MONITORING_SCHEMA_V1.extract([]).tolist() == [0.0] * MONITORING_SCHEMA_V1.dim
+
+    # 스키마 밖 피처도 같은 추출기에서 (step_mean: 측정값 있는 것만 평균)
+    assert features["step_mean"] == pytest.approx(140 / 3)
+    assert features["hr_trend"] == pytest.approx(65 - 72)
+
+
+def test_artifact_schema_mismatch_fails_fast(tmp_path):
+    """차원/해시 불일치 시 ModelLoadError"""
+    artifact = str(tmp_path / "isolation_forest.pkl")
+
+    with pytest.raises(ModelLoadError):
+        resolve_artifact_schema(artifact, n_features=7)
+
+    sidecar = write_schema_sidecar(artifact, MONITORING_SCHEMA_V1)
+    assert resolve_artifact_schema(artifact, n_features=10) is MONITORING_SCHEMA_V1
+
+    with open(sidecar, "r", encoding="utf-8") as f:
+        meta = json.load(f)
+    meta["fingerprint"] = "deadbeef"
+    with open(sidecar, "w", encoding="utf-8") as f:
+        json.dump(meta, f)
+
+    with pytest.raises(ModelLoadError):
+        resolve_artifact_schema(artifact, n_features=10)
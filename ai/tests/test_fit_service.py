@@ -0,0 +1,59 @@
+import asyncio
+
+from schemas.fit import FitRequest
+from schemas.job_risk import JobRiskRequest
+from schemas.matching import MatchingRequest
+from services.fit_service import FitService
+
+SEEKER = {"skills": ["요양보호", "운전"], "experience": 3, "education": "high_school"}
+JOBS = [
+    {"job_id": 1, "job_posting": {"required_skills": ["요양보호"], "required_experience": 2},
+     "job_type": "service", "safety_equipment": ["gloves"]},
+    {"job_id": 2, "job_posting": {"required_skills": ["운전"], "required_experience": 1},
+     "job_type": "construction", "work_environment": {"height": "high", "machinery": True}},
+    {"job_id": 3, "job_posting": {"required_skills": ["조리"], "required_experience": 5},
+     "job_type": "office"},
+]
+
+
+def _request(mobility: float) -> FitRequest:
+    return FitRequest(
+        health={
+            "senior_profile_id": 7, "height_cm": 165, "weight_kg": 62.0,
+            "risk_flags": {"mobility_limited": mobility},
+        },
+        job_seeker_profile=SEEKER,
+        jobs=JOBS,
+    )
+
+
+def test_fit_matches_separate_calls_and_filters_high_risk():
+    service = FitService()
+    service.matching_service.model = None
+    service.job_risk_service.model = None
+
+    relaxed = asyncio.run(service.evaluate(_request(0.2)))
+    assert {r.job_id for r in relaxed.results} == {1, 2, 3}
+    assert relaxed.excluded == []
+
+    fit_scores = [r.fit_score for r in relaxed.results]
+    assert fit_scores == sorted(fit_scores, reverse=True)
+
+    for result, job in ((r, next(j for j in JOBS if j["job_id"] == r.job_id)) for r in relaxed.results):
+        single_match = asyncio.run(service.matching_service.calculate_score(
+            MatchingRequest(job_seeker_profile=SEEKER, job_posting=job["job_posting"])
+        ))
+        single_risk = asyncio.run(service.job_risk_service.predict_risk(JobRiskRequest(
+            job_type=job["job_type"],
+            work_environment=job.get("work_environment", {}),
+            safety_equipment=job.get("safety_equipment", []),
+            experience_years=SEEKER["experience"],
+        )))
+        assert result.matching_score == single_match.matching_score
+        assert result.job_risk_score == single_risk.risk_score
+        assert result.job_risk_level == single_risk.risk_level
+
+    limited = asyncio.run(service.evaluate(_request(0.6)))
+    assert [e.job_id for e in limited.excluded] == [2]
+    assert limited.excluded[0].reason == "mobility_limited"
+    assert 2 not in {r.job_id for r in limited.results}
@@ -0,0 +1,46 @@
+import asyncio
+import random
+
+import numpy as np
+
+from features.job_risk_features import JobRiskFeatureEngineer
+from schemas.job_risk import JobRiskRequest
+from services.job_risk_service import JobRiskService
+
+JOB_TYPES = ["construction", "mining", "manufacturing", "office", "service", "other", "farming"]
+EQUIPMENT = ["helmet", "safety_harness", "gloves", "safety_shoes", "goggles", "mask"]
+
+
+def _requests(n: int, seed: int = 0):
+    rng = random.Random(seed)
+    return [
+        JobRiskRequest(
+            job_type=rng.choice(JOB_TYPES),
+            work_environment={
+                "height": rng.choice(["high", "low", None]),
+                "machinery": rng.random() < 0.5,
+                "chemicals": rng.random() < 0.3,
+                "noise": rng.random() < 0.3,
+            },
+            safety_equipment=rng.sample(EQUIPMENT, rng.randint(0, 4)),
+            experience_years=rng.randint(0, 15),
+        )
+        for _ in range(n)
+    ]
+
+
+def test_batch_encoder_and_baseline_match_single_path():
+    requests = _requests(300)
+    engineer = JobRiskFeatureEngineer()
+
+    X = engineer.encode_batch(requests)
+    assert X.shape == (300, 18) and X.dtype == np.float32
+    expected = np.array([engineer.extract_features(r) for r in requests], dtype=np.float32)
+    assert np.array_equal(X, expected)
+
+    service = JobRiskService()
+    service.model = None
+    batch = asyncio.run(service.predict_risk_batch(requests))
+    for request, result in zip(requests, batch):
+        single = asyncio.run(service.predict_risk(request))
+        assert result == single
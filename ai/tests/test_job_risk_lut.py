@@ -0,0 +1,41 @@
+import asyncio
+import itertools
+
+from schemas.job_risk import JobRiskRequest
+from services.job_risk_service import JobRiskService
+
+JOB_TYPES = ["construction", "mining", "manufacturing", "office", "service", "other", "farming"]
+ENVIRONMENTS = [
+    {},
+    {"height": "high"},
+    {"height": "low", "machinery": True},
+    {"height": "high", "machinery": True, "chemicals": True, "noise": True},
+]
+EQUIPMENT = ["helmet", "safety_harness", "gloves", "safety_shoes", "goggles", "mask"]
+
+
+def test_lookup_table_matches_live_logic():
+    service = JobRiskService()
+    service.model = None
+    assert service.baseline_table is not None
+
+    for job_type, env, n_equipment, experience in itertools.product(
+        JOB_TYPES, ENVIRONMENTS, range(0, 20, 3), [0, 1, 2, 5, 9, 10, 11, 40]
+    ):
+        request = JobRiskRequest(
+            job_type=job_type,
+            work_environment=env,
+            safety_equipment=(EQUIPMENT * 4)[:n_equipment],
+            experience_years=experience,
+        )
+        score = service._calculate_baseline_risk(request)
+        live = (
+            score,
+            service._determine_risk_level(score),
+            service._analyze_risk_factors(request),
+            service._generate_safety_recommendations(request, score),
+        )
+        assert service.baseline_table.lookup(request) == live
+
+        response = asyncio.run(service.predict_risk(request))
+        assert (response.risk_score, response.risk_level) == live[:2]
@@ -0,0 +1,136 @@
+import asyncio
+
+from schemas.matching import MatchingRankRequest, MatchingRequest
+from services.matching_service import MatchingService
+
+
+POSTINGS = [
+    {"posting_id": 10, "required_skills": ["요양보호"], "required_experience": 2, "education_level": "high_school"},
+    {"posting_id": 11, "required_skills": ["운전", "배송"], "required_experience": 5, "education_level": "bachelor"},
+    {"posting_id": 12, "required_skills": [], "required_experience": 0, "education_level": ""},
+    {"posting_id": 13, "required_skills": ["조리", "위생"], "required_experience": 1, "education_level": "master"},
+]
+SEEKER = {"skills": ["요양보호", "운전"], "experience": 3, "education": "high_school"}
+
+
+def test_rank_matches_single_pair_scores():
+    """Top-K 결과 == 단건 점수 API 결과 (점수 내림차순)"""
+    service = MatchingService()
+    service.model = None
+
+    ranked = asyncio.run(
+        service.rank_postings(
+            MatchingRankRequest(job_seeker_profile=SEEKER, job_postings=POSTINGS, top_k=3)
+        )
+    )
+
+    assert ranked.total_candidates == len(POSTINGS)
+    assert [r.posting_id for r in ranked.results] == [10, 12, 11]
+
+    by_id = {p["posting_id"]: p for p in POSTINGS}
+    for result in ranked.results:
+        single = asyncio.run(
+            service.calculate_score(
+                MatchingRequest(job_seeker_profile=SEEKER, job_posting=by_id[result.posting_id])
+            )
+        )
+        assert result.matching_score == single.matching_score
+        assert result.score_breakdown == single.score_breakdown
+
+
+def test_bitset_matrix_matches_rank_scores():
+    """비트셋 S×P 타일 점수 == 단건 랭킹 점수"""
+    from services.matching_matrix import MatchingMatrixEngine
+
+    service = MatchingService()
+    service.model = None
+
+    seekers = [SEEKER, {"skills": ["조리"], "experience": 0, "education": "phd"}, {}]
+    engine = MatchingMatrixEngine()
+    posting_block = engine.encode_postings(POSTINGS)
+    seeker_block = engine.encode_seekers(seekers)
+
+    tiles = list(engine.iter_score_tiles(seeker_block, posting_block, tile_seekers=2, tile_postings=3))
+    assert len(tiles) == 4
+
+    for s0, p0, tile in tiles:
+        for i in range(tile.shape[0]):
+            ranked = asyncio.run(
+                service.rank_postings(
+                    MatchingRankRequest(
+                        job_seeker_profile=seekers[s0 + i], job_postings=POSTINGS, top_k=len(POSTINGS)
+                    )
+                )
+            )
+            expected = {r.posting_id: r.matching_score for r in ranked.results}
+            for j in range(tile.shape[1]):
+                posting_id = POSTINGS[p0 + j]["posting_id"]
+                assert abs(float(tile[i, j]) - expected[posting_id]) < 1e-3
+
+
+def test_skill_index_pruning_matches_full_scan(monkeypatch):
+    """역색인 후보 축소 결과 == 전체 스캔 결과 (마감/재등록 포함)"""
+    from config.settings import settings
+    from services.posting_catalog import PostingCatalog
+
+    service = MatchingService()
+    service.model = None
+
+    catalog = PostingCatalog.from_postings(POSTINGS)
+    catalog.close_posting(12)
+    catalog.add_posting(14, {"required_skills": ["운전"], "required_experience": 1})
+    catalog.add_posting(10, {"required_skills": ["요양보호", "청소"], "required_experience": 2})
+
+    for top_k in (1, 2, 10):
+        monkeypatch.setattr(settings, "MATCHING_CANDIDATE_PRUNING", True)
+        pruned = service.rank_catalog(SEEKER, catalog, None, top_k)
+        monkeypatch.setattr(settings, "MATCHING_CANDIDATE_PRUNING", False)
+        full = service.rank_catalog(SEEKER, catalog, None, top_k)
+
+        assert [r.model_dump() for r in pruned.results] == [r.model_dump() for r in full.results]
+
+    assert 12 not in [r.posting_id for r in full.results]
+
+
+def test_add_postings_is_all_or_nothing():
+    """posting_id / 값이 잘못된 공고가 섞이면 배치 전체를 반영하지 않음"""
+    import pytest
+    from services.posting_catalog import PostingCatalog
+
+    catalog = PostingCatalog.from_postings(POSTINGS[:2])
+    before = catalog.arrays()
+
+    for bad in ({"required_skills": ["운전"]}, {"posting_id": 21, "required_experience": "many"}):
+        with pytest.raises((KeyError, ValueError)):
+            catalog.add_postings([{"posting_id": 20, "required_skills": ["조리"]}, bad])
+        assert len(catalog) == 2
+        assert catalog.arrays() is before
+
+
+def test_posting_routes_require_admin_key(monkeypatch):
+    from fastapi.testclient import TestClient
+
+    import api.v1.matching as matching_api
+    from config.settings import settings
+    from main import app
+    from services.posting_catalog import PostingCatalog
+
+    catalog = PostingCatalog()
+    monkeypatch.setattr(matching_api, "posting_catalog", catalog)
+    monkeypatch.setattr(settings, "ADMIN_API_KEY", "secret")
+    client = TestClient(app)
+    headers = {"X-Admin-Key": "secret"}
+
+    assert client.put("/api/v1/matching/postings", json={"postings": POSTINGS}).status_code == 401
+    assert client.delete("/api/v1/matching/postings/10").status_code == 401
+    assert len(catalog) == 0
+
+    # posting_id 누락 → 요청 검증에서 422, 앞의 공고도 반영되지 않음
+    body = {"postings": [POSTINGS[0], {"required_skills": ["운전"]}]}
+    assert client.put("/api/v1/matching/postings", json=body, headers=headers).status_code == 422
+    assert len(catalog) == 0
+
+    res = client.put("/api/v1/matching/postings", json={"postings": POSTINGS}, headers=headers)
+    assert res.json() == {"upserted": 4, "catalog_size": 4}
+    assert catalog.posting(catalog.rows_for([11])[0])["required_skills"] == ["운전", "배송"]
+    assert client.delete("/api/v1/matching/postings/10", headers=headers).json()["catalog_size"] == 3
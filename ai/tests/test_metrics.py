@@ -0,0 +1,84 @@
+import asyncio
+
+from fastapi.testclient import TestClient
+
+from services.health_service import HealthScoreService
+from utils.metrics import MetricsRegistry, metrics
+
+
+def test_histogram_render_is_cumulative():
+    registry = MetricsRegistry(enabled=True)
+    hist = registry.histogram("t_seconds", "test", ("stage",), buckets=(0.1, 1.0))
+    for value in (0.05, 0.5, 0.5, 3.0):
+        hist.observe(("a",), value)
+
+    text = registry.render()
+    assert 't_seconds_bucket{stage="a",le="0.1"} 1' in text
+    assert 't_seconds_bucket{stage="a",le="1.0"} 3' in text
+    assert 't_seconds_bucket{stage="a",le="+Inf"} 4' in text
+    assert 't_seconds_count{stage="a"} 4' in text
+    assert 't_seconds_sum{stage="a"} 4.05' in text
+
+
+def test_disabled_registry_records_nothing():
+    registry = MetricsRegistry(enabled=False)
+
+    @registry.timed("fn")
+    def fn():
+        return 1
+
+    @registry.timed("coro")
+    async def coro():
+        return 2
+
+    with registry.stage("block"):
+        pass
+    clock = registry.clock("p")
+    clock.lap("x")
+
+    assert fn() == 1 and asyncio.run(coro()) == 2
+    assert "if_stage_duration_seconds_count" not in registry.render()
+
+
+def test_health_stages_recorded():
+    before = metrics.stage_seconds.count(("health.validate",))
+    HealthScoreService.calculate_health_score(
+        senior_profile_id=1,
+        height_cm=170,
+        weight_kg=75,
+        chronic_conditions={"hypertension": False},
+        risk_flags={"mobility_limited": 0.1},
+    )
+    for stage in ("validate", "features", "rules", "ml", "ensemble", "risk_level", "recommendations"):
+        assert metrics.stage_seconds.count((f"health.{stage}",)) >= 1
+    assert metrics.stage_seconds.count(("health.validate",)) == before + 1
+
+
+def test_metrics_endpoint():
+    from main import app
+
+    client = TestClient(app)
+    client.post("/api/ml/v1/health/calculate", json={
+        "senior_profile_id": 1,
+        "height_cm": 170,
+        "weight_kg": 75,
+        "chronic_conditions": {"hypertension": False},
+        "risk_flags": {"mobility_limited": 0.1},
+    })
+    # 범위를 벗어난 위험 지표 → ValidationError
+    client.post("/api/ml/v1/health/calculate", json={
+        "senior_profile_id": 1,
+        "height_cm": 170,
+        "weight_kg": 75,
+        "chronic_conditions": {},
+        "risk_flags": {"mobility_limited": 5.0},
+    })
+
+    response = client.get("/metrics")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    text = response.text
+    assert 'if_stage_duration_seconds_bucket{stage="health.features"' in text
+    assert 'if_http_requests_total{method="POST",route="/api/ml/v1/health/calculate",status="200"}' in text
+    assert 'if_errors_total{error_code="VALIDATION_ERROR"}' in text
+    assert 'if_model_status{model="health",status=' in text
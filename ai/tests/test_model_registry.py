@@ -0,0 +1,79 @@
+import pickle
+
+from fastapi.testclient import TestClient
+
+from models.registry import ModelRegistry, ModelStatus, RegistryModel, model_registry
+
+
+def _write_pickle(path, obj):
+    with open(path, "wb") as f:
+        pickle.dump(obj, f)
+    return str(path)
+
+
+def _load_pickle(path):
+    with open(path, "rb") as f:
+        return pickle.load(f)
+
+
+def test_background_load_reports_version_and_memory(tmp_path):
+    registry = ModelRegistry()
+    registry.register("a", _write_pickle(tmp_path / "a.pkl", {"w": [1, 2, 3]}), _load_pickle)
+    registry.register("b", str(tmp_path / "missing.pkl"), _load_pickle)
+
+    registry.start()
+    assert registry.wait(timeout=10)
+
+    a = registry.entry("a")
+    assert a.status == ModelStatus.READY
+    assert registry.get("a") == {"w": [1, 2, 3]}
+    assert len(a.version) == 12 and a.memory_bytes > 0 and a.load_seconds is not None
+    # 파일 없음 = 규칙 기반으로 동작 가능 → 준비 완료
+    assert registry.entry("b").status == ModelStatus.MISSING
+    assert registry.status()["ready"] is True
+
+
+def test_failed_validation_is_not_ready(tmp_path):
+    def reject(path, model):
+        raise ValueError("schema mismatch")
+
+    registry = ModelRegistry()
+    registry.register("bad", _write_pickle(tmp_path / "bad.pkl", [0]), _load_pickle, reject)
+    entry = registry.load("bad")
+
+    assert entry.status == ModelStatus.FAILED
+    assert entry.error == "schema mismatch"
+    assert registry.get("bad") is None
+    assert registry.is_ready() is False
+
+
+def test_registry_model_descriptor_reads_live_and_pins(tmp_path):
+    name = "test_descriptor"
+    model_registry.register(name, _write_pickle(tmp_path / "m.pkl", "v1"), _load_pickle)
+
+    class Service:
+        model = RegistryModel(name)
+
+    service, pinned = Service(), Service()
+    pinned.model = None
+    assert service.model is None
+
+    model_registry.load(name)
+    assert service.model == "v1"
+    assert pinned.model is None
+
+    model_registry.unregister(name)
+
+
+def test_health_endpoint_reflects_readiness(monkeypatch):
+    from main import app
+
+    client = TestClient(app)
+    monkeypatch.setattr(model_registry, "is_ready", lambda: False)
+    response = client.get("/health")
+    assert response.status_code == 503
+    assert response.json()["ready"] is False
+
+    monkeypatch.undo()
+    models = client.get("/health/models").json()["models"]
+    assert {"health", "lstm", "isolation_forest", "job_risk", "matching"} <= set(models)
@@ -0,0 +1,156 @@
+import os
+import pickle
+
+from fastapi.testclient import TestClient
+
+from config.settings import settings
+from models.registry import ModelRegistry, ModelStatus, model_registry
+
+
+def _write_pickle(path, obj):
+    with open(path, "wb") as f:
+        pickle.dump(obj, f)
+    return str(path)
+
+
+def _load_pickle(path):
+    with open(path, "rb") as f:
+        return pickle.load(f)
+
+
+def _probe(model, schema_key):
+    if model.get("broken"):
+        raise ValueError("probe failed")
+
+
+def _registry(tmp_path, version):
+    registry = ModelRegistry()
+    path = _write_pickle(tmp_path / "m.pkl", {"version": version})
+    registry.register("m", path, _load_pickle, probe=_probe)
+    registry.load("m")
+    return registry, path
+
+
+def test_reload_swaps_atomically_and_notifies(tmp_path):
+    registry, path = _registry(tmp_path, 1)
+    events = []
+    registry.add_listener(lambda name, old, new: events.append((name, old, new)))
+
+    in_flight = registry.artifact("m")
+    old_version = in_flight.version
+    _write_pickle(path, {"version": 2})
+    result = registry.reload("m")
+
+    assert result["swapped"] is True
+    assert result["previous_version"] == old_version != result["version"]
+    assert result["total_seconds"] >= result["load_seconds"]
+    assert registry.get("m") == {"version": 2}
+    # 교체 전에 잡은 아티팩트는 그대로 이전 버전
+    assert in_flight.model == {"version": 1}
+    assert events == [("m", old_version, result["version"])]
+
+
+def test_failed_probe_keeps_serving_old_model(tmp_path):
+    registry, path = _registry(tmp_path, 1)
+    version = registry.entry("m").version
+
+    _write_pickle(path, {"version": 2, "broken": True})
+    result = registry.reload("m")
+
+    assert result["swapped"] is False and result["error"] == "probe failed"
+    assert registry.get("m") == {"version": 1}
+    assert registry.entry("m").version == version
+    assert registry.entry("m").status == ModelStatus.READY
+    assert registry.entry("m").last_reload is result
+
+
+def test_load_keeps_serving_model_on_failure(tmp_path):
+    registry, path = _registry(tmp_path, 1)
+    version = registry.entry("m").version
+
+    # 서비스 중인 모델이 있으면 실패 / 파일 없음에도 교체하지 않음
+    _write_pickle(path, {"version": 2, "broken": True})
+    entry = registry.load("m")
+    assert registry.get("m") == {"version": 1} and entry.version == version
+    assert entry.status == ModelStatus.READY and entry.error == "probe failed"
+
+    os.remove(path)
+    entry = registry.load("m")
+    assert registry.get("m") == {"version": 1} and entry.status == ModelStatus.READY
+
+    # 첫 로드 실패는 그대로 FAILED / MISSING
+    fresh = ModelRegistry()
+    fresh.register("m", str(tmp_path / "none.pkl"), _load_pickle, probe=_probe)
+    assert fresh.load("m").status == ModelStatus.MISSING
+    _write_pickle(tmp_path / "none.pkl", {"broken": True})
+    assert fresh.load("m").status == ModelStatus.FAILED and fresh.get("m") is None
+
+
+def test_check_for_updates_reloads_changed_files_once(tmp_path):
+    registry, path = _registry(tmp_path, 1)
+    assert registry.check_for_updates() == []
+
+    _write_pickle(path, {"version": 2})
+    mtime = os.path.getmtime(path) + 5
+    os.utime(path, (mtime, mtime))
+    results = registry.check_for_updates()
+    assert [r["swapped"] for r in results] == [True]
+    assert registry.get("m") == {"version": 2}
+
+    # 같은 파일로 실패하면 파일이 다시 바뀔 때까지 재시도하지 않음
+    _write_pickle(path, {"broken": True})
+    os.utime(path, (mtime + 5, mtime + 5))
+    assert [r["swapped"] for r in registry.check_for_updates()] == [False]
+    assert registry.check_for_updates() == []
+
+
+def test_admin_reload_endpoint(tmp_path, monkeypatch):
+    from main import app
+
+    path = _write_pickle(tmp_path / "admin.pkl", {"version": 1})
+    model_registry.register("test_admin", path, _load_pickle, probe=_probe)
+    monkeypatch.setattr(settings, "ADMIN_API_KEY", "secret")
+    try:
+        client = TestClient(app)
+        assert client.post("/api/v1/admin/models/test_admin/reload").status_code == 401
+
+        headers = {"X-Admin-Key": "secret"}
+        body = client.post("/api/v1/admin/models/test_admin/reload", headers=headers).json()
+        assert body["swapped"] is True and body["version"]
+        assert client.post("/api/v1/admin/models/nope/reload", headers=headers).status_code == 404
+    finally:
+        model_registry.unregister("test_admin")
+
+
+def test_admin_api_disabled_without_key(monkeypatch):
+    from main import app
+
+    monkeypatch.setattr(settings, "ADMIN_API_KEY", None)
+    client = TestClient(app)
+    assert client.get("/api/v1/admin/models").status_code == 403
+    assert client.post(
+        "/api/v1/admin/models/health/reload", json={"path": "/etc/passwd"}
+    ).status_code == 403
+
+
+def test_admin_reload_rejects_path_outside_model_dir(tmp_path, monkeypatch):
+    from main import app
+
+    model_dir = tmp_path / "models"
+    model_dir.mkdir()
+    path = _write_pickle(model_dir / "admin.pkl", {"version": 1})
+    outside = _write_pickle(tmp_path / "outside.pkl", {"version": 2})
+    os.symlink(outside, model_dir / "link.pkl")
+    model_registry.register("test_admin", path, _load_pickle, probe=_probe)
+    monkeypatch.setattr(settings, "ADMIN_API_KEY", "secret")
+    monkeypatch.setattr(settings, "MODEL_DIR", str(model_dir))
+    try:
+        client = TestClient(app)
+        headers = {"X-Admin-Key": "secret"}
+        url = "/api/v1/admin/models/test_admin/reload"
+        for bad in (outside, "../outside.pkl", "link.pkl"):
+            assert client.post(url, json={"path": bad}, headers=headers).status_code == 403
+        body = client.post(url, json={"path": "admin.pkl"}, headers=headers).json()
+        assert body["path"] == os.path.realpath(path)
+    finally:
+        model_registry.unregister("test_admin")
@@ -0,0 +1,44 @@
+from datetime import datetime, timedelta, timezone
+
+from schemas.monitoring import RollupResolution, SensorReading
+from services.monitoring_service import MonitoringRollupEngine
+
+
+def _reading(ts, **kwargs):
+    return SensorReading(timestamp=ts, **kwargs)
+
+
+def test_incremental_rollup_across_batches():
+    """배치를 나눠 적재해도 같은 집계"""
+    engine = MonitoringRollupEngine()
+    t0 = datetime(2025, 1, 1, 10, 0, tzinfo=timezone.utc)
+
+    first = [
+        _reading(t0 + timedelta(seconds=30 * i), heart_rate=70 + i, step_count=10)
+        for i in range(4)
+    ]
+    second = [
+        _reading(t0 + timedelta(minutes=2), heart_rate=120, activity="sitting"),
+        _reading(
+            t0 + timedelta(hours=1),
+            heart_rate=65,
+            posture={"angle": 20, "balance": "unstable"},
+            activity="standing",
+        ),
+    ]
+
+    engine.ingest(1, first)
+    engine.ingest(1, second)
+
+    hours = engine.query(1, RollupResolution.HOUR, t0, t0 + timedelta(hours=2))
+    assert hours["readings"].tolist() == [5, 1]
+    assert hours["hr_min"][0] == 70 and hours["hr_max"][0] == 120
+    assert hours["hr_mean"][0] == (70 + 71 + 72 + 73 + 120) / 5
+    assert hours["steps"].tolist() == [40, 0]
+    assert hours["falls"].tolist() == [0, 1]
+    # 120초 보행 (4구간 × 30초), 이후 sitting 측정은 1시간 공백이라 제외
+    assert hours["activity_sec"][0][0] == 120.0
+
+    days = engine.query(1, RollupResolution.DAY, t0, t0 + timedelta(days=1))
+    assert days["readings"].tolist() == [6]
+    assert engine.query(2, RollupResolution.DAY, t0, t0 + timedelta(days=1)) == {}
@@ -0,0 +1,71 @@
+import os
+import time
+
+import pandas as pd
+
+from services.priority_index import MatchingPriorityIndex
+
+BASELINE_DIR = os.path.join(os.path.dirname(__file__), "..", "..", "data", "03_baseline_model")
+
+
+def test_index_matches_pipeline_csv():
+    index = MatchingPriorityIndex(
+        os.path.join(BASELINE_DIR, "matching_score.csv"),
+        os.path.join(BASELINE_DIR, "senior_score.csv"),
+        check_interval=0,
+    )
+    assert index.snapshot() is None
+    assert index.reload_if_changed()
+    snapshot = index.snapshot()
+    df = pd.read_csv(os.path.join(BASELINE_DIR, "matching_score.csv"))
+
+    assert len(snapshot) == len(df)
+    assert snapshot.lookup(3)["priority"] == df.loc[3, "matching_score"]
+    for group, expected in df.groupby("age_group")["matching_score"].mean().items():
+        assert abs(snapshot.group_priority(group) - expected) < 1e-9
+
+        ordered = [e["priority"] for e in snapshot.top(group, limit=1000)]
+        assert ordered == sorted(ordered, reverse=True)
+        assert len(ordered) == (df["age_group"] == group).sum()
+
+
+def test_reload_swaps_snapshot_when_file_changes(tmp_path):
+    senior_path = tmp_path / "senior_score.csv"
+    pd.DataFrame({"age_group": ["60-69", "70-79"], "senior_score": [4, 1]}).to_csv(
+        senior_path, index=False
+    )
+    index = MatchingPriorityIndex(str(tmp_path / "matching_score.csv"), str(senior_path), check_interval=0)
+
+    index.reload_if_changed()
+    first = index.snapshot()
+    assert index.seeker_priority({"senior_id": 1}) == 3.0  # max(4) - 1
+    assert index.seeker_priority({"age_group": "60-69"}) == 0.0
+
+    pd.DataFrame({"age_group": ["60-69", "70-79"], "senior_score": [2, 4]}).to_csv(
+        senior_path, index=False
+    )
+    os.utime(senior_path, (first.source_mtimes[1] + 10, first.source_mtimes[1] + 10))
+
+    # 요청 경로는 파일을 다시 확인하지 않음 (감시 스레드가 교체)
+    assert index.snapshot() is first
+    assert index.reload_if_changed()
+    second = index.snapshot()
+    assert second is not first
+    assert second.top(limit=1)[0]["senior_key"] == 0
+    # 이전 스냅샷은 그대로 (조회 중인 요청은 일관된 값)
+    assert first.lookup(1)["priority"] == 3.0
+
+
+def test_watcher_loads_in_background(tmp_path):
+    senior_path = tmp_path / "senior_score.csv"
+    pd.DataFrame({"age_group": ["60-69"], "senior_score": [1]}).to_csv(senior_path, index=False)
+    index = MatchingPriorityIndex(str(tmp_path / "matching_score.csv"), str(senior_path), check_interval=0.05)
+
+    index.start_watcher()
+    try:
+        deadline = time.monotonic() + 5
+        while index.snapshot() is None and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert len(index.snapshot()) == 1
+    finally:
+        index.stop_watcher()
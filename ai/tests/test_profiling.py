@@ -0,0 +1,89 @@
+import threading
+
+from fastapi.testclient import TestClient
+
+from config.settings import settings
+from utils.profiling import ProfileStore, SamplingProfiler
+
+
+def _busy_offloaded_work(stop: threading.Event):
+    while not stop.is_set():
+        sum(i * i for i in range(1000))
+
+
+def test_sampler_captures_offloaded_thread():
+    stop = threading.Event()
+    worker = threading.Thread(target=_busy_offloaded_work, args=(stop,), name="pool-worker")
+    worker.start()
+    profiler = SamplingProfiler(0.001)
+    try:
+        for _ in range(20):
+            profiler.sample(threading.get_ident())
+    finally:
+        stop.set()
+        worker.join()
+
+    folded = profiler.collapsed()
+    assert profiler.samples == 20
+    assert any(
+        line.startswith("pool-worker;") and "_busy_offloaded_work" in line
+        for line in folded.splitlines()
+    )
+
+
+def test_store_is_bounded(tmp_path):
+    store = ProfileStore(str(tmp_path), max_files=3)
+    profiler = SamplingProfiler(0.001)
+    profiler.stacks["MainThread;f (a.py:1)"] = 2
+    for i in range(5):
+        store.save(store.new_id(), profiler, {"started_at": f"2024-01-01T00:00:0{i}"})
+
+    profiles = store.list()
+    assert len(profiles) == 3
+    assert [p["started_at"][-1] for p in profiles] == ["4", "3", "2"]
+    assert len(list(tmp_path.iterdir())) == 6
+    assert store.read(profiles[0]["id"]) == "MainThread;f (a.py:1) 2\n"
+    assert store.read("../etc/passwd") is None
+
+
+def test_profile_header_and_admin_listing(tmp_path, monkeypatch):
+    from api.v1 import admin
+    from main import app
+    from utils import profiling
+
+    store = ProfileStore(str(tmp_path), 10)
+    monkeypatch.setattr(profiling, "profile_store", store)
+    monkeypatch.setattr(admin, "profile_store", store)
+    monkeypatch.setattr(settings, "ADMIN_API_KEY", "secret")
+    client = TestClient(app, headers={"X-Admin-Key": "secret"})
+
+    assert "x-profile-id" not in client.get("/health/models").headers
+    response = client.get("/health/models", headers={"X-Profile": "1"})
+    profile_id = response.headers["x-profile-id"]
+
+    listing = client.get("/api/v1/admin/profiles").json()
+    assert listing["profiles"][0]["id"] == profile_id
+    assert listing["profiles"][0]["route"] == "/health/models"
+    assert client.get(f"/api/v1/admin/profiles/{profile_id}").status_code == 200
+    assert client.get("/api/v1/admin/profiles/nope").status_code == 404
+
+
+def test_profile_header_requires_configured_admin_key(tmp_path, monkeypatch):
+    from api.v1 import admin
+    from main import app
+    from utils import profiling
+
+    store = ProfileStore(str(tmp_path), 10)
+    monkeypatch.setattr(profiling, "profile_store", store)
+    monkeypatch.setattr(admin, "profile_store", store)
+    client = TestClient(app)
+
+    # 키가 없으면 헤더만으로는 프로파일링하지 않고 목록 / 다운로드도 막힘
+    monkeypatch.setattr(settings, "ADMIN_API_KEY", None)
+    assert "x-profile-id" not in client.get("/health/models", headers={"X-Profile": "1"}).headers
+    assert client.get("/api/v1/admin/profiles").status_code == 403
+
+    monkeypatch.setattr(settings, "ADMIN_API_KEY", "secret")
+    response = client.get("/health/models", headers={"X-Profile": "1", "X-Admin-Key": "wrong"})
+    assert "x-profile-id" not in response.headers
+    assert store.list() == []
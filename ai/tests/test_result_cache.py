@@ -0,0 +1,91 @@
+import multiprocessing
+import struct
+
+import numpy as np
+
+from utils.result_cache import HEADER_SIZE, SLOT_SIZE, ResultCache
+
+
+def _cache(tmp_path, n_sets=16, ways=4):
+    return ResultCache(str(tmp_path / "results.bin"), n_sets, ways)
+
+
+def test_hit_after_put_and_version_in_key(tmp_path):
+    cache = _cache(tmp_path)
+    x = np.array([[0.5, 0.8, 0.9, 0.9]])
+
+    assert cache.get("v1", x) is None
+    cache.put("v1", x, (0.73,))
+    assert cache.get("v1", x) == (0.73,)
+    # 다른 모델 버전 / 다른 피처는 미스
+    assert cache.get("v2", x) is None
+    assert cache.get("v1", x + 1e-9) is None
+
+    stats = cache.stats()
+    assert (stats["hits"], stats["misses"], stats["inserts"]) == (1, 3, 1)
+    assert stats["occupied"] == 1
+
+
+def test_get_or_compute_calls_once(tmp_path):
+    cache = _cache(tmp_path)
+    calls = []
+
+    def compute():
+        calls.append(1)
+        return -0.25
+
+    x = np.arange(24, dtype=np.float64)
+    assert cache.get_or_compute("v1", x, compute) == -0.25
+    assert cache.get_or_compute("v1", x, compute) == -0.25
+    assert len(calls) == 1
+    # 버전이 없으면 캐시하지 않음
+    cache.get_or_compute(None, x, compute)
+    assert len(calls) == 2
+
+
+def test_lru_eviction_within_set(tmp_path):
+    cache = _cache(tmp_path, n_sets=1, ways=4)
+    for i in range(4):
+        cache.put("v1", [float(i)], (float(i),))
+    # 웨이별 마지막 사용 시각 고정 → 다음 교체 대상은 tick이 가장 오래된 1번
+    for way, tick in enumerate((500, 100, 300, 400)):
+        struct.pack_into("<I", cache._mm, HEADER_SIZE + way * SLOT_SIZE + 16, tick)
+    cache.put("v1", [99.0], (99.0,))
+
+    assert cache.stats()["evictions"] == 1
+    assert cache.get("v1", [99.0]) == (99.0,)
+    assert cache.get("v1", [1.0]) is None
+    assert all(cache.get("v1", [float(i)]) is not None for i in (0, 2, 3))
+
+
+def test_corrupted_slot_is_a_miss(tmp_path):
+    cache = _cache(tmp_path, n_sets=1, ways=2)
+    cache.put("v1", [1.0], (1.0,))
+    # 값만 바뀐 슬롯 (쓰는 도중 읽은 상태) → checksum 불일치
+    struct.pack_into("<d", cache._mm, HEADER_SIZE + 32, 2.0)
+    assert cache.get("v1", [1.0]) is None
+
+
+def _child_lookup(path, queue):
+    cache = ResultCache(path, 16, 4)
+    queue.put(cache.get("v1", [1.0, 2.0]))
+
+
+def test_shared_across_processes(tmp_path):
+    cache = _cache(tmp_path)
+    cache.put("v1", [1.0, 2.0], (0.42,))
+
+    queue = multiprocessing.get_context("fork").Queue()
+    process = multiprocessing.get_context("fork").Process(target=_child_lookup, args=(cache.path, queue))
+    process.start()
+    process.join(10)
+
+    assert queue.get(timeout=5) == (0.42,)
+    assert cache.stats()["hits"] == 1
+
+
+def test_reopen_with_different_geometry_resets(tmp_path):
+    _cache(tmp_path).put("v1", [1.0], (1.0,))
+    cache = _cache(tmp_path, n_sets=32)
+    assert cache.get("v1", [1.0]) is None
+    assert cache.stats()["capacity"] == 128
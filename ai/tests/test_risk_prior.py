@@ -0,0 +1,65 @@
+import asyncio
+import itertools
+import os
+
+import pandas as pd
+
+from models.create_risk_prior import build_prior
+from schemas.job_risk import JobRiskRequest
+from services.job_risk_lut import JobRiskLookupTable
+from services.job_risk_service import JobRiskService
+from services.risk_prior import RiskPriorTable, write_risk_prior
+
+RAW_PATH = os.path.join(os.path.dirname(__file__), "..", "..", "data", "00_raw", "01_산업재해현황.csv")
+
+
+def _prior(tmp_path) -> RiskPriorTable:
+    header, arrays = build_prior(pd.read_csv(RAW_PATH, encoding="utf-8-sig"))
+    path = str(tmp_path / "risk_prior.bin")
+    write_risk_prior(path, header, arrays)
+    return RiskPriorTable(path)
+
+
+def test_prior_artifact_roundtrip(tmp_path):
+    prior = _prior(tmp_path)
+    assert prior.age_groups == ["50-59", "60-69", "70+"]
+    assert prior.points_table.shape == (7, 4)
+    assert 0.0 <= prior.points("construction", "70+") <= 30.0
+    # 모르는 연령대 = 전체 연령, 모르는 직종 = 기타 업종
+    assert prior.points("construction", "90+") == prior.points("construction")
+    assert prior.points("unknown_job") == prior.points("other")
+
+
+def test_prior_baseline_lut_and_batch_match_live(tmp_path):
+    service = JobRiskService()
+    service.model = None
+    service.risk_prior = _prior(tmp_path)
+    service.baseline_table = JobRiskLookupTable(service)
+
+    requests = [
+        JobRiskRequest(
+            job_type=job_type,
+            work_environment={"height": height, "machinery": True},
+            safety_equipment=["helmet"] * n_equipment,
+            experience_years=experience,
+            age_group=age_group,
+        )
+        for job_type, height, n_equipment, experience, age_group in itertools.product(
+            ["construction", "office", "farming"], ["high", "low"], [0, 2, 7],
+            [0, 3, 12], [None, "50-59", "70+", "90+"],
+        )
+    ]
+
+    batch = service.score_batch(requests)
+    for request, batch_score in zip(requests, batch.tolist()):
+        score = service._calculate_baseline_risk(request)
+        factors = service._analyze_risk_factors(request)
+        assert "industry_prior" not in factors
+        assert factors["job_type_risk"] == round(
+            service.risk_prior.points(request.job_type, request.age_group), 2
+        )
+        assert batch_score == score
+
+        response = asyncio.run(service.predict_risk(request))
+        assert response.risk_score == score
+        assert response.risk_factors == factors
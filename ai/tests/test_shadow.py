@@ -0,0 +1,85 @@
+import pickle
+
+import numpy as np
+from fastapi.testclient import TestClient
+from sklearn.linear_model import LinearRegression
+
+from config.settings import settings
+from models.registry import model_registry
+from models.shadow import ShadowCandidate, ShadowScorer
+
+
+def _linear(tmp_path, name, coef):
+    model = LinearRegression().fit(np.eye(4), np.asarray(coef, dtype=float))
+    path = tmp_path / f"{name}.pkl"
+    with open(path, "wb") as f:
+        pickle.dump(model, f)
+    return model, str(path)
+
+
+def _load_pickle(path):
+    with open(path, "rb") as f:
+        return pickle.load(f)
+
+
+def test_shadow_scores_candidate_in_background(tmp_path):
+    primary, primary_path = _linear(tmp_path, "primary", [1, 2, 3, 4])
+    _, candidate_path = _linear(tmp_path, "candidate", [2, 3, 4, 5])
+    model_registry.register("test_shadow", primary_path, _load_pickle)
+    try:
+        scorer = ShadowScorer(queue_size=256, batch_size=16, batch_wait_sec=0.01, window=100)
+        scorer.set_candidate("test_shadow", candidate_path)
+
+        X = np.random.default_rng(0).random((150, 4))
+        for row in X:
+            assert scorer.submit("test_shadow", row.reshape(1, -1), primary.predict(row.reshape(1, -1))[0])
+        assert scorer.flush()
+
+        stats = scorer.status()["candidates"]["test_shadow"]["stats"]
+        assert stats["scored"] == 150 and stats["dropped"] == 0 and stats["errors"] == 0
+        assert stats["window"] == 100
+        assert stats["batches"] >= 150 // 16
+        # 후보 = 주 모델 + 1 (학습 데이터가 단위행렬이라 절편 차이만큼)
+        expected = _load_pickle(candidate_path).predict(X[-100:]) - primary.predict(X[-100:])
+        assert np.isclose(stats["delta_mean"], expected.mean())
+    finally:
+        model_registry.unregister("test_shadow")
+
+
+def test_submit_without_candidate_is_noop_and_full_queue_drops(tmp_path):
+    scorer = ShadowScorer(queue_size=2, batch_size=4, batch_wait_sec=0.0, window=10)
+    assert scorer.submit("health", [0.5, 0.5, 0.5, 0.5], 0.5) is False
+
+    model, path = _linear(tmp_path, "m", [1, 2, 3, 4])
+    artifact = type("Artifact", (), {"model": model, "path": path, "version": "x"})()
+    # 워커 없이 후보만 등록 → 큐가 차면 대기하지 않고 버림
+    scorer._candidates["health"] = ShadowCandidate("health", artifact, 10)
+    results = [scorer.submit("health", np.ones(4), 1.0) for _ in range(5)]
+
+    assert results == [True, True, False, False, False]
+    assert scorer.candidate("health").stats.dropped == 3
+
+
+def test_shadow_admin_endpoints(tmp_path, monkeypatch):
+    from main import app
+
+    monkeypatch.setattr(settings, "ADMIN_API_KEY", "secret")
+    monkeypatch.setattr(settings, "MODEL_DIR", str(tmp_path))
+    client = TestClient(app, headers={"X-Admin-Key": "secret"})
+    assert client.put("/api/v1/admin/shadow/nope", json={"path": "x.pkl"}).status_code == 404
+    assert client.put(
+        "/api/v1/admin/shadow/health", json={"path": str(tmp_path / "missing.pkl")}
+    ).status_code == 404
+    assert "candidates" in client.get("/api/v1/admin/shadow").json()
+
+    # MODEL_DIR 밖의 후보 / 키 없는 요청은 로더까지 가지 않음
+    _, outside = _linear(tmp_path.parent, "outside", [1, 2, 3, 4])
+    assert client.put("/api/v1/admin/shadow/health", json={"path": outside}).status_code == 403
+    assert client.put(
+        "/api/v1/admin/shadow/health", json={"path": "../outside.pkl"}
+    ).status_code == 403
+    assert TestClient(app).put(
+        "/api/v1/admin/shadow/health", json={"path": "x.pkl"}
+    ).status_code == 401
+    monkeypatch.setattr(settings, "ADMIN_API_KEY", None)
+    assert client.put("/api/v1/admin/shadow/health", json={"path": "x.pkl"}).status_code == 403
@@ -0,0 +1,40 @@
+import numpy as np
+from sklearn.ensemble import IsolationForest
+
+from features.feature_schema import MONITORING_SCHEMA_V1
+from models.loader import _load_shared_forest, _probe_isolation_forest
+from models.registry import ModelRegistry, ModelStatus
+from models.shared_forest import SharedIsolationForest, export_isolation_forest
+
+
+def _forest(**kwargs):
+    rng = np.random.default_rng(0)
+    return IsolationForest(n_estimators=50, random_state=1, **kwargs).fit(
+        rng.normal(size=(400, MONITORING_SCHEMA_V1.dim))
+    )
+
+
+def test_shared_forest_matches_sklearn(tmp_path):
+    X = np.random.default_rng(1).normal(size=(300, MONITORING_SCHEMA_V1.dim)) * 2
+    for kwargs in ({}, {"max_features": 0.5}, {"max_samples": 40, "contamination": 0.05}):
+        model = _forest(**kwargs)
+        path = str(tmp_path / "isolation_forest.forest")
+        export_isolation_forest(model, path)
+        shared = SharedIsolationForest(path)
+
+        np.testing.assert_allclose(shared.decision_function(X), model.decision_function(X), atol=1e-12)
+        np.testing.assert_array_equal(shared.predict(X), model.predict(X))
+        assert shared.n_features_in_ == MONITORING_SCHEMA_V1.dim
+        assert isinstance(shared.left, np.memmap)
+
+
+def test_shared_forest_loads_through_registry(tmp_path):
+    path = str(tmp_path / "isolation_forest.forest")
+    export_isolation_forest(_forest(), path)
+
+    registry = ModelRegistry()
+    registry.register("isolation_forest", path, _load_shared_forest, probe=_probe_isolation_forest)
+    entry = registry.load("isolation_forest")
+
+    assert entry.status == ModelStatus.READY
+    assert entry.memory_bytes == entry.model.nbytes
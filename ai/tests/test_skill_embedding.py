@@ -0,0 +1,114 @@
+import asyncio
+
+import numpy as np
+import pytest
+
+from config.settings import settings
+from features.skill_embedding import SkillEmbeddingIndex, normalize_rows
+from schemas.matching import MatchingRankRequest, MatchingRequest
+from services.matching_service import MatchingService
+
+SKILLS = ["요양보호", "돌봄", "운전", "배송", "조리"]
+
+
+def _index() -> SkillEmbeddingIndex:
+    """요양보호≈돌봄, 운전≈배송, 조리는 무관"""
+    rng = np.random.default_rng(0)
+    base = rng.standard_normal((3, 16))
+    noise = 0.2 * rng.standard_normal((5, 16))
+    vectors = base[[0, 0, 1, 1, 2]] + noise
+    return SkillEmbeddingIndex(SKILLS, normalize_rows(vectors))
+
+
+def test_mmap_roundtrip_and_ivf_search_matches_brute_force(tmp_path):
+    index = _index()
+    index.build_ivf(n_lists=3)
+    path = str(tmp_path / "skill_embeddings.npy")
+    index.save(path)
+
+    loaded = SkillEmbeddingIndex.load(path)
+    assert isinstance(loaded.vectors, np.memmap)
+    assert loaded.n_lists == 3
+
+    queries = np.asarray(loaded.vectors)
+    brute_ids, brute_sims = loaded.search(queries, k=2)
+    ivf_ids, _ = loaded.search(queries, k=2, n_probe=3)
+    assert (brute_ids == ivf_ids).all()
+    assert (brute_ids[:, 0] == np.arange(len(SKILLS))).all()
+    assert brute_sims[0, 1] > 0.8 and brute_ids[0, 1] == 1
+
+
+def test_soft_match_scores_synonyms_and_rank_matches_single(monkeypatch):
+    monkeypatch.setattr(settings, "SKILL_SOFT_MATCH_THRESHOLD", 0.8)
+    service = MatchingService()
+    service.model = None
+    seeker = {"skills": ["요양보호"], "experience": 3, "education": "high_school"}
+    postings = [
+        {"posting_id": 1, "required_skills": ["돌봄"], "required_experience": 1},
+        {"posting_id": 2, "required_skills": ["조리"], "required_experience": 1},
+        {"posting_id": 3, "required_skills": ["요양보호", "배송"], "required_experience": 1},
+    ]
+
+    exact = asyncio.run(service.calculate_score(
+        MatchingRequest(job_seeker_profile=seeker, job_posting=postings[0])
+    ))
+    assert exact.score_breakdown["skills_match"] == 0.0
+
+    service.skill_embeddings = _index()
+    single = {
+        p["posting_id"]: asyncio.run(service.calculate_score(
+            MatchingRequest(job_seeker_profile=seeker, job_posting=p)
+        ))
+        for p in postings
+    }
+    assert single[1].score_breakdown["skills_match"] > 80.0
+    assert "돌봄" not in " ".join(single[1].recommendations)
+    assert single[2].score_breakdown["skills_match"] == 0.0
+
+    ranked = asyncio.run(service.rank_postings(
+        MatchingRankRequest(job_seeker_profile=seeker, job_postings=postings, top_k=3)
+    ))
+    for result in ranked.results:
+        assert result.matching_score == pytest.approx(
+            single[result.posting_id].matching_score, abs=1e-4
+        )
+
+
+class _RecordingModel:
+    def __init__(self):
+        self.inputs = []
+
+    def predict(self, X):
+        X = np.asarray(X, dtype=np.float64)
+        self.inputs.append(X)
+        return X[:, 0] * 100.0
+
+
+def test_rank_features_match_single_with_soft_skills(monkeypatch):
+    # 요양보호 기준 유사도: 돌봄 0.93, 배송 0.32, 운전 0.28 (부분 일치), 조리 -0.16
+    monkeypatch.setattr(settings, "SKILL_SOFT_MATCH_THRESHOLD", 0.25)
+    service = MatchingService()
+    service.model = _RecordingModel()
+    service.skill_embeddings = _index()
+    seeker = {"skills": ["요양보호"], "experience": 3, "education": "high_school"}
+    postings = [
+        {"posting_id": 1, "required_skills": ["운전", "배송", "조리", "돌봄"], "required_experience": 1},
+        {"posting_id": 2, "required_skills": ["요양보호", "조리"], "required_experience": 5},
+        {"posting_id": 3, "required_skills": [], "education_level": "bachelor"},
+    ]
+
+    single = {}
+    for p in postings:
+        asyncio.run(service.calculate_score(MatchingRequest(job_seeker_profile=seeker, job_posting=p)))
+        single[p["posting_id"]] = service.model.inputs.pop()[0]
+
+    service.model.inputs.clear()
+    ranked = asyncio.run(service.rank_postings(
+        MatchingRankRequest(job_seeker_profile=seeker, job_postings=postings, top_k=3)
+    ))
+    (X,) = service.model.inputs
+    # 부분 일치 3개는 가중 비율(1.53)과 무관하게 일치 스킬 수 3
+    assert single[1][3] == 3
+    for posting, row in zip(postings, X):
+        np.testing.assert_allclose(row, single[posting["posting_id"]], atol=1e-6)
+    assert len(ranked.results) == 3
@@ -0,0 +1,132 @@
+import os
+
+import numpy as np
+import pytest
+
+from features.feature_schema import MONITORING_SCHEMA_V1
+from models.loader import _load_lstm, _validate_lstm
+from models.registry import ModelRegistry, ModelStatus
+from models.tensor_artifact import LSTMArtifact, lstm_meta, write_tensor_artifact
+
+torch = pytest.importorskip("torch")
+from models.lstm_model import AnomalyLSTM  # noqa: E402
+
+
+def _export(tmp_path, model):
+    path = str(tmp_path / "lstm_model.tensors")
+    state = model.state_dict()
+    write_tensor_artifact(path, state, lstm_meta(state, MONITORING_SCHEMA_V1))
+    return path
+
+
+@pytest.mark.parametrize("num_layers", [1, 2])
+def test_numpy_forward_matches_torch(tmp_path, num_layers):
+    torch.manual_seed(0)
+    model = AnomalyLSTM(input_size=MONITORING_SCHEMA_V1.dim, hidden_size=16, num_layers=num_layers).eval()
+    artifact = LSTMArtifact(_export(tmp_path, model))
+
+    x = np.random.default_rng(0).normal(size=(3, 12, MONITORING_SCHEMA_V1.dim)).astype(np.float32)
+    with torch.no_grad():
+        expected = model(torch.from_numpy(x)).numpy()
+
+    np.testing.assert_allclose(artifact.forward(x), expected, atol=1e-5)
+    assert artifact.num_layers == num_layers and artifact.hidden_size == 16
+    assert isinstance(artifact["lstm.weight_ih_l0"], np.memmap)
+
+
+def test_to_torch_loads_state_dict_without_pickle(tmp_path):
+    model = AnomalyLSTM(input_size=MONITORING_SCHEMA_V1.dim)
+    artifact = LSTMArtifact(_export(tmp_path, model))
+
+    restored = AnomalyLSTM(input_size=MONITORING_SCHEMA_V1.dim)
+    restored.load_state_dict(artifact.to_torch())
+    for name, tensor in model.state_dict().items():
+        assert torch.equal(restored.state_dict()[name], tensor)
+
+
+def test_registry_loads_and_validates_tensor_artifact(tmp_path):
+    path = _export(tmp_path, AnomalyLSTM(input_size=MONITORING_SCHEMA_V1.dim))
+    registry = ModelRegistry()
+    registry.register("lstm", path, _load_lstm, _validate_lstm)
+    entry = registry.load("lstm")
+
+    assert entry.status == ModelStatus.READY
+    assert entry.schema_key == MONITORING_SCHEMA_V1.key
+    assert entry.memory_bytes == entry.model.nbytes
+
+    # 입력 차원이 스키마와 다르면 실패
+    bad = str(tmp_path / "bad.tensors")
+    state = AnomalyLSTM(input_size=3).state_dict()
+    write_tensor_artifact(bad, state, lstm_meta(state))
+    registry.register("bad", bad, _load_lstm, _validate_lstm)
+    assert registry.load("bad").status == ModelStatus.FAILED
+
+
+def test_anomaly_service_uses_lstm_artifact(tmp_path, monkeypatch):
+    from datetime import datetime, timedelta
+
+    from schemas.monitoring import AnomalyDetectionRequest
+    from services import anomaly_service
+    from services.anomaly_service import LSTM_WINDOW, AnomalyDetectionService
+
+    torch.manual_seed(0)
+    registry = ModelRegistry()
+    registry.register("lstm", _export(tmp_path, AnomalyLSTM(input_size=MONITORING_SCHEMA_V1.dim)),
+                      _load_lstm, _validate_lstm)
+    registry.load("lstm")
+    artifact = registry.artifact("lstm")
+
+    calls = []
+    forward = LSTMArtifact.forward
+
+    def spy(self, x):
+        calls.append(np.asarray(x).shape)
+        return forward(self, x)
+
+    monkeypatch.setattr(LSTMArtifact, "forward", spy)
+    original = anomaly_service.get_model_artifact
+    monkeypatch.setattr(
+        anomaly_service, "get_model_artifact",
+        lambda name: artifact if name == "lstm" else original(name),
+    )
+
+    start = datetime(2024, 1, 1, 9, 0)
+    heart_rates = [70 + (i % 3) for i in range(40)]
+    heart_rates[30] = 130
+    request = AnomalyDetectionRequest(
+        senior_profile_id=1,
+        matching_id=1,
+        sensor_readings=[
+            {"timestamp": start + timedelta(minutes=i), "heart_rate": hr,
+             "step_count": 10, "activity": "walking"}
+            for i, hr in enumerate(heart_rates)
+        ],
+    )
+    response = AnomalyDetectionService.detect_anomalies(request)
+
+    # 예측 시점마다 (LSTM_WINDOW, 스키마 차원) 시퀀스 1개
+    assert calls == [(40 - LSTM_WINDOW, LSTM_WINDOW, MONITORING_SCHEMA_V1.dim)]
+    lstm = [a for a in response.detected_anomalies if a.type == "lstm_anomaly"]
+    assert [a.value for a in lstm] == [130]
+
+
+def test_registry_switches_to_tensors_exported_after_startup(tmp_path):
+    model = AnomalyLSTM(input_size=MONITORING_SCHEMA_V1.dim)
+    pt_path = str(tmp_path / "lstm_model.pt")
+    torch.save(model.state_dict(), pt_path)
+    tensors_path = str(tmp_path / "lstm_model.tensors")
+
+    def resolve():
+        return pt_path if not os.path.exists(tensors_path) else tensors_path
+
+    registry = ModelRegistry()
+    registry.register("lstm", resolve(), _load_lstm, _validate_lstm, resolve_path=resolve)
+    registry.load("lstm")
+    assert registry.artifact("lstm").path == pt_path
+    assert registry.check_for_updates() == []
+
+    _export(tmp_path, model)
+    results = registry.check_for_updates()
+    assert [r["swapped"] for r in results] == [True]
+    assert isinstance(registry.get("lstm"), LSTMArtifact)
+    assert registry.check_for_updates() == []
@@ -0,0 +1,256 @@
+import asyncio
+import json
+import math
+import time
+from collections import deque
+from typing import Dict, List, Optional, Tuple
+
+from config.settings import settings
+from schemas.health import ErrorResponse
+from utils.metrics import ERRORS, metrics
+
+
+class RouteClass:
+    """
+    경로 분류별 수용 정책
+
+    - limit: 동시 처리 수
+    - queue: 대기열 길이 (가득 차면 즉시 거절)
+    - deadline: 대기열에서 기다릴 최대 시간 (초과하면 거절)
+    - priority: 자리가 나면 숫자가 작은 분류의 대기 요청부터
+    """
+
+    __slots__ = ("name", "limit", "queue", "deadline", "priority",
+                 "in_flight", "waiters", "service_ewma")
+
+    def __init__(self, name: str, limit: int, queue: int, deadline: float, priority: int):
+        self.name = name
+        self.limit = limit
+        self.queue = queue
+        self.deadline = deadline
+        self.priority = priority
+        self.in_flight = 0
+        self.waiters: deque = deque()
+        # 처리 시간 이동 평균 (Retry-After 추정)
+        self.service_ewma = 0.05
+
+
+# 우선순위: 낙상 / 위험 심박 경보(이상 탐지, 센서 적재) > 단건 점수 > 일괄 랭킹 > 대시보드 조회
+DEFAULT_ROUTE_CLASSES = {
+    "critical": dict(limit=32, queue=256, deadline=2.0, priority=0),
+    "light": dict(limit=32, queue=128, deadline=1.0, priority=1),
+    "heavy": dict(limit=8, queue=32, deadline=2.0, priority=2),
+    "dashboard": dict(limit=4, queue=16, deadline=0.5, priority=3),
+}
+
+# (메서드, 경로 접두사) → 분류 (위에서부터 처음 일치, 없으면 제한 없음)
+ROUTE_CLASS_RULES: List[Tuple[str, str, str]] = [
+    ("POST", "/api/ml/v1/monitoring/detect-anomaly", "critical"),
+    ("POST", "/api/ml/v1/monitoring", "critical"),
+    ("GET", "/api/ml/v1/monitoring/", "dashboard"),
+    ("GET", "/api/v1/matching/priority", "dashboard"),
+    ("POST", "/api/ml/v1/health/calculate", "light"),
+    ("POST", "/api/v1/matching/score", "light"),
+    ("POST", "/api/v1/job-risk/predict/batch", "heavy"),
+    ("POST", "/api/v1/job-risk/predict", "light"),
+    ("POST", "/api/v1/matching/rank", "heavy"),
+    ("POST", "/api/v1/fit/rank", "heavy"),
+]
+
+ADMITTED = metrics.counter(
+    "if_admission_admitted_total", "수용된 요청 수 (queued=대기 후 수용)", ("route_class", "queued")
+)
+SHED = metrics.counter(
+    "if_admission_shed_total", "거절(503)된 요청 수", ("route_class", "reason")
+)
+WAIT_SECONDS = metrics.histogram(
+    "if_admission_wait_seconds", "대기열에서 기다린 시간", ("route_class",)
+)
+
+
+class Overloaded(Exception):
+    def __init__(self, route_class: RouteClass, reason: str, retry_after: int):
+        self.route_class = route_class
+        self.reason = reason
+        self.retry_after = retry_after
+
+
+class AdmissionController:
+    """
+    분류별 동시 처리 상한 + 전체 상한, 분류별 유한 대기열 (이벤트 루프 1개 = 워커 1개 기준)
+
+    자리가 나면 priority 순으로 대기 요청을 깨움 (같은 분류 안에서는 FIFO).
+    대기열이 가득 차거나 deadline을 넘기면 Overloaded
+    """
+
+    def __init__(
+        self,
+        max_in_flight: int,
+        classes: Optional[Dict[str, dict]] = None,
+        rules: Optional[List[Tuple[str, str, str]]] = None,
+    ):
+        self.max_in_flight = max_in_flight
+        self.in_flight = 0
+        self.classes = {
+            name: RouteClass(name, **params)
+            for name, params in (classes or DEFAULT_ROUTE_CLASSES).items()
+        }
+        self._by_priority = sorted(self.classes.values(), key=lambda c: c.priority)
+        self.rules = rules if rules is not None else ROUTE_CLASS_RULES
+
+    def classify(self, method: str, path: str) -> Optional[RouteClass]:
+        for rule_method, prefix, name in self.rules:
+            if method == rule_method and path.startswith(prefix):
+                return self.classes[name]
+        return None
+
+    def _can_run(self, rc: RouteClass) -> bool:
+        return rc.in_flight < rc.limit and self.in_flight < self.max_in_flight
+
+    def _retry_after(self, rc: RouteClass) -> int:
+        # 앞선 대기 요청이 빠지는 데 걸릴 시간 추정 (1 ~ 30초)
+        estimate = rc.service_ewma * (len(rc.waiters) + 1) / max(1, rc.limit)
+        return int(min(30, max(1, math.ceil(estimate))))
+
+    async def acquire(self, rc: RouteClass) -> float:
+        """수용되면 대기 시간(초) 반환, 아니면 Overloaded"""
+        # 같은 분류의 대기 요청을 앞지르지 않음 (분류 간 우선순위는 _wake에서)
+        if self._can_run(rc) and not rc.waiters:
+            self._start(rc)
+            ADMITTED.inc((rc.name, "false"))
+            return 0.0
+
+        if len(rc.waiters) >= rc.queue:
+            raise Overloaded(rc, "queue_full", self._retry_after(rc))
+
+        waiter = asyncio.get_running_loop().create_future()
+        rc.waiters.append(waiter)
+        start = time.perf_counter()
+        try:
+            await asyncio.wait_for(asyncio.shield(waiter), rc.deadline)
+        except asyncio.TimeoutError:
+            # 시간 초과와 동시에 자리를 받았으면 그대로 수용
+            if not waiter.done():
+                waiter.cancel()
+                self._remove(rc, waiter)
+                WAIT_SECONDS.observe((rc.name,), time.perf_counter() - start)
+                raise Overloaded(rc, "deadline", self._retry_after(rc))
+        except BaseException:
+            # 클라이언트 연결 종료 등: 받은 자리가 있으면 돌려줌
+            if waiter.done() and not waiter.cancelled():
+                self.release(rc, 0.0)
+            else:
+                waiter.cancel()
+                self._remove(rc, waiter)
+            raise
+
+        waited = time.perf_counter() - start
+        WAIT_SECONDS.observe((rc.name,), waited)
+        ADMITTED.inc((rc.name, "true"))
+        return waited
+
+    def release(self, rc: RouteClass, service_seconds: float) -> None:
+        rc.in_flight -= 1
+        self.in_flight -= 1
+        if service_seconds > 0:
+            rc.service_ewma += 0.1 * (service_seconds - rc.service_ewma)
+        self._wake()
+
+    def _start(self, rc: RouteClass) -> None:
+        rc.in_flight += 1
+        self.in_flight += 1
+
+    def _wake(self) -> None:
+        # 자리를 대기 요청에 직접 넘김 (깨어난 요청이 다시 경쟁하지 않음)
+        for rc in self._by_priority:
+            while rc.waiters and self._can_run(rc):
+                waiter = rc.waiters.popleft()
+                if waiter.done():
+                    continue
+                self._start(rc)
+                waiter.set_result(None)
+            if self.in_flight >= self.max_in_flight:
+                return
+
+    @staticmethod
+    def _remove(rc: RouteClass, waiter) -> None:
+        try:
+            rc.waiters.remove(waiter)
+        except ValueError:
+            pass
+
+    def metric_families(self):
+        """GET /metrics 수집기: 분류별 대기열 길이 / 처리 중 요청 수"""
+        classes = list(self.classes.values())
+        yield (
+            "if_admission_queue_depth", "gauge", "분류별 대기 중 요청 수",
+            [({"route_class": c.name}, sum(1 for w in c.waiters if not w.done())) for c in classes],
+        )
+        yield (
+            "if_admission_in_flight", "gauge", "분류별 처리 중 요청 수",
+            [({"route_class": c.name}, c.in_flight) for c in classes],
+        )
+
+
+class AdmissionMiddleware:
+    """
+    수용 제어 / 부하 차단 (ASGI 미들웨어)
+
+    분류에 해당하지 않는 경로(/health, /metrics, 관리 API 등)는 그대로 통과.
+    거절 시 503 + Retry-After, 본문은 ErrorResponse (error_code=SERVICE_OVERLOADED)
+    """
+
+    def __init__(self, app, controller: Optional[AdmissionController] = None):
+        self.app = app
+        self.controller = controller or admission_controller
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        rc = self.controller.classify(scope["method"], scope["path"])
+        if rc is None:
+            await self.app(scope, receive, send)
+            return
+
+        try:
+            await self.controller.acquire(rc)
+        except Overloaded as e:
+            SHED.inc((rc.name, e.reason))
+            ERRORS.inc(("SERVICE_OVERLOADED",))
+            await _overloaded_response(send, e)
+            return
+
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            self.controller.release(rc, time.perf_counter() - start)
+
+
+async def _overloaded_response(send, e: Overloaded) -> None:
+    body = json.dumps(
+        ErrorResponse(
+            error_code="SERVICE_OVERLOADED",
+            message="요청이 많아 잠시 후 다시 시도해주세요.",
+            details={
+                "route_class": e.route_class.name,
+                "reason": e.reason,
+                "retry_after": e.retry_after,
+            },
+        ).model_dump(),
+        ensure_ascii=False,
+    ).encode("utf-8")
+    await send({
+        "type": "http.response.start",
+        "status": 503,
+        "headers": [
+            (b"content-type", b"application/json"),
+            (b"content-length", str(len(body)).encode()),
+            (b"retry-after", str(e.retry_after).encode()),
+        ],
+    })
+    await send({"type": "http.response.body", "body": body})
+
+
+admission_controller = AdmissionController(settings.ADMISSION_MAX_IN_FLIGHT)
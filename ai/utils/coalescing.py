@@ -0,0 +1,145 @@
+import asyncio
+import hashlib
+import json
+from typing import Dict, Optional, Set, Tuple
+
+from config.settings import settings
+from utils.metrics import metrics
+
+# 합칠 경로 (메서드, 경로 정확히 일치): 같은 본문이면 결과가 같은 읽기 전용 계산만
+DEFAULT_COALESCE_ROUTES: Set[Tuple[str, str]] = {
+    ("POST", "/api/ml/v1/monitoring/detect-anomaly"),
+    ("POST", "/api/ml/v1/health/calculate"),
+    ("POST", "/api/v1/matching/score"),
+    ("POST", "/api/v1/matching/rank"),
+    ("POST", "/api/v1/job-risk/predict"),
+    ("POST", "/api/v1/job-risk/predict/batch"),
+    ("POST", "/api/v1/fit/rank"),
+}
+
+COALESCED = metrics.counter(
+    "if_coalesce_requests_total",
+    "동일 요청 합치기 (leader=직접 계산, follower=진행 중인 계산 결과 공유, bypass=본문이 너무 큼)",
+    ("route", "role"),
+)
+
+
+def canonical_key(method: str, path: str, query: bytes, body: bytes) -> str:
+    """JSON 본문은 키 순서 / 공백과 무관하게 같은 키 (JSON이 아니면 원본 바이트)"""
+    try:
+        body = json.dumps(
+            json.loads(body), sort_keys=True, separators=(",", ":"), ensure_ascii=False
+        ).encode("utf-8")
+    except (ValueError, UnicodeDecodeError):
+        pass
+    digest = hashlib.sha256()
+    for part in (method.encode(), path.encode(), query, body):
+        digest.update(len(part).to_bytes(8, "little"))
+        digest.update(part)
+    return digest.hexdigest()
+
+
+class _Flight:
+    """진행 중인 계산 1건: leader 응답(상태, 헤더, 본문)을 follower에게 그대로 전달"""
+
+    __slots__ = ("done", "status", "headers", "body")
+
+    def __init__(self):
+        self.done = asyncio.Event()
+        self.status: Optional[int] = None
+        self.headers = []
+        self.body = bytearray()
+
+
+class CoalescingMiddleware:
+    """
+    동일 요청 single-flight (ASGI 미들웨어)
+
+    대상 경로의 요청 본문을 정규화 해시 → 같은 키가 처리 중이면 그 응답을 기다려 공유.
+    leader가 실패(예외 / 5xx)하면 follower는 각자 다시 계산.
+    결과 캐시(utils/result_cache.py)는 계산 이후의 반복을, 이 계층은 동시에 겹친 요청을 줄임
+    """
+
+    def __init__(self, app, routes: Optional[Set[Tuple[str, str]]] = None):
+        self.app = app
+        self.routes = routes if routes is not None else DEFAULT_COALESCE_ROUTES
+        self.max_body = settings.COALESCE_MAX_BODY_BYTES
+        self._flights: Dict[str, _Flight] = {}
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or (scope["method"], scope["path"]) not in self.routes:
+            await self.app(scope, receive, send)
+            return
+
+        route = scope["path"]
+        chunks, complete = await self._read_body(receive)
+        replay = _replay(chunks, complete, receive)
+        if not complete:
+            COALESCED.inc((route, "bypass"))
+            await self.app(scope, replay, send)
+            return
+
+        key = canonical_key(scope["method"], route, scope.get("query_string", b""), b"".join(chunks))
+        flight = self._flights.get(key)
+        if flight is not None:
+            await flight.done.wait()
+            if flight.status is not None and flight.status < 500:
+                COALESCED.inc((route, "follower"))
+                await _send_copy(send, flight)
+                return
+            # leader 실패 → 직접 계산
+            await self.app(scope, replay, send)
+            return
+
+        flight = self._flights[key] = _Flight()
+        COALESCED.inc((route, "leader"))
+
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start":
+                flight.status = message["status"]
+                flight.headers = list(message.get("headers", []))
+            elif message["type"] == "http.response.body":
+                flight.body += message.get("body", b"")
+            await send(message)
+
+        try:
+            await self.app(scope, replay, send_wrapper)
+        except BaseException:
+            flight.status = None
+            raise
+        finally:
+            del self._flights[key]
+            flight.done.set()
+
+    async def _read_body(self, receive):
+        """본문 전체 (max_body 초과 시 complete=False, 읽은 부분은 그대로 다시 전달)"""
+        chunks, size = [], 0
+        while True:
+            message = await receive()
+            if message["type"] != "http.request":
+                return chunks, False
+            body = message.get("body", b"")
+            chunks.append(body)
+            size += len(body)
+            if not message.get("more_body", False):
+                return chunks, True
+            if size > self.max_body:
+                return chunks, False
+
+
+def _replay(chunks, complete: bool, receive):
+    """미리 읽은 본문을 다시 내보낸 뒤 원래 receive로"""
+    pending = list(chunks)
+
+    async def replay_receive():
+        if pending:
+            body = pending.pop(0)
+            return {"type": "http.request", "body": body, "more_body": bool(pending) or not complete}
+        return await receive()
+
+    return replay_receive
+
+
+async def _send_copy(send, flight: _Flight) -> None:
+    await send({"type": "http.response.start", "status": flight.status, "headers": flight.headers})
+    await send({"type": "http.response.body", "body": bytes(flight.body)})
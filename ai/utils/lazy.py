@@ -0,0 +1,38 @@
+import threading
+from typing import Any, Callable
+
+
+class LazyInstance:
+    """
+    첫 속성 접근 때 생성되는 서비스 싱글톤
+
+    라우터 모듈 import 시점에는 아무것도 만들지 않으므로 (사전 계산 테이블, 카탈로그 등)
+    앱 기동이 빠르고, 엔드포인트가 처음 호출될 때 한 번만 생성
+    """
+
+    __slots__ = ("_factory", "_instance", "_lock")
+
+    def __init__(self, factory: Callable[[], Any]):
+        object.__setattr__(self, "_factory", factory)
+        object.__setattr__(self, "_instance", None)
+        object.__setattr__(self, "_lock", threading.Lock())
+
+    def get(self) -> Any:
+        instance = self._instance
+        if instance is None:
+            with self._lock:
+                instance = self._instance
+                if instance is None:
+                    instance = self._factory()
+                    object.__setattr__(self, "_instance", instance)
+        return instance
+
+    @property
+    def created(self) -> bool:
+        return self._instance is not None
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.get(), name)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        setattr(self.get(), name, value)
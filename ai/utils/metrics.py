@@ -0,0 +1,290 @@
+import functools
+import inspect
+import threading
+import time
+from bisect import bisect_left
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from config.settings import settings
+
+# 지연 시간 버킷 (초): 0.1ms ~ 10s
+LATENCY_BUCKETS = (
+    0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01,
+    0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0,
+)
+
+# 수집기 반환 형식: (이름, 타입, 설명, [(레이블 dict, 값), ...])
+Sample = Tuple[Dict[str, str], float]
+Family = Tuple[str, str, str, List[Sample]]
+
+
+def _escape(value) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _labels(names: Sequence[str], values: Sequence, extra: str = "") -> str:
+    parts = [f'{n}="{_escape(v)}"' for n, v in zip(names, values)]
+    if extra:
+        parts.append(extra)
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+
+def _number(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class Counter:
+    """레이블별 누적 카운터"""
+
+    def __init__(self, name: str, help: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.help = help
+        self.labelnames = tuple(labelnames)
+        self._values: Dict[tuple, float] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, labels: tuple = (), amount: float = 1) -> None:
+        with self._lock:
+            self._values[labels] = self._values.get(labels, 0) + amount
+
+    def value(self, labels: tuple = ()) -> float:
+        return self._values.get(labels, 0)
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} counter"]
+        with self._lock:
+            items = sorted(self._values.items())
+        lines.extend(f"{self.name}{_labels(self.labelnames, k)} {_number(v)}" for k, v in items)
+        return lines
+
+
+class Histogram:
+    """레이블별 고정 버킷 히스토그램 (관측 1회 = 이진 탐색 + 잠금 1회)"""
+
+    def __init__(
+        self,
+        name: str,
+        help: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = LATENCY_BUCKETS,
+    ):
+        self.name = name
+        self.help = help
+        self.labelnames = tuple(labelnames)
+        self.buckets = tuple(buckets)
+        # 레이블 → [버킷별 개수..., +Inf 개수, 합계]
+        self._series: Dict[tuple, list] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, labels: tuple, value: float) -> None:
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(labels)
+            if series is None:
+                series = self._series[labels] = [0] * (len(self.buckets) + 1) + [0.0]
+            series[index] += 1
+            series[-1] += value
+
+    def count(self, labels: tuple = ()) -> int:
+        series = self._series.get(labels)
+        return sum(series[:-1]) if series is not None else 0
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} histogram"]
+        with self._lock:
+            items = sorted((k, list(v)) for k, v in self._series.items())
+        for labels, series in items:
+            cumulative = 0
+            for bound, n in zip(self.buckets + (float("inf"),), series[:-1]):
+                cumulative += n
+                le = f'le="{_number(bound)}"'
+                lines.append(f"{self.name}_bucket{_labels(self.labelnames, labels, le)} {cumulative}")
+            lines.append(f"{self.name}_sum{_labels(self.labelnames, labels)} {_number(series[-1])}")
+            lines.append(f"{self.name}_count{_labels(self.labelnames, labels)} {cumulative}")
+        return lines
+
+
+class _NullStage:
+    """비활성 시 공용 no-op 컨텍스트 (할당 없음)"""
+
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NULL_STAGE = _NullStage()
+
+
+class _Stage:
+    __slots__ = ("histogram", "labels", "start")
+
+    def __init__(self, histogram: Histogram, name: str):
+        self.histogram = histogram
+        self.labels = (name,)
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.histogram.observe(self.labels, time.perf_counter() - self.start)
+        return False
+
+
+class StageClock:
+    """
+    번호 매긴 단계가 이어지는 함수용: 직전 lap 이후 경과 시간을 단계 이름으로 기록
+
+        clock = metrics.clock("health")
+        ... ; clock.lap("validate")
+        ... ; clock.lap("features")
+    """
+
+    __slots__ = ("histogram", "prefix", "last")
+
+    def __init__(self, histogram: Optional[Histogram], prefix: str):
+        self.histogram = histogram
+        self.prefix = prefix
+        self.last = time.perf_counter() if histogram is not None else 0.0
+
+    def lap(self, name: str) -> None:
+        if self.histogram is None:
+            return
+        now = time.perf_counter()
+        self.histogram.observe((f"{self.prefix}.{name}",), now - self.last)
+        self.last = now
+
+
+class MetricsRegistry:
+    """
+    프로세스 내 지표 (Prometheus 텍스트 형식으로 노출)
+
+    - stage(name): 구간 시간 컨텍스트 매니저
+    - timed(name): 함수 / 코루틴 데코레이터
+    - clock(prefix): 단계별 lap 기록
+    비활성(METRICS_ENABLED=false)이면 세 가지 모두 시간 측정 없이 그대로 통과
+    """
+
+    def __init__(self, enabled: bool = True):
+        self.enabled = enabled
+        self._metrics: List = []
+        self._collectors: List[Callable[[], Iterable[Family]]] = []
+        self.stage_seconds = self.histogram(
+            "if_stage_duration_seconds", "서비스 단계 / 모델 호출 소요 시간", ("stage",)
+        )
+
+    def counter(self, name: str, help: str, labelnames: Sequence[str] = ()) -> Counter:
+        metric = Counter(name, help, labelnames)
+        self._metrics.append(metric)
+        return metric
+
+    def histogram(
+        self,
+        name: str,
+        help: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = LATENCY_BUCKETS,
+    ) -> Histogram:
+        metric = Histogram(name, help, labelnames, buckets)
+        self._metrics.append(metric)
+        return metric
+
+    def add_collector(self, collector: Callable[[], Iterable[Family]]) -> None:
+        """스크레이프 시점에 값을 읽는 지표 (모델 상태, 캐시 통계 등)"""
+        self._collectors.append(collector)
+
+    # =========================================================
+    # 계측
+    # =========================================================
+    def stage(self, name: str):
+        if not self.enabled:
+            return _NULL_STAGE
+        return _Stage(self.stage_seconds, name)
+
+    def clock(self, prefix: str) -> StageClock:
+        return StageClock(self.stage_seconds if self.enabled else None, prefix)
+
+    def timed(self, name: str):
+        def decorator(fn):
+            if inspect.iscoroutinefunction(fn):
+                @functools.wraps(fn)
+                async def async_wrapper(*args, **kwargs):
+                    if not self.enabled:
+                        return await fn(*args, **kwargs)
+                    with _Stage(self.stage_seconds, name):
+                        return await fn(*args, **kwargs)
+                return async_wrapper
+
+            @functools.wraps(fn)
+            def wrapper(*args, **kwargs):
+                if not self.enabled:
+                    return fn(*args, **kwargs)
+                with _Stage(self.stage_seconds, name):
+                    return fn(*args, **kwargs)
+            return wrapper
+        return decorator
+
+    # =========================================================
+    # 노출
+    # =========================================================
+    def render(self) -> str:
+        lines: List[str] = []
+        for metric in self._metrics:
+            lines.extend(metric.render())
+        for collector in self._collectors:
+            for name, kind, help, samples in collector():
+                lines.append(f"# HELP {name} {help}")
+                lines.append(f"# TYPE {name} {kind}")
+                for labels, value in samples:
+                    lines.append(f"{name}{_labels(list(labels), list(labels.values()))} {_number(value)}")
+        return "\n".join(lines) + "\n"
+
+
+metrics = MetricsRegistry(settings.METRICS_ENABLED)
+
+REQUESTS = metrics.counter(
+    "if_http_requests_total", "HTTP 요청 수", ("method", "route", "status")
+)
+REQUEST_SECONDS = metrics.histogram(
+    "if_http_request_duration_seconds", "HTTP 요청 처리 시간", ("method", "route")
+)
+ERRORS = metrics.counter(
+    "if_errors_total", "오류 응답 수 (ErrorResponse.error_code 기준)", ("error_code",)
+)
+
+
+class MetricsMiddleware:
+    """
+    요청 수 / 처리 시간 (ASGI 미들웨어, 경로는 라우트 템플릿 기준이라 레이블 수가 고정)
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status_code = [500]
+
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start":
+                status_code[0] = message["status"]
+            await send(message)
+
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            route = scope.get("route")
+            path = getattr(route, "path", None) or "unmatched"
+            method = scope["method"]
+            REQUEST_SECONDS.observe((method, path), time.perf_counter() - start)
+            REQUESTS.inc((method, path, str(status_code[0])))
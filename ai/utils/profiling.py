@@ -0,0 +1,235 @@
+import asyncio
+import hmac
+import itertools
+import json
+import logging
+import os
+import random
+import re
+import sys
+import tempfile
+import threading
+import time
+from collections import Counter
+from datetime import datetime
+from typing import List, Optional
+
+from config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+# 요청 헤더 (ADMIN_API_KEY가 설정돼 있고 X-Admin-Key가 맞을 때만)
+PROFILE_HEADER = b"x-profile"
+ADMIN_KEY_HEADER = b"x-admin-key"
+# 응답 헤더: 저장된 프로파일 ID
+PROFILE_ID_HEADER = b"x-profile-id"
+
+# 대기 중인 스레드 (이벤트 루프 select, 스레드풀 작업 대기 등)는 샘플에서 제외
+_IDLE_FRAMES = {
+    ("selectors.py", "select"),
+    ("threading.py", "wait"),
+    ("threading.py", "_wait_for_tstate_lock"),
+    ("queue.py", "get"),
+    ("thread.py", "_worker"),
+}
+
+_PROFILE_ID = re.compile(r"^[0-9T]+-\d+-\d+$")
+
+
+def _frame_label(code) -> str:
+    return f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+
+
+class SamplingProfiler:
+    """
+    스레드 스택 샘플링 프로파일러 (표준 라이브러리만 사용)
+
+    별도 스레드가 interval마다 sys._current_frames()로 모든 스레드의 스택을 읽어
+    collapsed stack(스레드 이름;바깥 함수;...;안쪽 함수 개수)으로 집계.
+    요청이 스레드풀(run_in_threadpool, 레지스트리 executor 등)로 넘긴 작업도
+    그 스레드 이름 아래에 함께 잡힘. 대기 중인 스레드는 제외.
+    """
+
+    def __init__(self, interval: float):
+        self.interval = interval
+        self.stacks: Counter = Counter()
+        self.samples = 0
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        self._thread = threading.Thread(target=self._run, name="profile-sampler", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+
+    def _run(self) -> None:
+        own = threading.get_ident()
+        while not self._stop.wait(self.interval):
+            self.sample(own)
+
+    def sample(self, exclude: Optional[int] = None) -> None:
+        names = {t.ident: t.name for t in threading.enumerate()}
+        for ident, frame in sys._current_frames().items():
+            if ident == exclude:
+                continue
+            code = frame.f_code
+            if (os.path.basename(code.co_filename), code.co_name) in _IDLE_FRAMES:
+                continue
+            stack = []
+            while frame is not None:
+                stack.append(_frame_label(frame.f_code))
+                frame = frame.f_back
+            stack.append(names.get(ident, str(ident)))
+            self.stacks[";".join(reversed(stack))] += 1
+        self.samples += 1
+
+    def collapsed(self) -> str:
+        """flamegraph.pl / speedscope 입력 형식"""
+        return "".join(f"{stack} {n}\n" for stack, n in self.stacks.most_common())
+
+
+class ProfileStore:
+    """
+    프로파일 저장 폴더 (최근 max_files개만 유지, 오래된 것부터 삭제)
+
+    <id>.folded: collapsed stack, <id>.json: 요청 / 소요 시간 / 샘플 수
+    """
+
+    def __init__(self, directory: str, max_files: int):
+        self.directory = directory
+        self.max_files = max_files
+        self._seq = itertools.count(1)
+        self._lock = threading.Lock()
+
+    def new_id(self) -> str:
+        return f"{datetime.now().strftime('%Y%m%dT%H%M%S')}-{os.getpid()}-{next(self._seq)}"
+
+    def save(self, profile_id: str, profiler: SamplingProfiler, meta: dict) -> None:
+        os.makedirs(self.directory, exist_ok=True)
+        with open(os.path.join(self.directory, f"{profile_id}.folded"), "w") as f:
+            f.write(profiler.collapsed())
+        with open(os.path.join(self.directory, f"{profile_id}.json"), "w") as f:
+            json.dump({"id": profile_id, **meta, "samples": profiler.samples}, f, ensure_ascii=False)
+        self._prune()
+
+    def _prune(self) -> None:
+        with self._lock:
+            profiles = self.list()
+            for meta in profiles[self.max_files:]:
+                for ext in (".folded", ".json"):
+                    try:
+                        os.remove(os.path.join(self.directory, meta["id"] + ext))
+                    except FileNotFoundError:
+                        pass
+
+    def list(self) -> List[dict]:
+        """최신순 메타데이터 목록"""
+        if not os.path.isdir(self.directory):
+            return []
+        profiles = []
+        for name in os.listdir(self.directory):
+            if not name.endswith(".json"):
+                continue
+            try:
+                with open(os.path.join(self.directory, name)) as f:
+                    profiles.append(json.load(f))
+            except (OSError, ValueError):
+                continue
+        profiles.sort(key=lambda m: m.get("started_at", ""), reverse=True)
+        return profiles
+
+    def read(self, profile_id: str) -> Optional[str]:
+        if not _PROFILE_ID.match(profile_id):
+            return None
+        path = os.path.join(self.directory, f"{profile_id}.folded")
+        if not os.path.exists(path):
+            return None
+        with open(path) as f:
+            return f.read()
+
+
+class ProfilingMiddleware:
+    """
+    요청 단위 온디맨드 프로파일링 (ASGI 미들웨어)
+
+    - X-Profile: 1 + X-Admin-Key 헤더 (ADMIN_API_KEY 설정 시에만) 또는 PROFILE_SAMPLE_RATE 확률로 샘플링
+    - 프로세스당 한 번에 한 요청만 (동시 요청은 그대로 통과)
+    - 꺼져 있으면 헤더 확인만 하고 통과
+    """
+
+    def __init__(self, app, store: Optional[ProfileStore] = None):
+        self.app = app
+        self.store = store
+
+    def _requested(self, scope) -> bool:
+        # 관리 API 키가 없으면 헤더 요청은 무시 (샘플링 비율만)
+        if not settings.ADMIN_API_KEY:
+            return False
+        headers = dict(scope.get("headers") or ())
+        if headers.get(PROFILE_HEADER) not in (b"1", b"true"):
+            return False
+        return hmac.compare_digest(headers.get(ADMIN_KEY_HEADER, b""), settings.ADMIN_API_KEY.encode())
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not (
+            self._requested(scope)
+            or (settings.PROFILE_SAMPLE_RATE > 0 and random.random() < settings.PROFILE_SAMPLE_RATE)
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        if not _active.acquire(blocking=False):
+            await self.app(scope, receive, send)
+            return
+
+        store = self.store or profile_store
+        profile_id = store.new_id()
+        status_code = [500]
+
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start":
+                status_code[0] = message["status"]
+                message["headers"] = list(message.get("headers", [])) + [
+                    (PROFILE_ID_HEADER, profile_id.encode())
+                ]
+            await send(message)
+
+        profiler = SamplingProfiler(settings.PROFILE_INTERVAL_SEC)
+        started_at = datetime.now().isoformat()
+        start = time.perf_counter()
+        profiler.start()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            # 샘플러 스레드 join은 이벤트 루프 밖에서 (다른 요청을 막지 않음)
+            await asyncio.to_thread(profiler.stop)
+            _active.release()
+            route = scope.get("route")
+            meta = {
+                "started_at": started_at,
+                "method": scope["method"],
+                "path": scope["path"],
+                "route": getattr(route, "path", None),
+                "status": status_code[0],
+                "duration_ms": round((time.perf_counter() - start) * 1000, 2),
+                "interval_ms": settings.PROFILE_INTERVAL_SEC * 1000,
+                "pid": os.getpid(),
+            }
+            try:
+                store.save(profile_id, profiler, meta)
+            except OSError as e:
+                logger.warning(f"프로파일 저장 실패 ({store.directory}): {str(e)}")
+
+
+_active = threading.Lock()
+
+
+def _profile_dir() -> str:
+    return settings.PROFILE_DIR or os.path.join(tempfile.gettempdir(), "if_profiles")
+
+
+profile_store = ProfileStore(_profile_dir(), settings.PROFILE_MAX_FILES)
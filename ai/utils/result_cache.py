@@ -0,0 +1,254 @@
+import fcntl
+import hashlib
+import logging
+import mmap
+import os
+import struct
+import tempfile
+import time
+from typing import Callable, Optional, Sequence, Tuple
+
+import numpy as np
+
+from config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+# 파일 구조: 헤더(64) | 세트 n_sets개 × 웨이 ways개 × 슬롯(64)
+#   헤더: MAGIC(4) | 형식 버전 | n_sets | ways | (예약) | hits | misses | inserts | evictions
+#   슬롯: key_hi | key_lo | tick(ms) | 값 개수 | checksum | 값 4개(float64)
+# 키 = blake2b(모델 버전 + 피처 벡터 바이트) 128비트, 세트 = key_lo % n_sets
+# 세트 안에서 tick이 가장 오래된 웨이를 교체 (근사 LRU)
+# 잠금 없이 여러 프로세스가 읽고 쓰므로 checksum이 맞지 않는 슬롯(쓰는 중)은 미스로 처리
+MAGIC = b"IFRC"
+FORMAT_VERSION = 1
+HEADER = struct.Struct("<4sIIII")
+COUNTERS = struct.Struct("<QQQQ")
+COUNTERS_OFFSET = 32
+HEADER_SIZE = 64
+SLOT = struct.Struct("<QQIIQ4d")
+SLOT_SIZE = SLOT.size
+TICK = struct.Struct("<I")
+MAX_VALUES = 4
+_VALUE_BITS = struct.Struct("<4Q")
+_VALUE_DOUBLES = struct.Struct("<4d")
+_CHECK_SEED = 0x9E3779B97F4A7C15
+
+HITS, MISSES, INSERTS, EVICTIONS = range(4)
+
+
+def _checksum(key_hi: int, key_lo: int, n: int, values: Tuple[float, ...]) -> int:
+    check = _CHECK_SEED ^ key_hi ^ (key_lo * 31) ^ n
+    for bits in _VALUE_BITS.unpack(_VALUE_DOUBLES.pack(*values)):
+        check = (check * 1099511628211 ^ bits) & 0xFFFFFFFFFFFFFFFF
+    return check
+
+
+def _tick() -> int:
+    # CLOCK_MONOTONIC는 프로세스 간 공통 (ms, 약 49일마다 순환)
+    return int(time.monotonic() * 1000) & 0xFFFFFFFF
+
+
+def default_cache_path() -> str:
+    base = "/dev/shm" if os.path.isdir("/dev/shm") else tempfile.gettempdir()
+    return os.path.join(base, "if_result_cache.bin")
+
+
+class ResultCache:
+    """
+    프로세스 간 공유 추론 결과 캐시 (메모리맵 파일, 외부 서비스 없음)
+
+    같은 호스트의 uvicorn 워커들이 같은 파일을 열어 (모델 버전, 피처 벡터) → 결과를 공유.
+    모델 버전이 키에 들어가므로 재로드 후에는 자연히 미스 (이전 버전 항목은 LRU로 밀려남)
+    """
+
+    def __init__(self, path: str, n_sets: int, ways: int = 8):
+        self.path = path
+        self.n_sets = int(n_sets)
+        self.ways = int(ways)
+        self.size = HEADER_SIZE + self.n_sets * self.ways * SLOT_SIZE
+        self._set_bytes = self.ways * SLOT_SIZE
+
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o600)
+        try:
+            # 초기화는 파일 잠금 안에서 (여러 워커가 동시에 시작)
+            fcntl.flock(fd, fcntl.LOCK_EX)
+            try:
+                self._init_file(fd)
+            finally:
+                fcntl.flock(fd, fcntl.LOCK_UN)
+            self._mm = mmap.mmap(fd, self.size)
+        finally:
+            os.close(fd)
+
+        # 이 프로세스의 카운터 (공유 카운터는 잠금 없이 갱신하므로 근사값)
+        self.local = [0, 0, 0, 0]
+
+    def _init_file(self, fd: int) -> None:
+        header = os.pread(fd, HEADER.size, 0)
+        if len(header) == HEADER.size and os.fstat(fd).st_size == self.size:
+            magic, version, n_sets, ways, _ = HEADER.unpack(header)
+            if (magic, version, n_sets, ways) == (MAGIC, FORMAT_VERSION, self.n_sets, self.ways):
+                return
+        # 새 파일 또는 구조가 다른 파일 → 비우고 다시 만듦
+        os.ftruncate(fd, 0)
+        os.ftruncate(fd, self.size)
+        os.pwrite(fd, HEADER.pack(MAGIC, FORMAT_VERSION, self.n_sets, self.ways, 0), 0)
+        logger.info(f"추론 결과 캐시 생성: {self.path} ({self.n_sets}세트 × {self.ways}웨이)")
+
+    # =========================================================
+    # 키
+    # =========================================================
+    @staticmethod
+    def key(version: str, features) -> Tuple[int, int]:
+        vector = np.ascontiguousarray(features, dtype=np.float64)
+        digest = hashlib.blake2b(version.encode(), digest_size=16)
+        digest.update(b"\0")
+        digest.update(vector.tobytes())
+        key_hi, key_lo = struct.unpack("<QQ", digest.digest())
+        return key_hi, (key_lo or 1)
+
+    def _set_offset(self, key_lo: int) -> int:
+        return HEADER_SIZE + (key_lo % self.n_sets) * self._set_bytes
+
+    # =========================================================
+    # 조회 / 저장
+    # =========================================================
+    def get(self, version: str, features) -> Optional[Tuple[float, ...]]:
+        key_hi, key_lo = self.key(version, features)
+        mm = self._mm
+        offset = self._set_offset(key_lo)
+        for _ in range(self.ways):
+            slot_hi, slot_lo, _, n, check, *values = SLOT.unpack_from(mm, offset)
+            if slot_hi == key_hi and slot_lo == key_lo:
+                if check == _checksum(key_hi, key_lo, n, tuple(values)):
+                    TICK.pack_into(mm, offset + 16, _tick())
+                    self._count(HITS)
+                    return tuple(values[:n])
+                break
+            offset += SLOT_SIZE
+        self._count(MISSES)
+        return None
+
+    def put(self, version: str, features, values: Sequence[float]) -> None:
+        values = tuple(float(v) for v in values)[:MAX_VALUES]
+        n = len(values)
+        padded = values + (0.0,) * (MAX_VALUES - n)
+        key_hi, key_lo = self.key(version, features)
+        mm = self._mm
+        base = self._set_offset(key_lo)
+
+        target, oldest_tick, evict = None, None, False
+        offset = base
+        for _ in range(self.ways):
+            slot_hi, slot_lo, tick = struct.unpack_from("<QQI", mm, offset)
+            if (slot_hi == key_hi and slot_lo == key_lo) or (slot_hi == 0 and slot_lo == 0):
+                target, evict = offset, False
+                break
+            if oldest_tick is None or tick < oldest_tick:
+                target, oldest_tick, evict = offset, tick, True
+            offset += SLOT_SIZE
+
+        # 키를 먼저 지우고 값 → 키 순서로 기록 (읽는 쪽은 checksum으로 검증)
+        struct.pack_into("<QQ", mm, target, 0, 0)
+        SLOT.pack_into(
+            mm, target, 0, 0, _tick(), n, _checksum(key_hi, key_lo, n, padded), *padded
+        )
+        struct.pack_into("<QQ", mm, target, key_hi, key_lo)
+        self._count(INSERTS)
+        if evict:
+            self._count(EVICTIONS)
+
+    def get_or_compute(self, version: Optional[str], features, compute: Callable[[], float]) -> float:
+        """단일 점수 캐시 (버전이 없으면 캐시하지 않음)"""
+        if version is None:
+            return compute()
+        cached = self.get(version, features)
+        if cached is not None:
+            return cached[0]
+        value = compute()
+        self.put(version, features, (value,))
+        return value
+
+    def _count(self, index: int) -> None:
+        self.local[index] += 1
+        offset = COUNTERS_OFFSET + index * 8
+        (value,) = struct.unpack_from("<Q", self._mm, offset)
+        struct.pack_into("<Q", self._mm, offset, value + 1)
+
+    # =========================================================
+    # 상태
+    # =========================================================
+    def clear(self) -> None:
+        """전체 항목 + 공유 카운터 초기화"""
+        self._mm[HEADER.size:self.size] = bytes(self.size - HEADER.size)
+        self.local = [0, 0, 0, 0]
+
+    def stats(self) -> dict:
+        hits, misses, inserts, evictions = COUNTERS.unpack_from(self._mm, COUNTERS_OFFSET)
+        keys = np.frombuffer(self._mm, dtype="<u8", offset=HEADER_SIZE).reshape(-1, SLOT_SIZE // 8)[:, :2]
+        occupied = int(np.count_nonzero(keys.any(axis=1)))
+        lookups = hits + misses
+        local_lookups = self.local[HITS] + self.local[MISSES]
+        return {
+            "enabled": True,
+            "path": self.path,
+            "capacity": self.n_sets * self.ways,
+            "occupied": occupied,
+            "hits": hits,
+            "misses": misses,
+            "inserts": inserts,
+            "evictions": evictions,
+            "hit_ratio": hits / lookups if lookups else 0.0,
+            "process": {
+                "pid": os.getpid(),
+                "hits": self.local[HITS],
+                "misses": self.local[MISSES],
+                "inserts": self.local[INSERTS],
+                "evictions": self.local[EVICTIONS],
+                "hit_ratio": self.local[HITS] / local_lookups if local_lookups else 0.0,
+            },
+        }
+
+    def metric_families(self):
+        """GET /metrics 수집기 (공유 카운터, 전체 워커 합산)"""
+        hits, misses, inserts, evictions = COUNTERS.unpack_from(self._mm, COUNTERS_OFFSET)
+        for name, value in (
+            ("hits", hits), ("misses", misses), ("inserts", inserts), ("evictions", evictions)
+        ):
+            yield f"if_result_cache_{name}_total", "counter", f"공유 추론 결과 캐시 {name}", [({}, value)]
+
+    def close(self) -> None:
+        self._mm.close()
+
+
+class _DisabledCache:
+    """RESULT_CACHE_ENABLED=false 일 때 (항상 계산)"""
+
+    def get_or_compute(self, version, features, compute):
+        return compute()
+
+    def clear(self) -> None:
+        pass
+
+    def stats(self) -> dict:
+        return {"enabled": False}
+
+    def metric_families(self):
+        return ()
+
+
+def _create_result_cache():
+    if not settings.RESULT_CACHE_ENABLED:
+        return _DisabledCache()
+    path = settings.RESULT_CACHE_PATH or default_cache_path()
+    n_sets = max(1, settings.RESULT_CACHE_SLOTS // settings.RESULT_CACHE_WAYS)
+    try:
+        return ResultCache(path, n_sets, settings.RESULT_CACHE_WAYS)
+    except OSError as e:
+        logger.warning(f"추론 결과 캐시를 열 수 없습니다 ({path}): {str(e)}. 캐시 없이 동작합니다.")
+        return _DisabledCache()
+
+
+result_cache = _create_result_cache()